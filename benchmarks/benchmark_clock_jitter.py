@@ -0,0 +1,170 @@
+"""
+Benchmark TempoClock jitter under tempo changes, with many pending events.
+
+Compares ``TempoClock`` against the previous tombstoning event queue and
+event-by-event rescheduling, kept here verbatim as ``ReferenceTempoClock``::
+
+    python benchmarks/benchmark_clock_jitter.py
+"""
+import queue
+import statistics
+import time
+
+from supriya.clock import TempoClock
+from supriya.clock.bases import logger
+from supriya.clock.ephemera import CallbackCommand, ChangeCommand
+
+
+class ReferenceEventQueue(queue.PriorityQueue):
+    def _init(self, maxsize):
+        self.queue = []
+        self.items = {}
+
+    def _put(self, item):
+        entry = [item, True]
+        if item in self.items:
+            self.items[item][-1] = False
+        self.items[item] = entry
+        super()._put(entry)
+
+    def _get(self):
+        while self.queue:
+            item, active = super()._get()
+            if active:
+                del self.items[item]
+                return item
+        raise queue.Empty
+
+    def clear(self):
+        with self.mutex:
+            self._init(None)
+
+    def peek(self):
+        with self.mutex:
+            item = self._get()
+            entry = [item, True]
+            self.items[item] = entry
+            super()._put(entry)
+        return item
+
+    def remove(self, item):
+        with self.mutex:
+            entry = self.items.pop(item, None)
+            if entry is not None:
+                entry[-1] = False
+
+
+class ReferenceTempoClock(TempoClock):
+    def __init__(self):
+        TempoClock.__init__(self)
+        self._event_queue = ReferenceEventQueue()
+        self._offset_relative_event_ids = set()
+
+    def _cancel(self, event_id):
+        event = self._events_by_id.pop(event_id, None)
+        if event is not None and not isinstance(
+            event, (CallbackCommand, ChangeCommand)
+        ):
+            self._event_queue.remove(event)
+            if event.offset is not None:
+                self._offset_relative_event_ids.remove(event.event_id)
+                if event.measure is not None:
+                    self._measure_relative_event_ids.remove(event.event_id)
+        return event
+
+    def _enqueue_event(self, event):
+        self._events_by_id[event.event_id] = event
+        self._event_queue.put(event)
+        if event.offset is not None:
+            self._offset_relative_event_ids.add(event.event_id)
+            if event.measure is not None:
+                self._measure_relative_event_ids.add(event.event_id)
+
+    def _perform_change_event(self, event, current_moment, desired_moment):
+        result = super()._perform_change_event(event, current_moment, desired_moment)
+        if event.beats_per_minute is not None:
+            self._reschedule_offset_relative_events()
+        return result
+
+    def _reschedule_offset_relative_events(self):
+        for event_id in tuple(self._offset_relative_event_ids):
+            event = self._cancel(event_id)
+            if event is None:
+                self._offset_relative_event_ids.remove(event_id)
+                continue
+            seconds = self._offset_to_seconds(event.offset)
+            logger.debug(
+                f"[{self.name}] ... ... ... Rescheduling offset-relative event "
+                f"({event.event_id}) from "
+                f"{event.seconds - self._state.initial_seconds}:s to "
+                f"{seconds - self._state.initial_seconds}:s"
+            )
+            self._enqueue_event(event._replace(seconds=seconds))
+
+    def _reschedule_measure_relative_events(self):
+        for event_id in tuple(self._measure_relative_event_ids):
+            event = self._cancel(event_id)
+            if event is None:
+                self._measure_relative_event_ids.remove(event_id)
+                continue
+            offset = self._measure_to_offset(event.measure)
+            seconds = self._offset_to_seconds(offset)
+            logger.debug(
+                f"[{self.name}] ... ... ... Rescheduling measure-relative event from "
+                f"offset {event.offset} to {offset}"
+            )
+            self._enqueue_event(event._replace(offset=offset, seconds=seconds))
+
+
+def pending(current_moment, desired_moment, event):
+    pass
+
+
+def measure_jitter(class_, pending_count, duration=2.0, change_period=0.1):
+    """
+    Ticks a metronome every 1/64 beat while changing tempo every
+    ``change_period`` seconds, with ``pending_count`` events waiting far in the
+    future. Returns the metronome's lateness in seconds, per tick.
+    """
+    lateness = []
+
+    def metronome(current_moment, desired_moment, event):
+        lateness.append(time.time() - desired_moment.seconds)
+        return 1 / 64
+
+    clock = class_()
+    for i in range(pending_count):
+        clock.schedule(pending, schedule_at=1000 + i / 64)
+    clock.start()
+    while clock._event_queue.qsize() < pending_count:
+        time.sleep(0.01)
+    clock.schedule(metronome, schedule_at=clock._seconds_to_offset(time.time()))
+    stop_time = time.time() + duration
+    for i in range(int(duration / change_period)):
+        time.sleep(change_period)
+        clock.change(beats_per_minute=120 + 10 * (i % 2))
+    while time.time() < stop_time:
+        time.sleep(0.01)
+    clock.stop()
+    return lateness
+
+
+def main():
+    print(f"{'pending':>8}{'clock':>12}{'ticks':>8}{'mean late':>14}{'max late':>14}")
+    for pending_count in (10000, 100000):
+        for name, class_ in [
+            ("reference", ReferenceTempoClock),
+            ("current", TempoClock),
+        ]:
+            lateness = measure_jitter(class_, pending_count)
+            print(
+                f"{pending_count:>8}"
+                f"{name:>12}"
+                f"{len(lateness):>8}"
+                f"{statistics.mean(lateness) * 1000:>12.2f}ms"
+                f"{max(lateness) * 1000:>12.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
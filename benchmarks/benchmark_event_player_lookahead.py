@@ -0,0 +1,84 @@
+"""
+Benchmark the time pattern playback spends inside clock callbacks.
+
+Plays a ``Ppar`` of ``Pbind`` voices through an offline clock into a server
+which encodes every bundle it is sent, first rendering each bundle inside its
+clock callback, then releasing bundles an ``EventPlayer`` with ``lookahead``
+rendered ahead of the clock::
+
+    python benchmarks/benchmark_event_player_lookahead.py
+"""
+import statistics
+import time
+import types
+
+import supriya.patterns
+from supriya.clock import OfflineTempoClock
+from supriya.realtime import BlockAllocator, NodeIdAllocator
+
+
+class TimedEventPlayer(supriya.patterns.EventPlayer):
+    def __call__(self, current_moment, desired_moment, *args, **kwargs):
+        start_time = time.perf_counter()
+        delta = super().__call__(current_moment, desired_moment, *args, **kwargs)
+        self.callback_times.append(time.perf_counter() - start_time)
+        return delta
+
+
+def make_pattern(voice_count):
+    return supriya.patterns.Ppar(
+        [
+            supriya.patterns.Pbind(
+                amplitude=supriya.patterns.Pwhite(0.1, 0.5),
+                duration=0.125 * (1 + i % 5),
+                frequency=supriya.patterns.Pseq(range(64), 1) * (i + 1),
+            )
+            for i in range(voice_count)
+        ]
+    )
+
+
+def play(pattern, lookahead):
+    server = types.SimpleNamespace(
+        audio_bus_allocator=BlockAllocator(),
+        control_bus_allocator=BlockAllocator(),
+        is_running=True,
+        latency=0.1,
+        node_id_allocator=NodeIdAllocator(),
+        send=lambda x: x.to_datagram(),
+    )
+    clock = OfflineTempoClock()
+    player = TimedEventPlayer(pattern, clock=clock, lookahead=lookahead, server=server)
+    player.callback_times = []
+    player.start()
+    if lookahead is not None:
+        # Let the worker render ahead, as it would while a live clock waits
+        count = -1
+        while count != player.buffered_bundle_count:
+            count = player.buffered_bundle_count
+            time.sleep(0.1)
+    clock.run()
+    return player
+
+
+def main():
+    print(
+        f"{'voices':>8}{'lookahead':>10}{'bundles':>9}"
+        f"{'median':>10}{'p99':>10}{'max':>10}{'underruns':>11}"
+    )
+    for voice_count in (4, 32):
+        pattern = make_pattern(voice_count)
+        for lookahead in (None, 600.0):
+            player = play(pattern, lookahead)
+            times = sorted(player.callback_times)
+            print(
+                f"{voice_count:>8}{str(lookahead):>10}{len(times):>9}"
+                f"{statistics.median(times) * 1e6:>8.0f}us"
+                f"{times[int(len(times) * 0.99)] * 1e6:>8.0f}us"
+                f"{times[-1] * 1e6:>8.0f}us"
+                f"{player.underrun_count:>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark building and querying interval trees.
+
+Compares building a tree by inserting and rebalancing one interval at a time,
+as ``IntervalTreeDriver.update()`` used to, against sorting once and building
+a balanced tree, and then looking up ten thousand offsets one at a time
+against looking them up in one batch, first building the tree's array
+snapshot and then reusing it::
+
+    python benchmarks/benchmark_interval_tree.py
+"""
+import random
+import time
+
+from supriya.intervals import Interval, IntervalTree, IntervalTreeDriver
+from supriya.intervals.IntervalTreeDriver import _CInterval
+
+
+class ReferenceIntervalTreeDriver(IntervalTreeDriver):
+    """
+    The driver as it inserted intervals in bulk before sorting them once.
+    """
+
+    __slots__ = ()
+
+    def update(self, intervals):
+        for interval in intervals:
+            if not self._is_interval(interval):
+                continue
+            cinterval = _CInterval.from_interval(interval)
+            self._insert_interval(cinterval)
+        self._update_indices(self._root_node, -1)
+        self._update_offsets(self._root_node)
+
+
+def make_intervals(interval_count, seed=0):
+    random_ = random.Random(seed)
+    duration = interval_count / 25
+    intervals = []
+    for _ in range(interval_count):
+        start_offset = round(random_.random() * duration, 2)
+        intervals.append(Interval(start_offset, start_offset + 1 + random_.random()))
+    return intervals, duration
+
+
+def main():
+    print(
+        f"{'intervals':>10}{'inserted':>10}{'bulk':>10}"
+        f"{'one by one':>12}{'batched':>10}{'warm':>10}"
+    )
+    for interval_count in (10 ** 4, 10 ** 5, 10 ** 6):
+        intervals, duration = make_intervals(interval_count)
+        start_time = time.perf_counter()
+        ReferenceIntervalTreeDriver(intervals)
+        inserted_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        interval_tree = IntervalTree(intervals, accelerated=False)
+        bulk_time = time.perf_counter() - start_time
+        random_ = random.Random(1)
+        offsets = [random_.random() * duration for _ in range(10 ** 4)]
+        start_time = time.perf_counter()
+        expected = [interval_tree.find_intersection(offset) for offset in offsets]
+        one_by_one_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        actual = interval_tree.find_intersections(offsets)
+        batched_time = time.perf_counter() - start_time
+        assert actual == expected
+        start_time = time.perf_counter()
+        interval_tree.find_intersections(offsets)
+        warm_time = time.perf_counter() - start_time
+        print(
+            f"{interval_count:>10}{inserted_time:>9.2f}s{bulk_time:>9.2f}s"
+            f"{one_by_one_time:>11.2f}s{batched_time:>9.2f}s{warm_time:>9.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
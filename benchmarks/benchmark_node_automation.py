@@ -0,0 +1,105 @@
+"""
+Benchmark writing dense automation to a non-realtime node.
+
+Compares inserting control events out of order into the sorted list nodes
+used to keep, against a ``Timeline``, and then writing a whole automation
+curve one moment at a time against writing it with ``Node.set_curve``::
+
+    python benchmarks/benchmark_node_automation.py
+"""
+import bisect
+import random
+import time
+
+import supriya.nonrealtime
+from supriya.nonrealtime.timelines import Timeline
+
+
+class ReferenceTimeline:
+    """
+    The sorted list of ``(offset, value)`` events nodes kept per control.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def get(self, offset):
+        events = self.events
+        index = bisect.bisect_left(events, (offset,))
+        if len(events) <= index:
+            old_offset, value = events[-1]
+        else:
+            old_offset, value = events[index]
+        if old_offset == offset:
+            return value, old_offset
+        index -= 1
+        if index < 0:
+            return None, None
+        actual_offset, value = events[index]
+        return value, actual_offset
+
+    def set(self, offset, value):
+        events = self.events
+        new_event = (offset, value)
+        if not events:
+            events.append(new_event)
+            return
+        index = bisect.bisect_left(events, new_event)
+        if len(events) <= index:
+            events.append(new_event)
+        old_offset, old_value = events[index]
+        if old_offset == offset:
+            events[index] = (offset, value)
+        else:
+            events.insert(index, new_event)
+
+
+def measure_timeline(timeline_class, offsets):
+    timeline = timeline_class()
+    start_time = time.perf_counter()
+    for offset in offsets:
+        timeline.set(offset, offset)
+    for offset in offsets:
+        timeline.get(offset)
+    return time.perf_counter() - start_time
+
+
+def measure_session(point_count, bulk=False):
+    session = supriya.nonrealtime.Session()
+    with session.at(0):
+        synth = session.add_synth(duration=point_count / 100 + 1)
+    offsets = [i / 100 for i in range(point_count)]
+    values = [440 + i % 100 for i in range(point_count)]
+    start_time = time.perf_counter()
+    if bulk:
+        synth.set_curve("frequency", offsets, values)
+    else:
+        for offset, value in zip(offsets, values):
+            with session.at(offset):
+                synth["frequency"] = value
+    build_time = time.perf_counter() - start_time
+    session.to_lists()
+    return build_time, time.perf_counter() - start_time - build_time
+
+
+def main():
+    print(f"{'events':>8}{'list':>10}{'timeline':>10}")
+    for event_count in (10000, 100000, 400000):
+        offsets = [i / 100 for i in range(event_count)]
+        random.Random(0).shuffle(offsets)
+        reference_time = measure_timeline(ReferenceTimeline, offsets)
+        timeline_time = measure_timeline(Timeline, offsets)
+        print(f"{event_count:>8}{reference_time:>9.2f}s{timeline_time:>9.2f}s")
+    print()
+    print(f"{'points':>8}{'moments':>10}{'set_curve':>11}{'compile':>10}")
+    for point_count in (2000, 8000, 32000):
+        moment_time, _ = measure_session(point_count)
+        curve_time, compile_time = measure_session(point_count, bulk=True)
+        print(
+            f"{point_count:>8}{moment_time:>9.2f}s{curve_time:>10.2f}s"
+            f"{compile_time:>9.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
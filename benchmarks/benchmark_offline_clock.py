@@ -0,0 +1,54 @@
+"""
+Benchmark running a tempo clock offline.
+
+Runs an hour of callbacks through an ``OfflineTempoClock``, first with
+callbacks that only reschedule themselves and then with callbacks adding a
+synth to a non-realtime provider each time, and reports how many callbacks
+the clock performs per second of real time::
+
+    python benchmarks/benchmark_offline_clock.py
+"""
+import time
+
+from supriya.clock import OfflineTempoClock
+from supriya.provider import Provider
+
+
+def measure(callback_count, delta, provider=None):
+    def procedure(current_moment, desired_moment, event):
+        if provider is not None:
+            with provider.at(desired_moment.seconds):
+                provider.add_synth(duration=delta, frequency=440)
+        return delta
+
+    clock = OfflineTempoClock()
+    for _ in range(callback_count):
+        clock.cue(procedure)
+    clock.start()
+    start_time = time.perf_counter()
+    clock.run(until=3600)
+    return clock.event_count, time.perf_counter() - start_time, clock.events_per_second
+
+
+def main():
+    print(
+        f"{'callbacks':>10}{'provider':>10}{'events':>10}{'time':>10}{'events/s':>12}"
+    )
+    for callback_count, delta, provider in (
+        (1, 1.0, None),
+        (8, 1.0, None),
+        (8, 0.125, None),
+        (1, 1.0, Provider.nonrealtime()),
+        (8, 1.0, Provider.nonrealtime()),
+    ):
+        event_count, run_time, events_per_second = measure(
+            callback_count, delta, provider
+        )
+        print(
+            f"{callback_count:>10}{provider is not None!s:>10}{event_count:>10}"
+            f"{run_time:>9.2f}s{events_per_second:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
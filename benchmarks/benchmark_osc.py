@@ -0,0 +1,206 @@
+"""
+Benchmark OSC encoding and decoding.
+
+Compares ``OscMessage`` against the previous concatenate-and-slice codec, kept
+here verbatim as ``ReferenceCodec``::
+
+    python benchmarks/benchmark_osc.py
+"""
+import collections
+import enum
+import struct
+import timeit
+
+from supriya.osc import OscBundle, OscMessage
+
+
+class ReferenceCodec:
+    @staticmethod
+    def _decode_blob(data):
+        actual_length, remainder = struct.unpack(">I", data[:4])[0], data[4:]
+        padded_length = actual_length
+        if actual_length % 4 != 0:
+            padded_length = (actual_length // 4 + 1) * 4
+        return remainder[:padded_length][:actual_length], remainder[padded_length:]
+
+    @staticmethod
+    def _decode_string(data):
+        actual_length = data.index(b"\x00")
+        padded_length = (actual_length // 4 + 1) * 4
+        return str(data[:actual_length], "ascii"), data[padded_length:]
+
+    @staticmethod
+    def _encode_string(value):
+        result = bytes(value + "\x00", "ascii")
+        if len(result) % 4 != 0:
+            width = (len(result) // 4 + 1) * 4
+            result = result.ljust(width, b"\x00")
+        return result
+
+    @staticmethod
+    def _encode_blob(value):
+        result = bytes(struct.pack(">I", len(value)) + value)
+        if len(result) % 4 != 0:
+            width = (len(result) // 4 + 1) * 4
+            result = result.ljust(width, b"\x00")
+        return result
+
+    @classmethod
+    def _encode_value(cls, value):
+        if hasattr(value, "to_datagram"):
+            value = bytearray(value.to_datagram())
+        elif isinstance(value, enum.Enum):
+            value = value.value
+        type_tags, encoded_value = "", b""
+        if isinstance(value, (bytearray, bytes)):
+            type_tags += "b"
+            encoded_value = cls._encode_blob(value)
+        elif isinstance(value, str):
+            type_tags += "s"
+            encoded_value = cls._encode_string(value)
+        elif isinstance(value, bool):
+            type_tags += "T" if value else "F"
+        elif isinstance(value, float):
+            type_tags += "f"
+            encoded_value += struct.pack(">f", value)
+        elif isinstance(value, int):
+            type_tags += "i"
+            encoded_value += struct.pack(">i", value)
+        elif value is None:
+            type_tags += "N"
+        elif isinstance(value, collections.Sequence):
+            type_tags += "["
+            for sub_value in value:
+                sub_type_tags, sub_encoded_value = cls._encode_value(sub_value)
+                type_tags += sub_type_tags
+                encoded_value += sub_encoded_value
+            type_tags += "]"
+        else:
+            message = "Cannot encode {!r}".format(value)
+            raise TypeError(message)
+        return type_tags, encoded_value
+
+    @classmethod
+    def to_datagram(cls, self):
+        # address can be a string or (in SuperCollider) an int
+        if isinstance(self.address, str):
+            encoded_address = cls._encode_string(self.address)
+        else:
+            encoded_address = struct.pack(">i", self.address)
+        encoded_type_tags = ","
+        encoded_contents = b""
+        for value in self.contents or ():
+            type_tags, encoded_value = cls._encode_value(value)
+            encoded_type_tags += type_tags
+            encoded_contents += encoded_value
+        return (
+            encoded_address + cls._encode_string(encoded_type_tags) + encoded_contents
+        )
+
+    @classmethod
+    def from_datagram(cls, datagram):
+        remainder = datagram
+        address, remainder = cls._decode_string(remainder)
+        type_tags, remainder = cls._decode_string(remainder)
+        contents = []
+        array_stack = [contents]
+        for type_tag in type_tags[1:]:
+            if type_tag == "i":
+                value, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
+                array_stack[-1].append(value)
+            elif type_tag == "f":
+                value, remainder = struct.unpack(">f", remainder[:4])[0], remainder[4:]
+                array_stack[-1].append(value)
+            elif type_tag == "d":
+                value, remainder = struct.unpack(">d", remainder[:8])[0], remainder[8:]
+                array_stack[-1].append(value)
+            elif type_tag == "s":
+                value, remainder = cls._decode_string(remainder)
+                array_stack[-1].append(value)
+            elif type_tag == "b":
+                value, remainder = cls._decode_blob(remainder)
+                for class_ in (OscBundle, OscMessage):
+                    try:
+                        value = class_.from_datagram(value)
+                        break
+                    except Exception:
+                        pass
+                array_stack[-1].append(value)
+            elif type_tag == "T":
+                array_stack[-1].append(True)
+            elif type_tag == "F":
+                array_stack[-1].append(False)
+            elif type_tag == "N":
+                array_stack[-1].append(None)
+            elif type_tag == "[":
+                array = []
+                array_stack[-1].append(array)
+                array_stack.append(array)
+            elif type_tag == "]":
+                array_stack.pop()
+            else:
+                raise RuntimeError(f"Unable to parse type {type_tag!r}")
+        return OscMessage(address, *contents)
+
+
+def measure(callable_, number):
+    return min(timeit.repeat(callable_, number=number, repeat=5)) / number
+
+
+def main():
+    messages = {
+        "/n_set (4 pairs)": OscMessage(
+            "/n_set", 1000, "amplitude", 0.5, "frequency", 440.0, "gate", 1, "pan", 0.0
+        ),
+        "/b_setn (64 floats)": OscMessage(
+            "/b_setn", 1, 0, 64, *(float(i) / 64 for i in range(64))
+        ),
+        "/b_setn (1024 floats)": OscMessage(
+            "/b_setn", 1, 0, 1024, *(float(i) / 1024 for i in range(1024))
+        ),
+    }
+    print(
+        f"{'message':<24}{'operation':<12}"
+        f"{'reference':>12}{'current':>12}{'speedup':>10}"
+    )
+    for name, message in messages.items():
+        datagram = message.to_datagram()
+        assert datagram == ReferenceCodec.to_datagram(message)
+        assert OscMessage.from_datagram(datagram) == ReferenceCodec.from_datagram(
+            datagram
+        )
+        number = 20000 // len(message.contents)
+        for operation, reference, current in [
+            (
+                "encode",
+                lambda: ReferenceCodec.to_datagram(message),
+                lambda: message.to_datagram(),
+            ),
+            (
+                "decode",
+                lambda: ReferenceCodec.from_datagram(datagram),
+                lambda: OscMessage.from_datagram(datagram),
+            ),
+        ]:
+            reference_time = measure(reference, number)
+            current_time = measure(current, number)
+            print(
+                f"{name:<24}{operation:<12}"
+                f"{reference_time * 1e6:>10.1f}us{current_time * 1e6:>10.1f}us"
+                f"{reference_time / current_time:>9.1f}x"
+            )
+    bundle = OscBundle(timestamp=0.0, contents=list(messages.values()) * 4)
+    datagram = bundle.to_datagram()
+    for operation, callable_ in [
+        ("encode", lambda: bundle.to_datagram()),
+        ("decode", lambda: OscBundle.from_datagram(datagram)),
+    ]:
+        current_time = measure(callable_, 20)
+        print(
+            f"{'bundle (12 messages)':<24}{operation:<12}{'':>12}"
+            f"{current_time * 1e6:>10.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark OSC callback dispatch with many registered callbacks.
+
+Compares ``OscProtocol`` against the previous nested-dict trie, kept here
+verbatim as ``ReferenceOscProtocol``::
+
+    python benchmarks/benchmark_osc_dispatch.py
+"""
+import random
+import time
+
+from supriya.osc import AsyncOscProtocol, OscCallback, OscMessage
+
+
+class ReferenceOscProtocol(AsyncOscProtocol):
+    def unregister(self, callback: OscCallback):
+        self._remove_callback(callback)
+
+    def _add_callback(self, callback: OscCallback):
+        patterns = [callback.pattern]
+        if callback.failure_pattern:
+            patterns.append(callback.failure_pattern)
+        for pattern in patterns:
+            callback_map = self.callbacks
+            for item in pattern:
+                callbacks, callback_map = callback_map.setdefault(item, ([], {}))
+            callbacks.append(callback)
+
+    def _match_callbacks(self, message):
+        items = (message.address,) + message.contents
+        matching_callbacks = []
+        callback_map = self.callbacks
+        for item in items:
+            if item not in callback_map:
+                break
+            callbacks, callback_map = callback_map[item]
+            matching_callbacks.extend(callbacks)
+        for callback in matching_callbacks:
+            if callback.once:
+                self.unregister(callback)
+        return matching_callbacks
+
+    def _remove_callback(self, callback: OscCallback):
+        def delete(pattern, original_callback_map):
+            key = pattern.pop(0)
+            if key not in original_callback_map:
+                return
+            callbacks, callback_map = original_callback_map[key]
+            if pattern:
+                delete(pattern, callback_map)
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks and not callback_map:
+                original_callback_map.pop(key)
+
+        patterns = [callback.pattern]
+        if callback.failure_pattern:
+            patterns.append(callback.failure_pattern)
+        for pattern in patterns:
+            delete(list(pattern), self.callbacks)
+
+
+class PendingRequest:
+    def set_response(self, message):
+        pass
+
+
+def populate(protocol, callback_count):
+    def procedure(message):
+        pass
+
+    callbacks = []
+    for i in range(callback_count // 4):
+        # per-node listeners, e.g. node watchers and trigger handlers
+        node_id = 1000 + i
+        for pattern in [("/n_go", node_id), ("/n_end", node_id), ("/tr", node_id, 0)]:
+            callbacks.append(protocol.register(pattern=pattern, procedure=procedure))
+        # pending requests sharing one response pattern
+        callbacks.append(
+            protocol.register(
+                pattern=("/done", "/b_alloc"),
+                failure_pattern=("/fail", "/b_alloc"),
+                procedure=PendingRequest().set_response,
+            )
+        )
+    for pattern in ["/n_go", "/n_end", "/n_set", "/status.reply", "/fail"]:
+        callbacks.append(protocol.register(pattern=pattern, procedure=procedure))
+    return callbacks
+
+
+def main(callback_count=10000, message_count=100000):
+    messages = []
+    for i in range(message_count // 4):
+        node_id = 1000 + (i * 7919) % (callback_count // 2)
+        messages.extend(
+            [
+                OscMessage("/n_go", node_id, 1, -1, -1, 0),
+                OscMessage("/n_end", node_id, 1, -1, -1, 0),
+                OscMessage("/tr", node_id, 0, 0.5),
+                OscMessage("/reply", node_id, 1, 0.25, 0.5),
+            ]
+        )
+    print(f"{'implementation':<16}{'register':>14}{'dispatch':>14}{'unregister':>14}")
+    for name, class_ in [
+        ("reference", ReferenceOscProtocol),
+        ("current", AsyncOscProtocol),
+    ]:
+        protocol = class_()
+        start_time = time.perf_counter()
+        callbacks = populate(protocol, callback_count)
+        register_time = time.perf_counter() - start_time
+        match_callbacks = protocol._match_callbacks
+        dispatch_time = float("inf")
+        for _ in range(5):
+            start_time = time.perf_counter()
+            for message in messages:
+                match_callbacks(message)
+            dispatch_time = min(dispatch_time, time.perf_counter() - start_time)
+        # responses rarely arrive in the order their requests were issued
+        random.Random(0).shuffle(callbacks)
+        start_time = time.perf_counter()
+        for callback in callbacks:
+            protocol.unregister(callback)
+        unregister_time = time.perf_counter() - start_time
+        print(
+            f"{name:<16}"
+            f"{len(callbacks) / register_time:>10.0f}/sec"
+            f"{len(messages) / dispatch_time:>10.0f}/sec"
+            f"{len(callbacks) / unregister_time:>10.0f}/sec"
+        )
+
+
+if __name__ == "__main__":
+    main()
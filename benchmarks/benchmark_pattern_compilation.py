@@ -0,0 +1,57 @@
+"""
+Benchmark evaluating compiled event patterns against iterating them.
+
+Generates a seeded ``Pbind`` of sequences, random values and arithmetic,
+first by iterating the pattern, then by iterating its ``CompiledPattern``,
+and then as columns from ``CompiledPattern.iterate_chunks()``::
+
+    python benchmarks/benchmark_pattern_compilation.py
+"""
+import time
+
+import supriya.patterns
+
+
+def make_pattern(event_count):
+    return supriya.patterns.Pseed(
+        supriya.patterns.Pbind(
+            amplitude=supriya.patterns.Pwhite(0.1, 0.5, repetitions=event_count),
+            duration=supriya.patterns.Prand([0.125, 0.25, 0.5], None),
+            frequency=supriya.patterns.Pseq([0, 3, 7, 12], None) * 110 + 220,
+            pan=supriya.patterns.Pwhite(-1.0, 1.0),
+        )
+    )
+
+
+def measure(iterable):
+    start_time = time.perf_counter()
+    count = 0
+    for _ in iterable:
+        count += 1
+    return count / (time.perf_counter() - start_time)
+
+
+def measure_chunks(compiled_pattern):
+    start_time = time.perf_counter()
+    count = 0
+    for chunk in compiled_pattern.iterate_chunks():
+        count += len(chunk["synthdef"])
+    return count / (time.perf_counter() - start_time)
+
+
+def main():
+    print(f"{'events':>8}{'iterated':>12}{'compiled':>12}{'columns':>12}")
+    for event_count in (10 ** 4, 10 ** 5):
+        pattern = make_pattern(event_count)
+        compiled_pattern = supriya.patterns.CompiledPattern(pattern)
+        iterated_rate = measure(pattern)
+        compiled_rate = measure(compiled_pattern)
+        columns_rate = measure_chunks(compiled_pattern)
+        print(
+            f"{event_count:>8}{iterated_rate:>12.0f}{compiled_rate:>12.0f}"
+            f"{columns_rate:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark evaluating random number generator resolution in patterns.
+
+Iterates unseeded and seeded random patterns with generators resolved through
+a context variable, against patterns resolving them by walking the interpreter
+stack, and then draws seeded numbers one at a time against drawing them in
+blocks with ``RandomNumberGenerator.iterate_blocks()``::
+
+    python benchmarks/benchmark_pattern_rng.py
+"""
+import inspect
+import itertools
+import time
+
+import supriya.patterns
+
+
+def get_rng(cls):
+    # Resolution as it was: walk up the stack looking for a running Pseed
+    identifier = None
+    try:
+        frame = inspect.currentframe()
+        while frame is not None:
+            if (
+                frame.f_code.co_filename == ReferencePseed._file_path
+                and frame.f_code.co_name == "_iterate"
+            ):
+                identifier = id(frame)
+                break
+            frame = frame.f_back
+    finally:
+        del frame
+    if identifier in ReferencePseed._rngs:
+        return ReferencePseed._rngs[identifier]
+    return supriya.patterns.RandomNumberGenerator.get_stdlib_rng()
+
+
+class ReferencePwhite(supriya.patterns.Pwhite):
+
+    _get_rng = classmethod(get_rng)
+
+
+class ReferencePrand(supriya.patterns.Prand):
+
+    _get_rng = classmethod(get_rng)
+
+
+class ReferencePseed(supriya.patterns.Pseed):
+
+    _file_path = __file__
+
+    _rngs: dict = {}
+
+    def _iterate(self, state=None):
+        try:
+            identifier = id(inspect.currentframe())
+            rng = iter(supriya.patterns.RandomNumberGenerator(seed=self.seed))
+            self._rngs[identifier] = rng
+            yield from self._pattern
+        finally:
+            del self._rngs[identifier]
+
+
+def make_pattern(event_count, pwhite_class, prand_class, pseed_class=None):
+    pattern = supriya.patterns.Pn(
+        supriya.patterns.Pbind(
+            amplitude=pwhite_class(0.1, 0.5, repetitions=4),
+            duration=prand_class([0.125, 0.25, 0.5], None),
+            pan=pwhite_class(-1.0, 1.0),
+        ),
+        event_count // 4,
+    )
+    if pseed_class is not None:
+        pattern = pseed_class(pattern)
+    return pattern
+
+
+def measure(iterable):
+    start_time = time.perf_counter()
+    count = 0
+    for _ in iterable:
+        count += 1
+    return count / (time.perf_counter() - start_time)
+
+
+def main():
+    print(f"{'events':>8}{'seeded':>8}{'reference':>12}{'context':>12}")
+    for event_count in (10 ** 4, 10 ** 5):
+        for seeded in (False, True):
+            reference_pattern = make_pattern(
+                event_count,
+                ReferencePwhite,
+                ReferencePrand,
+                ReferencePseed if seeded else None,
+            )
+            pattern = make_pattern(
+                event_count,
+                supriya.patterns.Pwhite,
+                supriya.patterns.Prand,
+                supriya.patterns.Pseed if seeded else None,
+            )
+            reference_rate = measure(reference_pattern)
+            rate = measure(pattern)
+            print(
+                f"{event_count:>8}{str(seeded):>8}"
+                f"{reference_rate:>12.0f}{rate:>12.0f}"
+            )
+    print()
+    print(f"{'numbers':>8}{'iterated':>12}{'blocks':>12}")
+    for number_count in (10 ** 5, 10 ** 6):
+        rng = supriya.patterns.RandomNumberGenerator(seed=1)
+        iterated_rate = measure(itertools.islice(rng, number_count))
+        blocks = itertools.chain.from_iterable(x.tolist() for x in rng.iterate_blocks())
+        blocks_rate = measure(itertools.islice(blocks, number_count))
+        print(f"{number_count:>8}{iterated_rate:>12.0f}{blocks_rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark merging parallel event patterns.
+
+Iterates a ``Ppar`` of 8, 64 and 512 child patterns, first merging them
+through thread-safe ``queue.PriorityQueue`` instances, then through the
+``heapq`` lists ``Ppar`` merges them with::
+
+    python benchmarks/benchmark_ppar.py
+"""
+import time
+from queue import PriorityQueue
+
+import supriya.patterns
+
+
+class ReferencePpar(supriya.patterns.Ppar):
+    def _iterate(self, state=None):
+        while True:
+            if not state["iterator_queue"].empty():
+                self._prime_queues(state)
+            elif state["event_queue"].empty():
+                return
+            if state["event_queue"].qsize() > 1:
+                event_tuple_a = self._fetch_event_tuple_a(state)
+                if not event_tuple_a:
+                    continue
+                event_tuple_b = self._fetch_event_tuple_b(state)
+                event = self._pre_process_event(event_tuple_a, event_tuple_b)
+                state["should_stop"] = yield event
+                self._post_process_event(event, event_tuple_a, event_tuple_b, state)
+            elif state["event_queue"].qsize() == 1 and state["iterator_queue"].empty():
+                yield self._process_final_event(state)
+
+    def _fetch_event_tuple_a(self, state):
+        event_tuple_a = state["event_queue"].get()
+        if (
+            state["has_stopped"]
+            and event_tuple_a.iterator_index not in state["visited_iterators"]
+        ):
+            return
+        return event_tuple_a
+
+    def _fetch_event_tuple_b(self, state):
+        return state["event_queue"].get()
+
+    def _post_process_event(self, event, event_tuple_a, event_tuple_b, state):
+        state["event_queue"].put(event_tuple_b)
+        if not state["should_stop"]:
+            state["visited_iterators"].add(event_tuple_a.iterator_index)
+            return
+        raise NotImplementedError
+
+    def _process_final_event(self, state):
+        event_tuple = state["event_queue"].get()
+        state["visited_iterators"].add(event_tuple.iterator_index)
+        return event_tuple.event
+
+    def _prime_queues(self, state):
+        iterator_tuple = state["iterator_queue"].get()
+        iterator = iterator_tuple.iterator
+        try:
+            event = iterator.send(state["should_stop"])
+        except TypeError:
+            try:
+                event = next(iterator)
+            except StopIteration:
+                return
+        except StopIteration:
+            return
+        event_index = state["event_counter"][iterator]
+        event = self._apply_iterator_recursively(event, iterator)
+        event_tuple = self._EventTuple(
+            offset=iterator_tuple.offset,
+            iterator_index=iterator_tuple.index,
+            event_index=event_index,
+            event=event,
+        )
+        state["event_queue"].put(event_tuple)
+        state["event_counter"][iterator] += 1
+        state["iterator_queue"].put(
+            iterator_tuple._replace(offset=float(iterator_tuple.offset + event.delta))
+        )
+
+    def _setup_state(self):
+        state = super()._setup_state()
+        iterator_queue = PriorityQueue()
+        for iterator_tuple in state["iterator_queue"]:
+            iterator_queue.put(iterator_tuple)
+        state.update(event_queue=PriorityQueue(), iterator_queue=iterator_queue)
+        return state
+
+
+def make_patterns(voice_count, event_count):
+    return [
+        supriya.patterns.Pbind(
+            duration=0.125 * (1 + i % 7),
+            frequency=supriya.patterns.Pseq(range(event_count // voice_count), 1),
+        )
+        for i in range(voice_count)
+    ]
+
+
+def measure(pattern):
+    start_time = time.perf_counter()
+    events = list(pattern)
+    return events, time.perf_counter() - start_time
+
+
+def summarize(events):
+    return [(x.delta, x["frequency"]) for x in events]
+
+
+def main():
+    event_count = 16384
+    print(f"{'voices':>8}{'events':>8}{'reference':>12}{'heapq':>12}")
+    for voice_count in (8, 64, 512):
+        patterns = make_patterns(voice_count, event_count)
+        reference_events, reference_time = measure(ReferencePpar(patterns))
+        events, heapq_time = measure(supriya.patterns.Ppar(patterns))
+        assert summarize(events) == summarize(reference_events)
+        print(
+            f"{voice_count:>8}{event_count:>8}"
+            f"{reference_time:>11.3f}s{heapq_time:>11.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark finding an unchanged session's cached output.
+
+Compares naming a session's output by hashing its whole score, as a renderer
+without a render cache must, against looking its fingerprint up in a warm
+``RenderCache``::
+
+    python benchmarks/benchmark_render_cache.py
+"""
+import pathlib
+import tempfile
+import time
+
+from benchmark_session_memory import build_session
+
+import supriya.nonrealtime
+
+
+def measure(session, directory_path, render_cache=None):
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session, render_directory_path=directory_path, render_cache=render_cache
+    )
+    start_time = time.perf_counter()
+    renderer._collect_prerender_tuples(session)
+    elapsed_time = time.perf_counter() - start_time
+    return renderer.renderable_prefixes[session], elapsed_time
+
+
+def main():
+    print(f"{'events':>8}{'hashed':>10}{'cached':>10}")
+    for event_count in (1000, 4000):
+        with tempfile.TemporaryDirectory() as directory_path:
+            directory_path = pathlib.Path(directory_path)
+            cache = supriya.nonrealtime.RenderCache(directory_path / "cache")
+            prefix, hashed_time = measure(build_session(event_count), directory_path)
+            output_file_path = directory_path / prefix.with_suffix(".aiff")
+            output_file_path.write_bytes(b"")
+            measure(build_session(event_count), directory_path, cache)
+            cache.store(output_file_path.name, output_file_path)
+            cached_prefix, cached_time = measure(
+                build_session(event_count), directory_path, cache
+            )
+            assert cached_prefix == prefix
+        print(f"{event_count:>8}{hashed_time:>9.2f}s{cached_time:>9.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark rendering a session built from many independent stems.
+
+Renders a session cueing a number of stem sessions, serially and with
+increasingly many workers. A stand-in for ``scsynth`` takes a fixed time per
+render, as a real render would given a core of its own::
+
+    python benchmarks/benchmark_render_concurrency.py
+"""
+import pathlib
+import sys
+import tempfile
+import time
+
+import supriya.nonrealtime
+
+fake_scsynth = """#!{executable}
+import pathlib, sys, time
+time.sleep({seconds})
+pathlib.Path(sys.argv[4]).write_bytes(b"")
+"""
+
+
+def build_session(stem_count):
+    session = supriya.nonrealtime.Session()
+    with session.at(0):
+        for i in range(stem_count):
+            stem = supriya.nonrealtime.Session()
+            with stem.at(0):
+                stem.add_synth(duration=i + 1)
+            session.cue_soundfile(stem, duration=stem_count + 1)
+    return session
+
+
+def measure(stem_count, maximum_workers, seconds=0.5):
+    with tempfile.TemporaryDirectory() as directory_path:
+        directory_path = pathlib.Path(directory_path)
+        scsynth_path = directory_path / "scsynth"
+        scsynth_path.write_text(
+            fake_scsynth.format(executable=sys.executable, seconds=seconds)
+        )
+        scsynth_path.chmod(0o755)
+        start_time = time.perf_counter()
+        build_session(stem_count).render(
+            render_directory_path=directory_path,
+            scsynth_path=scsynth_path,
+            maximum_workers=maximum_workers,
+        )
+        return time.perf_counter() - start_time
+
+
+def main():
+    stem_count = 16
+    print(f"{'stems':>8}{'workers':>10}{'time':>10}")
+    for maximum_workers in (None, 2, 4, 8, 16):
+        elapsed_time = measure(stem_count, maximum_workers)
+        print(f"{stem_count:>8}{str(maximum_workers or 1):>10}{elapsed_time:>9.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark rendering one long session in segments.
+
+Renders a long session whole, and then in increasingly many segments, each
+pre-rolled for a second and rendered on a worker of its own. A stand-in for
+``scsynth`` takes time in proportion to the score it renders, as a real render
+would given a core of its own::
+
+    python benchmarks/benchmark_render_segments.py
+"""
+import pathlib
+import sys
+import tempfile
+import time
+
+from benchmark_session_memory import build_session
+
+fake_scsynth = """#!{executable}
+import struct, sys, time
+arguments = sys.argv[1:]
+osc_path, output_path, sample_rate = arguments[1], arguments[3], arguments[4]
+channel_count = 8
+if "-o" in arguments:
+    channel_count = int(arguments[arguments.index("-o") + 1])
+data, offset, timestamp = open(osc_path, "rb").read(), 0, 0.0
+while offset < len(data):
+    size = struct.unpack_from(">i", data, offset)[0]
+    timestamp = struct.unpack_from(">Q", data, offset + 12)[0] / 2 ** 32
+    offset += 4 + size
+time.sleep(timestamp * {seconds_per_second})
+size = int(round(timestamp * int(sample_rate))) * channel_count * 4
+with open(output_path, "wb") as file_pointer:
+    file_pointer.write(struct.pack(
+        "<4sI4s4sIHHIIHH4sI", b"RIFF", 36 + size, b"WAVE",
+        b"fmt ", 16, 3, channel_count, int(sample_rate),
+        int(sample_rate) * channel_count * 4, channel_count * 4, 32,
+        b"data", size,
+    ))
+    file_pointer.write(bytes(size))
+"""
+
+
+def measure(session, segment_count, seconds_per_second=0.2):
+    with tempfile.TemporaryDirectory() as directory_path:
+        directory_path = pathlib.Path(directory_path)
+        scsynth_path = directory_path / "scsynth"
+        scsynth_path.write_text(
+            fake_scsynth.format(
+                executable=sys.executable, seconds_per_second=seconds_per_second
+            )
+        )
+        scsynth_path.chmod(0o755)
+        segment_offsets = [
+            session.duration * i / segment_count for i in range(1, segment_count)
+        ]
+        start_time = time.perf_counter()
+        session.render(
+            header_format="wav",
+            render_directory_path=directory_path,
+            sample_format="float",
+            sample_rate=8000,
+            scsynth_path=scsynth_path,
+            maximum_workers=segment_count,
+            segment_offsets=segment_offsets,
+        )
+        return time.perf_counter() - start_time
+
+
+def main():
+    session = build_session(1000)
+    print(f"{'duration':>10}{'segments':>10}{'time':>10}")
+    for segment_count in (1, 2, 4, 8, 16):
+        elapsed_time = measure(session, segment_count)
+        print(f"{session.duration:>9.0f}s{segment_count:>10}{elapsed_time:>9.2f}s")
+
+
+if __name__ == "__main__":
+    main()
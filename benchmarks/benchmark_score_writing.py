@@ -0,0 +1,115 @@
+"""
+Benchmark the peak memory of writing a non-realtime session's score file.
+
+Compares ``SessionRenderer``'s streaming score writer against the previous
+pipeline, kept here verbatim as ``ReferenceSessionRenderer``, which built
+every OSC bundle and then the whole datagram in memory before writing::
+
+    python benchmarks/benchmark_score_writing.py
+"""
+import hashlib
+import pathlib
+import struct
+import tempfile
+import time
+import tracemalloc
+
+from benchmark_session_memory import build_session
+
+from supriya.nonrealtime import SessionRenderer
+
+
+class ReferenceSessionRenderer(SessionRenderer):
+    def _build_datagram(self, osc_bundles):
+        datagrams = []
+        for osc_bundle in osc_bundles:
+            datagram = osc_bundle.to_datagram(realtime=False)
+            size = len(datagram)
+            size = struct.pack(">i", size)
+            datagrams.append(size)
+            datagrams.append(datagram)
+        datagram = b"".join(datagrams)
+        return datagram
+
+    def _build_file_path(self, datagram, input_file_path, session):
+        md5 = hashlib.md5()
+        md5.update(datagram)
+        hash_values = []
+        if input_file_path is not None:
+            hash_values.append(input_file_path)
+        for value in (
+            session.options.input_bus_channel_count,
+            session.options.output_bus_channel_count,
+            self.sample_rate,
+            self.header_format,
+            self.sample_format,
+        ):
+            hash_values.append(value)
+        for value in hash_values:
+            if not isinstance(value, str):
+                value = str(value)
+            value = value.encode()
+            md5.update(value)
+        md5 = md5.hexdigest()
+        file_path = "session-{}.osc".format(md5)
+        return pathlib.Path(file_path)
+
+    def write_score(self, session):
+        non_xrefd_bundles = [
+            request_bundle.to_osc()
+            for request_bundle in session._to_non_xrefd_request_bundles()
+        ]
+        osc_bundles = list(self._build_xrefd_bundles(non_xrefd_bundles))
+        datagram = self._build_datagram(osc_bundles)
+        file_path = self.render_directory_path / self._build_file_path(
+            datagram, None, session
+        )
+        self._write(file_path, datagram, mode="b")
+        return file_path
+
+
+class CurrentSessionRenderer(SessionRenderer):
+    def write_score(self, session):
+        self._collect_prerender_tuples(session, write=True)
+        self._write_prerender_tuple(self.prerender_tuples[-1])
+        return self.render_directory_path / self.renderable_prefixes[
+            session
+        ].with_suffix(".osc")
+
+
+def measure(class_, session, directory_path):
+    renderer = class_(session, render_directory_path=directory_path)
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    file_path = renderer.write_score(session)
+    elapsed_time = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return file_path, peak, elapsed_time
+
+
+def main():
+    print(f"{'events':>8}{'score':>10}{'writer':>12}{'peak':>12}{'time':>10}")
+    for event_count in (1000, 4000):
+        session = build_session(event_count)
+        session._to_non_xrefd_request_bundles()
+        contents = []
+        for name, class_ in [
+            ("reference", ReferenceSessionRenderer),
+            ("current", CurrentSessionRenderer),
+        ]:
+            with tempfile.TemporaryDirectory() as directory_path:
+                file_path, peak, elapsed_time = measure(class_, session, directory_path)
+                contents.append((file_path.name, file_path.read_bytes()))
+            print(
+                f"{event_count:>8}"
+                f"{len(contents[-1][1]) / 2 ** 20:>8.1f}MB"
+                f"{name:>12}"
+                f"{peak / 2 ** 20:>10.1f}MB"
+                f"{elapsed_time:>9.2f}s"
+            )
+        assert contents[0] == contents[1]
+
+
+if __name__ == "__main__":
+    main()
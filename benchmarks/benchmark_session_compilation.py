@@ -0,0 +1,53 @@
+"""
+Benchmark recompiling a non-realtime session after small edits.
+
+Compiles a long score once, then tweaks one synth's control, adds one synth,
+and recompiles after each, comparing incremental recompilation against
+compiling from scratch::
+
+    python benchmarks/benchmark_session_compilation.py
+"""
+import time
+
+from benchmark_session_memory import build_session
+
+
+def compile_session(session, from_scratch):
+    if from_scratch:
+        session._compiled_offsets.clear()
+    start_time = time.perf_counter()
+    request_bundles = session._to_non_xrefd_request_bundles()
+    return request_bundles, time.perf_counter() - start_time
+
+
+def main():
+    print(f"{'events':>8}{'offsets':>10}{'edit':>10}{'scratch':>12}{'incremental':>14}")
+    for event_count in (1000, 4000):
+        session = build_session(event_count, incremental=True)
+        compile_session(session, from_scratch=True)
+        synths = sorted(session.nodes, key=lambda x: x.start_offset)
+        synth = synths[len(synths) // 2]
+        edits = [
+            ("none", lambda: None),
+            ("n_set", lambda: synth.__setitem__("amplitude", 0.5)),
+            ("s_new", lambda: session.add_synth(duration=2)),
+        ]
+        for name, edit in edits:
+            with session.at(synth.start_offset):
+                edit()
+            incremental, incremental_time = compile_session(session, False)
+            from_scratch, from_scratch_time = compile_session(session, True)
+            assert [x.to_osc() for x in incremental] == [
+                x.to_osc() for x in from_scratch
+            ]
+            print(
+                f"{event_count:>8}"
+                f"{len(session.offsets):>10}"
+                f"{name:>10}"
+                f"{from_scratch_time:>11.3f}s"
+                f"{incremental_time:>13.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark the memory held by a non-realtime session's node-tree snapshots.
+
+Builds long scores of overlapping synths, then measures the memory allocated
+while building them, with the states' node trees held either as persistent
+mappings or, as previously, as full dict copies::
+
+    python benchmarks/benchmark_session_memory.py
+"""
+import gc
+import random
+import time
+import tracemalloc
+
+import supriya.nonrealtime.sessions
+import supriya.nonrealtime.states
+from supriya.nonrealtime.mappings import PersistentMapping
+
+
+def build_session(event_count, seed=0, **kwargs):
+    """
+    Spreads ``event_count`` synths, a few seconds long each, over a score
+    roughly one second per 25 events long, across a handful of groups.
+    """
+    random_ = random.Random(seed)
+    duration = event_count / 25
+    session = supriya.nonrealtime.Session(**kwargs)
+    with session.at(0):
+        groups = [session.add_group(duration=duration + 10) for _ in range(8)]
+    for _ in range(event_count):
+        offset = round(random_.random() * duration, 2)
+        with session.at(offset):
+            random_.choice(groups).add_synth(duration=1 + random_.random() * 4)
+    return session
+
+
+def measure(mapping_class, event_count):
+    for module in (supriya.nonrealtime.sessions, supriya.nonrealtime.states):
+        module.PersistentMapping = mapping_class
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    session = build_session(event_count)
+    elapsed_time = time.perf_counter() - start_time
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return session, size, elapsed_time
+
+
+def main():
+    print(f"{'events':>8}{'offsets':>10}{'mapping':>22}{'memory':>12}{'build':>10}")
+    for event_count in (1000, 2000, 4000):
+        outputs = []
+        for mapping_class in (dict, PersistentMapping):
+            session, size, elapsed_time = measure(mapping_class, event_count)
+            outputs.append(session.to_lists())
+            print(
+                f"{event_count:>8}"
+                f"{len(session.offsets):>10}"
+                f"{mapping_class.__name__:>22}"
+                f"{size / 2 ** 20:>10.1f}MB"
+                f"{elapsed_time:>9.2f}s"
+            )
+        assert outputs[0] == outputs[1]
+
+
+if __name__ == "__main__":
+    main()
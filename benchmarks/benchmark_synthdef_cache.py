@@ -0,0 +1,51 @@
+"""
+Benchmark rebuilding parameterized SynthDefs, with and without the SynthDef
+cache::
+
+    python benchmarks/benchmark_synthdef_cache.py
+"""
+import time
+
+import supriya.synthdefs
+import supriya.ugens
+
+
+def build(frequency):
+    with supriya.synthdefs.SynthDefBuilder(amplitude=0.5, gate=1, pan=0) as builder:
+        source = supriya.ugens.Mix.new(
+            [
+                supriya.ugens.LPF.ar(
+                    source=supriya.ugens.Saw.ar(frequency=frequency * ratio),
+                    frequency=frequency * ratio * 4,
+                )
+                for ratio in (1, 1.5, 2, 3)
+            ]
+        )
+        envelope = supriya.ugens.EnvGen.kr(
+            envelope=supriya.synthdefs.Envelope.asr(), gate=builder["gate"]
+        )
+        source = supriya.ugens.Pan2.ar(
+            source=source * envelope * builder["amplitude"], position=builder["pan"]
+        )
+        supriya.ugens.Out.ar(bus=0, source=source)
+    return builder.build()
+
+
+def main():
+    frequencies = [110 * 2 ** (x / 12) for x in range(24)]
+    repeats = 20
+    print(f"{'cache':<16}{'builds':>14}")
+    for name, maximum_size in [("disabled", 0), ("enabled", 1024)]:
+        cache = supriya.synthdefs.SynthDefCache(maximum_size=maximum_size)
+        supriya.synthdefs.SynthDefCache._default_cache = cache
+        start_time = time.perf_counter()
+        for _ in range(repeats):
+            for frequency in frequencies:
+                build(frequency)
+        elapsed_time = time.perf_counter() - start_time
+        print(f"{name:<16}{repeats * len(frequencies) / elapsed_time:>10.0f}/sec")
+        print(f"    {cache.info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Benchmark building SynthDefs from ever larger UGen graphs.
+
+Compares ``SynthDef`` against the previous sort, optimize and compile
+pipeline, kept here verbatim as ``ReferenceSynthDef``::
+
+    python benchmarks/benchmark_synthdef_sort.py
+"""
+import collections
+import copy
+import time
+
+import supriya.synthdefs
+import supriya.ugens
+from supriya.synthdefs import (
+    OutputProxy,
+    SynthDef,
+    SynthDefCompiler,
+    UGen,
+    WidthFirstUGen,
+)
+from supriya.system import SupriyaObject
+
+
+class ReferenceUGenSortBundle(SupriyaObject):
+    def __init__(self, ugen, width_first_antecedents):
+        self.antecedents = []
+        self.descendants = []
+        self.ugen = ugen
+        self.width_first_antecedents = tuple(width_first_antecedents)
+
+    def _initialize_topological_sort(self, sort_bundles):
+        for input_ in self.ugen.inputs:
+            if isinstance(input_, OutputProxy):
+                input_ = input_.source
+            elif not isinstance(input_, UGen):
+                continue
+            input_sort_bundle = sort_bundles[input_]
+            if input_ not in self.antecedents:
+                self.antecedents.append(input_)
+            if self.ugen not in input_sort_bundle.descendants:
+                input_sort_bundle.descendants.append(self.ugen)
+        for input_ in self.width_first_antecedents:
+            input_sort_bundle = sort_bundles[input_]
+            if input_ not in self.antecedents:
+                self.antecedents.append(input_)
+            if self.ugen not in input_sort_bundle.descendants:
+                input_sort_bundle.descendants.append(self.ugen)
+
+    def _make_available(self, available_ugens):
+        if not self.antecedents:
+            if self.ugen not in available_ugens:
+                available_ugens.append(self.ugen)
+
+    def _schedule(self, available_ugens, out_stack, sort_bundles):
+        for ugen in reversed(self.descendants):
+            sort_bundle = sort_bundles[ugen]
+            sort_bundle.antecedents.remove(self.ugen)
+            sort_bundle._make_available(available_ugens)
+        out_stack.append(self.ugen)
+
+
+class ReferenceSynthDef(SynthDef):
+    def __init__(self, ugens, name=None, optimize=True, parameter_names=None, **kwargs):
+        self._name = name
+        ugens = list(copy.deepcopy(ugens))
+        assert all(isinstance(_, UGen) for _ in ugens)
+        ugens = self._cleanup_pv_chains(ugens)
+        ugens = self._cleanup_local_bufs(ugens)
+        if optimize:
+            ugens = self._optimize_ugen_graph(ugens)
+        ugens = self._sort_ugens_topologically(ugens)
+        self._ugens = tuple(ugens)
+        self._constants = self._collect_constants(self._ugens)
+        self._control_ugens = self._collect_control_ugens(self._ugens)
+        self._indexed_parameters = self._collect_indexed_parameters(
+            self._control_ugens, parameter_names=parameter_names
+        )
+        self._compiled_ugen_graph = self._compile_ugen_graph(self)
+
+    @staticmethod
+    def _collect_constants(ugens):
+        constants = []
+        for ugen in ugens:
+            for input_ in ugen._inputs:
+                if not isinstance(input_, float):
+                    continue
+                if input_ not in constants:
+                    constants.append(input_)
+        return tuple(constants)
+
+    @staticmethod
+    def _compile_ugen_graph(synthdef):
+        result = []
+        result.append(
+            SynthDefCompiler.encode_unsigned_int_32bit(len(synthdef.constants))
+        )
+        for constant in synthdef.constants:
+            result.append(SynthDefCompiler.encode_float(constant))
+        result.append(SynthDefCompiler.compile_parameters(synthdef))
+        result.append(SynthDefCompiler.encode_unsigned_int_32bit(len(synthdef.ugens)))
+        for ugen_index, ugen in enumerate(synthdef.ugens):
+            result.append(SynthDefCompiler.compile_ugen(ugen, synthdef))
+        result.append(SynthDefCompiler.encode_unsigned_int_16bit(0))
+        result = bytes().join(result)
+        return result
+
+    @staticmethod
+    def _initialize_topological_sort(ugens):
+        ugens = list(ugens)
+        sort_bundles = collections.OrderedDict()
+        width_first_antecedents = []
+        for ugen in ugens:
+            sort_bundles[ugen] = ReferenceUGenSortBundle(ugen, width_first_antecedents)
+            if isinstance(ugen, WidthFirstUGen):
+                width_first_antecedents.append(ugen)
+        for ugen in ugens:
+            sort_bundle = sort_bundles[ugen]
+            sort_bundle._initialize_topological_sort(sort_bundles)
+            sort_bundle.descendants[:] = sorted(
+                sort_bundles[ugen].descendants, key=lambda x: ugens.index(ugen)
+            )
+        return sort_bundles
+
+    @staticmethod
+    def _optimize_ugen_graph(ugens):
+        sort_bundles = ReferenceSynthDef._initialize_topological_sort(ugens)
+        for ugen in ugens:
+            ugen._optimize_graph(sort_bundles)
+        return tuple(sort_bundles)
+
+    @staticmethod
+    def _sort_ugens_topologically(ugens):
+        sort_bundles = ReferenceSynthDef._initialize_topological_sort(ugens)
+        available_ugens = []
+        for ugen in reversed(ugens):
+            sort_bundles[ugen]._make_available(available_ugens)
+        out_stack = []
+        while available_ugens:
+            available_ugen = available_ugens.pop()
+            sort_bundles[available_ugen]._schedule(
+                available_ugens, out_stack, sort_bundles
+            )
+        return out_stack
+
+
+def build_ugens(voice_count):
+    """
+    A detuned filter bank: four ugens per voice, summed into one output.
+    """
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        voices = [
+            supriya.ugens.LPF.ar(
+                source=supriya.ugens.Saw.ar(frequency=55.0 + i * 0.25),
+                frequency=supriya.ugens.LFNoise1.kr(frequency=0.1 + i / 1000) * 1000.0,
+            )
+            for i in range(voice_count)
+        ]
+        supriya.ugens.Out.ar(bus=0, source=supriya.ugens.Mix.new(voices))
+    return list(builder._ugens)
+
+
+def main():
+    supriya.synthdefs.SynthDefCache.default().maximum_size = 0
+    print(f"{'ugens':>8}{'reference':>16}{'current':>16}{'per ugen':>16}")
+    for voice_count in (50, 100, 200, 400, 800, 1600):
+        ugens = build_ugens(voice_count)
+        timings, compiled = [], []
+        for class_ in (ReferenceSynthDef, SynthDef):
+            start_time = time.perf_counter()
+            synthdef = class_(ugens)
+            timings.append(time.perf_counter() - start_time)
+            compiled.append(synthdef.compile())
+        assert compiled[0] == compiled[1]
+        print(
+            f"{len(ugens):>8}"
+            f"{timings[0]:>15.3f}s"
+            f"{timings[1]:>15.3f}s"
+            f"{timings[1] / len(ugens) * 1e6:>14.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
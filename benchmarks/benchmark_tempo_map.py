@@ -0,0 +1,88 @@
+"""
+Benchmark converting offsets to seconds in the tempo clock.
+
+Compares converting offsets one at a time from the clock's current state, as
+the clock used to, against looking up each offset's tempo segment in a
+``TempoMap`` one at a time and in one batch::
+
+    python benchmarks/benchmark_tempo_map.py
+"""
+import random
+import time
+
+from supriya import conversions
+from supriya.clock.ephemera import ClockState
+from supriya.clock.tempomap import TempoMap
+
+
+class ReferenceTempoClock:
+    """
+    The conversions the clock made from its current state alone.
+    """
+
+    def __init__(self, state):
+        self._state = state
+
+    def _offset_to_seconds(self, offset):
+        return conversions.offset_to_seconds(
+            beats_per_minute=self._state.beats_per_minute,
+            current_offset=offset,
+            previous_offset=self._state.previous_offset,
+            previous_seconds=self._state.previous_seconds,
+            beat_duration=1 / self._state.time_signature[1],
+        )
+
+
+def make_tempo_map(change_count, seed=0):
+    random_ = random.Random(seed)
+    state = ClockState(
+        beats_per_minute=120.0,
+        initial_seconds=0.0,
+        previous_measure=1,
+        previous_offset=0.0,
+        previous_seconds=0.0,
+        previous_time_signature_change_offset=0.0,
+        time_signature=(4, 4),
+    )
+    tempo_map = TempoMap(state)
+    for _ in range(change_count):
+        offset = state.previous_offset + 1
+        state = state._replace(
+            beats_per_minute=random_.randrange(60, 180),
+            previous_measure=state.previous_measure + 1,
+            previous_offset=offset,
+            previous_seconds=tempo_map.offset_to_seconds(offset),
+            previous_time_signature_change_offset=offset,
+        )
+        tempo_map.update(state)
+    return tempo_map, state
+
+
+def main():
+    print(f"{'offsets':>8}{'reference':>11}{'one by one':>12}{'batched':>10}")
+    tempo_map, state = make_tempo_map(100)
+    reference_clock = ReferenceTempoClock(state)
+    for offset_count in (10 ** 4, 10 ** 5, 10 ** 6):
+        random_ = random.Random(1)
+        offsets = [
+            state.previous_offset + random_.random() * 100 for _ in range(offset_count)
+        ]
+        start_time = time.perf_counter()
+        expected = [reference_clock._offset_to_seconds(x) for x in offsets]
+        reference_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        actual = [tempo_map.offset_to_seconds(x) for x in offsets]
+        one_by_one_time = time.perf_counter() - start_time
+        assert actual == expected
+        start_time = time.perf_counter()
+        actual = tempo_map.offsets_to_seconds(offsets)
+        batched_time = time.perf_counter() - start_time
+        assert actual == expected
+        print(
+            f"{offset_count:>8}{reference_time:>10.2f}s{one_by_one_time:>11.2f}s"
+            f"{batched_time:>9.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark value object equality, hashing and copying.
+
+Hashes, compares and copies requests, OSC messages and patterns, and compiles
+a non-realtime session from scratch, first introspecting signatures on every
+call through ``uqbar.objects``, then with the per-class fields cached by
+``supriya.system``::
+
+    python benchmarks/benchmark_value_objects.py
+"""
+import contextlib
+import copy
+import time
+
+import uqbar.objects
+from benchmark_session_memory import build_session
+
+import supriya.commands
+import supriya.osc
+import supriya.patterns
+import supriya.system
+
+
+@contextlib.contextmanager
+def uncached():
+    get_vars = supriya.system.get_vars
+    supriya.system.get_vars = uqbar.objects.get_vars
+    try:
+        yield
+    finally:
+        supriya.system.get_vars = get_vars
+
+
+def make_objects(count):
+    objects = []
+    for i in range(count):
+        objects.append(
+            supriya.commands.SynthNewRequest(
+                node_id=1000 + i, synthdef="default", target_node_id=1, frequency=i
+            )
+        )
+        objects.append(supriya.osc.OscMessage("/n_set", 1000 + i, "amplitude", 0.5))
+        objects.append(supriya.patterns.Pseq([i, i + 1], 2))
+    return objects
+
+
+def measure_objects(objects):
+    start_time = time.perf_counter()
+    unique = set(objects)
+    unique.update(copy.copy(x) for x in objects)
+    assert len(unique) == len(objects)
+    return time.perf_counter() - start_time
+
+
+def measure_session(event_count):
+    session = build_session(event_count)
+    start_time = time.perf_counter()
+    session._to_non_xrefd_request_bundles()
+    return time.perf_counter() - start_time
+
+
+def main():
+    print(f"{'benchmark':>10}{'size':>8}{'uncached':>12}{'cached':>12}")
+    for count in (1000, 10000):
+        objects = make_objects(count)
+        with uncached():
+            uncached_time = measure_objects(objects)
+        cached_time = measure_objects(objects)
+        print(f"{'objects':>10}{count:>8}{uncached_time:>11.3f}s{cached_time:>11.3f}s")
+    for event_count in (1000, 4000):
+        with uncached():
+            uncached_time = measure_session(event_count)
+        cached_time = measure_session(event_count)
+        print(
+            f"{'session':>10}{event_count:>8}"
+            f"{uncached_time:>11.3f}s{cached_time:>11.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
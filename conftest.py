@@ -4,6 +4,14 @@ import supriya
 from supriya import scsynth
 from supriya.realtime.servers import AsyncServer, Server
 
+collect_ignore = []
+
+try:
+    import numpy  # noqa
+except ImportError:
+    # NumPy is optional, so skip the modules requiring it.
+    collect_ignore.append("supriya/intervals/IntervalArray.py")
+
 
 @pytest.fixture(autouse=True)
 def add_libraries(doctest_namespace):
@@ -33,6 +33,7 @@ extras_require = {
         "jupyter_nbextensions_configurator",
         "rise",
     ],
+    "numpy": ["numpy"],
     "test": [
         "black == 19.10b0",  # Trailing comma behavior in 20.x needs work
         "flake8",
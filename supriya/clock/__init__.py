@@ -1,5 +1,6 @@
 from .asynchronous import AsyncTempoClock
 from .ephemera import Moment, TimeUnit
+from .offline import OfflineTempoClock
 from .threaded import TempoClock
 
-__all__ = ["AsyncTempoClock", "Moment", "TempoClock", "TimeUnit"]
+__all__ = ["AsyncTempoClock", "Moment", "OfflineTempoClock", "TempoClock", "TimeUnit"]
@@ -33,11 +33,8 @@ class AsyncTempoClock(BaseTempoClock):
         if event is not None and not isinstance(
             event, (CallbackCommand, ChangeCommand)
         ):
-            self._event_queue.remove(event)
-            if event.offset is not None:
-                self._offset_relative_event_ids.remove(event.event_id)
-                if event.measure is not None:
-                    self._measure_relative_event_ids.remove(event.event_id)
+            event = self._event_queue.remove(event) or event
+            self._measure_relative_event_ids.discard(event.event_id)
         return event
 
     async def _enqueue_command(self, command):
@@ -171,6 +168,7 @@ class AsyncTempoClock(BaseTempoClock):
                 beats_per_minute=beats_per_minute or self._state.beats_per_minute,
                 time_signature=time_signature or self._state.time_signature,
             )
+            self._tempo_map.reset(self._state)
             return None
         event_id = next(self._counter)
         command = ChangeCommand(
@@ -338,6 +336,7 @@ class AsyncTempoClock(BaseTempoClock):
             previous_time_signature_change_offset=float(initial_offset),
             time_signature=time_signature or self._state.time_signature,
         )
+        self._tempo_map.reset(self._state)
         self._is_running = True
         loop = asyncio.get_running_loop()
         self._task = loop.create_task(self._run())
@@ -8,7 +8,6 @@ import time
 import traceback
 from typing import Optional, Tuple
 
-from .. import conversions
 from .ephemera import (
     CallbackCommand,
     CallbackEvent,
@@ -19,6 +18,7 @@ from .ephemera import (
     TimeUnit,
 )
 from .eventqueue import EventQueue
+from .tempomap import TempoMap
 
 logger = logging.getLogger("supriya.clock")
 
@@ -55,12 +55,11 @@ class BaseTempoClock:
         self._name = None
         self._counter = itertools.count()
         self._command_deque = collections.deque()
-        self._event_queue = EventQueue()
+        self._event_queue = EventQueue(offset_to_seconds=self._offset_to_seconds)
         self._is_running = False
         self._slop = 0.001
         self._events_by_id = {}
         self._measure_relative_event_ids = set()
-        self._offset_relative_event_ids = set()
         self._state = ClockState(
             beats_per_minute=120.0,
             initial_seconds=0.0,
@@ -70,6 +69,7 @@ class BaseTempoClock:
             previous_time_signature_change_offset=0.0,
             time_signature=(4, 4),
         )
+        self._tempo_map = TempoMap(self._state)
 
     ### TIME METHODS ###
 
@@ -113,75 +113,43 @@ class BaseTempoClock:
         return seconds, offset, measure
 
     def _measure_to_offset(self, measure: int) -> float:
-        return conversions.measure_to_offset(
-            measure,
-            self._state.time_signature,
-            self._state.previous_measure,
-            self._state.previous_time_signature_change_offset,
-        )
+        return self._tempo_map.measure_to_offset(measure)
 
     def _offset_to_measure(self, offset: float) -> int:
-        return conversions.offset_to_measure(
-            offset,
-            self._state.time_signature,
-            self._state.previous_measure,
-            self._state.previous_time_signature_change_offset,
-        )
+        return self._tempo_map.offset_to_measure(offset)[0]
 
     def _offset_to_measure_offset(self, offset: float) -> float:
-        return conversions.offset_to_measure_offset(
-            offset,
-            self._state.time_signature,
-            self._state.previous_time_signature_change_offset,
-        )
+        return self._tempo_map.offset_to_measure(offset)[1]
 
     def _offset_to_moment(self, offset: float) -> Moment:
-        seconds = self._offset_to_seconds(offset)
-        measure, measure_offset = divmod(
-            offset - self._state.previous_time_signature_change_offset,
-            self._state.time_signature[0] / self._state.time_signature[1],
-        )
+        seconds = self._tempo_map.offset_to_seconds(offset)
+        measure, measure_offset = self._tempo_map.offset_to_measure(offset)
         return Moment(
-            beats_per_minute=self._state.beats_per_minute,
-            measure=int(measure + self._state.previous_measure),
+            beats_per_minute=self._tempo_map.get_beats_per_minute(offset),
+            measure=measure,
             measure_offset=measure_offset,
             offset=offset,
             seconds=seconds,
-            time_signature=self._state.time_signature,
+            time_signature=self._tempo_map.get_time_signature(offset),
         )
 
     def _offset_to_seconds(self, offset: float) -> float:
-        return conversions.offset_to_seconds(
-            beats_per_minute=self._state.beats_per_minute,
-            current_offset=offset,
-            previous_offset=self._state.previous_offset,
-            previous_seconds=self._state.previous_seconds,
-            beat_duration=1 / self._state.time_signature[1],
-        )
+        return self._tempo_map.offset_to_seconds(offset)
 
     def _seconds_to_moment(self, seconds):
-        offset = self._seconds_to_offset(seconds)
-        measure, measure_offset = divmod(
-            offset - self._state.previous_time_signature_change_offset,
-            self._state.time_signature[0] / self._state.time_signature[1],
-        )
+        offset = self._tempo_map.seconds_to_offset(seconds)
+        measure, measure_offset = self._tempo_map.offset_to_measure(offset)
         return Moment(
-            beats_per_minute=self._state.beats_per_minute,
-            measure=int(measure + self._state.previous_measure),
+            beats_per_minute=self._tempo_map.get_beats_per_minute(offset),
+            measure=measure,
             measure_offset=measure_offset,
             offset=offset,
             seconds=seconds,
-            time_signature=self._state.time_signature,
+            time_signature=self._tempo_map.get_time_signature(offset),
         )
 
     def _seconds_to_offset(self, seconds: float) -> float:
-        return conversions.seconds_to_offset(
-            beats_per_minute=self._state.beats_per_minute,
-            current_time=seconds,
-            previous_offset=self._state.previous_offset,
-            previous_seconds=self._state.previous_seconds,
-            beat_duration=1 / self._state.time_signature[1],
-        )
+        return self._tempo_map.seconds_to_offset(seconds)
 
     ### SCHEDULING METHODS ###
 
@@ -203,14 +171,10 @@ class BaseTempoClock:
     def _enqueue_event(self, event):
         self._events_by_id[event.event_id] = event
         self._event_queue.put(event)
-        if event.offset is not None:
-            self._offset_relative_event_ids.add(event.event_id)
-            if event.measure is not None:
-                self._measure_relative_event_ids.add(event.event_id)
+        if event.measure is not None:
+            self._measure_relative_event_ids.add(event.event_id)
 
     def _process_perform_event_loop(self, current_moment):
-        # There may be items in the queue which have been flagged "removed".
-        # They contribute to the queue's size, but cannot be retrieved by .get().
         try:
             event = self._event_queue.get()
         except queue.Empty:
@@ -298,6 +262,7 @@ class BaseTempoClock:
                     previous_time_signature_change_offset=desired_moment.offset,
                     time_signature=event.time_signature,
                 )
+            self._tempo_map.update(self._state)
             self._reschedule_measure_relative_events()
             current_moment = dataclasses.replace(
                 current_moment,
@@ -312,7 +277,9 @@ class BaseTempoClock:
                 previous_seconds=desired_moment.seconds,
                 previous_offset=desired_moment.offset,
             )
-            self._reschedule_offset_relative_events()
+            self._tempo_map.update(self._state)
+            # Offset-relative events are converted to seconds lazily by the
+            # event queue, so they need no rescheduling.
             new_current_offset = self._seconds_to_offset(current_moment.seconds)
             logger.debug(
                 f"[{self.name}] ... ... ... Revised offset from "
@@ -406,34 +373,33 @@ class BaseTempoClock:
                 f"({event.event_id}) for {event.seconds}:s / {event.offset}:o"
             )
 
-    def _reschedule_offset_relative_events(self):
-        for event_id in tuple(self._offset_relative_event_ids):
-            event = self._cancel(event_id)
-            if event is None:
-                self._offset_relative_event_ids.remove(event_id)
-                continue
-            seconds = self._offset_to_seconds(event.offset)
-            logger.debug(
-                f"[{self.name}] ... ... ... Rescheduling offset-relative event "
-                f"({event.event_id}) from "
-                f"{event.seconds - self._state.initial_seconds}:s to "
-                f"{seconds - self._state.initial_seconds}:s"
-            )
-            self._enqueue_event(event._replace(seconds=seconds))
-
     def _reschedule_measure_relative_events(self):
-        for event_id in tuple(self._measure_relative_event_ids):
-            event = self._cancel(event_id)
-            if event is None:
-                self._measure_relative_event_ids.remove(event_id)
-                continue
-            offset = self._measure_to_offset(event.measure)
-            seconds = self._offset_to_seconds(offset)
-            logger.debug(
-                f"[{self.name}] ... ... ... Rescheduling measure-relative event from "
-                f"offset {event.offset} to {offset}"
+        event_ids = tuple(
+            event_id
+            for event_id in self._measure_relative_event_ids
+            if event_id in self._events_by_id
+        )
+        # Convert every event's measure in one batch, rather than one at a time
+        measures = [self._events_by_id[event_id].measure for event_id in event_ids]
+        offsets = self._tempo_map.measures_to_offsets(measures)
+        moments = {
+            measure: (offset, seconds)
+            for measure, offset, seconds in zip(
+                measures, offsets, self._tempo_map.offsets_to_seconds(offsets)
             )
-            self._enqueue_event(event._replace(offset=offset, seconds=seconds))
+        }
+
+        def procedure(event):
+            offset, seconds = moments[event.measure]
+            return event._replace(offset=offset, seconds=seconds)
+
+        events = self._event_queue.retime(event_ids, procedure)
+        self._measure_relative_event_ids = {event.event_id for event in events}
+        self._events_by_id.update((event.event_id, event) for event in events)
+        logger.debug(
+            f"[{self.name}] ... ... ... Rescheduled {len(events)} "
+            f"measure-relative events"
+        )
 
     ### PUBLIC METHODS ###
 
@@ -1,29 +1,150 @@
+import heapq
 import queue
 
 
+class _IndexedHeap:
+    """
+    A binary heap of ``(key, event_type, event_id, event)`` entries which
+    tracks each entry's position by event ID.
+    """
+
+    def __init__(self):
+        self.entries = []
+        self.indices = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def heapify(self):
+        heapq.heapify(self.entries)
+        self.indices = {entry[2]: i for i, entry in enumerate(self.entries)}
+
+    def pop(self, index):
+        entries, indices = self.entries, self.indices
+        entry = entries[index]
+        del indices[entry[2]]
+        last_entry = entries.pop()
+        if index < len(entries):
+            entries[index] = last_entry
+            self.sift(index)
+        return entry
+
+    def push(self, entry):
+        index = self.indices.get(entry[2])
+        if index is None:
+            index = len(self.entries)
+            self.entries.append(entry)
+        else:
+            self.entries[index] = entry
+        self.sift(index)
+
+    def sift(self, index):
+        """
+        Moves the entry at ``index`` up or down until the heap is ordered again.
+        """
+        entries, indices = self.entries, self.indices
+        entry, size = entries[index], len(entries)
+        while index:
+            parent_index = (index - 1) >> 1
+            parent = entries[parent_index]
+            if not entry < parent:
+                break
+            entries[index] = parent
+            indices[parent[2]] = index
+            index = parent_index
+        while True:
+            child_index = 2 * index + 1
+            if size <= child_index:
+                break
+            right_index = child_index + 1
+            if right_index < size and entries[right_index] < entries[child_index]:
+                child_index = right_index
+            child = entries[child_index]
+            if not child < entry:
+                break
+            entries[index] = child
+            indices[child[2]] = index
+            index = child_index
+        entries[index] = entry
+        indices[entry[2]] = index
+
+
 class EventQueue(queue.PriorityQueue):
+    """
+    A priority queue of clock events, ordered by seconds, event type and ID.
+
+    Events are indexed by event ID, so they can be removed or replaced in
+    O(log n). Putting an event whose ID is already queued replaces it.
+
+    Events scheduled against an offset are kept in a separate heap ordered by
+    offset, and converted to seconds with ``offset_to_seconds`` only when they
+    reach the front of the queue. Tempo changes preserve the order of offsets,
+    so they need not touch the queue at all.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, maxsize=0, offset_to_seconds=None):
+        self.offset_to_seconds = offset_to_seconds
+        queue.PriorityQueue.__init__(self, maxsize)
 
     ### PRIVATE METHODS ###
 
     def _init(self, maxsize):
-        self.queue = []
-        self.items = {}
-
-    def _put(self, item):
-        entry = [item, True]
-        if item in self.items:
-            self.items[item][-1] = False
-        self.items[item] = entry
-        super()._put(entry)
+        self.offset_heap = _IndexedHeap()
+        self.seconds_heap = _IndexedHeap()
 
     def _get(self):
-        while self.queue:
-            item, active = super()._get()
-            if active:
-                del self.items[item]
-                return item
+        heap, event = self._peek()
+        heap.pop(0)
+        return event
+
+    def _get_heap(self, event_id):
+        if event_id in self.seconds_heap.indices:
+            return self.seconds_heap
+        elif event_id in self.offset_heap.indices:
+            return self.offset_heap
+        return None
+
+    def _peek(self):
+        """
+        Gets the heap holding the earliest event, and that event, with its
+        seconds brought up to date.
+        """
+        seconds_heap, offset_heap = self.seconds_heap, self.offset_heap
+        if offset_heap.entries:
+            event = self._refresh(offset_heap.entries[0][-1])
+            if (
+                not seconds_heap.entries
+                or (event.seconds, event.event_type, event.event_id,)
+                < seconds_heap.entries[0][:3]
+            ):
+                return offset_heap, event
+        if seconds_heap.entries:
+            return seconds_heap, seconds_heap.entries[0][-1]
         raise queue.Empty
 
+    def _put(self, item):
+        heap = self._get_heap(item.event_id)
+        if item.offset is None:
+            key, target_heap = item.seconds, self.seconds_heap
+        else:
+            key, target_heap = item.offset, self.offset_heap
+        if heap is not None and heap is not target_heap:
+            heap.pop(heap.indices[item.event_id])
+        target_heap.push((key, item.event_type, item.event_id, item))
+
+    def _qsize(self):
+        return len(self.offset_heap) + len(self.seconds_heap)
+
+    def _refresh(self, event):
+        if event.offset is None or self.offset_to_seconds is None:
+            return event
+        seconds = self.offset_to_seconds(event.offset)
+        if seconds != event.seconds:
+            event = event._replace(seconds=seconds)
+        return event
+
     ### PUBLIC METHODS ###
 
     def clear(self):
@@ -32,14 +153,44 @@ class EventQueue(queue.PriorityQueue):
 
     def peek(self):
         with self.mutex:
-            item = self._get()
-            entry = [item, True]
-            self.items[item] = entry
-            super()._put(entry)
-        return item
+            return self._peek()[1]
 
     def remove(self, item):
+        """
+        Removes the queued event with ``item``'s event ID, if any.
+
+        Returns the removed event, or none.
+        """
+        with self.mutex:
+            heap = self._get_heap(item.event_id)
+            if heap is None:
+                return None
+            return self._refresh(heap.pop(heap.indices[item.event_id])[-1])
+
+    def retime(self, event_ids, procedure):
+        """
+        Replaces each queued event whose ID is in ``event_ids`` with the result
+        of calling ``procedure`` on it, then reorders the queue in one pass.
+
+        Returns the replacement events. IDs not in the queue are skipped.
+        """
         with self.mutex:
-            entry = self.items.pop(item, None)
-            if entry is not None:
-                entry[-1] = False
+            events, moved_events, heaps = [], [], set()
+            for event_id in event_ids:
+                heap = self._get_heap(event_id)
+                if heap is None:
+                    continue
+                index = heap.indices[event_id]
+                event = procedure(self._refresh(heap.entries[index][-1]))
+                events.append(event)
+                if (event.offset is None) != (heap is self.seconds_heap):
+                    moved_events.append(event)
+                    continue
+                key = event.seconds if event.offset is None else event.offset
+                heap.entries[index] = (key, event.event_type, event_id, event)
+                heaps.add(heap)
+            for heap in heaps:
+                heap.heapify()
+            for event in moved_events:
+                self._put(event)
+            return events
@@ -0,0 +1,147 @@
+import logging
+import time
+from typing import Optional, Tuple
+
+from .ephemera import ClockState
+from .threaded import TempoClock
+
+logger = logging.getLogger("supriya.clock")
+
+
+class OfflineTempoClock(TempoClock):
+    """
+    A tempo clock which runs in virtual time, as fast as it can.
+
+    Rather than sleeping until each event is due, ``run()`` jumps the clock's
+    time straight to the next event, performing every event due at that moment
+    together. Callbacks see the same moments they would see live, so the same
+    callbacks can write into a non-realtime provider::
+
+        >>> from supriya.clock import OfflineTempoClock
+        >>> from supriya.provider import Provider
+        >>> provider = Provider.nonrealtime()
+        >>> def callback(current_moment, desired_moment, event):
+        ...     with provider.at(desired_moment.seconds):
+        ...         provider.add_synth(frequency=440 + event.invocations)
+        ...     return 1.0
+        ...
+        >>> clock = OfflineTempoClock()
+        >>> event_id = clock.cue(callback)
+        >>> clock.start()
+        >>> clock.run(until=59.0)
+        30
+        >>> clock.get_current_time()
+        59.0
+
+    ::
+
+        >>> provider.session.offsets[-2:]
+        [58.0, inf]
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    _default_clock = None
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        TempoClock.__init__(self)
+        self._current_time = 0.0
+        self._event_count = 0
+        self._first_run = True
+        self._run_time = 0.0
+
+    ### SCHEDULING METHODS ###
+
+    def _perform_callback_event(self, event, current_moment, desired_moment):
+        self._event_count += 1
+        super()._perform_callback_event(event, current_moment, desired_moment)
+
+    ### PUBLIC METHODS ###
+
+    def get_current_time(self) -> float:
+        return self._current_time
+
+    def run(self, until: Optional[float] = None) -> int:
+        """
+        Performs events in virtual time until none are left, the clock is
+        stopped, or the next event is due after ``until`` seconds.
+
+        Returns the number of callbacks performed.
+        """
+        if not self._is_running:
+            raise RuntimeError("Not started")
+        start_time = time.perf_counter()
+        event_count = self._event_count
+        while self._is_running:
+            self._process_command_deque(first_run=self._first_run)
+            self._first_run = False
+            if not self._event_queue.qsize():
+                break
+            next_time = self._event_queue.peek().seconds
+            if until is not None and until < next_time:
+                break
+            self._current_time = max(self._current_time, next_time)
+            current_moment = self._perform_events(
+                self._seconds_to_moment(self._current_time)
+            )
+            self._state = self._state._replace(
+                previous_seconds=current_moment.seconds,
+                previous_offset=current_moment.offset,
+            )
+        if until is not None:
+            self._current_time = max(self._current_time, until)
+        self._run_time += time.perf_counter() - start_time
+        event_count = self._event_count - event_count
+        logger.debug(f"[{self.name}] Performed {event_count} events")
+        return event_count
+
+    def start(
+        self,
+        initial_time: Optional[float] = None,
+        initial_offset: float = 0.0,
+        initial_measure: int = 1,
+        beats_per_minute: Optional[float] = None,
+        time_signature: Optional[Tuple[int, int]] = None,
+    ):
+        if self._is_running:
+            raise RuntimeError("Already started")
+        if initial_time is None:
+            initial_time = self.get_current_time()
+        self._current_time = float(initial_time)
+        self._state = ClockState(
+            beats_per_minute=beats_per_minute or self._state.beats_per_minute,
+            initial_seconds=initial_time,
+            previous_measure=int(initial_measure),
+            previous_offset=float(initial_offset),
+            previous_seconds=float(initial_time),
+            previous_time_signature_change_offset=float(initial_offset),
+            time_signature=time_signature or self._state.time_signature,
+        )
+        self._tempo_map.reset(self._state)
+        self._first_run = True
+        self._is_running = True
+
+    def stop(self):
+        self._is_running = False
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def event_count(self) -> int:
+        """
+        Gets the number of callbacks performed by ``run()`` so far.
+        """
+        return self._event_count
+
+    @property
+    def events_per_second(self) -> float:
+        """
+        Gets the number of callbacks ``run()`` has performed per second of real
+        time.
+        """
+        if not self._run_time:
+            return 0.0
+        return self._event_count / self._run_time
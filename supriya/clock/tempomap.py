@@ -0,0 +1,228 @@
+import bisect
+from typing import Iterable, List, Tuple
+
+from .. import conversions
+from .ephemera import ClockState
+
+
+class TempoMap:
+    """
+    A piecewise-linear map between a clock's seconds, offsets and measures.
+
+    Tempo segments run at a constant rate from the offset and seconds at which
+    each tempo took effect. Meter segments count measures from the offset at
+    which each time signature took effect. Conversions find their segment by
+    binary search, so offsets before the latest change still convert as they
+    did before it.
+
+    ::
+
+        >>> from supriya.clock.ephemera import ClockState
+        >>> from supriya.clock.tempomap import TempoMap
+        >>> state = ClockState(
+        ...     beats_per_minute=120.0,
+        ...     initial_seconds=0.0,
+        ...     previous_measure=1,
+        ...     previous_offset=0.0,
+        ...     previous_seconds=0.0,
+        ...     previous_time_signature_change_offset=0.0,
+        ...     time_signature=(4, 4),
+        ... )
+        >>> tempo_map = TempoMap(state)
+        >>> tempo_map.update(
+        ...     state._replace(
+        ...         beats_per_minute=60.0,
+        ...         previous_offset=1.0,
+        ...         previous_seconds=2.0,
+        ...     )
+        ... )
+        >>> tempo_map.offsets_to_seconds([0.5, 1.0, 1.5])
+        [1.0, 2.0, 4.0]
+
+    ::
+
+        >>> tempo_map.seconds_to_offsets([1.0, 4.0])
+        [0.5, 1.5]
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_beat_durations",
+        "_beats_per_minute",
+        "_meter_measures",
+        "_meter_offsets",
+        "_tempo_offsets",
+        "_tempo_seconds",
+        "_time_signatures",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, state: ClockState):
+        self.reset(state)
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _find(offsets: List[float], offset: float) -> int:
+        return max(bisect.bisect_right(offsets, offset) - 1, 0)
+
+    ### PUBLIC METHODS ###
+
+    def get_beats_per_minute(self, offset: float) -> float:
+        return self._beats_per_minute[self._find(self._tempo_offsets, offset)]
+
+    def get_time_signature(self, offset: float) -> Tuple[int, int]:
+        return self._time_signatures[self._find(self._meter_offsets, offset)]
+
+    def measure_to_offset(self, measure: int) -> float:
+        index = self._find(self._meter_measures, measure)
+        numerator, denominator = self._time_signatures[index]
+        return (
+            (measure - self._meter_measures[index]) * (numerator / denominator)
+        ) + self._meter_offsets[index]
+
+    def measures_to_offsets(self, measures: Iterable[int]) -> List[float]:
+        return [self.measure_to_offset(measure) for measure in measures]
+
+    def offset_to_measure(self, offset: float) -> Tuple[int, float]:
+        """
+        Gets the measure at ``offset``, and ``offset``'s offset into it.
+        """
+        index = self._find(self._meter_offsets, offset)
+        numerator, denominator = self._time_signatures[index]
+        measure, measure_offset = divmod(
+            offset - self._meter_offsets[index], numerator / denominator
+        )
+        return int(measure + self._meter_measures[index]), measure_offset
+
+    def offset_to_seconds(self, offset: float) -> float:
+        index = self._find(self._tempo_offsets, offset)
+        return conversions.offset_to_seconds(
+            beats_per_minute=self._beats_per_minute[index],
+            current_offset=offset,
+            previous_offset=self._tempo_offsets[index],
+            previous_seconds=self._tempo_seconds[index],
+            beat_duration=self._beat_durations[index],
+        )
+
+    def offsets_to_measures(self, offsets: Iterable[float]) -> List[int]:
+        return [self.offset_to_measure(offset)[0] for offset in offsets]
+
+    def offsets_to_seconds(self, offsets: Iterable[float]) -> List[float]:
+        """
+        Converts many offsets to seconds at once.
+
+        Segments are looked up for all offsets in one vectorized pass if NumPy
+        is available.
+        """
+        try:
+            import numpy
+        except ImportError:
+            return [self.offset_to_seconds(offset) for offset in offsets]
+        offsets = numpy.asarray(offsets, dtype=float)
+        tempo_offsets = numpy.asarray(self._tempo_offsets)
+        indices = numpy.maximum(
+            numpy.searchsorted(tempo_offsets, offsets, side="right") - 1, 0
+        )
+        return conversions.offset_to_seconds(
+            beats_per_minute=numpy.asarray(self._beats_per_minute)[indices],
+            current_offset=offsets,
+            previous_offset=tempo_offsets[indices],
+            previous_seconds=numpy.asarray(self._tempo_seconds)[indices],
+            beat_duration=numpy.asarray(self._beat_durations)[indices],
+        ).tolist()
+
+    def reset(self, state: ClockState) -> None:
+        """
+        Forgets every segment, starting again from ``state``.
+        """
+        self._beat_durations: List[float] = []
+        self._beats_per_minute: List[float] = []
+        self._meter_measures: List[int] = []
+        self._meter_offsets: List[float] = []
+        self._tempo_offsets: List[float] = []
+        self._tempo_seconds: List[float] = []
+        self._time_signatures: List[Tuple[int, int]] = []
+        self.update(state)
+
+    def seconds_to_offset(self, seconds: float) -> float:
+        index = self._find(self._tempo_seconds, seconds)
+        return conversions.seconds_to_offset(
+            beats_per_minute=self._beats_per_minute[index],
+            current_time=seconds,
+            previous_offset=self._tempo_offsets[index],
+            previous_seconds=self._tempo_seconds[index],
+            beat_duration=self._beat_durations[index],
+        )
+
+    def seconds_to_offsets(self, seconds: Iterable[float]) -> List[float]:
+        """
+        Converts many seconds to offsets at once.
+
+        Segments are looked up for all seconds in one vectorized pass if NumPy
+        is available.
+        """
+        try:
+            import numpy
+        except ImportError:
+            return [self.seconds_to_offset(x) for x in seconds]
+        seconds = numpy.asarray(seconds, dtype=float)
+        tempo_seconds = numpy.asarray(self._tempo_seconds)
+        indices = numpy.maximum(
+            numpy.searchsorted(tempo_seconds, seconds, side="right") - 1, 0
+        )
+        return conversions.seconds_to_offset(
+            beats_per_minute=numpy.asarray(self._beats_per_minute)[indices],
+            current_time=seconds,
+            previous_offset=numpy.asarray(self._tempo_offsets)[indices],
+            previous_seconds=tempo_seconds[indices],
+            beat_duration=numpy.asarray(self._beat_durations)[indices],
+        ).tolist()
+
+    def update(self, state: ClockState) -> None:
+        """
+        Starts new segments where ``state`` changes the tempo or meter.
+
+        Segments from the new segments' offsets on are discarded. Moving
+        along the current segments, as a running clock does, changes nothing.
+        """
+        tempo = (state.beats_per_minute, 1 / state.time_signature[1])
+        if not self._tempo_offsets or tempo != (
+            self._beats_per_minute[-1],
+            self._beat_durations[-1],
+        ):
+            index = bisect.bisect_left(self._tempo_offsets, state.previous_offset)
+            for list_ in (
+                self._beat_durations,
+                self._beats_per_minute,
+                self._tempo_offsets,
+                self._tempo_seconds,
+            ):
+                del list_[index:]
+            self._beats_per_minute.append(tempo[0])
+            self._beat_durations.append(tempo[1])
+            self._tempo_offsets.append(state.previous_offset)
+            self._tempo_seconds.append(state.previous_seconds)
+        meter = (
+            state.previous_time_signature_change_offset,
+            state.previous_measure,
+            tuple(state.time_signature),
+        )
+        if not self._meter_offsets or meter != (
+            self._meter_offsets[-1],
+            self._meter_measures[-1],
+            self._time_signatures[-1],
+        ):
+            index = bisect.bisect_left(self._meter_offsets, meter[0])
+            for list_ in (
+                self._meter_measures,
+                self._meter_offsets,
+                self._time_signatures,
+            ):
+                del list_[index:]
+            self._meter_offsets.append(meter[0])
+            self._meter_measures.append(meter[1])
+            self._time_signatures.append(meter[2])
@@ -39,11 +39,8 @@ class TempoClock(BaseTempoClock):
         if event is not None and not isinstance(
             event, (CallbackCommand, ChangeCommand)
         ):
-            self._event_queue.remove(event)
-            if event.offset is not None:
-                self._offset_relative_event_ids.remove(event.event_id)
-                if event.measure is not None:
-                    self._measure_relative_event_ids.remove(event.event_id)
+            event = self._event_queue.remove(event) or event
+            self._measure_relative_event_ids.discard(event.event_id)
         return event
 
     def _enqueue_command(self, command):
@@ -120,6 +117,7 @@ class TempoClock(BaseTempoClock):
                 beats_per_minute=beats_per_minute or self._state.beats_per_minute,
                 time_signature=time_signature or self._state.time_signature,
             )
+            self._tempo_map.reset(self._state)
             return None
         event_id = next(self._counter)
         command = ChangeCommand(
@@ -293,6 +291,7 @@ class TempoClock(BaseTempoClock):
             previous_time_signature_change_offset=float(initial_offset),
             time_signature=time_signature or self._state.time_signature,
         )
+        self._tempo_map.reset(self._state)
         self._is_running = True
         self._thread = threading.Thread(target=self._run, args=(self,), daemon=True)
         self._thread.start()
@@ -1,8 +1,7 @@
 import abc
 
-from uqbar.objects import new
-
 from supriya.commands.Requestable import Requestable
+from supriya.system import new
 
 
 class Request(Requestable):
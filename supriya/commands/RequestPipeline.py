@@ -0,0 +1,262 @@
+import asyncio
+import collections
+import logging
+import time
+
+from supriya.commands.Requestable import Requestable
+from supriya.commands.SyncRequest import SyncRequest
+from supriya.osc.messages import OscBundle
+
+logger = logging.getLogger("supriya.osc")
+
+
+class RequestPipeline(Requestable):
+    """
+    A pipeline of requests.
+
+    Sends its requests back to back without waiting for each response, then
+    correlates responses with requests as they arrive: scsynth handles commands
+    in order, so responses matching the same pattern are matched to requests
+    first-in-first-out.
+
+    ::
+
+        >>> request_one = supriya.commands.BufferQueryRequest(buffer_ids=[0])
+        >>> request_two = supriya.commands.BufferQueryRequest(buffer_ids=[1])
+        >>> request_pipeline = supriya.commands.RequestPipeline(
+        ...     contents=[request_one, request_two],
+        ...     )
+        >>> request_pipeline
+        RequestPipeline(
+            contents=(
+                BufferQueryRequest(
+                    buffer_ids=(0,),
+                    ),
+                BufferQueryRequest(
+                    buffer_ids=(1,),
+                    ),
+                ),
+            )
+
+    ::
+
+        >>> request_pipeline.to_list()
+        [['/b_query', 0], ['/b_query', 1]]
+
+    Encoded as OSC, a pipeline is an immediate bundle of its requests, which
+    scsynth also performs in order:
+
+    ::
+
+        >>> request_pipeline.to_osc()
+        OscBundle(
+            contents=(
+                OscMessage('/b_query', 0),
+                OscMessage('/b_query', 1),
+                ),
+            )
+
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, contents=None):
+        Requestable.__init__(self)
+        assert all(isinstance(x, Requestable) for x in contents or ())
+        self._contents = tuple(contents or ())
+
+    ### SPECIAL METHODS ###
+
+    def __iter__(self):
+        return iter(self.contents)
+
+    def __len__(self):
+        return len(self.contents)
+
+    ### PRIVATE METHODS ###
+
+    def _get_response_patterns_and_requestable(self, server):
+        # As a single requestable, a pipeline completes once a trailing sync
+        # request is answered
+        sync_id = server.next_sync_id
+        contents = list(self.contents)
+        contents.append(SyncRequest(sync_id=sync_id))
+        request_pipeline = type(self)(contents=contents)
+        response_pattern = ["/synced", sync_id]
+        return response_pattern, None, request_pipeline
+
+    def _handle_async(self, sync, server):
+        if not sync:
+            for requestable in self.contents:
+                server.send(requestable.to_osc())
+            return True
+
+    def _linearize(self):
+        for x in self.contents:
+            yield from x._linearize()
+
+    def _register(self, server, on_complete):
+        """
+        Register one callback per distinct response pattern.
+
+        Returns the requestables to send, the responses (filled in as they
+        arrive), the registered callbacks and the indices of requests still
+        awaiting a response. ``on_complete`` is called with the pipeline's
+        condition held once no requests remain.
+        """
+        from supriya.commands import Response
+
+        pending = collections.OrderedDict()
+        requestables, responses = [], []
+        for index, requestable in enumerate(self.contents):
+            (
+                success_pattern,
+                failure_pattern,
+                requestable,
+            ) = requestable._get_response_patterns_and_requestable(server)
+            requestables.append(requestable)
+            responses.append(None)
+            if success_pattern is None:
+                continue
+            for pattern in (success_pattern, failure_pattern):
+                if pattern:
+                    pending.setdefault(tuple(pattern), collections.deque()).append(
+                        index
+                    )
+        remaining = {index for indices in pending.values() for index in indices}
+        patterns = sorted(pending, key=len, reverse=True)
+
+        def procedure(pattern, message):
+            items = (message.address,) + message.contents
+            with self.condition:
+                for other_pattern in patterns:
+                    if len(other_pattern) <= len(pattern):
+                        break
+                    # defer to the most specific pattern still awaiting responses
+                    if items[: len(other_pattern)] == other_pattern and any(
+                        index in remaining for index in pending[other_pattern]
+                    ):
+                        return
+                indices = pending[pattern]
+                while indices:
+                    index = indices.popleft()
+                    if index in remaining:
+                        break
+                else:
+                    return
+                remaining.remove(index)
+                responses[index] = Response.from_osc_message(message)
+                if not remaining:
+                    on_complete()
+
+        callbacks = [
+            server.osc_protocol.register(
+                pattern=pattern,
+                procedure=lambda message, pattern=pattern: procedure(pattern, message),
+            )
+            for pattern in pending
+        ]
+        if not remaining:
+            on_complete()
+        return requestables, responses, callbacks, remaining
+
+    ### PUBLIC METHODS ###
+
+    def communicate(self, server=None, sync=True, timeout=1.0, apply_local=True):
+        """
+        Send all requests and wait up to ``timeout`` seconds for all responses.
+
+        Returns a list of responses, one per request, in request order. Requests
+        without a response, or whose response did not arrive in time, map to
+        ``None``.
+        """
+        import supriya.realtime
+
+        server = server or supriya.realtime.Server.default()
+        assert isinstance(server, supriya.realtime.servers.BaseServer)
+        assert server.is_running
+        if apply_local:
+            with server._lock:
+                for request in self._linearize():
+                    request._apply_local(server)
+        if self._handle_async(sync, server):
+            return
+        start_time = time.time()
+        with self.condition:
+            requestables, responses, callbacks, remaining = self._register(
+                server, self.condition.notify
+            )
+            try:
+                for requestable in requestables:
+                    server.send(requestable.to_osc())
+                while remaining:
+                    delta_time = time.time() - start_time
+                    if timeout <= delta_time:
+                        break
+                    self.condition.wait(timeout - delta_time)
+            finally:
+                for callback in callbacks:
+                    server.osc_protocol.unregister(callback)
+            # late responses may still be delivered until the unregistrations
+            # are processed, so snapshot under the lock
+            responses, timed_out_count = list(responses), len(remaining)
+        if timed_out_count:
+            logger.warning(
+                "Timed out: {} of {} requests".format(timed_out_count, len(self))
+            )
+        self._response = responses
+        return responses
+
+    async def communicate_async(self, server=None, sync=True, timeout=1.0):
+        """
+        Send all requests and wait up to ``timeout`` seconds for all responses.
+
+        Returns a list of responses, one per request, in request order. Requests
+        without a response, or whose response did not arrive in time, map to
+        ``None``.
+        """
+        if self._handle_async(sync, server):
+            return
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def on_complete():
+            if not future.done():
+                future.set_result(True)
+
+        requestables, responses, callbacks, remaining = self._register(
+            server, on_complete
+        )
+        try:
+            for requestable in requestables:
+                server.send(requestable.to_osc())
+            await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Timed out: {} of {} requests".format(len(remaining), len(self))
+            )
+        finally:
+            for callback in callbacks:
+                server.osc_protocol.unregister(callback)
+        self._response = responses
+        return responses
+
+    def to_osc(self, *, with_placeholders=False):
+        return OscBundle(
+            contents=[
+                requestable.to_osc(with_placeholders=with_placeholders)
+                for requestable in self.contents
+            ]
+        )
+
+    def to_list(self, *, with_placeholders=False):
+        return [
+            requestable.to_list(with_placeholders=with_placeholders)
+            for requestable in self.contents
+        ]
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def contents(self):
+        return self._contents
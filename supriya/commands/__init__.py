@@ -69,6 +69,7 @@ from .QueryTreeResponse import QueryTreeResponse
 from .QuitRequest import QuitRequest
 from .Request import Request
 from .RequestBundle import RequestBundle
+from .RequestPipeline import RequestPipeline
 from .Requestable import Requestable
 from .Response import Response
 from .StatusRequest import StatusRequest
@@ -157,6 +158,7 @@ __all__ = [
     "QuitRequest",
     "Request",
     "RequestBundle",
+    "RequestPipeline",
     "Requestable",
     "Response",
     "StatusRequest",
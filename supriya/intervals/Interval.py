@@ -1,8 +1,6 @@
 from typing import Optional, Union
 
-from uqbar.objects import get_repr, new
-
-from supriya.system import SupriyaValueObject
+from supriya.system import SupriyaValueObject, get_repr, new
 
 
 class Interval(SupriyaValueObject):
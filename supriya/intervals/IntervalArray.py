@@ -0,0 +1,171 @@
+import numpy
+
+from supriya.system import SupriyaObject
+
+
+class IntervalArray(SupriyaObject):
+    """
+    An immutable sorted array of intervals, answering queries in batches.
+
+    ::
+
+        >>> from supriya.intervals import Interval, IntervalArray
+        >>> interval_array = IntervalArray([
+        ...     Interval(0, 3),
+        ...     Interval(1, 3),
+        ...     Interval(1, 2),
+        ...     Interval(2, 5),
+        ...     Interval(6, 9),
+        ...     ])
+
+    Intervals are sorted once, and their offsets held in NumPy arrays, so that
+    a whole array of offsets can be looked up at once::
+
+        >>> intersections = interval_array.find_intersections([1.5, 5, 6])
+        >>> for interval in intersections[0]:
+        ...     interval
+        ...
+        Interval(start_offset=0.0, stop_offset=3.0)
+        Interval(start_offset=1.0, stop_offset=2.0)
+        Interval(start_offset=1.0, stop_offset=3.0)
+
+    ::
+
+        >>> intersections[1:]
+        [[], [Interval(start_offset=6.0, stop_offset=9.0)]]
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_intervals",
+        "_maximum_stop_offsets",
+        "_sorted_stop_offsets",
+        "_start_offsets",
+        "_stop_offsets",
+        "_stop_order",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, intervals=None):
+        intervals = list(intervals or ())
+        start_offsets = numpy.fromiter(
+            (x.start_offset for x in intervals), dtype=float, count=len(intervals)
+        )
+        stop_offsets = numpy.fromiter(
+            (x.stop_offset for x in intervals), dtype=float, count=len(intervals)
+        )
+        order = numpy.lexsort((stop_offsets, start_offsets))
+        self._intervals = tuple(intervals[i] for i in order.tolist())
+        self._start_offsets = start_offsets[order]
+        self._stop_offsets = stop_offsets[order]
+        # Every interval before the first whose running maximum stop offset
+        # follows an offset stops at or before it.
+        self._maximum_stop_offsets = numpy.maximum.accumulate(self._stop_offsets)
+        self._stop_order = numpy.argsort(self._stop_offsets, kind="stable")
+        self._sorted_stop_offsets = self._stop_offsets[self._stop_order]
+        for array in (self._start_offsets, self._stop_offsets):
+            array.flags.writeable = False
+
+    ### SPECIAL METHODS ###
+
+    def __getitem__(self, item):
+        return self._intervals[item]
+
+    def __iter__(self):
+        return iter(self._intervals)
+
+    def __len__(self):
+        return len(self._intervals)
+
+    ### PUBLIC METHODS ###
+
+    def find_intersection(self, offset):
+        """
+        Finds intervals intersecting ``offset``.
+        """
+        return self.find_intersections([offset])[0]
+
+    def find_intersections(self, offsets):
+        """
+        Finds intervals intersecting each of ``offsets``.
+
+        Returns one list of intervals per offset, in order.
+        """
+        offsets = numpy.asarray(offsets, dtype=float).ravel()
+        upper_indices = numpy.searchsorted(self._start_offsets, offsets, side="right")
+        lower_indices = numpy.searchsorted(
+            self._maximum_stop_offsets, offsets, side="right"
+        )
+        intersections = []
+        for offset, lower_index, upper_index in zip(
+            offsets.tolist(), lower_indices.tolist(), upper_indices.tolist()
+        ):
+            if upper_index <= lower_index:
+                intersections.append([])
+                continue
+            stop_offsets = self._stop_offsets[lower_index:upper_index]
+            indices = numpy.flatnonzero(offset < stop_offsets) + lower_index
+            intersections.append([self._intervals[i] for i in indices.tolist()])
+        return intersections
+
+    def iterate_sweep(self):
+        """
+        Sweeps over every start and stop offset, in order.
+
+        ::
+
+            >>> from supriya.intervals import Interval, IntervalArray
+            >>> interval_array = IntervalArray([
+            ...     Interval(0, 3),
+            ...     Interval(1, 3),
+            ...     Interval(1, 2),
+            ...     Interval(2, 5),
+            ...     ])
+            >>> for offset, starting, stopping in interval_array.iterate_sweep():
+            ...     offset, len(starting), len(stopping)
+            ...
+            (0.0, 1, 0)
+            (1.0, 2, 0)
+            (2.0, 1, 1)
+            (3.0, 0, 2)
+            (5.0, 0, 1)
+
+        Yields each offset with the intervals starting and stopping there.
+        """
+        offsets = numpy.union1d(self._start_offsets, self._stop_offsets)
+        start_indices = numpy.searchsorted(self._start_offsets, offsets, side="left")
+        stop_indices = numpy.searchsorted(
+            self._sorted_stop_offsets, offsets, side="left"
+        )
+        start_indices = start_indices.tolist() + [len(self)]
+        stop_indices = stop_indices.tolist() + [len(self)]
+        for i, offset in enumerate(offsets.tolist()):
+            yield (
+                offset,
+                self._intervals[start_indices[i] : start_indices[i + 1]],
+                tuple(
+                    self._intervals[j]
+                    for j in self._stop_order[
+                        stop_indices[i] : stop_indices[i + 1]
+                    ].tolist()
+                ),
+            )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def start_offsets(self):
+        """
+        Gets the intervals' start offsets, as a read-only array.
+        """
+        return self._start_offsets
+
+    @property
+    def stop_offsets(self):
+        """
+        Gets the intervals' stop offsets, as a read-only array.
+        """
+        return self._stop_offsets
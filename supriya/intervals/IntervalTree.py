@@ -1,6 +1,4 @@
-from uqbar.objects import get_repr
-
-from supriya.system import SupriyaObject
+from supriya.system import SupriyaObject, get_repr
 
 from .IntervalTreeDriver import IntervalTreeDriver
 from .Moment import Moment
@@ -24,12 +22,17 @@ class IntervalTree(SupriyaObject):
 
     """
 
+    ### CLASS VARIABLES ###
+
+    _batch_size = 32
+
     ### INITIALIZER ###
 
     # TODO: Protect datastructure with a R/W lock: https://pypi.org/project/readerwriterlock/
 
     def __init__(self, intervals=None, accelerated=True):
         self._driver = IntervalTreeDriver(intervals)
+        self._interval_array = None
         self._accelerated = bool(accelerated)
         if not accelerated:
             return
@@ -261,6 +264,15 @@ class IntervalTree(SupriyaObject):
 
     ### PRIVATE METHODS ###
 
+    def _get_interval_array(self):
+        if self._interval_array is None:
+            try:
+                from .IntervalArray import IntervalArray
+            except ImportError:
+                return None
+            self._interval_array = IntervalArray(self)
+        return self._interval_array
+
     @staticmethod
     def _is_interval(expr):
         if hasattr(expr, "start_offset") and hasattr(expr, "stop_offset"):
@@ -328,6 +340,50 @@ class IntervalTree(SupriyaObject):
             return self._driver.find_intervals_intersecting_interval(interval_or_offset)
         return self._driver.find_intervals_intersecting_offset(interval_or_offset)
 
+    def find_intersections(self, offsets):
+        """
+        Finds intervals intersecting each of ``offsets``.
+
+        ::
+
+            >>> from supriya.intervals import Interval, IntervalTree
+            >>> intervals = (
+            ...     Interval(0, 3),
+            ...     Interval(1, 3),
+            ...     Interval(1, 2),
+            ...     Interval(2, 5),
+            ...     Interval(6, 9),
+            ...     )
+            >>> interval_tree = IntervalTree(intervals)
+
+        ::
+
+            >>> intersections = interval_tree.find_intersections([0, 2.5, 5.5])
+            >>> [len(x) for x in intersections]
+            [1, 3, 0]
+
+        ::
+
+            >>> for x in intersections[1]:
+            ...     x
+            ...
+            Interval(start_offset=0.0, stop_offset=3.0)
+            Interval(start_offset=1.0, stop_offset=3.0)
+            Interval(start_offset=2.0, stop_offset=5.0)
+
+        Large batches are answered from an ``IntervalArray`` snapshot of the
+        tree, kept until the tree next changes, if NumPy is available.
+
+        Returns one list of intervals per offset, in order.
+        """
+        offsets = list(offsets)
+        if self._interval_array is None and len(offsets) < self._batch_size:
+            return [self.find_intersection(offset) for offset in offsets]
+        interval_array = self._get_interval_array()
+        if interval_array is None:
+            return [self.find_intersection(offset) for offset in offsets]
+        return interval_array.find_intersections(offsets)
+
     def find_intervals_starting_at(self, offset):
         return self._driver.find_intervals_starting_at(offset)
 
@@ -506,9 +562,11 @@ class IntervalTree(SupriyaObject):
         return self._driver.index(interval)
 
     def add(self, interval):
+        self._interval_array = None
         self._driver.add(interval)
 
     def update(self, intervals):
+        self._interval_array = None
         self._driver.update(intervals)
 
     def iterate_moments(self, reverse=False):
@@ -568,6 +626,49 @@ class IntervalTree(SupriyaObject):
                 yield moment
                 moment = moment.next_moment
 
+    def iterate_sweep(self):
+        """
+        Sweeps over every start and stop offset in this interval tree, in
+        order.
+
+        ::
+
+            >>> from supriya.intervals import Interval, IntervalTree
+            >>> intervals = (
+            ...     Interval(0, 3),
+            ...     Interval(1, 3),
+            ...     Interval(1, 2),
+            ...     Interval(2, 5),
+            ...     Interval(6, 9),
+            ...     )
+            >>> interval_tree = IntervalTree(intervals)
+
+        ::
+
+            >>> for offset, starting, stopping in interval_tree.iterate_sweep():
+            ...     offset, len(starting), len(stopping)
+            ...
+            (0.0, 1, 0)
+            (1.0, 2, 0)
+            (2.0, 1, 1)
+            (3.0, 0, 2)
+            (5.0, 0, 1)
+            (6.0, 1, 0)
+            (9.0, 0, 1)
+
+        Yields each offset with the intervals starting and stopping there.
+        """
+        interval_array = self._get_interval_array()
+        if interval_array is not None:
+            yield from interval_array.iterate_sweep()
+            return
+        for offset in self.all_offsets:
+            yield (
+                offset,
+                tuple(self.find_intervals_starting_at(offset)),
+                tuple(self.find_intervals_stopping_at(offset)),
+            )
+
     def iterate_moments_nwise(self, n=3, reverse=False):
         """
         Iterates moments in this interval tree in groups of
@@ -660,16 +761,20 @@ class IntervalTree(SupriyaObject):
             Interval(start_offset=6.0, stop_offset=9.0)
 
         """
+        self._interval_array = None
         self._driver.remove(interval)
 
     ### PRIVATE PROPERTIES ###
 
     @property
     def _root_node(self):
+        if isinstance(self._driver, IntervalTreeDriver):
+            self._driver._refresh()
         return self._driver._root_node
 
     @_root_node.setter
     def _root_node(self, node):
+        self._interval_array = None
         self._driver._root_node = node
 
     ### PUBLIC PROPERTIES ###
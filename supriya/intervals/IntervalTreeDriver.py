@@ -89,12 +89,13 @@ class IntervalTreeDriver:
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_root_node",)
+    __slots__ = ("_root_node", "_stale")
 
     ### INITIALIZER ###
 
     def __init__(self, intervals=None):
         self._root_node = None
+        self._stale = False
         self.update(intervals or [])
 
     ### SPECIAL METHODS ###
@@ -107,6 +108,7 @@ class IntervalTreeDriver:
         return result
 
     def __getitem__(self, item):
+        self._refresh()
         if isinstance(item, int):
             if self._root_node is None:
                 raise IndexError
@@ -144,12 +146,37 @@ class IntervalTreeDriver:
             current = current.right_child
 
     def __len__(self):
+        self._refresh()
         if self._root_node is None:
             return 0
         return self._root_node.subtree_stop_index
 
     ### PRIVATE METHODS ###
 
+    def _build_nodes(self, payloads, start, stop):
+        """
+        Builds a balanced subtree of nodes from sorted ``payloads[start:stop]``.
+        """
+        if stop <= start:
+            return None
+        middle = (start + stop) // 2
+        node = _CNode(payloads[middle][0].start_offset)
+        node.payload = payloads[middle]
+        self._set_node_left_child(node, self._build_nodes(payloads, start, middle))
+        self._set_node_right_child(node, self._build_nodes(payloads, middle + 1, stop))
+        return node
+
+    def _collect_cintervals(self):
+        cintervals, stack, current = [], [], self._root_node
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.left_child
+            current = stack.pop()
+            cintervals.extend(current.payload)
+            current = current.right_child
+        return cintervals
+
     def _get_node_cinterval(self, node):
         return Interval(
             start_offset=node.start_offset, stop_offset=node.stop_offset_high
@@ -178,6 +205,16 @@ class IntervalTreeDriver:
             return True
         return False
 
+    def _refresh(self):
+        """
+        Reindexes the tree, if changed since it was last indexed.
+        """
+        if not self._stale:
+            return
+        self._update_indices(self._root_node, -1)
+        self._update_offsets(self._root_node)
+        self._stale = False
+
     def _remove_node(self, node, start_offset):
         if node is None:
             return None
@@ -445,10 +482,10 @@ class IntervalTreeDriver:
             return
         cinterval = _CInterval.from_interval(interval)
         self._insert_interval(cinterval)
-        self._update_indices(self._root_node, -1)
-        self._update_offsets(self._root_node)
+        self._stale = True
 
     def find_intervals_intersecting_offset(self, offset):
+        self._refresh()
         offset = float(offset)
         cintervals = self._recurse_find_intervals_intersecting_offset(
             self._root_node, offset
@@ -457,6 +494,7 @@ class IntervalTreeDriver:
         return [cinterval.original_interval for cinterval in cintervals]
 
     def find_intervals_intersecting_interval(self, interval):
+        self._refresh()
         cinterval = _CInterval.from_interval(interval)
         cintervals = self._recurse_find_intervals_intersecting_interval(
             self._root_node, cinterval
@@ -473,6 +511,7 @@ class IntervalTreeDriver:
         return results
 
     def find_intervals_stopping_at(self, offset):
+        self._refresh()
         cintervals = self._recurse_find_intervals_stopping_at(self._root_node, offset)
         cintervals.sort(key=lambda x: (x.start_offset, x.stop_offset))
         return [cinterval.original_interval for cinterval in cintervals]
@@ -490,6 +529,7 @@ class IntervalTreeDriver:
         return node.start_offset
 
     def index(self, interval):
+        self._refresh()
         assert self._is_interval(interval)
         cinterval = _CInterval.from_interval(interval)
         node = self._search(self._root_node, cinterval.start_offset)
@@ -505,18 +545,33 @@ class IntervalTreeDriver:
             raise ValueError(interval)
         cinterval = _CInterval.from_interval(interval)
         self._remove_interval(cinterval)
-        self._update_indices(self._root_node, -1)
-        self._update_offsets(self._root_node)
+        self._stale = True
 
     def update(self, intervals):
-        # for interval in intervals:
-        #     if not self._is_interval(interval):
-        #         raise ValueError(interval)
-        for interval in intervals:
-            if not self._is_interval(interval):
-                # raise ValueError(interval)
-                continue
-            cinterval = _CInterval.from_interval(interval)
-            self._insert_interval(cinterval)
-        self._update_indices(self._root_node, -1)
-        self._update_offsets(self._root_node)
+        """
+        Adds ``intervals`` in bulk.
+
+        Sorts the new intervals once, merges them with those already present,
+        and rebuilds a balanced tree from the result, rather than inserting and
+        rebalancing one interval at a time.
+        """
+        cintervals = [
+            _CInterval.from_interval(interval)
+            for interval in intervals
+            if self._is_interval(interval)
+        ]
+        if not cintervals:
+            return
+        cintervals = sorted(
+            self._collect_cintervals() + cintervals,
+            key=lambda x: (x.start_offset, x.stop_offset),
+        )
+        payloads = []
+        for cinterval in cintervals:
+            if payloads and payloads[-1][0].start_offset == cinterval.start_offset:
+                payloads[-1].append(cinterval)
+            else:
+                payloads.append([cinterval])
+        self._root_node = self._build_nodes(payloads, 0, len(payloads))
+        self._stale = True
+        self._refresh()
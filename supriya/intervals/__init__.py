@@ -6,6 +6,11 @@ from .IntervalTree import IntervalTree  # noqa
 from .IntervalTreeDriver import IntervalTreeDriver  # noqa
 from .Moment import Moment  # noqa
 
+try:
+    from .IntervalArray import IntervalArray  # noqa
+except ImportError:
+    pass
+
 try:
     from .IntervalTreeDriverEx import IntervalTreeDriverEx  # noqa
 except ModuleNotFoundError:
@@ -0,0 +1,238 @@
+import contextlib
+import json
+import os
+import pathlib
+import shutil
+import sqlite3
+import tempfile
+import time
+
+import supriya
+from supriya.system import SupriyaObject
+
+
+class RenderCache(SupriyaObject):
+    """
+    A content-addressed cache of rendered outputs, shareable between
+    renderers and render directories.
+
+    ::
+
+        >>> import tempfile
+        >>> import supriya.nonrealtime
+        >>> cache = supriya.nonrealtime.RenderCache(
+        ...     tempfile.mkdtemp(), maximum_size=2 ** 30,
+        ... )
+        >>> len(cache)
+        0
+
+    Outputs are stored under their file name, which renderers derive from the
+    hash of the score they were rendered from, and indexed in a SQLite
+    manifest with their size, metadata and last access time. Storing an
+    output evicts the least recently used outputs until the cache fits in
+    ``maximum_size`` bytes.
+
+    The manifest also maps cheap session fingerprints to those file names,
+    so that renderers can find unchanged sessions' outputs without compiling
+    their scores.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Session Internals"
+
+    __slots__ = ("_directory_path", "_maximum_size")
+
+    ### INITIALIZER ###
+
+    def __init__(self, directory_path=None, maximum_size=None):
+        self._directory_path = (
+            pathlib.Path(directory_path or supriya.output_path / "cache")
+            .expanduser()
+            .absolute()
+        )
+        if maximum_size is not None:
+            maximum_size = int(maximum_size)
+        self._maximum_size = maximum_size
+        self._directory_path.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, size INTEGER, created REAL, "
+                "accessed REAL, metadata TEXT)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprints ("
+                "fingerprint TEXT PRIMARY KEY, key TEXT)"
+            )
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, key):
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT 1 FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None and (self.directory_path / key).exists()
+
+    def __len__(self):
+        with self._connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    ### PRIVATE METHODS ###
+
+    @contextlib.contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(str(self.manifest_path), timeout=60)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _copy(self, source_path, target_path):
+        """
+        Copies ``source_path`` to ``target_path`` atomically, so that readers
+        never see a partial file.
+        """
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=str(target_path.parent), prefix=".", suffix=target_path.suffix
+        )
+        os.close(file_descriptor)
+        try:
+            shutil.copyfile(str(source_path), temporary_path)
+            os.replace(temporary_path, str(target_path))
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    ### PUBLIC METHODS ###
+
+    def evict(self, maximum_size=None):
+        """
+        Evicts the least recently used outputs until the cache fits in
+        ``maximum_size`` bytes, or the cache's own maximum size.
+
+        Returns the evicted outputs' keys.
+        """
+        if maximum_size is None:
+            maximum_size = self.maximum_size
+        if maximum_size is None:
+            return []
+        evicted_keys = []
+        with self._connect() as connection:
+            total_size = connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()[0]
+            rows = connection.execute(
+                "SELECT key, size FROM entries ORDER BY accessed, created"
+            )
+            for key, size in rows.fetchall():
+                if total_size <= maximum_size:
+                    break
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total_size -= size
+                evicted_keys.append(key)
+        for key in evicted_keys:
+            with contextlib.suppress(FileNotFoundError):
+                (self.directory_path / key).unlink()
+        return evicted_keys
+
+    def fetch(self, key, file_path):
+        """
+        Copies the output stored under ``key`` to ``file_path``, hard-linking
+        it where possible.
+
+        Returns true if the cache held the output, otherwise false.
+        """
+        file_path = pathlib.Path(file_path)
+        cached_file_path = self.directory_path / key
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            if not cursor.rowcount:
+                return False
+            if not cached_file_path.exists():
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return False
+        if file_path.exists():
+            return True
+        try:
+            os.link(str(cached_file_path), str(file_path))
+        except FileExistsError:
+            pass
+        except OSError:
+            self._copy(cached_file_path, file_path)
+        return True
+
+    def get_key(self, fingerprint):
+        """
+        Gets the key recorded for ``fingerprint``, if any.
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT key FROM fingerprints WHERE fingerprint = ?", (fingerprint,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_metadata(self, key):
+        """
+        Gets the metadata stored with the output under ``key``, if any.
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT metadata FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_key(self, fingerprint, key):
+        """
+        Records ``key`` as the key of outputs rendered from ``fingerprint``.
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO fingerprints VALUES (?, ?)", (fingerprint, key)
+            )
+
+    def store(self, key, file_path, **metadata):
+        """
+        Stores the output at ``file_path`` under ``key``, with ``metadata``,
+        then evicts outputs beyond the cache's maximum size.
+        """
+        file_path = pathlib.Path(file_path)
+        self._copy(file_path, self.directory_path / key)
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    file_path.stat().st_size,
+                    now,
+                    now,
+                    json.dumps(metadata, default=str, sort_keys=True),
+                ),
+            )
+        self.evict()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory_path(self):
+        return self._directory_path
+
+    @property
+    def manifest_path(self):
+        return self.directory_path / "manifest.sqlite3"
+
+    @property
+    def maximum_size(self):
+        return self._maximum_size
+
+    @property
+    def size(self):
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()[0]
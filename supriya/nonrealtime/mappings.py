@@ -0,0 +1,296 @@
+import collections.abc
+
+_BITS = 5
+
+_MASK = (1 << _BITS) - 1
+
+_MAXIMUM_SHIFT = 64
+
+
+class _Node:
+    """
+    A hash array mapped trie node.
+
+    Holds a bitmap of occupied slots, and one entry per occupied slot: either a
+    ``(key, value)`` pair or a child node. Only the mapping owning a node may
+    change it in place; everyone else copies it first.
+    """
+
+    __slots__ = ("bitmap", "entries", "owner")
+
+    def __init__(self, bitmap, entries, owner=None):
+        self.bitmap = bitmap
+        self.entries = entries
+        self.owner = owner
+
+
+class _Bucket:
+    """
+    A list of ``(key, value)`` pairs whose keys' hashes collide entirely.
+    """
+
+    __slots__ = ("entries",)
+
+    def __init__(self, entries):
+        self.entries = entries
+
+
+_MISSING = object()
+
+
+def _hash(key):
+    return hash(key) & ((1 << _MAXIMUM_SHIFT) - 1)
+
+
+def _get(node, hash_, key, default):
+    shift = 0
+    while True:
+        if isinstance(node, _Bucket):
+            for pair in node.entries:
+                if pair[0] is key or pair[0] == key:
+                    return pair[1]
+            return default
+        bit = 1 << ((hash_ >> shift) & _MASK)
+        if not node.bitmap & bit:
+            return default
+        entry = node.entries[bin(node.bitmap & (bit - 1)).count("1")]
+        if isinstance(entry, tuple):
+            if entry[0] is key or entry[0] == key:
+                return entry[1]
+            return default
+        node, shift = entry, shift + _BITS
+
+
+def _merge(pair_one, hash_one, pair_two, hash_two, shift, owner):
+    if _MAXIMUM_SHIFT <= shift:
+        return _Bucket((pair_one, pair_two))
+    index_one = (hash_one >> shift) & _MASK
+    index_two = (hash_two >> shift) & _MASK
+    if index_one == index_two:
+        child = _merge(pair_one, hash_one, pair_two, hash_two, shift + _BITS, owner)
+        return _Node(1 << index_one, [child], owner)
+    entries = [pair_one, pair_two] if index_one < index_two else [pair_two, pair_one]
+    return _Node((1 << index_one) | (1 << index_two), entries, owner)
+
+
+def _edit(node, owner):
+    if node.owner is owner:
+        return node
+    return _Node(node.bitmap, list(node.entries), owner)
+
+
+def _set(node, hash_, key, value, shift, owner):
+    """
+    Maps ``key`` to ``value`` in ``node``, copying it unless owned by ``owner``.
+
+    Returns the new node, and whether the key was added.
+    """
+    if isinstance(node, _Bucket):
+        entries = list(node.entries)
+        for i, pair in enumerate(entries):
+            if pair[0] is key or pair[0] == key:
+                entries[i] = (key, value)
+                return _Bucket(tuple(entries)), False
+        entries.append((key, value))
+        return _Bucket(tuple(entries)), True
+    bit = 1 << ((hash_ >> shift) & _MASK)
+    index = bin(node.bitmap & (bit - 1)).count("1")
+    if not node.bitmap & bit:
+        node = _edit(node, owner)
+        node.bitmap |= bit
+        node.entries.insert(index, (key, value))
+        return node, True
+    entry = node.entries[index]
+    if isinstance(entry, tuple):
+        if entry[0] is key or entry[0] == key:
+            if entry[1] is value:
+                return node, False
+            node = _edit(node, owner)
+            node.entries[index] = (key, value)
+            return node, False
+        child = _merge(
+            entry, _hash(entry[0]), (key, value), hash_, shift + _BITS, owner
+        )
+        added = True
+    else:
+        child, added = _set(entry, hash_, key, value, shift + _BITS, owner)
+        if child is entry:
+            return node, added
+    node = _edit(node, owner)
+    node.entries[index] = child
+    return node, added
+
+
+def _delete(node, hash_, key, shift, owner):
+    """
+    Removes ``key`` from ``node``, copying it unless owned by ``owner``.
+
+    Returns the new node, and whether the key was removed. Children left
+    holding a single pair are collapsed into that pair, so every set of keys
+    has exactly one shape, and equal mappings have equal tries.
+    """
+    if isinstance(node, _Bucket):
+        entries = tuple(
+            pair for pair in node.entries if not (pair[0] is key or pair[0] == key)
+        )
+        if len(entries) == len(node.entries):
+            return node, False
+        elif len(entries) == 1:
+            return entries[0], True
+        return _Bucket(entries), True
+    bit = 1 << ((hash_ >> shift) & _MASK)
+    if not node.bitmap & bit:
+        return node, False
+    index = bin(node.bitmap & (bit - 1)).count("1")
+    entry = node.entries[index]
+    if isinstance(entry, tuple):
+        if not (entry[0] is key or entry[0] == key):
+            return node, False
+        if shift and len(node.entries) == 2:
+            other = node.entries[1 - index]
+            if isinstance(other, tuple):
+                return other, True
+        node = _edit(node, owner)
+        node.bitmap ^= bit
+        del node.entries[index]
+        return node, True
+    child, removed = _delete(entry, hash_, key, shift + _BITS, owner)
+    if not removed:
+        return node, False
+    if shift and len(node.entries) == 1 and isinstance(child, tuple):
+        return child, True
+    node = _edit(node, owner)
+    node.entries[index] = child
+    return node, True
+
+
+def _equals(node_one, node_two):
+    if node_one is node_two:
+        return True
+    elif isinstance(node_one, _Bucket) and isinstance(node_two, _Bucket):
+        return dict(node_one.entries) == dict(node_two.entries)
+    elif not (isinstance(node_one, _Node) and isinstance(node_two, _Node)):
+        return False
+    elif node_one.bitmap != node_two.bitmap:
+        return False
+    for entry_one, entry_two in zip(node_one.entries, node_two.entries):
+        if entry_one is entry_two:
+            continue
+        elif isinstance(entry_one, tuple) and isinstance(entry_two, tuple):
+            if entry_one[0] is not entry_two[0] and entry_one[0] != entry_two[0]:
+                return False
+            elif entry_one[1] is not entry_two[1] and entry_one[1] != entry_two[1]:
+                return False
+        elif not _equals(entry_one, entry_two):
+            return False
+    return True
+
+
+def _iterate(node):
+    for entry in node.entries:
+        if isinstance(entry, tuple):
+            yield entry
+        else:
+            yield from _iterate(entry)
+
+
+class PersistentMapping(collections.abc.MutableMapping):
+    """
+    A mapping whose copies share structure.
+
+    Backed by a hash array mapped trie: copying is constant-time, and each
+    change copies at most the handful of trie nodes along one key's path, so
+    many slightly different copies cost memory proportional to their
+    differences. Comparing copies skips every subtrie they still share.
+
+    ::
+
+        >>> from supriya.nonrealtime.mappings import PersistentMapping
+        >>> mapping_one = PersistentMapping({"a": 1, "b": 2})
+        >>> mapping_two = mapping_one.copy()
+        >>> mapping_two["c"] = 3
+        >>> del mapping_two["a"]
+
+    ::
+
+        >>> sorted(mapping_one.items())
+        [('a', 1), ('b', 2)]
+
+    ::
+
+        >>> sorted(mapping_two.items())
+        [('b', 2), ('c', 3)]
+
+    Iteration order follows key hashes, not insertion.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Session Internals"
+
+    __slots__ = ("_length", "_owner", "_root")
+
+    ### INITIALIZER ###
+
+    def __init__(self, items=None):
+        self._length = 0
+        self._owner = object()
+        self._root = _Node(0, [], self._owner)
+        if items:
+            self.update(items)
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, key):
+        return _get(self._root, _hash(key), key, _MISSING) is not _MISSING
+
+    def __delitem__(self, key):
+        self._root, removed = _delete(self._root, _hash(key), key, 0, self._owner)
+        if not removed:
+            raise KeyError(key)
+        self._length -= 1
+
+    def __eq__(self, expr):
+        if isinstance(expr, type(self)):
+            return self._length == expr._length and _equals(self._root, expr._root)
+        return collections.abc.MutableMapping.__eq__(self, expr)
+
+    def __getitem__(self, key):
+        value = _get(self._root, _hash(key), key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __getstate__(self):
+        return dict(self)
+
+    def __iter__(self):
+        for key, _ in _iterate(self._root):
+            yield key
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, dict(self))
+
+    def __setitem__(self, key, value):
+        self._root, added = _set(self._root, _hash(key), key, value, 0, self._owner)
+        self._length += added
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    ### PUBLIC METHODS ###
+
+    def copy(self):
+        # Both mappings give up ownership of the shared trie.
+        self._owner = object()
+        mapping = type(self).__new__(type(self))
+        mapping._length = self._length
+        mapping._owner = object()
+        mapping._root = self._root
+        return mapping
+
+    def get(self, key, default=None):
+        return _get(self._root, _hash(key), key, default)
@@ -1,10 +1,8 @@
-import bisect
 import collections
 import uuid
 from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 import uqbar.graphs
-from uqbar.objects import new
 
 import supriya  # noqa
 import supriya.realtime
@@ -12,7 +10,9 @@ from supriya.commands.GroupNewRequest import GroupNewRequest
 from supriya.commands.SynthNewRequest import SynthNewRequest
 from supriya.nonrealtime.bases import SessionObject
 from supriya.nonrealtime.states import NodeTransition, State
+from supriya.nonrealtime.timelines import Timeline
 from supriya.patterns.Pattern import Pattern
+from supriya.system import new
 
 
 class Node(SessionObject):
@@ -44,7 +44,7 @@ class Node(SessionObject):
         if duration is None:
             duration = float("inf")
         self._duration = duration
-        self._events: Dict[str, List[Tuple[float, float]]] = {}
+        self._events: Dict[str, Timeline] = {}
 
     ### SPECIAL METHODS ###
 
@@ -120,21 +120,19 @@ class Node(SessionObject):
             moment.state.stop_nodes.add(self)
 
     def _fixup_events(self, new_node: "Node", split_offset: float) -> None:
-        left_events: Dict[str, List[Tuple[float, float]]] = {}
-        right_events: Dict[str, List[Tuple[float, float]]] = {}
+        left_events: Dict[str, Timeline] = {}
+        right_events: Dict[str, Timeline] = {}
         for name, events in self._events.items():
-            for offset, value in events:
-                if offset < split_offset:
-                    left_events.setdefault(name, []).append((offset, value))
-                else:
-                    right_events.setdefault(name, []).append((offset, value))
-        for name, events in left_events.items():
-            if name in right_events and right_events[name][0][0] == split_offset:
-                continue
-            event = (split_offset, events[-1][-1])
-            right_events.setdefault(name, []).insert(0, event)
+            left, right = events.split(split_offset)
+            if left:
+                left_events[name] = left
+                if not right or right[0][0] != split_offset:
+                    right.set(split_offset, left[-1][-1])
+            if right:
+                right_events[name] = right
         self._events = left_events
         new_node._events = right_events
+        self.session._mark_dirty(split_offset, self.stop_offset)
 
     def _fixup_node_actions(
         self, new_node: "Node", start_offset: "float", stop_offset: "float"
@@ -145,6 +143,7 @@ class Node(SessionObject):
             elif stop_offset < offset:
                 break
             transitions = self.session.states[offset].transitions
+            self.session._mark_dirty(offset)
             if self in transitions:
                 transitions[new_node] = transitions.pop(self)
             for node, action in transitions.items():
@@ -167,18 +166,7 @@ class Node(SessionObject):
         events = self._events.get(item)
         if not events:
             return None, None
-        index = bisect.bisect_left(events, (offset,))
-        if len(events) <= index:
-            old_offset, value = events[-1]
-        else:
-            old_offset, value = events[index]
-        if old_offset == offset:
-            return value, old_offset
-        index -= 1
-        if index < 0:
-            return None, None
-        actual_offset, value = events[index]
-        return value, actual_offset
+        return events.get(offset)
 
     def _set_at_offset(self, offset, item, value):
         """
@@ -186,19 +174,9 @@ class Node(SessionObject):
         """
         if offset < self.start_offset or self.stop_offset <= offset:
             return
-        events = self._events.setdefault(item, [])
-        new_event = (offset, value)
-        if not events:
-            events.append(new_event)
-            return
-        index = bisect.bisect_left(events, new_event)
-        if len(events) <= index:
-            events.append(new_event)
-        old_offset, old_value = events[index]
-        if old_offset == offset:
-            events[index] = (offset, value)
-        else:
-            events.insert(index, new_event)
+        if item not in self._events:
+            self._events[item] = Timeline()
+        self._events[item].set(offset, value)
 
     def _split(
         self,
@@ -366,8 +344,10 @@ class Node(SessionObject):
             state_two._transitions = state_two._rebuild_transitions(
                 state_one, state_two
             )
+            self.session._mark_dirty(state_two.offset)
             if state_two == self.stop_offset:
                 break
+        self.session._mark_dirty(self.start_offset, self.stop_offset)
         self.session.nodes.remove(self)
         self.session._nodes_by_session_id.pop(self.session_id)
         self.session._apply_transitions([self.start_offset, self.stop_offset])
@@ -379,6 +359,50 @@ class Node(SessionObject):
             raise ValueError("Cannot free after stop offset")
         return self.set_duration(new_duration, clip_children=True)
 
+    def set_curve(self, item: str, offsets, values) -> None:
+        """
+        Sets control ``item`` to each of ``values`` at the matching one of
+        ``offsets``, in one pass.
+
+        ::
+
+            >>> import supriya.nonrealtime
+            >>> session = supriya.nonrealtime.Session()
+            >>> with session.at(0):
+            ...     synth = session.add_synth(duration=1)
+            ...
+            >>> synth.set_curve("frequency", [0.25, 0.5, 0.75], [440, 550, 660])
+            >>> with session.at(0.6):
+            ...     synth["frequency"]
+            ...
+            550
+
+        Points outside the node's lifetime are ignored, as when setting one
+        control at a time.
+        """
+        import supriya.nonrealtime
+
+        events = []
+        for offset, value in zip(offsets, values):
+            offset = float(offset)
+            assert isinstance(
+                value,
+                (int, float, supriya.nonrealtime.Bus, supriya.nonrealtime.BusGroup),
+            )
+            if self.start_offset <= offset < self.stop_offset:
+                events.append((offset, value))
+        if not events:
+            return
+        if item not in self._events:
+            self._events[item] = Timeline()
+        self._events[item].update(events)
+        for offset, _ in events:
+            if offset not in self.session.states:
+                self.session._add_state_at(offset)
+        self.session._mark_dirty(
+            min(offset for offset, _ in events), max(offset for offset, _ in events)
+        )
+
     def set_duration(self, new_duration: float, clip_children: bool = False) -> "Node":
         import supriya.nonrealtime
 
@@ -1,23 +1,30 @@
+import array
+import concurrent.futures
+import filecmp
 import hashlib
 import os
 import pathlib
 import shutil
 import struct
 import subprocess
+import sys
+import tempfile
 
 import tqdm  # type: ignore
 import uqbar.containers
 import uqbar.io
 import yaml
-from uqbar.objects import new
 
 import supriya
 import supriya.realtime
 import supriya.soundfiles
+import supriya.synthdefs
 import supriya.system
+import supriya.ugens
 from supriya import HeaderFormat, SampleFormat, scsynth
 from supriya.exceptions import NonrealtimeOutputMissing, NonrealtimeRenderError
-from supriya.system import SupriyaObject
+from supriya.system import SupriyaObject, new
+from supriya.utils import iterate_nwise
 
 
 class SessionRenderer(SupriyaObject):
@@ -34,12 +41,15 @@ class SessionRenderer(SupriyaObject):
         "_header_format",
         "_prerender_tuples",
         "_print_transcript",
+        "_render_cache",
         "_render_directory_path",
         "_sample_format",
         "_sample_rate",
         "_session",
+        "_session_fingerprints",
         "_session_input_paths",
         "_renderable_prefixes",
+        "_temporary_file_paths",
         "_transcript",
         "_transcript_prefix",
         "_dependency_graph",
@@ -57,6 +67,7 @@ class SessionRenderer(SupriyaObject):
         sample_format=SampleFormat.INT24,
         sample_rate=44100,
         transcript_prefix=None,
+        render_cache=None,
     ):
         self._session = session
 
@@ -76,6 +87,8 @@ class SessionRenderer(SupriyaObject):
 
         self._sample_rate = int(sample_rate)
 
+        self._render_cache = render_cache
+
         transcript_prefix = transcript_prefix or None
         if transcript_prefix:
             transcript_prefix = str(transcript_prefix)
@@ -85,21 +98,20 @@ class SessionRenderer(SupriyaObject):
 
     ### PRIVATE METHODS ###
 
-    def _build_datagram(self, osc_bundles):
-        datagrams = []
-        for osc_bundle in osc_bundles:
-            datagram = osc_bundle.to_datagram(realtime=False)
-            size = len(datagram)
-            size = struct.pack(">i", size)
-            datagrams.append(size)
-            datagrams.append(datagram)
-        datagram = b"".join(datagrams)
-        return datagram
-
-    def _build_file_path(self, datagram, input_file_path, session):
-        # print('BUILDING FILE PATH')
+    def _build_fingerprint(self, session, duration):
         md5 = hashlib.md5()
-        md5.update(datagram)
+        for value in (
+            session._build_fingerprint(),
+            duration,
+            self.sample_rate,
+            self.header_format,
+            self.sample_format,
+        ):
+            md5.update(str(value).encode())
+        return md5.hexdigest()
+
+    def _build_file_path(self, md5, input_file_path, session, name="session"):
+        md5 = md5.copy()
         hash_values = []
         if input_file_path is not None:
             hash_values.append(input_file_path)
@@ -117,7 +129,7 @@ class SessionRenderer(SupriyaObject):
             value = value.encode()
             md5.update(value)
         md5 = md5.hexdigest()
-        file_path = "session-{}.osc".format(md5)
+        file_path = "{}-{}.osc".format(name, md5)
         return pathlib.Path(file_path)
 
     def _build_render_command(
@@ -126,10 +138,14 @@ class SessionRenderer(SupriyaObject):
         output_file_path,
         session_osc_file_path,
         *,
+        header_format=None,
+        sample_format=None,
         scsynth_path=None,
         server_options=None,
     ):
         cwd = pathlib.Path.cwd()
+        header_format = header_format or self.header_format
+        sample_format = sample_format or self.sample_format
         scsynth_path = scsynth.find(scsynth_path)
         server_options = server_options or scsynth.Options()
         if os.environ.get("TRAVIS", None):
@@ -145,8 +161,8 @@ class SessionRenderer(SupriyaObject):
             output_file_path = output_file_path.relative_to(cwd)
         parts.append(output_file_path)
         parts.append(self.sample_rate)
-        parts.append(self.header_format.name.lower())  # Must be lowercase.
-        parts.append(self.sample_format.name.lower())  # Must be lowercase.
+        parts.append(header_format.name.lower())  # Must be lowercase.
+        parts.append(sample_format.name.lower())  # Must be lowercase.
         server_options = server_options.as_options_string(realtime=False)
         if server_options:
             parts.append(server_options)
@@ -161,13 +177,66 @@ class SessionRenderer(SupriyaObject):
         render_yaml = yaml.dump(render_data, default_flow_style=False, indent=4)
         return render_yaml
 
-    def _build_xrefd_bundles(self, osc_bundles):
+    def _build_segments(self, segment_offsets, preroll, crossfade, block_size):
+        """
+        Builds ``(preroll_offset, start_offset, stop_offset, crossfade_offset)``
+        tuples splitting the session at ``segment_offsets``.
+
+        Each segment renders from ``preroll_offset``, rounded down to a whole
+        block so that every event falls on the same sample as it would
+        unsegmented, through ``crossfade_offset``.
+        """
+        _, duration = self.compiled_sessions[self.session]
+        duration = duration or self.session.duration
+        offsets = sorted(set(x for x in segment_offsets if 0 < x < duration))
+        segments = []
+        for start_offset, stop_offset in iterate_nwise([0.0] + offsets + [duration]):
+            preroll_frame = int(round((start_offset - preroll) * self.sample_rate))
+            preroll_frame = max(preroll_frame // block_size * block_size, 0)
+            segments.append(
+                (
+                    preroll_frame / self.sample_rate,
+                    start_offset,
+                    stop_offset,
+                    min(stop_offset + crossfade, duration),
+                )
+            )
+        return segments
+
+    def _build_conversion_session(self, input_file_path, channel_count, duration):
+        import supriya.nonrealtime
+
+        with supriya.synthdefs.SynthDefBuilder() as builder:
+            source = supriya.ugens.In.ar(
+                bus=supriya.ugens.NumOutputBuses.ir(), channel_count=channel_count
+            )
+            supriya.ugens.Out.ar(bus=0, source=source)
+        session = supriya.nonrealtime.Session(
+            input_bus_channel_count=channel_count,
+            output_bus_channel_count=channel_count,
+            input_=input_file_path,
+        )
+        with session.at(0):
+            session.add_synth(duration=duration, synthdef=builder.build())
+        self.compiled_sessions[session] = input_file_path, duration
+        return session
+
+    def _build_xrefd_bundles(self, osc_bundles, parent=None, write=False):
+        """
+        Replaces the sessions and renderables ``osc_bundles`` refer to with
+        their output file paths.
+
+        With ``parent``, each is first collected as one of ``parent``'s
+        dependencies, if it hasn't been already.
+        """
         extension = ".{}".format(self.header_format.name.lower())
         for osc_bundle in osc_bundles:
             for osc_message in osc_bundle.contents:
                 contents = list(osc_message.contents)
                 for i, x in enumerate(contents):
                     x = self._sessionable_to_session(x)
+                    if parent is not None:
+                        self._build_dependency_graph_conditionally(x, parent, write)
                     try:
                         if x not in self.renderable_prefixes:
                             continue
@@ -178,81 +247,105 @@ class SessionRenderer(SupriyaObject):
                     )
                     contents[i] = str(renderable_file_path)
                 osc_message.contents = tuple(contents)
-        return osc_bundles
+            yield osc_bundle
 
-    def _build_dependency_graph_and_nonxrefd_osc_bundles_conditionally(
-        self, expr, parent
-    ):
+    def _build_dependency_graph_conditionally(self, expr, parent, write=False):
         import supriya.nonrealtime
 
         expr = self._sessionable_to_session(expr)
         if isinstance(expr, supriya.nonrealtime.Session):
             if expr not in self.dependency_graph:
-                self._build_dependency_graph_and_nonxrefd_osc_bundles(expr)
+                self._build_dependency_graph(expr, write=write)
             self.dependency_graph.add(expr, parent=parent)
         elif hasattr(expr, "__render__"):
+            if expr not in self.renderable_prefixes:
+                result = self._collect_renderable_prerender_tuple(expr)
+                self.renderable_prefixes[expr] = result[1]
             self.dependency_graph.add(expr, parent=parent)
 
-    def _build_dependency_graph_and_nonxrefd_osc_bundles(self, session, duration=None):
+    def _build_dependency_graph(
+        self, session, duration=None, write=False, write_score=True
+    ):
         input_ = session.input_
         if isinstance(input_, str):
             input_ = pathlib.Path(input_)
         input_ = self._sessionable_to_session(input_)
-        non_xrefd_bundles = session._to_non_xrefd_osc_bundles(duration)
-        self.compiled_sessions[session] = input_, non_xrefd_bundles
+        self.compiled_sessions[session] = input_, duration
         if session is self.session:
             self.dependency_graph.add(session)
-        self._build_dependency_graph_and_nonxrefd_osc_bundles_conditionally(
-            input_, session
-        )
-        for non_xrefd_bundle in non_xrefd_bundles:
-            for request in non_xrefd_bundle.contents:
-                for x in request.contents:
-                    self._build_dependency_graph_and_nonxrefd_osc_bundles_conditionally(
-                        x, session
-                    )
+        if self.render_cache is not None:
+            fingerprint = self._build_fingerprint(session, duration)
+            self.session_fingerprints[session] = fingerprint
+            key = self.render_cache.get_key(fingerprint)
+            if key is None:
+                is_cached = False
+            elif write:
+                # Fetch the output now, so it can't be evicted before it's needed.
+                is_cached = self._fetch_from_cache(self.render_directory_path / key)
+            else:
+                is_cached = key in self.render_cache
+            if is_cached:
+                # Its output is cached, so neither it nor its inputs need compiling.
+                self.renderable_prefixes[session] = pathlib.Path(key).with_suffix("")
+                return
+        self._build_dependency_graph_conditionally(input_, session, write)
+        self._collect_session(session, write=write, write_score=write_score)
 
     def _call_subprocess(self, command):
         return subprocess.call(command, shell=True)
 
-    def _stream_subprocess(self, command, session_duration):
+    def _stream_subprocess(self, command, session_duration, progress_bar=None):
+        """
+        Runs ``command``, reporting its progress through ``session_duration``.
+
+        Progress is reported on a new progress bar, or on ``progress_bar`` if
+        given, which may be shared with other concurrently streaming commands.
+        """
         process = subprocess.Popen(
             command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
         )
-        previous_value = 0
+        if progress_bar is not None:
+            return self._stream_subprocess_output(process, progress_bar)
         progress_bar = tqdm.tqdm(
             bar_format=(), total=int(session_duration * 1000), unit="ms"
         )
         with progress_bar:
-            while True:
-                output = process.stdout.readline()
-                if not output:
-                    if process.poll() is not None:
-                        break
-                    continue
-                output = output.decode().strip()
-                if output.startswith("nextOSCPacket"):
-                    current_value = int(float(output.split()[-1]) * 1000)
-                    difference = current_value - previous_value
+            return self._stream_subprocess_output(process, progress_bar)
+
+    def _stream_subprocess_output(self, process, progress_bar):
+        previous_value = 0
+        while True:
+            output = process.stdout.readline()
+            if not output:
+                if process.poll() is not None:
+                    break
+                continue
+            output = output.decode().strip()
+            if output.startswith("nextOSCPacket"):
+                current_value = int(float(output.split()[-1]) * 1000)
+                difference = current_value - previous_value
+                with progress_bar.get_lock():
                     progress_bar.update(difference)
-                    previous_value = current_value
-                elif output.startswith("FAILURE"):
-                    if output.startswith("FAILURE IN SERVER /n_free Node"):
-                        continue
-                    progress_bar.write(output)
-                elif output.startswith("start time 0"):
+                previous_value = current_value
+            elif output.startswith("FAILURE"):
+                if output.startswith("FAILURE IN SERVER /n_free Node"):
                     continue
-                else:
-                    progress_bar.write("WARNING: {}".format(output))
-                    if output.startswith("alloc failed"):
-                        return -6
+                progress_bar.write(output)
+            elif output.startswith("start time 0"):
+                continue
+            else:
+                progress_bar.write("WARNING: {}".format(output))
+                if output.startswith("alloc failed"):
+                    return -6
         return process.poll()
 
-    def _collect_prerender_tuples(self, session, duration=None):
+    def _collect_prerender_tuples(
+        self, session, duration=None, write=False, write_score=True
+    ):
         import supriya.nonrealtime
 
-        self._build_dependency_graph_and_nonxrefd_osc_bundles(
-            session, duration=duration
+        self._build_dependency_graph(
+            session, duration=duration, write=write, write_score=write_score
         )
         assert self.dependency_graph.is_acyclic()
         extension = ".{}".format(self.header_format.name.lower())
@@ -271,9 +364,19 @@ class SessionRenderer(SupriyaObject):
         renderable_prefix = renderable._build_file_path().with_suffix("")
         return (renderable,), renderable_prefix
 
-    def _collect_session_prerender_tuple(self, session, extension):
-        input_, non_xrefd_bundles = self.compiled_sessions[session]
-        osc_bundles = self._build_xrefd_bundles(non_xrefd_bundles)
+    def _collect_session(self, session, write=False, write_score=True):
+        """
+        Compiles ``session``'s score in a single pass, collecting the sessions
+        and renderables it depends on as it first meets them, and names it by
+        the score's hash.
+
+        With ``write``, the scores of the sessions it depends on, and its own
+        unless ``write_score`` is false, also stream into temporary files in
+        the render directory, which ``_write_prerender_tuple()`` moves into
+        place.
+        """
+        input_, duration = self.compiled_sessions[session]
+        extension = ".{}".format(self.header_format.name.lower())
         input_file_path = input_
         if input_ and input_ in self.renderable_prefixes:
             input_file_path = self.renderable_prefixes[input_]
@@ -283,11 +386,166 @@ class SessionRenderer(SupriyaObject):
                 input_file_path, self.render_directory_path
             )
             self.session_input_paths[session] = input_file_path
-        datagram = self._build_datagram(osc_bundles)
+        osc_bundles = self._build_xrefd_bundles(
+            session._iterate_non_xrefd_osc_bundles(duration),
+            parent=session,
+            write=write,
+        )
+        md5 = hashlib.md5()
+        file_pointer = None
+        if write and write_score:
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=str(self.render_directory_path), suffix=".osc"
+            )
+            self._temporary_file_paths[session] = temporary_path
+            file_pointer = os.fdopen(file_descriptor, "wb")
+        try:
+            for datagram in self._iterate_datagrams(osc_bundles):
+                md5.update(datagram)
+                if file_pointer is not None:
+                    file_pointer.write(datagram)
+        finally:
+            if file_pointer is not None:
+                file_pointer.close()
         renderable_prefix = self._build_file_path(
-            datagram, input_file_path, session
+            md5, input_file_path, session
         ).with_suffix("")
-        return (session, datagram, input_, osc_bundles), renderable_prefix
+        self.renderable_prefixes[session] = renderable_prefix
+        if session in self.session_fingerprints:
+            self.render_cache.set_key(
+                self.session_fingerprints[session],
+                renderable_prefix.with_suffix(extension).name,
+            )
+
+    def _collect_session_prerender_tuple(self, session, extension):
+        input_, _ = self.compiled_sessions[session]
+        return (session, input_), self.renderable_prefixes[session]
+
+    def _fetch_from_cache(self, output_file_path):
+        if self.render_cache is None:
+            return False
+        if not self.render_cache.fetch(output_file_path.name, output_file_path):
+            return False
+        self._report(
+            "    Fetched {} from cache.".format(self._relativize(output_file_path))
+        )
+        return True
+
+    def _discard_temporary_files(self):
+        for temporary_path in self._temporary_file_paths.values():
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+        self._temporary_file_paths.clear()
+
+    def _iterate_datagrams(self, osc_bundles):
+        """
+        Iterates over ``osc_bundles`` as length-prefixed bundle datagrams.
+
+        Bundles are compiled, cross-referenced and serialized one at a time, so
+        a score never needs to be held in memory all at once.
+        """
+        for osc_bundle in osc_bundles:
+            datagram = osc_bundle.to_datagram(realtime=False)
+            yield struct.pack(">i", len(datagram))
+            yield datagram
+
+    def _iterate_xrefd_osc_bundles(self, session, segment=None):
+        _, duration = self.compiled_sessions[session]
+        if segment is None:
+            osc_bundles = session._iterate_non_xrefd_osc_bundles(duration)
+        else:
+            preroll_offset, _, _, crossfade_offset = segment
+            osc_bundles = (
+                request_bundle.to_osc()
+                for request_bundle in session._iterate_segment_request_bundles(
+                    preroll_offset, crossfade_offset, duration, self.sample_rate
+                )
+            )
+        return self._build_xrefd_bundles(osc_bundles)
+
+    def _render_concurrently(
+        self, maximum_workers, scsynth_path=None, segments=None, **kwargs
+    ):
+        """
+        Renders the prerender tuples on up to ``maximum_workers`` threads, each
+        waiting on its own scsynth subprocess.
+
+        Renderables sharing a prefix, and so an output file, are rendered once.
+        Every score file is written up front. A segmented session renders last,
+        from the calling thread, its segments sharing the same threads. Returns
+        the session's exit code.
+        """
+        import supriya.nonrealtime
+
+        prerender_tuples, dependencies, dependents = {}, {}, {}
+        for prerender_tuple in self.prerender_tuples:
+            renderable = prerender_tuple[0]
+            prefix = self.renderable_prefixes[renderable]
+            if prefix in prerender_tuples:
+                continue
+            self._write_prerender_tuple(prerender_tuple)
+            prerender_tuples[prefix] = prerender_tuple
+            dependencies[prefix] = set()
+            for child in self.dependency_graph.children(renderable):
+                child_prefix = self.renderable_prefixes[child]
+                dependencies[prefix].add(child_prefix)
+                dependents.setdefault(child_prefix, set()).add(prefix)
+        total = sum(
+            int(prerender_tuple[0].duration * 1000)
+            for prerender_tuple in prerender_tuples.values()
+            if isinstance(prerender_tuple[0], supriya.nonrealtime.Session)
+        )
+        exit_codes = {}
+        with tqdm.tqdm(bar_format=(), total=total, unit="ms") as progress_bar:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=maximum_workers
+            ) as executor:
+                futures = {}
+                session_prefix = self.renderable_prefixes[self.session]
+
+                def submit(prefix):
+                    if segments and prefix == session_prefix:
+                        return
+                    future = executor.submit(
+                        self._render_prerender_tuple,
+                        prerender_tuples[prefix],
+                        scsynth_path=scsynth_path,
+                        progress_bar=progress_bar,
+                        segments=segments,
+                        maximum_workers=maximum_workers,
+                        **kwargs,
+                    )
+                    futures[future] = prefix
+
+                for prefix, prefix_dependencies in dependencies.items():
+                    if not prefix_dependencies:
+                        submit(prefix)
+                while futures:
+                    done, _ = concurrent.futures.wait(
+                        futures, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        prefix = futures.pop(future)
+                        try:
+                            exit_codes[prefix] = future.result()
+                        except BaseException:
+                            for pending_future in futures:
+                                pending_future.cancel()
+                            raise
+                        for dependent in sorted(dependents.get(prefix, ())):
+                            dependencies[dependent].discard(prefix)
+                            if not dependencies[dependent]:
+                                submit(dependent)
+                if segments:
+                    exit_codes[session_prefix] = self._render_prerender_tuple(
+                        prerender_tuples[session_prefix],
+                        scsynth_path=scsynth_path,
+                        progress_bar=progress_bar,
+                        segments=segments,
+                        executor=executor,
+                        **kwargs,
+                    )
+        return exit_codes[self.renderable_prefixes[self.session]]
 
     def _render_datagram(
         self,
@@ -296,6 +554,10 @@ class SessionRenderer(SupriyaObject):
         output_file_path,
         session_osc_file_path,
         scsynth_path=None,
+        progress_bar=None,
+        duration=None,
+        header_format=None,
+        sample_format=None,
         **kwargs,
     ):
         relative_session_osc_file_path = session_osc_file_path
@@ -319,12 +581,16 @@ class SessionRenderer(SupriyaObject):
                 input_file_path,
                 output_file_path,
                 session_osc_file_path,
+                header_format=header_format,
+                sample_format=sample_format,
                 scsynth_path=scsynth_path,
                 server_options=server_options,
             )
             self._report("    Command: {}".format(command))
             try:
-                exit_code = self._stream_subprocess(command, session.duration)
+                exit_code = self._stream_subprocess(
+                    command, duration or session.duration, progress_bar=progress_bar
+                )
             except KeyboardInterrupt:
                 if output_file_path.exists():
                     output_file_path.unlink()
@@ -354,6 +620,196 @@ class SessionRenderer(SupriyaObject):
         except FileNotFoundError:
             return None
 
+    def _relativize(self, file_path):
+        cwd = pathlib.Path.cwd()
+        if file_path.is_absolute() and cwd in file_path.parents:
+            return file_path.relative_to(cwd)
+        return file_path
+
+    def _render_prerender_tuple(
+        self,
+        prerender_tuple,
+        scsynth_path=None,
+        progress_bar=None,
+        segments=None,
+        maximum_workers=None,
+        executor=None,
+        **kwargs,
+    ):
+        import supriya.nonrealtime
+
+        renderable = prerender_tuple[0]
+        renderable_prefix = self.renderable_prefixes[renderable]
+        extension = ".{}".format(self.header_format.name.lower())
+        output_file_path = renderable_prefix.with_suffix(extension)
+        if not isinstance(renderable, supriya.nonrealtime.Session):
+            renderable.__render__(
+                output_file_path=output_file_path,
+                print_transcript=self.print_transcript,
+            )
+            return None
+        if segments and renderable is self.session:
+            exit_code = self._render_segments(
+                renderable,
+                output_file_path,
+                segments,
+                scsynth_path=scsynth_path,
+                progress_bar=progress_bar,
+                maximum_workers=maximum_workers,
+                executor=executor,
+                **kwargs,
+            )
+        else:
+            exit_code = self._render_datagram(
+                renderable,
+                self.session_input_paths.get(renderable),
+                output_file_path,
+                renderable_prefix.with_suffix(".osc"),
+                scsynth_path=scsynth_path,
+                progress_bar=progress_bar,
+                **kwargs,
+            )
+        if exit_code:
+            self._report("    SuperCollider errored!")
+            raise NonrealtimeRenderError(exit_code)
+        self._store_in_cache(renderable, output_file_path)
+        return exit_code
+
+    def _render_segment(
+        self,
+        session,
+        osc_file_path,
+        duration,
+        scsynth_path=None,
+        progress_bar=None,
+        **kwargs,
+    ):
+        output_file_path = osc_file_path.with_suffix(".wav")
+        exit_code = self._render_datagram(
+            session,
+            None,
+            output_file_path,
+            osc_file_path,
+            scsynth_path=scsynth_path,
+            progress_bar=progress_bar,
+            duration=duration,
+            header_format=HeaderFormat.WAV,
+            sample_format=SampleFormat.FLOAT,
+            **kwargs,
+        )
+        if exit_code:
+            self._report("    SuperCollider errored!")
+            raise NonrealtimeRenderError(exit_code)
+        return output_file_path
+
+    def _render_segments(
+        self,
+        session,
+        output_file_path,
+        segments,
+        scsynth_path=None,
+        progress_bar=None,
+        maximum_workers=None,
+        executor=None,
+        **kwargs,
+    ):
+        """
+        Renders ``session`` as overlapping ``segments``, up to
+        ``maximum_workers`` at once, or on ``executor``'s threads, and stitches
+        them into one file.
+
+        Every segment's score is written up front. Segments render as 32-bit
+        float WAV files. Stitched output in any other format is converted by
+        one more, trivial, render.
+        """
+        self._report("Rendering {} in segments.".format(output_file_path))
+        if output_file_path.exists():
+            self._report(
+                "    Skipped {}. Output already exists.".format(output_file_path)
+            )
+            return 0
+        if progress_bar is None:
+            total = sum(int((x[-1] - x[0]) * 1000) for x in segments)
+            with tqdm.tqdm(bar_format=(), total=total, unit="ms") as progress_bar:
+                return self._render_segments(
+                    session,
+                    output_file_path,
+                    segments,
+                    scsynth_path=scsynth_path,
+                    progress_bar=progress_bar,
+                    maximum_workers=maximum_workers,
+                    executor=executor,
+                    **kwargs,
+                )
+        if executor is None:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=maximum_workers or 1
+            ) as executor:
+                return self._render_segments(
+                    session,
+                    output_file_path,
+                    segments,
+                    scsynth_path=scsynth_path,
+                    progress_bar=progress_bar,
+                    executor=executor,
+                    **kwargs,
+                )
+        osc_file_paths = [
+            self._write_datagram(None, session, segment, name="segment")
+            for segment in segments
+        ]
+        futures = [
+            executor.submit(
+                self._render_segment,
+                session,
+                osc_file_path,
+                segment[-1] - segment[0],
+                scsynth_path=scsynth_path,
+                progress_bar=progress_bar,
+                **kwargs,
+            )
+            for segment, osc_file_path in zip(segments, osc_file_paths)
+        ]
+        done, pending = concurrent.futures.wait(
+            futures, return_when=concurrent.futures.FIRST_EXCEPTION
+        )
+        for future in pending:
+            future.cancel()
+        for future in done:
+            future.result()
+        segment_file_paths = [future.result() for future in futures]
+        channel_count = session.options.output_bus_channel_count
+        if (self.header_format, self.sample_format) == (
+            HeaderFormat.WAV,
+            SampleFormat.FLOAT,
+        ):
+            self._stitch_segments(
+                output_file_path, segment_file_paths, segments, channel_count
+            )
+            return 0
+        stitched_file_path = output_file_path.with_suffix(".stitched.wav")
+        self._stitch_segments(
+            stitched_file_path, segment_file_paths, segments, channel_count
+        )
+        conversion_session = self._build_conversion_session(
+            stitched_file_path, channel_count, segments[-1][2]
+        )
+        osc_file_path = output_file_path.with_suffix(".stitched.osc")
+        self._write_datagram(osc_file_path, conversion_session)
+        try:
+            exit_code = self._render_datagram(
+                conversion_session,
+                stitched_file_path,
+                output_file_path,
+                osc_file_path,
+                scsynth_path=scsynth_path,
+                progress_bar=progress_bar,
+                **kwargs,
+            )
+        finally:
+            stitched_file_path.unlink()
+        return exit_code
+
     def _report(self, message):
         if self.transcript_prefix:
             message = "{}{}".format(self.transcript_prefix, message)
@@ -367,8 +823,10 @@ class SessionRenderer(SupriyaObject):
         self._session._transcript = self._transcript = []
         self._renderable_prefixes = {}
         self._dependency_graph = uqbar.containers.DependencyGraph()
+        self._session_fingerprints = {}
         self._session_input_paths = {}
         self._sessionables_to_sessions = {}
+        self._temporary_file_paths = {}
 
     def _sessionable_to_session(self, expr):
         if hasattr(expr, "__session__"):
@@ -377,17 +835,141 @@ class SessionRenderer(SupriyaObject):
             return self._sessionables_to_sessions[expr]
         return expr
 
-    def _write_datagram(self, file_path, new_contents):
-        self._write(file_path, new_contents, mode="b")
+    def _store_in_cache(self, session, output_file_path):
+        if self.render_cache is None or not output_file_path.exists():
+            return
+        elif output_file_path.name in self.render_cache:
+            return
+        self.render_cache.store(
+            output_file_path.name,
+            output_file_path,
+            duration=self.compiled_sessions[session][1] or session.duration,
+            header_format=self.header_format.name,
+            name=session.name,
+            sample_format=self.sample_format.name,
+            sample_rate=self.sample_rate,
+        )
+        self._report("    Stored {} in cache.".format(output_file_path))
+
+    def _stitch_segments(
+        self, output_file_path, segment_file_paths, segments, channel_count
+    ):
+        """
+        Stitches rendered segments into one 32-bit float WAV file, dropping
+        each segment's pre-roll and crossfading linearly into the next.
+        """
+
+        def to_frame(offset):
+            return int(round(offset * self.sample_rate))
+
+        self._report("Stitching {}.".format(self._relativize(output_file_path)))
+        frame_count = to_frame(segments[-1][2])
+        with open(str(output_file_path), "wb") as file_pointer:
+            file_pointer.write(
+                supriya.soundfiles._build_float_wav_header(
+                    frame_count, channel_count, self.sample_rate
+                )
+            )
+            tail = array.array("f")
+            for segment, file_path in zip(segments, segment_file_paths):
+                preroll_offset, start_offset, stop_offset, crossfade_offset = segment
+                _, samples = supriya.soundfiles.read_float_wav(file_path)
+                first_frame = to_frame(preroll_offset)
+
+                def read(start_frame, stop_frame):
+                    start = (start_frame - first_frame) * channel_count
+                    stop = (stop_frame - first_frame) * channel_count
+                    result = samples[start:stop]
+                    result.frombytes(bytes(4 * (stop - start - len(result))))
+                    return result
+
+                body = read(to_frame(start_offset), to_frame(stop_offset))
+                fade_frame_count = len(tail) // channel_count
+                for i in range(min(len(tail), len(body))):
+                    gain = (i // channel_count + 0.5) / fade_frame_count
+                    body[i] = tail[i] + (body[i] - tail[i]) * gain
+                tail = read(to_frame(stop_offset), to_frame(crossfade_offset))
+                if sys.byteorder == "big":
+                    body.byteswap()
+                body.tofile(file_pointer)
+        self._report("    Stitched {}.".format(self._relativize(output_file_path)))
+
+    def _write_datagram(self, file_path, session, segment=None, name="session"):
+        """
+        Writes ``session``'s score, or one segment's score, to ``file_path`` in
+        a single pass.
+
+        Datagrams are hashed as they stream into a temporary file, which is
+        renamed into place at the end. Without ``file_path``, the file is named
+        ``name`` plus that hash, as ``_build_file_path()`` would name it.
+
+        Returns the file path written.
+        """
+        directory_path = "." if file_path is None else str(file_path.parent)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=directory_path, suffix=".osc"
+        )
+        try:
+            md5 = hashlib.md5()
+            osc_bundles = self._iterate_xrefd_osc_bundles(session, segment)
+            with os.fdopen(file_descriptor, "wb") as file_pointer:
+                for datagram in self._iterate_datagrams(osc_bundles):
+                    md5.update(datagram)
+                    file_pointer.write(datagram)
+            if file_path is None:
+                file_path = self._build_file_path(md5, None, session, name)
+            self._write_temporary_file(temporary_path, file_path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+        return file_path
+
+    def _write_prerender_tuple(self, prerender_tuple):
+        """
+        Moves a session's score, written while collecting it, into place,
+        unless its output can be fetched from the render cache instead.
+
+        Sessions without a score were fetched from the cache while collecting.
+        """
+        import supriya.nonrealtime
+
+        renderable = prerender_tuple[0]
+        if not isinstance(renderable, supriya.nonrealtime.Session):
+            return
+        temporary_path = self._temporary_file_paths.pop(renderable, None)
+        if temporary_path is None:
+            return
+        try:
+            renderable_prefix = (
+                self.render_directory_path / self.renderable_prefixes[renderable]
+            )
+            extension = ".{}".format(self.header_format.name.lower())
+            if not self._fetch_from_cache(renderable_prefix.with_suffix(extension)):
+                self._write_temporary_file(
+                    temporary_path, renderable_prefix.with_suffix(".osc")
+                )
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def _write_temporary_file(self, temporary_path, file_path):
+        relative_file_path = self._relativize(file_path)
+        self._report("Writing {}.".format(relative_file_path))
+        if file_path.exists() and filecmp.cmp(
+            temporary_path, str(file_path), shallow=False
+        ):
+            self._report(
+                "    Skipped {}. File already exists.".format(relative_file_path)
+            )
+        else:
+            os.replace(temporary_path, str(file_path))
+            self._report("    Wrote {}.".format(relative_file_path))
 
     def _write_render_yml(self, file_path, render_yaml):
         self._write(file_path, render_yaml)
 
     def _write(self, file_path, new_contents, mode=""):
-        cwd = pathlib.Path.cwd()
-        relative_file_path = file_path
-        if file_path.is_absolute() and cwd in file_path.parents:
-            relative_file_path = file_path.relative_to(cwd)
+        relative_file_path = self._relativize(file_path)
         self._report("Writing {}.".format(relative_file_path))
         old_contents = self._read(file_path, mode=mode)
         if old_contents == new_contents:
@@ -407,8 +989,8 @@ class SessionRenderer(SupriyaObject):
 
     def to_osc_bundles(self, duration=None):
         self._collect_prerender_tuples(self.session, duration=duration)
-        (session, datagram, input_file_path, osc_bundles) = self.prerender_tuples[-1]
-        return osc_bundles
+        (session, input_file_path) = self.prerender_tuples[-1]
+        return list(self._iterate_xrefd_osc_bundles(session))
 
     @classmethod
     def get_path_relative_to_render_path(cls, target_path, render_path):
@@ -438,47 +1020,76 @@ class SessionRenderer(SupriyaObject):
         duration=None,
         build_render_yml=None,
         scsynth_path=None,
+        maximum_workers=None,
+        segment_offsets=None,
+        segment_preroll=1.0,
+        segment_crossfade=0.01,
         **kwargs,
     ):
-        import supriya.nonrealtime
+        """
+        Renders the session, and every renderable it depends on.
 
+        With ``maximum_workers`` greater than 1, renders up to that many
+        renderables at once, each as soon as everything it depends on has been
+        rendered.
+
+        With ``segment_offsets``, renders the session itself as segments split
+        at those offsets, up to ``maximum_workers`` at once. Each segment
+        pre-rolls for ``segment_preroll`` seconds from the session's state
+        there, and crossfades into the next over ``segment_crossfade``
+        seconds. Synths already playing when a segment's pre-roll starts
+        restart there, so split where no synth whose sound depends on its age,
+        like an enveloped or sample-playing one, is playing.
+        """
+        if segment_offsets and self.session.input_:
+            raise ValueError("Can't render a session with an input in segments.")
         extension = ".{}".format(self.header_format.name.lower())
         if output_file_path is not None:
             output_file_path = pathlib.Path(output_file_path)
             output_file_path = output_file_path.expanduser().absolute()
         original_output_file_path = output_file_path
-        self._collect_prerender_tuples(self.session, duration=duration)
-        assert self.prerender_tuples, self.prerender_tuples
-        visited_renderable_prefixes = []
-        with uqbar.io.DirectoryChange(directory=str(self.render_directory_path)):
+        try:
+            # Segmented sessions only write their segments' scores.
+            self._collect_prerender_tuples(
+                self.session,
+                duration=duration,
+                write=True,
+                write_score=not segment_offsets,
+            )
+            assert self.prerender_tuples, self.prerender_tuples
+            segments = None
+            if segment_offsets:
+                block_size = kwargs.get("block_size", self.session.options.block_size)
+                segments = self._build_segments(
+                    segment_offsets, segment_preroll, segment_crossfade, block_size
+                )
+            visited_renderable_prefixes = []
             for prerender_tuple in self.prerender_tuples:
-                renderable = prerender_tuple[0]
-                renderable_prefix = self.renderable_prefixes[renderable]
+                renderable_prefix = self.renderable_prefixes[prerender_tuple[0]]
                 visited_renderable_prefixes.append(
                     renderable_prefix.with_suffix("").name
                 )
                 output_file_path = renderable_prefix.with_suffix(extension)
-                if isinstance(renderable, supriya.nonrealtime.Session):
-                    (session, datagram, input_, _) = prerender_tuple
-                    osc_file_path = renderable_prefix.with_suffix(".osc")
-                    input_file_path = self.session_input_paths.get(session)
-                    self._write_datagram(osc_file_path, datagram)
-                    exit_code = self._render_datagram(
-                        session,
-                        input_file_path,
-                        output_file_path,
-                        osc_file_path,
+            with uqbar.io.DirectoryChange(directory=str(self.render_directory_path)):
+                if maximum_workers is not None and 1 < maximum_workers:
+                    exit_code = self._render_concurrently(
+                        maximum_workers,
                         scsynth_path=scsynth_path,
+                        segments=segments,
                         **kwargs,
                     )
-                    if exit_code:
-                        self._report("    SuperCollider errored!")
-                        raise NonrealtimeRenderError(exit_code)
                 else:
-                    renderable.__render__(
-                        output_file_path=output_file_path,
-                        print_transcript=self.print_transcript,
-                    )
+                    for prerender_tuple in self.prerender_tuples:
+                        self._write_prerender_tuple(prerender_tuple)
+                        exit_code = self._render_prerender_tuple(
+                            prerender_tuple,
+                            scsynth_path=scsynth_path,
+                            segments=segments,
+                            maximum_workers=maximum_workers,
+                            **kwargs,
+                        )
+        finally:
+            self._discard_temporary_files()
         output_file_path = self.render_directory_path / output_file_path
         if not output_file_path.exists():
             self._report("    Output file is missing!")
@@ -513,6 +1124,10 @@ class SessionRenderer(SupriyaObject):
     def print_transcript(self):
         return self._print_transcript
 
+    @property
+    def render_cache(self):
+        return self._render_cache
+
     @property
     def render_directory_path(self):
         return self._render_directory_path
@@ -533,6 +1148,10 @@ class SessionRenderer(SupriyaObject):
     def session(self):
         return self._session
 
+    @property
+    def session_fingerprints(self):
+        return self._session_fingerprints
+
     @property
     def session_input_paths(self):
         return self._session_input_paths
@@ -1,8 +1,9 @@
 import bisect
 import collections
+import hashlib
+import heapq
 import os
 import pathlib
-from queue import PriorityQueue
 from types import MappingProxyType
 
 import uqbar.io
@@ -27,8 +28,11 @@ from supriya.commands.BufferZeroRequest import BufferZeroRequest
 from supriya.commands.NothingRequest import NothingRequest
 from supriya.commands.RequestBundle import RequestBundle
 from supriya.nonrealtime.bases import SessionObject
+from supriya.nonrealtime.mappings import PersistentMapping
 from supriya.nonrealtime.nodes import Synth
+from supriya.nonrealtime.timelines import Timeline
 from supriya.querytree import QueryTreeGroup
+from supriya.system import new
 from supriya.utils import iterate_nwise
 
 
@@ -114,6 +118,7 @@ class Session:
         input_=None,
         name=None,
         padding=None,
+        incremental=False,
         **kwargs,
     ):
         import supriya.nonrealtime
@@ -128,6 +133,10 @@ class Session:
         self._buffers_by_seesion_id = {}
         self._buses = collections.OrderedDict()
         self._buses_by_session_id = {}
+        self._compiled_offsets = {}
+        self._compiled_parameters = None
+        self._dirty_offsets = set()
+        self._incremental = bool(incremental)
         self._name = name
         self._nodes = supriya.intervals.IntervalTree(accelerated=True)
         self._nodes_by_session_id = {}
@@ -230,23 +239,25 @@ class Session:
         old_state = self._find_state_before(offset)
         state = old_state._clone(offset)
         self.states[offset] = state
-        self.offsets.insert(self.offsets.index(old_state.offset) + 1, offset)
+        bisect.insort(self.offsets, offset)
         return state
 
     def _apply_transitions(self, offsets, chain=True):
         import supriya.nonrealtime
 
-        if supriya.nonrealtime.DoNotPropagate._stack:
-            return
-        queue = PriorityQueue()
         try:
-            for offset in offsets:
-                queue.put(offset)
+            offsets = tuple(offsets)
         except TypeError:
-            queue.put(offsets)
+            offsets = (offsets,)
+        if self._incremental:
+            self._dirty_offsets.update(offsets)
+        if supriya.nonrealtime.DoNotPropagate._stack:
+            return
+        queue = list(offsets)
+        heapq.heapify(queue)
         previous_offset = None
-        while not queue.empty():
-            offset = queue.get()
+        while queue:
+            offset = heapq.heappop(queue)
             if offset == previous_offset:
                 continue
             previous_offset = offset
@@ -262,15 +273,76 @@ class Session:
                 state.stop_nodes,
             )
             nodes_to_children, nodes_to_parents = result
-            changed = False
-            if nodes_to_children != state.nodes_to_children:
-                state._nodes_to_children = nodes_to_children
-                state._nodes_to_parents = nodes_to_parents
-                changed = True
-            if changed and chain:
-                next_state = self._find_state_after(offset, with_node_tree=True)
-                if next_state is not None:
-                    queue.put(next_state.offset)
+            if nodes_to_children == state.nodes_to_children:
+                continue
+            state._nodes_to_children = nodes_to_children
+            state._nodes_to_parents = nodes_to_parents
+            next_state = self._find_state_after(offset, with_node_tree=True)
+            if next_state is None:
+                self._mark_dirty(offset, float("inf"))
+                continue
+            # Sparse states order their node settings by this state's tree.
+            self._mark_dirty(offset, next_state.offset)
+            if chain:
+                heapq.heappush(queue, next_state.offset)
+
+    def _build_fingerprint(self):
+        """
+        Hashes everything the session's score is compiled from, without
+        compiling it.
+
+        Sessions with equal fingerprints compile to equal scores.
+        """
+
+        def fingerprint(value):
+            if isinstance(value, SessionObject):
+                return type(value).__name__, value.session_id
+            elif isinstance(value, Session):
+                return value._build_fingerprint()
+            elif hasattr(value, "__session__"):
+                return value.__session__()._build_fingerprint()
+            elif hasattr(value, "__render__"):
+                return str(value._build_file_path())
+            elif isinstance(value, dict):
+                return tuple(
+                    sorted((repr(key), fingerprint(value[key])) for key in value)
+                )
+            elif isinstance(value, (list, tuple, Timeline)):
+                return tuple(fingerprint(x) for x in value)
+            return repr(value)
+
+        md5 = hashlib.md5()
+
+        def update(*values):
+            md5.update(repr(fingerprint(values)).encode())
+
+        update(supriya.__version__, self._options, self.padding, self.input_)
+        for offset in self.offsets[1:]:
+            update(
+                offset,
+                [
+                    (source, action.action, action.target)
+                    for source, action in self.states[offset].transitions.items()
+                ],
+            )
+        for node in sorted(self.nodes, key=lambda x: x.session_id):
+            update(node, node.start_offset, node.duration, node._events)
+            if isinstance(node, Synth):
+                update(node.synthdef.anonymous_name, node._synth_kwargs)
+        for buffer_ in sorted(self.buffers, key=lambda x: x.session_id):
+            update(
+                buffer_,
+                buffer_.start_offset,
+                buffer_.duration,
+                buffer_.channel_count,
+                buffer_.file_path,
+                buffer_.frame_count,
+                buffer_.starting_frame,
+                buffer_._events,
+            )
+        for bus in self._buses:
+            update(bus, bus.calculation_rate, bus._events)
+        return md5.hexdigest()
 
     def _build_id_mapping(self):
         id_mapping = {}
@@ -519,7 +591,7 @@ class Session:
                 bus_settings.setdefault(offset, {})[bus_id] = value
         return bus_settings
 
-    def _collect_durated_objects(self, offset, is_last_offset):
+    def _collect_durated_objects(self, offset, is_last_offset, intersections=None):
         state = self._find_state_at(offset, clone_if_missing=True)
         start_buffers, start_nodes = state.start_buffers, state.start_nodes
         stop_buffers = state.stop_buffers.copy()
@@ -527,8 +599,12 @@ class Session:
         if is_last_offset:
             stop_buffers.update(state.overlap_buffers)
             stop_nodes.update(state.overlap_nodes)
-        all_buffers = set(self.buffers.find_intersection(offset))
-        all_nodes = set(self.nodes.find_intersection(offset))
+        if intersections is None:
+            intersections = (
+                self.buffers.find_intersection(offset),
+                self.nodes.find_intersection(offset),
+            )
+        all_buffers, all_nodes = set(intersections[0]), set(intersections[1])
         all_buffers.update(stop_buffers)
         all_nodes.update(stop_nodes)
         return (
@@ -600,7 +676,7 @@ class Session:
                     requests.append(request)
         return requests
 
-    def _collect_node_settings(self, offset, state, id_mapping):
+    def _collect_node_settings(self, offset, state, id_mapping, persistent=False):
         result = collections.OrderedDict()
         if state.nodes_to_children is None:
             # Current state is sparse;
@@ -611,7 +687,7 @@ class Session:
             iterator = state._iterate_nodes(self.root_node, state.nodes_to_children)
         for node in iterator:
             settings = node._collect_settings(
-                offset, id_mapping=id_mapping, persistent=False
+                offset, id_mapping=id_mapping, persistent=persistent
             )
             if settings:
                 result[node] = settings
@@ -668,6 +744,123 @@ class Session:
                 requests.append(request)
         return requests
 
+    def _collect_preroll_requests(
+        self,
+        buffer_open_states,
+        duration,
+        id_mapping,
+        offset,
+        sample_rate,
+        stop_offset,
+        visited_synthdefs,
+    ):
+        """
+        Collects requests recreating the session's state just before
+        ``offset``, so that it may be rendered from ``offset`` on its own.
+
+        Loads the synthdefs of every synth playing before ``stop_offset``,
+        allocates and refills live buffers, advancing cued soundfiles to
+        ``offset``, sets control buses, and recreates live nodes in order,
+        with their current controls.
+
+        Records the buffers left open and synthdefs loaded in
+        ``buffer_open_states`` and ``visited_synthdefs``, for compiling the
+        offsets that follow.
+        """
+        import supriya.nonrealtime
+
+        scalar_rate = ParameterRate.SCALAR
+        requests = []
+        nodes = [
+            node
+            for node in self.nodes
+            if node.start_offset < stop_offset and offset <= node.stop_offset
+        ]
+        requests += self._collect_synthdef_requests(nodes, visited_synthdefs)
+        buffers = [
+            buffer_
+            for buffer_ in self.buffers
+            if buffer_.start_offset < offset <= buffer_.stop_offset
+        ]
+        requests += self._collect_buffer_allocate_requests(
+            buffer_open_states, id_mapping, buffers
+        )
+        buffer_settings = {}
+        for buffer_offset, offset_settings in self._collect_buffer_settings(
+            id_mapping
+        ).items():
+            if offset <= buffer_offset:
+                continue
+            for request_type, buffer_requests in offset_settings.items():
+                for request in buffer_requests:
+                    if request.buffer_id not in buffer_open_states:
+                        continue
+                    if request_type is BufferReadRequest and request.leave_open:
+                        starting_frame_in_file = request.starting_frame_in_file or 0
+                        starting_frame_in_file += int(
+                            round((offset - buffer_offset) * sample_rate)
+                        )
+                        request = new(
+                            request, starting_frame_in_file=starting_frame_in_file
+                        )
+                    buffer_settings.setdefault(buffer_offset, {}).setdefault(
+                        request_type, []
+                    ).append(request)
+        for buffer_offset in sorted(buffer_settings):
+            requests += self._collect_buffer_nonlifecycle_requests(
+                buffers,
+                buffer_open_states,
+                buffer_settings,
+                id_mapping,
+                buffer_offset,
+                self._ordered_buffer_post_alloc_request_types,
+            )
+        bus_values = {}
+        for bus in self._buses:
+            if bus.calculation_rate != supriya.CalculationRate.CONTROL:
+                continue
+            for bus_offset, value in bus._events:
+                if offset <= bus_offset:
+                    break
+                bus_values[id_mapping[bus]] = value
+        if bus_values:
+            request = supriya.commands.ControlBusSetRequest(
+                index_value_pairs=sorted(bus_values.items())
+            )
+            requests.append(request)
+        state = self._find_state_before(offset, with_node_tree=True)
+        node_settings = self._collect_node_settings(
+            offset, state, id_mapping, persistent=True
+        )
+        for parent, node in state._iterate_node_pairs(
+            self.root_node, state.nodes_to_children
+        ):
+            action = supriya.nonrealtime.NodeTransition(
+                source=node, action=supriya.AddAction.ADD_TO_TAIL, target=parent
+            )
+            if not isinstance(node, supriya.nonrealtime.Synth):
+                requests.append(node._to_request(action, id_mapping))
+                continue
+            parameters = node.synthdef.parameters
+            synth_kwargs = node.synth_kwargs
+            synth_kwargs.update(
+                node._collect_settings(node.start_offset, id_mapping=id_mapping)
+            )
+            for key, value in node_settings.get(node, {}).items():
+                if key in parameters and parameters[key].parameter_rate != scalar_rate:
+                    synth_kwargs[key] = value
+            if "duration" in node.synthdef.parameter_names:
+                node_duration = min(node.stop_offset, duration) - offset
+                synth_kwargs["duration"] = float(node_duration)
+            for key, value in synth_kwargs.items():
+                if (
+                    value in id_mapping
+                    and parameters[key].parameter_rate == scalar_rate
+                ):
+                    synth_kwargs[key] = id_mapping[value]
+            requests.append(node._to_request(action, id_mapping, **synth_kwargs))
+        return requests
+
     def _collect_requests_at_offset(
         self,
         buffer_open_states,
@@ -678,6 +871,7 @@ class Session:
         is_last_offset,
         offset,
         visited_synthdefs,
+        intersections=None,
     ):
         requests = []
         (
@@ -687,7 +881,7 @@ class Session:
             start_nodes,
             stop_buffers,
             stop_nodes,
-        ) = self._collect_durated_objects(offset, is_last_offset)
+        ) = self._collect_durated_objects(offset, is_last_offset, intersections)
         state = self._find_state_at(offset, clone_if_missing=True)
         node_actions = state.transitions
         node_settings = self._collect_node_settings(offset, state, id_mapping)
@@ -763,7 +957,7 @@ class Session:
             old_state = self._find_state_before(offset, with_node_tree=True)
             state = old_state._clone(offset)
             self.states[offset] = state
-            self.offsets.insert(self.offsets.index(old_state.offset) + 1, offset)
+            bisect.insort(self.offsets, offset)
         return state
 
     def _find_state_before(self, offset, with_node_tree=None):
@@ -820,8 +1014,8 @@ class Session:
 
         offset = float("-inf")
         state = supriya.nonrealtime.State(self, offset)
-        state._nodes_to_children = {self.root_node: None}
-        state._nodes_to_parents = {self.root_node: None}
+        state._nodes_to_children = PersistentMapping({self.root_node: None})
+        state._nodes_to_parents = PersistentMapping({self.root_node: None})
         self.states[offset] = state
         self.offsets.append(offset)
         offset = 0.0
@@ -829,6 +1023,20 @@ class Session:
         self.states[offset] = state
         self.offsets.append(offset)
 
+    def _mark_dirty(self, start_offset, stop_offset=None):
+        """
+        Marks the offsets from ``start_offset`` through ``stop_offset`` for
+        recompilation.
+        """
+        if not self._incremental:
+            return
+        elif stop_offset is None:
+            self._dirty_offsets.add(start_offset)
+            return
+        start_index = bisect.bisect_left(self.offsets, start_offset)
+        stop_index = bisect.bisect_right(self.offsets, stop_offset)
+        self._dirty_offsets.update(self.offsets[start_index:stop_index])
+
     def _remove_state_at(self, offset):
         state = self._find_state_at(offset, clone_if_missing=False)
         if state is None:
@@ -838,14 +1046,21 @@ class Session:
         del self.states[offset]
         return state
 
-    def _to_non_xrefd_osc_bundles(self, duration=None):
-        osc_bundles = []
-        request_bundles = self._to_non_xrefd_request_bundles(duration=duration)
-        for request_bundle in request_bundles:
-            osc_bundles.append(request_bundle.to_osc())
-        return osc_bundles
+    def _iterate_non_xrefd_osc_bundles(self, duration=None):
+        for request_bundle in self._iterate_non_xrefd_request_bundles(duration):
+            yield request_bundle.to_osc()
 
-    def _to_non_xrefd_request_bundles(self, duration=None):
+    def _iterate_non_xrefd_request_bundles(self, duration=None):
+        """
+        Compiles one request bundle per offset, lazily.
+
+        Incremental sessions cache bundles per offset, and only offsets marked
+        dirty since the last compilation, or whose preceding offsets left
+        different buffers open or synthdefs loaded, are recompiled. Changing
+        the duration, or any already-compiled object's ID, recompiles
+        everything. Other sessions cache nothing, so each bundle can be
+        discarded as soon as it has been consumed.
+        """
         id_mapping = self._build_id_mapping()
         if self.duration == float("inf"):
             assert duration is not None and 0 < duration < float("inf")
@@ -854,36 +1069,145 @@ class Session:
         if duration not in offsets:
             offsets.append(duration)
             offsets.sort()
+        if self._compiled_parameters is not None:
+            old_duration, old_id_mapping = self._compiled_parameters
+            if old_duration != duration or any(
+                id_mapping.get(key, value) != value
+                for key, value in old_id_mapping.items()
+            ):
+                self._compiled_offsets.clear()
+        self._compiled_parameters = duration, id_mapping
+        compiled_offsets, dirty_offsets = self._compiled_offsets, self._dirty_offsets
+        self._compiled_offsets, self._dirty_offsets = {}, set()
+        # Look up the buffers and nodes live at every offset known to need
+        # recompiling in one batch.
+        stale_offsets = [
+            offset
+            for offset in offsets
+            if offset not in compiled_offsets or offset in dirty_offsets
+        ]
+        intersections = dict(
+            zip(
+                stale_offsets,
+                zip(
+                    self.buffers.find_intersections(stale_offsets),
+                    self.nodes.find_intersections(stale_offsets),
+                ),
+            )
+        )
+        buffer_settings = bus_settings = None
+        buffer_open_states, visited_synthdefs = (), frozenset()
+        for offset in offsets:
+            is_last_offset = offset == duration
+            inputs = buffer_open_states, visited_synthdefs
+            entry = compiled_offsets.get(offset)
+            if (
+                entry is None
+                or entry[0] != inputs
+                or is_last_offset
+                or offset in dirty_offsets
+            ):
+                if buffer_settings is None:
+                    buffer_settings = self._collect_buffer_settings(id_mapping)
+                    bus_settings = self._collect_bus_settings(id_mapping)
+                open_states = dict(buffer_open_states)
+                visited = set(visited_synthdefs)
+                requests = self._collect_requests_at_offset(
+                    open_states,
+                    buffer_settings,
+                    bus_settings,
+                    duration,
+                    id_mapping,
+                    is_last_offset,
+                    offset,
+                    visited,
+                    intersections=intersections.get(offset),
+                )
+                if is_last_offset:
+                    requests.append(NothingRequest())
+                request_bundle = None
+                if requests:
+                    request_bundle = RequestBundle(
+                        contents=requests, timestamp=float(offset)
+                    )
+                if len(visited) != len(visited_synthdefs):
+                    visited_synthdefs = frozenset(visited)
+                outputs = tuple(sorted(open_states.items())), visited_synthdefs
+                entry = inputs, outputs, request_bundle
+            if self._incremental:
+                self._compiled_offsets[offset] = entry
+            buffer_open_states, visited_synthdefs = entry[1]
+            if entry[2] is not None:
+                yield entry[2]
+            if is_last_offset:
+                break
+
+    def _iterate_segment_request_bundles(
+        self, start_offset, stop_offset, duration=None, sample_rate=44100
+    ):
+        """
+        Compiles the request bundles rendering ``start_offset`` through
+        ``stop_offset`` on its own, timestamped relative to ``start_offset``.
+
+        The first bundle recreates the session's state at ``start_offset``.
+        Synths already playing are recreated rather than resumed, so their
+        envelopes, phases and other internal state restart there. Only the
+        offsets from ``start_offset`` up to ``stop_offset`` are compiled.
+        """
+        id_mapping = self._build_id_mapping()
+        duration = duration or self.duration
+        buffer_open_states, visited_synthdefs = {}, set()
+        requests = []
+        if 0 < start_offset:
+            requests += self._collect_preroll_requests(
+                buffer_open_states,
+                duration,
+                id_mapping,
+                start_offset,
+                sample_rate,
+                stop_offset,
+                visited_synthdefs,
+            )
+        start_index = max(bisect.bisect_left(self.offsets, start_offset), 1)
+        stop_index = bisect.bisect_left(self.offsets, stop_offset)
+        offsets = self.offsets[start_index:stop_index]
+        intersections = zip(
+            self.buffers.find_intersections(offsets),
+            self.nodes.find_intersections(offsets),
+        )
         buffer_settings = self._collect_buffer_settings(id_mapping)
         bus_settings = self._collect_bus_settings(id_mapping)
-        is_last_offset = False
-        request_bundles = []
-        buffer_open_states = {}
-        visited_synthdefs = set()
-        for offset in offsets:
-            requests = []
-            if offset == duration:
-                is_last_offset = True
-            requests = self._collect_requests_at_offset(
+        for offset, offset_intersections in zip(offsets, intersections):
+            offset_requests = self._collect_requests_at_offset(
                 buffer_open_states,
                 buffer_settings,
                 bus_settings,
                 duration,
                 id_mapping,
-                is_last_offset,
+                False,
                 offset,
                 visited_synthdefs,
+                intersections=offset_intersections,
             )
-            if is_last_offset:
-                requests.append(NothingRequest())
+            if offset == start_offset:
+                requests += offset_requests
+                continue
+            elif not offset_requests:
+                continue
             if requests:
-                request_bundle = RequestBundle(
-                    contents=requests, timestamp=float(offset)
-                )
-                request_bundles.append(request_bundle)
-            if is_last_offset:
-                break
-        return request_bundles
+                yield RequestBundle(contents=requests, timestamp=0.0)
+                requests = []
+            yield RequestBundle(
+                contents=offset_requests, timestamp=offset - start_offset
+            )
+        if requests:
+            yield RequestBundle(contents=requests, timestamp=0.0)
+        yield RequestBundle(
+            contents=[NothingRequest()], timestamp=stop_offset - start_offset
+        )
+
+    def _to_non_xrefd_request_bundles(self, duration=None):
+        return list(self._iterate_non_xrefd_request_bundles(duration))
 
     ### PUBLIC METHODS ###
 
@@ -1051,6 +1375,7 @@ class Session:
         self.root_node.move_node(node, add_action=add_action, offset=offset)
 
     def rebuild_transitions(self):
+        self._mark_dirty(float("-inf"), float("inf"))
         for state_one, state_two in self._iterate_state_pairs(
             float("-inf"), with_node_tree=True
         ):
@@ -1069,6 +1394,11 @@ class Session:
         sample_rate=44100,
         print_transcript=None,
         transcript_prefix=None,
+        maximum_workers=None,
+        segment_offsets=None,
+        segment_preroll=1.0,
+        segment_crossfade=0.01,
+        render_cache=None,
         **kwargs,
     ):
         import supriya.nonrealtime
@@ -1083,9 +1413,17 @@ class Session:
             sample_format=sample_format,
             sample_rate=sample_rate,
             transcript_prefix=transcript_prefix,
+            render_cache=render_cache,
         )
         exit_code, transcript, output_file_path = renderer.render(
-            output_file_path, duration=duration, debug=debug, **kwargs
+            output_file_path,
+            duration=duration,
+            debug=debug,
+            maximum_workers=maximum_workers,
+            segment_offsets=segment_offsets,
+            segment_preroll=segment_preroll,
+            segment_crossfade=segment_crossfade,
+            **kwargs,
         )
         self._transcript = transcript
         return exit_code, output_file_path
@@ -1196,6 +1534,10 @@ class Session:
             duration += self.padding
         return duration
 
+    @property
+    def incremental(self):
+        return self._incremental
+
     @property
     def input_(self):
         return self._input
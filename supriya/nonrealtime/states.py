@@ -5,6 +5,7 @@ import uqbar.graphs
 
 import supriya.commands
 from supriya.nonrealtime.bases import SessionObject
+from supriya.nonrealtime.mappings import PersistentMapping
 from supriya.system import SupriyaValueObject
 from supriya.utils import iterate_nwise
 
@@ -39,8 +40,8 @@ class State(SessionObject):
 
         SessionObject.__init__(self, session)
         self._transitions = collections.OrderedDict()
-        self._nodes_to_children: Dict[Node, Tuple[Node]] = {}
-        self._nodes_to_parents: Dict[Node, Tuple[Node]] = {}
+        self._nodes_to_children: Dict[Node, Tuple[Node]] = PersistentMapping()
+        self._nodes_to_parents: Dict[Node, Tuple[Node]] = PersistentMapping()
         self._start_nodes = set()
         self._stop_nodes = set()
         self._start_buffers = set()
@@ -67,11 +68,11 @@ class State(SessionObject):
         if nodes_to_children is not None:
             nodes_to_children = nodes_to_children.copy()
         else:
-            nodes_to_children = {}
+            nodes_to_children = PersistentMapping()
         if nodes_to_parents is not None:
             nodes_to_parents = nodes_to_parents.copy()
         else:
-            nodes_to_parents = {}
+            nodes_to_parents = PersistentMapping()
         transitions = transitions or {}
         for node, action in transitions.items():
             action.apply_transform(nodes_to_children, nodes_to_parents)
@@ -339,6 +340,7 @@ class Moment(SessionObject):
 
     def __enter__(self):
         self.session.active_moments.append(self)
+        self.session._mark_dirty(self.offset)
         if self.propagate:
             self.session._apply_transitions(self.state.offset)
         return self
@@ -352,6 +354,7 @@ class Moment(SessionObject):
 
     def __exit__(self, exc_type, exc_value, traceback):
         self.session.active_moments.pop()
+        self.session._mark_dirty(self.offset)
         if self.propagate:
             self.session._apply_transitions(self.state.offset)
 
@@ -0,0 +1,227 @@
+import array
+import bisect
+import collections.abc
+import itertools
+
+
+class Timeline(collections.abc.Sequence):
+    """
+    A sorted sequence of ``(offset, value)`` events, at most one per offset.
+
+    Offsets live in chunked blocks of C doubles, with values in parallel lists.
+    Finding an offset takes two binary searches, and inserting one shifts at
+    most a block, so building a timeline in any order stays fast however long
+    it grows. Runs of events, like an automation curve, merge in in one pass.
+
+    ::
+
+        >>> from supriya.nonrealtime.timelines import Timeline
+        >>> timeline = Timeline([(0.0, 440.0), (1.0, 880.0)])
+        >>> timeline.set(0.5, 660.0)
+        >>> timeline.update([(0.25, 550.0), (1.0, 990.0)])
+        >>> list(timeline)
+        [(0.0, 440.0), (0.25, 550.0), (0.5, 660.0), (1.0, 990.0)]
+
+    ::
+
+        >>> timeline.get(0.75)
+        (660.0, 0.5)
+
+    ::
+
+        >>> list(timeline.irange(0.25, 1.0))
+        [(0.25, 550.0), (0.5, 660.0)]
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Session Internals"
+
+    __slots__ = ("_firsts", "_length", "_offsets", "_values")
+
+    _block_size = 512
+
+    ### INITIALIZER ###
+
+    def __init__(self, events=None):
+        self._firsts = []
+        self._length = 0
+        self._offsets = []
+        self._values = []
+        if events:
+            self.update(events)
+
+    ### SPECIAL METHODS ###
+
+    def __eq__(self, expr):
+        if not isinstance(expr, collections.abc.Sequence) or isinstance(expr, str):
+            return NotImplemented
+        return len(self) == len(expr) and all(
+            tuple(x) == tuple(y) for x, y in zip(self, expr)
+        )
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        for offsets, values in zip(self._offsets, self._values):
+            if index < len(offsets):
+                return offsets[index], values[index]
+            index -= len(offsets)
+
+    def __iter__(self):
+        for offsets, values in zip(self._offsets, self._values):
+            yield from zip(offsets, values)
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, list(self))
+
+    ### PRIVATE METHODS ###
+
+    def _build_blocks(self, events):
+        self._firsts, self._offsets, self._values = [], [], []
+        self._length = 0
+        self._extend(events)
+
+    def _extend(self, events):
+        """
+        Appends ``events``, which must follow every event already present.
+        """
+        iterator = iter(events)
+        if self._offsets and len(self._offsets[-1]) < self._block_size:
+            offsets, values = self._offsets[-1], self._values[-1]
+            for offset, value in itertools.islice(
+                iterator, self._block_size - len(offsets)
+            ):
+                offsets.append(offset)
+                values.append(value)
+                self._length += 1
+        while True:
+            chunk = list(itertools.islice(iterator, self._block_size))
+            if not chunk:
+                break
+            offsets = array.array("d", (offset for offset, _ in chunk))
+            self._firsts.append(offsets[0])
+            self._offsets.append(offsets)
+            self._values.append([value for _, value in chunk])
+            self._length += len(chunk)
+
+    def _locate(self, offset):
+        """
+        Locates the block and position at which ``offset`` is, or would be.
+        """
+        block_index = max(bisect.bisect_right(self._firsts, offset) - 1, 0)
+        return block_index, bisect.bisect_left(self._offsets[block_index], offset)
+
+    ### PUBLIC METHODS ###
+
+    def copy(self):
+        timeline = type(self)()
+        timeline._extend(self)
+        return timeline
+
+    def get(self, offset):
+        """
+        Gets the value of the last event at or before ``offset``, and that
+        event's offset, or a pair of nones.
+        """
+        if not self._length:
+            return None, None
+        block_index, index = self._locate(offset)
+        offsets = self._offsets[block_index]
+        if index < len(offsets) and offsets[index] == offset:
+            return self._values[block_index][index], offset
+        if index:
+            return self._values[block_index][index - 1], offsets[index - 1]
+        if block_index:
+            return self._values[block_index - 1][-1], self._offsets[block_index - 1][-1]
+        return None, None
+
+    def irange(self, start_offset, stop_offset):
+        """
+        Iterates over the events from ``start_offset`` up to, but excluding,
+        ``stop_offset``.
+        """
+        if not self._length:
+            return
+        block_index, index = self._locate(start_offset)
+        for offsets, values in zip(
+            self._offsets[block_index:], self._values[block_index:]
+        ):
+            for i in range(index, len(offsets)):
+                if stop_offset <= offsets[i]:
+                    return
+                yield offsets[i], values[i]
+            index = 0
+
+    def set(self, offset, value):
+        """
+        Sets the event at ``offset`` to ``value``.
+        """
+        offset = float(offset)
+        if not self._length or self._offsets[-1][-1] < offset:
+            self._extend([(offset, value)])
+            return
+        block_index, index = self._locate(offset)
+        offsets, values = self._offsets[block_index], self._values[block_index]
+        if index < len(offsets) and offsets[index] == offset:
+            values[index] = value
+            return
+        offsets.insert(index, offset)
+        values.insert(index, value)
+        self._firsts[block_index] = offsets[0]
+        self._length += 1
+        if 2 * self._block_size < len(offsets):
+            half = len(offsets) // 2
+            self._offsets[block_index : block_index + 1] = [
+                offsets[:half],
+                offsets[half:],
+            ]
+            self._values[block_index : block_index + 1] = [
+                values[:half],
+                values[half:],
+            ]
+            self._firsts.insert(block_index + 1, offsets[half])
+
+    def split(self, offset):
+        """
+        Splits into the events before ``offset``, and those from ``offset`` on.
+        """
+        left, right = type(self)(), type(self)()
+        if not self._length:
+            return left, right
+        block_index, index = self._locate(offset)
+        events = iter(self)
+        left._extend(
+            itertools.islice(
+                events, sum(len(x) for x in self._offsets[:block_index]) + index,
+            )
+        )
+        right._extend(events)
+        return left, right
+
+    def update(self, events):
+        """
+        Sets every one of ``events``, in order.
+
+        Events following every event already present are appended in bulk.
+        Otherwise, all events are merged in one pass.
+        """
+        events = [(float(offset), value) for offset, value in events]
+        if not events:
+            return
+        if all(x[0] < y[0] for x, y in zip(events, events[1:])) and (
+            not self._length or self._offsets[-1][-1] < events[0][0]
+        ):
+            self._extend(events)
+            return
+        merged = dict(self)
+        merged.update(events)
+        self._build_blocks(sorted(merged.items(), key=lambda x: x[0]))
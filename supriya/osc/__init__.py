@@ -6,15 +6,18 @@ from .captures import Capture, CaptureEntry
 from .messages import OscBundle, OscMessage
 from .protocols import (
     AsyncOscProtocol,
+    AsyncTcpOscProtocol,
     HealthCheck,
     OscCallback,
     OscProtocol,
     ThreadedOscProtocol,
+    ThreadedTcpOscProtocol,
 )
 from .utils import find_free_port
 
 __all__ = [
     "AsyncOscProtocol",
+    "AsyncTcpOscProtocol",
     "Capture",
     "CaptureEntry",
     "HealthCheck",
@@ -23,5 +26,6 @@ __all__ = [
     "OscMessage",
     "OscProtocol",
     "ThreadedOscProtocol",
+    "ThreadedTcpOscProtocol",
     "find_free_port",
 ]
@@ -1,6 +1,7 @@
 import collections
 import datetime
 import enum
+import functools
 import struct
 import time
 
@@ -16,6 +17,84 @@ SYSTEM_EPOCH = datetime.date(*time.gmtime(0)[0:3])
 NTP_EPOCH = datetime.date(1900, 1, 1)
 NTP_DELTA = (SYSTEM_EPOCH - NTP_EPOCH).days * 24 * 3600
 
+_DATE_STRUCT = struct.Struct(">Q")
+_LENGTH_STRUCT = struct.Struct(">i")
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_message_struct(address_length, type_tags, lengths):
+    """
+    Get the packer for a message with ``type_tags``.
+
+    ``lengths`` holds the unpadded byte length of each string and blob argument,
+    in order, and ``address_length`` is ``None`` for integer addresses.
+    """
+    if address_length is None:
+        formats = [">i"]
+    else:
+        formats = [">{}s".format(_pad_string_length(address_length))]
+    formats.append("{}s".format(_pad_string_length(len(type_tags))))
+    lengths = iter(lengths)
+    for type_tag in type_tags[1:].decode("ascii"):
+        if type_tag in "if":
+            formats.append(type_tag)
+        elif type_tag == "s":
+            formats.append("{}s".format(_pad_string_length(next(lengths))))
+        elif type_tag == "b":
+            formats.append("I{}s".format(_pad_blob_length(next(lengths))))
+    return struct.Struct("".join(formats))
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_type_tags(type_tags):
+    """
+    Compile ``type_tags`` into decoding operations.
+
+    Runs of fixed-width type tags collapse into a single ``struct.Struct``, so
+    purely numeric messages decode with one ``unpack_from()`` call.
+    """
+    operations = []
+    format_ = ""
+    for type_tag in type_tags:
+        if type_tag in "ifd":
+            format_ += type_tag
+            continue
+        if format_:
+            operations.append(struct.Struct(">" + format_))
+            format_ = ""
+        if type_tag not in "sbTFN[]":
+            raise RuntimeError(f"Unable to parse type {type_tag!r}")
+        operations.append(type_tag)
+    if format_:
+        operations.append(struct.Struct(">" + format_))
+    return tuple(operations)
+
+
+def _decode_blob(datagram, offset, end):
+    if offset + 4 > end:
+        raise ValueError("datagram is truncated")
+    actual_length = _LENGTH_STRUCT.unpack_from(datagram, offset)[0]
+    offset += 4
+    if offset + actual_length > end:
+        raise ValueError("datagram is truncated")
+    value = datagram[offset : offset + actual_length]
+    return value, offset + _pad_blob_length(actual_length)
+
+
+def _decode_string(datagram, offset, end):
+    actual_length = datagram.index(b"\x00", offset, end) - offset
+    value = str(datagram[offset : offset + actual_length], "ascii")
+    return value, offset + _pad_string_length(actual_length)
+
+
+def _pad_blob_length(length):
+    return (length + 3) & ~3
+
+
+def _pad_string_length(length):
+    # strings are always null-terminated, even when already 4-byte aligned
+    return (length + 4) & ~3
+
 
 class OscMessage(SupriyaValueObject):
     """
@@ -115,110 +194,92 @@ class OscMessage(SupriyaValueObject):
     ### PRIVATE METHODS ###
 
     @staticmethod
-    def _decode_blob(data):
-        actual_length, remainder = struct.unpack(">I", data[:4])[0], data[4:]
-        padded_length = actual_length
-        if actual_length % 4 != 0:
-            padded_length = (actual_length // 4 + 1) * 4
-        return remainder[:padded_length][:actual_length], remainder[padded_length:]
-
-    @staticmethod
-    def _decode_string(data):
-        actual_length = data.index(b"\x00")
-        padded_length = (actual_length // 4 + 1) * 4
-        return str(data[:actual_length], "ascii"), data[padded_length:]
-
-    @staticmethod
-    def _encode_string(value):
-        result = bytes(value + "\x00", "ascii")
-        if len(result) % 4 != 0:
-            width = (len(result) // 4 + 1) * 4
-            result = result.ljust(width, b"\x00")
-        return result
-
-    @staticmethod
-    def _encode_blob(value):
-        result = bytes(struct.pack(">I", len(value)) + value)
-        if len(result) % 4 != 0:
-            width = (len(result) // 4 + 1) * 4
-            result = result.ljust(width, b"\x00")
-        return result
-
-    @classmethod
-    def _encode_value(cls, value):
+    def _compile_value(value, type_tags, values, lengths):
+        class_ = value.__class__
+        # fast paths for the overwhelmingly common argument types
+        if class_ is float:
+            type_tags.append("f")
+            values.append(value)
+            return
+        elif class_ is int:
+            type_tags.append("i")
+            values.append(value)
+            return
+        elif class_ is str:
+            value = value.encode("ascii")
+            type_tags.append("s")
+            values.append(value)
+            lengths.append(len(value))
+            return
         if hasattr(value, "to_datagram"):
-            value = bytearray(value.to_datagram())
+            value = value.to_datagram()
         elif isinstance(value, enum.Enum):
             value = value.value
-        type_tags, encoded_value = "", b""
         if isinstance(value, (bytearray, bytes)):
-            type_tags += "b"
-            encoded_value = cls._encode_blob(value)
+            type_tags.append("b")
+            values.append(len(value))
+            values.append(value)
+            lengths.append(len(value))
         elif isinstance(value, str):
-            type_tags += "s"
-            encoded_value = cls._encode_string(value)
+            value = value.encode("ascii")
+            type_tags.append("s")
+            values.append(value)
+            lengths.append(len(value))
         elif isinstance(value, bool):
-            type_tags += "T" if value else "F"
+            type_tags.append("T" if value else "F")
         elif isinstance(value, float):
-            type_tags += "f"
-            encoded_value += struct.pack(">f", value)
+            type_tags.append("f")
+            values.append(value)
         elif isinstance(value, int):
-            type_tags += "i"
-            encoded_value += struct.pack(">i", value)
+            type_tags.append("i")
+            values.append(value)
         elif value is None:
-            type_tags += "N"
+            type_tags.append("N")
         elif isinstance(value, collections.Sequence):
-            type_tags += "["
+            type_tags.append("[")
             for sub_value in value:
-                sub_type_tags, sub_encoded_value = cls._encode_value(sub_value)
-                type_tags += sub_type_tags
-                encoded_value += sub_encoded_value
-            type_tags += "]"
+                OscMessage._compile_value(sub_value, type_tags, values, lengths)
+            type_tags.append("]")
         else:
             message = "Cannot encode {!r}".format(value)
             raise TypeError(message)
-        return type_tags, encoded_value
 
-    ### PUBLIC METHODS ###
-
-    def to_datagram(self):
+    def _compile(self):
+        """
+        Compile message into its size, a (cached) packer and the flat values
+        to pack.
+        """
         # address can be a string or (in SuperCollider) an int
         if isinstance(self.address, str):
-            encoded_address = self._encode_string(self.address)
+            address = self.address.encode("ascii")
+            address_length = len(address)
         else:
-            encoded_address = struct.pack(">i", self.address)
-        encoded_type_tags = ","
-        encoded_contents = b""
-        for value in self.contents or ():
-            type_tags, encoded_value = self._encode_value(value)
-            encoded_type_tags += type_tags
-            encoded_contents += encoded_value
-        return (
-            encoded_address + self._encode_string(encoded_type_tags) + encoded_contents
-        )
+            address, address_length = self.address, None
+        type_tags, values, lengths = [","], [address, None], []
+        compile_value = self._compile_value
+        for value in self.contents:
+            compile_value(value, type_tags, values, lengths)
+        values[1] = type_tags = "".join(type_tags).encode("ascii")
+        compiled_struct = _get_message_struct(address_length, type_tags, tuple(lengths))
+        return compiled_struct.size, compiled_struct, values
 
     @classmethod
-    def from_datagram(cls, datagram):
-        remainder = datagram
-        address, remainder = cls._decode_string(remainder)
-        type_tags, remainder = cls._decode_string(remainder)
+    def _decode(cls, datagram, offset, end):
+        address, offset = _decode_string(datagram, offset, end)
+        type_tags, offset = _decode_string(datagram, offset, end)
         contents = []
         array_stack = [contents]
-        for type_tag in type_tags[1:]:
-            if type_tag == "i":
-                value, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
-                array_stack[-1].append(value)
-            elif type_tag == "f":
-                value, remainder = struct.unpack(">f", remainder[:4])[0], remainder[4:]
-                array_stack[-1].append(value)
-            elif type_tag == "d":
-                value, remainder = struct.unpack(">d", remainder[:8])[0], remainder[8:]
-                array_stack[-1].append(value)
-            elif type_tag == "s":
-                value, remainder = cls._decode_string(remainder)
+        for operation in _compile_type_tags(type_tags[1:]):
+            if operation.__class__ is struct.Struct:
+                if offset + operation.size > end:
+                    raise ValueError("datagram is truncated")
+                array_stack[-1].extend(operation.unpack_from(datagram, offset))
+                offset += operation.size
+            elif operation == "s":
+                value, offset = _decode_string(datagram, offset, end)
                 array_stack[-1].append(value)
-            elif type_tag == "b":
-                value, remainder = cls._decode_blob(remainder)
+            elif operation == "b":
+                value, offset = _decode_blob(datagram, offset, end)
                 for class_ in (OscBundle, OscMessage):
                     try:
                         value = class_.from_datagram(value)
@@ -226,22 +287,37 @@ class OscMessage(SupriyaValueObject):
                     except Exception:
                         pass
                 array_stack[-1].append(value)
-            elif type_tag == "T":
+            elif operation == "T":
                 array_stack[-1].append(True)
-            elif type_tag == "F":
+            elif operation == "F":
                 array_stack[-1].append(False)
-            elif type_tag == "N":
+            elif operation == "N":
                 array_stack[-1].append(None)
-            elif type_tag == "[":
+            elif operation == "[":
                 array = []
                 array_stack[-1].append(array)
                 array_stack.append(array)
-            elif type_tag == "]":
+            elif operation == "]":
                 array_stack.pop()
-            else:
-                raise RuntimeError(f"Unable to parse type {type_tag!r}")
         return cls(address, *contents)
 
+    def _pack_into(self, buffer, offset, compiled):
+        size, compiled_struct, values = compiled
+        compiled_struct.pack_into(buffer, offset, *values)
+        return offset + size
+
+    ### PUBLIC METHODS ###
+
+    def to_datagram(self):
+        _, compiled_struct, values = self._compile()
+        return compiled_struct.pack(*values)
+
+    @classmethod
+    def from_datagram(cls, datagram):
+        if not isinstance(datagram, bytes):
+            datagram = bytes(datagram)
+        return cls._decode(datagram, 0, len(datagram))
+
     def to_list(self):
         result = [self.address]
         for x in self.contents:
@@ -348,12 +424,11 @@ class OscBundle(SupriyaValueObject):
     ### PRIVATE METHODS ###
 
     @staticmethod
-    def _decode_date(data):
-        data, remainder = data[:8], data[8:]
-        if data == IMMEDIATELY:
-            return None, remainder
-        date = (struct.unpack(">Q", data)[0] / SECONDS_TO_NTP_TIMESTAMP) - NTP_DELTA
-        return date, remainder
+    def _decode_date(data, offset=0):
+        value = _DATE_STRUCT.unpack_from(data, offset)[0]
+        if value == 1:
+            return None
+        return (value / SECONDS_TO_NTP_TIMESTAMP) - NTP_DELTA
 
     @staticmethod
     def _encode_date(seconds, realtime=True):
@@ -364,54 +439,135 @@ class OscBundle(SupriyaValueObject):
             return struct.pack(">Q", int(seconds * SECONDS_TO_NTP_TIMESTAMP))
         return struct.pack(">Q", int(seconds * SECONDS_TO_NTP_TIMESTAMP))
 
-    ### PUBLIC METHODS ###
-
     @classmethod
-    def from_datagram(cls, datagram):
-        if not datagram.startswith(BUNDLE_PREFIX):
+    def _decode(cls, datagram, offset, end):
+        if datagram[offset : offset + 8] != BUNDLE_PREFIX:
             raise ValueError("datagram is not a bundle")
-        remainder = datagram[8:]
-        timestamp, remainder = cls._decode_date(remainder)
+        if offset + 16 > end:
+            raise ValueError("datagram is truncated")
+        timestamp = cls._decode_date(datagram, offset + 8)
+        offset += 16
         contents = []
-        while len(remainder):
-            length, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
-            if remainder.startswith(BUNDLE_PREFIX):
-                item = cls.from_datagram(remainder[:length])
+        while offset < end:
+            length = _LENGTH_STRUCT.unpack_from(datagram, offset)[0]
+            offset += 4
+            if offset + length > end:
+                raise ValueError("datagram is truncated")
+            if datagram[offset : offset + 8] == BUNDLE_PREFIX:
+                item = cls._decode(datagram, offset, offset + length)
             else:
-                item = OscMessage.from_datagram(remainder[:length])
+                item = OscMessage._decode(datagram, offset, offset + length)
             contents.append(item)
-            remainder = remainder[length:]
-        osc_bundle = cls(timestamp=timestamp, contents=tuple(contents))
-        return osc_bundle
+            offset += length
+        return cls(timestamp=timestamp, contents=tuple(contents))
+
+    def _compile(self):
+        size, entries = 16, []
+        for content in self.contents:
+            compiled = content._compile()
+            entries.append((content, compiled))
+            size += 4 + compiled[0]
+        return size, entries
+
+    def _pack_into(self, buffer, offset, compiled, realtime=True):
+        _, entries = compiled
+        buffer[offset : offset + 8] = BUNDLE_PREFIX
+        buffer[offset + 8 : offset + 16] = self._encode_date(
+            self.timestamp, realtime=realtime
+        )
+        offset += 16
+        for content, content_compiled in entries:
+            _LENGTH_STRUCT.pack_into(buffer, offset, content_compiled[0])
+            # nested bundles are always encoded with realtime timestamps
+            offset = content._pack_into(buffer, offset + 4, content_compiled)
+        return offset
+
+    ### PUBLIC METHODS ###
 
     @classmethod
-    def partition(cls, messages, timestamp=None):
-        bundles = []
-        contents = []
-        message = collections.deque(messages)
-        remaining = maximum = 8192 - len(BUNDLE_PREFIX) - 4
-        while messages:
-            message = messages.popleft()
-            datagram = message.to_datagram()
-            remaining -= len(datagram) + 4
-            if remaining > 0:
-                contents.append(message)
+    def from_datagram(cls, datagram):
+        if not isinstance(datagram, bytes):
+            datagram = bytes(datagram)
+        return cls._decode(datagram, 0, len(datagram))
+
+    @classmethod
+    def _group_by_size(cls, messages, maximum):
+        """
+        Group ``messages`` greedily, in order, into runs whose bundle fits in
+        ``maximum`` bytes.
+
+        Yields lists of (message, compiled) pairs. A message too large to share
+        a bundle is yielded alone.
+        """
+        group, size = [], 16
+        for message in messages:
+            compiled = message._compile()
+            if group and size + 4 + compiled[0] > maximum:
+                yield group
+                group, size = [], 16
+            group.append((message, compiled))
+            size += 4 + compiled[0]
+        if group:
+            yield group
+
+    @classmethod
+    def partition(cls, messages, timestamp=None, maximum=8192):
+        """
+        Partition ``messages`` into bundles no larger than ``maximum`` bytes.
+
+        ::
+
+            >>> messages = [
+            ...     supriya.osc.OscMessage("/n_set", 1000, "amplitude", 0.5)
+            ...     for _ in range(3)
+            ... ]
+            >>> for bundle in supriya.osc.OscBundle.partition(messages, maximum=96):
+            ...     bundle
+            ...
+            OscBundle(
+                contents=(
+                    OscMessage('/n_set', 1000, 'amplitude', 0.5),
+                    OscMessage('/n_set', 1000, 'amplitude', 0.5),
+                    ),
+                )
+            OscBundle(
+                contents=(
+                    OscMessage('/n_set', 1000, 'amplitude', 0.5),
+                    ),
+                )
+
+        """
+        return [
+            cls(timestamp=timestamp, contents=[message for message, _ in group])
+            for group in cls._group_by_size(messages, maximum)
+        ]
+
+    @classmethod
+    def partition_datagrams(cls, messages, timestamp=None, maximum=8192):
+        """
+        Partition ``messages`` into datagrams no larger than ``maximum`` bytes.
+
+        Equivalent to encoding each bundle returned by ``partition()``, except
+        that a lone message is left unbundled when ``timestamp`` is none, and each
+        message is compiled only once.
+        """
+        datagrams = []
+        for group in cls._group_by_size(messages, maximum):
+            if len(group) == 1 and timestamp is None:
+                message, compiled = group[0]
             else:
-                bundles.append(cls(timestamp=timestamp, contents=contents))
-                contents = [message]
-                remaining = maximum
-        if contents:
-            bundles.append(cls(timestamp=timestamp, contents=contents))
-        return bundles
+                message = cls(timestamp=timestamp)
+                compiled = (16 + sum(4 + x[0] for _, x in group), group)
+            buffer = bytearray(compiled[0])
+            message._pack_into(buffer, 0, compiled)
+            datagrams.append(bytes(buffer))
+        return datagrams
 
     def to_datagram(self, realtime=True):
-        datagram = BUNDLE_PREFIX
-        datagram += self._encode_date(self.timestamp, realtime=realtime)
-        for content in self.contents:
-            content_datagram = content.to_datagram()
-            datagram += struct.pack(">i", len(content_datagram))
-            datagram += content_datagram
-        return datagram
+        compiled = self._compile()
+        buffer = bytearray(compiled[0])
+        self._pack_into(buffer, 0, compiled, realtime=realtime)
+        return bytes(buffer)
 
     def to_list(self):
         result = [self.timestamp]
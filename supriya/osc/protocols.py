@@ -1,12 +1,25 @@
 import asyncio
 import collections
 import dataclasses
+import itertools
 import logging
-import queue
+import selectors
+import socket
 import socketserver
+import struct
 import threading
 import time
-from typing import Any, Callable, Dict, NamedTuple, Optional, Set, Tuple, Union
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from .captures import Capture, CaptureEntry
 from .messages import OscBundle, OscMessage
@@ -17,6 +30,39 @@ udp_in_logger = logging.getLogger("supriya.udp.in")
 udp_out_logger = logging.getLogger("supriya.udp.out")
 
 
+_FRAME_LENGTH_STRUCT = struct.Struct(">i")
+
+# Larger length prefixes are taken as a corrupt stream, not as a packet to wait for
+_MAXIMUM_FRAME_LENGTH = 1 << 24
+
+
+def _frame(datagram: bytes) -> bytes:
+    return _FRAME_LENGTH_STRUCT.pack(len(datagram)) + datagram
+
+
+def _unframe(buffer: bytearray) -> List[bytes]:
+    """
+    Remove and return all complete length-prefixed packets from ``buffer``.
+
+    OSC 1.0 over TCP, as spoken by scsynth: each packet is preceded by its size
+    as a big-endian int32.
+
+    Raises ``ValueError`` on a negative or oversized length, after which the
+    stream can't be resynchronized.
+    """
+    datagrams, offset = [], 0
+    while len(buffer) - offset >= 4:
+        (length,) = _FRAME_LENGTH_STRUCT.unpack_from(buffer, offset)
+        if not 0 <= length <= _MAXIMUM_FRAME_LENGTH:
+            raise ValueError("Invalid packet length: {}".format(length))
+        if len(buffer) - offset - 4 < length:
+            break
+        datagrams.append(bytes(buffer[offset + 4 : offset + 4 + length]))
+        offset += 4 + length
+    del buffer[:offset]
+    return datagrams
+
+
 class OscProtocolOffline(Exception):
     pass
 
@@ -32,6 +78,56 @@ class OscCallback(NamedTuple):
     once: bool = False
 
 
+class OscCallbackTable:
+    """
+    Callbacks registered against a single OSC address.
+
+    A trie over the message contents that callback patterns require. Callbacks
+    are keyed by identity at each node, so removing a callback never scans its
+    siblings.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("callbacks", "children")
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        self.callbacks: Dict[int, OscCallback] = {}
+        self.children: Dict[Union[str, int, float], OscCallbackTable] = {}
+
+    ### SPECIAL METHODS ###
+
+    def __bool__(self):
+        return bool(self.callbacks or self.children)
+
+    ### PUBLIC METHODS ###
+
+    def add(self, prefix: Tuple, callback: OscCallback):
+        table = self
+        for item in prefix:
+            child = table.children.get(item)
+            if child is None:
+                child = table.children[item] = OscCallbackTable()
+            table = child
+        table.callbacks[id(callback)] = callback
+
+    def remove(self, prefix: Tuple, callback: OscCallback):
+        path = [self]
+        for item in prefix:
+            table = path[-1].children.get(item)
+            if table is None:
+                return
+            path.append(table)
+        path[-1].callbacks.pop(id(callback), None)
+        # prune emptied nodes, deepest first
+        for item, table in zip(reversed(prefix), reversed(path[:-1])):
+            if table.children[item]:
+                break
+            del table.children[item]
+
+
 @dataclasses.dataclass
 class HealthCheck:
     request_pattern: str
@@ -46,8 +142,13 @@ class OscProtocol:
 
     ### INITIALIZER ###
 
-    def __init__(self):
-        self.callbacks: Dict[Any, Any] = {}
+    def __init__(
+        self,
+        *,
+        coalescing_window: Optional[float] = None,
+        max_datagram_size: int = 8192,
+    ):
+        self.callbacks: Dict[Union[str, int], OscCallbackTable] = {}
         self.captures: Set[Capture] = set()
         self.healthcheck = None
         self.healthcheck_osc_callback = None
@@ -55,51 +156,58 @@ class OscProtocol:
         self.ip_address = None
         self.is_running: bool = False
         self.port = None
+        # When set, outgoing messages are held for up to this many seconds (e.g.
+        # one control period, 64 samples at 44.1kHz is ~0.0015s) and sent
+        # coalesced into bundles of at most max_datagram_size bytes.
+        self.coalescing_window = coalescing_window
+        self.max_datagram_size = max_datagram_size
+        self.send_queue: List[Union[OscBundle, OscMessage]] = []
 
     ### PRIVATE METHODS ###
 
     def _add_callback(self, callback: OscCallback):
-        patterns = [callback.pattern]
-        if callback.failure_pattern:
-            patterns.append(callback.failure_pattern)
-        for pattern in patterns:
-            callback_map = self.callbacks
-            for item in pattern:
-                callbacks, callback_map = callback_map.setdefault(item, ([], {}))
-            callbacks.append(callback)
+        for pattern in (callback.pattern, callback.failure_pattern):
+            if not pattern:
+                continue
+            table = self.callbacks.get(pattern[0])
+            if table is None:
+                table = self.callbacks[pattern[0]] = OscCallbackTable()
+            table.add(tuple(pattern[1:]), callback)
 
     def _match_callbacks(self, message):
-        items = (message.address,) + message.contents
-        matching_callbacks = []
-        callback_map = self.callbacks
-        for item in items:
-            if item not in callback_map:
+        table = self.callbacks.get(message.address)
+        if table is None:
+            return []
+        matching_callbacks = [*table.callbacks.values()]
+        children = table.children
+        for item in message.contents:
+            if not children:
+                break
+            try:
+                table = children.get(item)
+            except TypeError:  # unhashable contents, e.g. arrays
+                break
+            if table is None:
                 break
-            callbacks, callback_map = callback_map[item]
-            matching_callbacks.extend(callbacks)
+            matching_callbacks.extend(table.callbacks.values())
+            children = table.children
         for callback in matching_callbacks:
             if callback.once:
-                self.unregister(callback)
+                # Only the receive path mutates the index, so one-shot callbacks
+                # can be removed immediately rather than via unregister().
+                self._remove_callback(callback)
         return matching_callbacks
 
     def _remove_callback(self, callback: OscCallback):
-        def delete(pattern, original_callback_map):
-            key = pattern.pop(0)
-            if key not in original_callback_map:
-                return
-            callbacks, callback_map = original_callback_map[key]
-            if pattern:
-                delete(pattern, callback_map)
-            if callback in callbacks:
-                callbacks.remove(callback)
-            if not callbacks and not callback_map:
-                original_callback_map.pop(key)
-
-        patterns = [callback.pattern]
-        if callback.failure_pattern:
-            patterns.append(callback.failure_pattern)
-        for pattern in patterns:
-            delete(list(pattern), self.callbacks)
+        for pattern in (callback.pattern, callback.failure_pattern):
+            if not pattern:
+                continue
+            table = self.callbacks.get(pattern[0])
+            if table is None:
+                continue
+            table.remove(tuple(pattern[1:]), callback)
+            if not table:
+                del self.callbacks[pattern[0]]
 
     def _reset_attempts(self, message):
         self.attempts = 0
@@ -148,7 +256,45 @@ class OscProtocol:
                 CaptureEntry(timestamp=time.time(), label="R", message=message,)
             )
 
-    def _validate_send(self, message):
+    def _coalesce_send_queue(self):
+        """
+        Coalesce queued messages into as few datagrams as possible.
+
+        Consecutive messages and bundles sharing a timestamp merge into one
+        bundle (bare messages count as immediate), preserving send order.
+        Bundles nesting other bundles are sent as-is, since scsynth does not
+        execute nested bundles.
+        """
+
+        def get_key(message):
+            if isinstance(message, OscMessage):
+                return None
+            elif all(isinstance(x, OscMessage) for x in message.contents):
+                return message.timestamp
+            return message
+
+        messages, self.send_queue = self.send_queue, []
+        datagrams = []
+        for key, group in itertools.groupby(messages, get_key):
+            if isinstance(key, OscBundle):
+                datagrams.extend(bundle.to_datagram() for bundle in group)
+                continue
+            contents = []
+            for message in group:
+                if isinstance(message, OscBundle):
+                    contents.extend(message.contents)
+                else:
+                    contents.append(message)
+            datagrams.extend(
+                OscBundle.partition_datagrams(
+                    contents, timestamp=key, maximum=self.max_datagram_size
+                )
+            )
+        for datagram in datagrams:
+            udp_out_logger.debug(datagram)
+        return datagrams
+
+    def _validate_message(self, message):
         if not self.is_running:
             raise OscProtocolOffline
         if not isinstance(message, (str, collections.Iterable, OscBundle, OscMessage)):
@@ -162,7 +308,10 @@ class OscProtocol:
             capture.messages.append(
                 CaptureEntry(timestamp=time.time(), label="S", message=message)
             )
-        datagram = message.to_datagram()
+        return message
+
+    def _validate_send(self, message):
+        datagram = self._validate_message(message).to_datagram()
         udp_out_logger.debug(datagram)
         return datagram
 
@@ -189,17 +338,39 @@ class OscProtocol:
         ...
 
 
-class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
+class _AsyncOscProtocol(OscProtocol):
+    """
+    The transport-independent half of an asyncio OSC protocol.
+    """
 
     ### INITIALIZER ###
 
-    def __init__(self):
-        asyncio.DatagramProtocol.__init__(self)
-        OscProtocol.__init__(self)
+    def __init__(
+        self,
+        *,
+        coalescing_window: Optional[float] = None,
+        max_datagram_size: int = 8192,
+    ):
+        OscProtocol.__init__(
+            self,
+            coalescing_window=coalescing_window,
+            max_datagram_size=max_datagram_size,
+        )
         self.loop = None
 
     ### PRIVATE METHODS ###
 
+    async def _create_endpoint(self, ip_address, port):
+        await self.loop.create_datagram_endpoint(
+            lambda: self, remote_addr=(ip_address, port),
+        )
+
+    def _flush_send_queue(self):
+        if not self.is_running:
+            return
+        for datagram in self._coalesce_send_queue():
+            self._send_datagram(datagram)
+
     async def _run_healthcheck(self):
         while self.is_running:
             sleep_time = self.healthcheck.timeout * pow(
@@ -217,6 +388,9 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
             self.send(OscMessage(*self.healthcheck.request_pattern))
             await asyncio.sleep(sleep_time)
 
+    def _send_datagram(self, datagram):
+        self.transport.sendto(datagram)
+
     ### PUBLIC METHODS ###
 
     async def connect(
@@ -227,9 +401,7 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         self._setup(ip_address, port, healthcheck)
         self.loop = asyncio.get_running_loop()
         self.exit_future = self.loop.create_future()
-        _, protocol = await self.loop.create_datagram_endpoint(
-            lambda: self, remote_addr=(ip_address, port),
-        )
+        await self._create_endpoint(ip_address, port)
 
     def connection_made(self, transport):
         loop = asyncio.get_running_loop()
@@ -241,12 +413,10 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
     def connection_lost(self, exc):
         pass
 
-    def datagram_received(self, data, addr):
-        self._validate_receive(data)
-
     async def disconnect(self):
         if not self.is_running:
             return
+        self._flush_send_queue()
         self.exit_future.set_result(True)
         self._teardown()
         if self.loop.is_closed():
@@ -256,9 +426,6 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         if self.healthcheck is not None:
             await self.healthcheck_task
 
-    def error_received(self, exc):
-        osc_out_logger.warning(exc)
-
     def register(
         self, pattern, procedure, *, failure_pattern=None, once=False,
     ) -> OscCallback:
@@ -269,13 +436,42 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         return callback
 
     def send(self, message):
-        datagram = self._validate_send(message)
-        return self.transport.sendto(datagram)
+        if self.coalescing_window is None:
+            return self._send_datagram(self._validate_send(message))
+        self.send_queue.append(self._validate_message(message))
+        if len(self.send_queue) == 1:
+            self.loop.call_later(self.coalescing_window, self._flush_send_queue)
 
     def unregister(self, callback: OscCallback):
         self._remove_callback(callback)
 
 
+class AsyncOscProtocol(_AsyncOscProtocol, asyncio.DatagramProtocol):
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        *,
+        coalescing_window: Optional[float] = None,
+        max_datagram_size: int = 8192,
+    ):
+        asyncio.DatagramProtocol.__init__(self)
+        _AsyncOscProtocol.__init__(
+            self,
+            coalescing_window=coalescing_window,
+            max_datagram_size=max_datagram_size,
+        )
+
+    ### PUBLIC METHODS ###
+
+    def datagram_received(self, data, addr):
+        self._validate_receive(data)
+
+    def error_received(self, exc):
+        osc_out_logger.warning(exc)
+
+
 class ThreadedOscServer(socketserver.UDPServer):
     osc_protocol: "ThreadedOscProtocol"
 
@@ -288,19 +484,47 @@ class ThreadedOscServer(socketserver.UDPServer):
 
 
 class ThreadedOscHandler(socketserver.BaseRequestHandler):
+
+    # Maximum datagrams handled per wake-up of the server loop.
+    batch_size = 64
+
     def handle(self):
-        data = self.request[0]
-        self.server.osc_protocol._validate_receive(data)
+        data, socket_ = self.request
+        osc_protocol = self.server.osc_protocol
+        osc_protocol._validate_receive(data)
+        if not hasattr(socket, "MSG_DONTWAIT"):
+            return
+        # Deliver whatever else is already waiting on the socket in one batch,
+        # rather than round-tripping through select() once per datagram.
+        for _ in range(self.batch_size - 1):
+            try:
+                data = socket_.recv(self.server.max_packet_size, socket.MSG_DONTWAIT)
+            except (BlockingIOError, InterruptedError):
+                return
+            osc_protocol._process_command_queue()
+            osc_protocol._validate_receive(data)
 
 
 class ThreadedOscProtocol(OscProtocol):
 
     ### INITIALIZER ###
 
-    def __init__(self):
-        OscProtocol.__init__(self)
-        self.command_queue = queue.Queue()
+    def __init__(
+        self,
+        *,
+        coalescing_window: Optional[float] = None,
+        max_datagram_size: int = 8192,
+    ):
+        OscProtocol.__init__(
+            self,
+            coalescing_window=coalescing_window,
+            max_datagram_size=max_datagram_size,
+        )
+        self.command_queue: Deque[Tuple[str, OscCallback]] = collections.deque()
         self.lock = threading.RLock()
+        self.send_condition = threading.Condition()
+        self.send_deadline = 0.0
+        self.send_thread: Optional[threading.Thread] = None
         self.server = None
         self.server_thread = None
 
@@ -312,16 +536,24 @@ class ThreadedOscProtocol(OscProtocol):
     ### PRIVATE METHODS ###
 
     def _process_command_queue(self):
-        while self.command_queue.qsize():
-            try:
-                action, callback = self.command_queue.get()
-            except queue.Empty:
-                continue
+        # Only the server thread consumes the queue, so popping is safe.
+        while self.command_queue:
+            action, callback = self.command_queue.popleft()
             if action == "add":
                 self._add_callback(callback)
             elif action == "remove":
                 self._remove_callback(callback)
 
+    def _flush_send_queue(self):
+        # Send while holding the condition, so batches never overtake each other.
+        with self.send_condition:
+            for datagram in self._coalesce_send_queue():
+                try:
+                    self._send_datagram(datagram)
+                except OSError:
+                    # One failed send mustn't drop the rest of the batch
+                    udp_out_logger.exception("Failed to send datagram")
+
     def _run_healthcheck(self):
         if self.healthcheck is None or time.time() < self.healthcheck_deadline:
             return
@@ -339,6 +571,25 @@ class ThreadedOscProtocol(OscProtocol):
             self.server_thread = None
             self.healthcheck.callback()
 
+    def _run_send_queue(self):
+        with self.send_condition:
+            while self.send_thread is threading.current_thread():
+                if not self.send_queue:
+                    self.send_condition.wait()
+                    continue
+                timeout = self.send_deadline - time.monotonic()
+                if timeout > 0:
+                    self.send_condition.wait(timeout)
+                    continue
+                try:
+                    self._flush_send_queue()
+                except Exception:
+                    # Keep the sender running, or later sends would pile up
+                    osc_out_logger.exception("Failed to flush send queue")
+
+    def _send_datagram(self, datagram):
+        self.server.socket.sendto(datagram, (self.ip_address, self.port))
+
     def _server_factory(self, ip_address, port):
         server = ThreadedOscServer(
             (self.ip_address, self.port), ThreadedOscHandler, bind_and_activate=False
@@ -346,6 +597,13 @@ class ThreadedOscProtocol(OscProtocol):
         server.osc_protocol = self
         return server
 
+    def _teardown(self):
+        with self.send_condition:
+            OscProtocol._teardown(self)
+            self.send_queue.clear()
+            self.send_thread = None
+            self.send_condition.notify_all()
+
     ### PUBLIC METHODS ###
 
     def connect(self, ip_address: str, port: int, *, healthcheck: HealthCheck = None):
@@ -363,8 +621,10 @@ class ThreadedOscProtocol(OscProtocol):
         with self.lock:
             if not self.is_running:
                 return
+            self._flush_send_queue()
             self._teardown()
             self.server.shutdown()
+            self.server.server_close()
             self.server = None
             self.server_thread = None
 
@@ -378,13 +638,26 @@ class ThreadedOscProtocol(OscProtocol):
             pattern, procedure, failure_pattern=failure_pattern, once=once
         )
         # Command queue prevents lock contention.
-        self.command_queue.put(("add", callback))
+        self.command_queue.append(("add", callback))
         return callback
 
     def send(self, message):
+        if self.coalescing_window is not None:
+            message = self._validate_message(message)
+            with self.send_condition:
+                self.send_queue.append(message)
+                if len(self.send_queue) > 1:
+                    return
+                self.send_deadline = time.monotonic() + self.coalescing_window
+                if self.send_thread is None:
+                    self.send_thread = threading.Thread(target=self._run_send_queue)
+                    self.send_thread.daemon = True
+                    self.send_thread.start()
+                self.send_condition.notify()
+            return
         datagram = self._validate_send(message)
         try:
-            self.server.socket.sendto(datagram, (self.ip_address, self.port))
+            self._send_datagram(datagram)
         except OSError:
             # print(message)
             raise
@@ -394,4 +667,176 @@ class ThreadedOscProtocol(OscProtocol):
         Unregister a callback.
         """
         # Command queue prevents lock contention.
-        self.command_queue.put(("remove", callback))
+        self.command_queue.append(("remove", callback))
+
+
+class AsyncTcpOscProtocol(_AsyncOscProtocol, asyncio.Protocol):
+    """
+    An asyncio OSC protocol over TCP.
+
+    Packets are length-prefixed rather than size-limited, so large payloads
+    such as ``/d_recv`` or ``/b_setn`` can be streamed to a server booted with
+    ``Options(protocol="tcp")``.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        *,
+        coalescing_window: Optional[float] = None,
+        max_datagram_size: int = 65536,
+    ):
+        asyncio.Protocol.__init__(self)
+        _AsyncOscProtocol.__init__(
+            self,
+            coalescing_window=coalescing_window,
+            max_datagram_size=max_datagram_size,
+        )
+        self.buffer = bytearray()
+
+    ### PRIVATE METHODS ###
+
+    async def _create_endpoint(self, ip_address, port):
+        self.buffer.clear()
+        await self.loop.create_connection(lambda: self, ip_address, port)
+
+    def _send_datagram(self, datagram):
+        self.transport.write(_frame(datagram))
+
+    ### PUBLIC METHODS ###
+
+    def connection_lost(self, exc):
+        if self.is_running:
+            osc_in_logger.warning("Connection lost: {!r}".format(exc))
+
+    def data_received(self, data):
+        self.buffer.extend(data)
+        try:
+            datagrams = _unframe(self.buffer)
+        except ValueError as exc:
+            osc_in_logger.warning("Closing connection: {}".format(exc))
+            self.buffer.clear()
+            self.transport.close()
+            return
+        for datagram in datagrams:
+            self._validate_receive(datagram)
+
+
+class ThreadedTcpOscServer(socketserver.BaseServer):
+    """
+    The receiving half of a threaded OSC protocol over TCP.
+
+    Drives a single client connection with the same ``socketserver`` loop as
+    the UDP server: each ``recv()`` is one "request", whose complete packets
+    are handed to the protocol.
+    """
+
+    osc_protocol: "ThreadedTcpOscProtocol"
+
+    def __init__(self, server_address, RequestHandlerClass):
+        socketserver.BaseServer.__init__(self, server_address, RequestHandlerClass)
+        self.buffer = bytearray()
+        self.is_closing = False
+        self.is_shut_down = threading.Event()
+        self.is_shut_down.set()
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def close(self, reason):
+        """
+        Stops serving the connection, from any thread.
+        """
+        osc_in_logger.warning(reason)
+        self.is_closing = True
+
+    def fileno(self):
+        return self.socket.fileno()
+
+    def get_request(self):
+        data = self.socket.recv(65536)
+        if not data:
+            self.close("Connection closed by {}".format(self.server_address))
+        return data, self.server_address
+
+    def serve_forever(self, poll_interval=0.5):
+        # Like BaseServer.serve_forever(), but stopped by a flag of our own,
+        # which the serving thread may also set
+        self.is_shut_down.clear()
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(self, selectors.EVENT_READ)
+                while not self.is_closing:
+                    if selector.select(poll_interval) and not self.is_closing:
+                        self._handle_request_noblock()
+                    self.service_actions()
+        finally:
+            self.is_shut_down.set()
+
+    def server_activate(self):
+        self.socket.connect(self.server_address)
+
+    def server_close(self):
+        self.socket.close()
+
+    def service_actions(self):
+        self.osc_protocol._run_healthcheck()
+
+    def shutdown(self):
+        self.is_closing = True
+        self.is_shut_down.wait()
+
+    def verify_request(self, request, client_address):
+        self.osc_protocol._process_command_queue()
+        return True
+
+
+class ThreadedTcpOscHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        buffer = self.server.buffer
+        buffer.extend(self.request)
+        osc_protocol = self.server.osc_protocol
+        try:
+            datagrams = _unframe(buffer)
+        except ValueError as exc:
+            buffer.clear()
+            self.server.close("Closing connection: {}".format(exc))
+            return
+        for datagram in datagrams:
+            osc_protocol._process_command_queue()
+            osc_protocol._validate_receive(datagram)
+
+
+class ThreadedTcpOscProtocol(ThreadedOscProtocol):
+    """
+    A threaded OSC protocol over TCP.
+
+    The threaded counterpart of ``AsyncTcpOscProtocol``.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        *,
+        coalescing_window: Optional[float] = None,
+        max_datagram_size: int = 65536,
+    ):
+        ThreadedOscProtocol.__init__(
+            self,
+            coalescing_window=coalescing_window,
+            max_datagram_size=max_datagram_size,
+        )
+
+    ### PRIVATE METHODS ###
+
+    def _send_datagram(self, datagram):
+        # Writes from different threads must not interleave mid-packet.
+        with self.send_condition:
+            self.server.socket.sendall(_frame(datagram))
+
+    def _server_factory(self, ip_address, port):
+        server = ThreadedTcpOscServer((ip_address, port), ThreadedTcpOscHandler)
+        server.osc_protocol = self
+        server.server_activate()
+        return server
@@ -0,0 +1,588 @@
+import abc
+import collections
+import collections.abc
+import itertools
+import uuid
+
+from supriya.system import SupriyaObject
+
+from .Pattern import Pattern
+from .RandomNumberGenerator import RandomNumberGenerator
+
+
+class _Uncompilable(Exception):
+    pass
+
+
+def _iterate_seeded(seed):
+    rng = RandomNumberGenerator(seed=seed)
+    try:
+        import numpy  # noqa
+    except ImportError:
+        return iter(rng)
+    return itertools.chain.from_iterable(x.tolist() for x in rng.iterate_blocks())
+
+
+class _ValueNode(metaclass=abc.ABCMeta):
+    """
+    A compiled value pattern, evaluated a chunk of values at a time.
+
+    ``length`` is the number of values the pattern yields, or None if it is
+    infinite or not known in advance. ``effects`` are the nodes which draw
+    random numbers or pull from generators, in the order the pattern would.
+    """
+
+    __slots__ = ("effects", "length")
+
+    @abc.abstractmethod
+    def evaluate(self, position, count, context, draws):
+        """
+        Evaluates ``count`` values from ``position``.
+
+        ``draws`` maps each effect to the values it drew for them.
+        """
+        raise NotImplementedError
+
+    def exhaust(self, position, context):
+        """
+        Repeats the side effects of pulling a value at ``position``, where
+        this node runs out.
+        """
+        pass
+
+    def pull(self, context):
+        """
+        Repeats the side effects of pulling one value.
+        """
+        for effect in self.effects:
+            effect.pull(context)
+
+    @property
+    def is_scalar(self):
+        return False
+
+    @property
+    def may_be_none(self):
+        return False
+
+
+class _ConstantNode(_ValueNode):
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.effects = ()
+        self.length = None
+        self.value = value
+
+    def evaluate(self, position, count, context, draws):
+        return [self.value] * count
+
+    @property
+    def is_scalar(self):
+        return not isinstance(self.value, collections.abc.Sequence)
+
+    @property
+    def may_be_none(self):
+        return self.value is None
+
+
+class _SequenceNode(_ValueNode):
+
+    __slots__ = ("sequence",)
+
+    def __init__(self, sequence, repetitions):
+        self.effects = ()
+        self.length = None if repetitions is None else len(sequence) * repetitions
+        self.sequence = tuple(sequence)
+
+    def evaluate(self, position, count, context, draws):
+        if not self.sequence:
+            return []
+        start = position % len(self.sequence)
+        return list(
+            itertools.islice(itertools.cycle(self.sequence), start, start + count)
+        )
+
+    @property
+    def is_scalar(self):
+        return not any(isinstance(x, collections.abc.Sequence) for x in self.sequence)
+
+    @property
+    def may_be_none(self):
+        return None in self.sequence
+
+
+class _RandomNode(_ValueNode):
+
+    __slots__ = ("stream",)
+
+    def __init__(self, repetitions, stream):
+        self.effects = (self,)
+        self.length = repetitions
+        self.stream = stream
+
+    def pull(self, context):
+        next(context[self.stream])
+
+
+class _WhiteNode(_RandomNode):
+
+    __slots__ = ("maximum", "minimum")
+
+    def __init__(self, minimum, maximum, repetitions, stream):
+        _RandomNode.__init__(self, repetitions, stream)
+        self.minimum, self.maximum = sorted([minimum, maximum])
+
+    def evaluate(self, position, count, context, draws):
+        minimum, range_ = self.minimum, self.maximum - self.minimum
+        return [(number * range_) + minimum for number in draws[self]]
+
+    @property
+    def is_scalar(self):
+        return True
+
+
+class _ChoiceNode(_RandomNode):
+
+    __slots__ = ("sequence",)
+
+    def __init__(self, sequence, repetitions, stream):
+        _RandomNode.__init__(self, repetitions, stream)
+        self.sequence = sequence
+
+    def evaluate(self, position, count, context, draws):
+        sequence, length = self.sequence, len(self.sequence)
+        return [sequence[int(number * 0x7FFFFFFF) % length] for number in draws[self]]
+
+    @property
+    def is_scalar(self):
+        return not any(isinstance(x, collections.abc.Sequence) for x in self.sequence)
+
+    @property
+    def may_be_none(self):
+        return None in self.sequence
+
+
+class _BinaryNode(_ValueNode):
+
+    __slots__ = ("one", "procedure", "two")
+
+    def __init__(self, one, procedure, two):
+        self.effects = one.effects + two.effects
+        lengths = [x.length for x in (one, two) if x.length is not None]
+        self.length = min(lengths) if lengths else None
+        self.one = one
+        self.two = two
+        self.procedure = procedure
+
+    def evaluate(self, position, count, context, draws):
+        return list(
+            map(
+                self.procedure,
+                self.one.evaluate(position, count, context, draws),
+                self.two.evaluate(position, count, context, draws),
+            )
+        )
+
+    def exhaust(self, position, context):
+        if self.one.length == position:
+            self.one.exhaust(position, context)
+        else:
+            self.one.pull(context)
+            self.two.exhaust(position, context)
+
+    @property
+    def is_scalar(self):
+        return not isinstance(self.procedure, _Recursive)
+
+
+class _SeededNode(_ValueNode):
+
+    __slots__ = ("node", "seed")
+
+    def __init__(self, seed):
+        self.seed = seed
+
+    def evaluate(self, position, count, context, draws):
+        return self.node.evaluate(position, count, context, draws)
+
+    def exhaust(self, position, context):
+        self.node.exhaust(position, context)
+
+    @property
+    def is_scalar(self):
+        return self.node.is_scalar
+
+    @property
+    def may_be_none(self):
+        return self.node.may_be_none
+
+
+class _GeneratorNode(_ValueNode):
+    """
+    A value pattern the compiler does not support, iterated as usual.
+    """
+
+    __slots__ = ("pattern",)
+
+    def __init__(self, pattern):
+        self.effects = (self,)
+        self.length = None
+        self.pattern = pattern
+
+    def evaluate(self, position, count, context, draws):
+        return draws[self]
+
+    def pull(self, context):
+        next(context[self], None)
+
+    @property
+    def may_be_none(self):
+        return True
+
+
+class _BindSegment:
+    """
+    One or more chained ``Pbind`` patterns, evaluated column by column.
+    """
+
+    __slots__ = ("binds", "effects", "generators", "length", "seeds", "streams")
+
+    def __init__(self, patterns, seeded):
+        import supriya.patterns
+
+        self.binds, self.generators, self.seeds = [], [], []
+        for i, pattern in enumerate(patterns):
+            nodes = []
+            values = dict(pattern._patterns, synthdef=pattern.synthdef)
+            for name, value in sorted(values.items()):
+                node = self._compile(value, None)
+                # Chained patterns only override fields with values not None
+                is_new = not any(name in names for names, _ in self.binds)
+                if i and is_new and node.may_be_none:
+                    raise _Uncompilable
+                nodes.append((name, node))
+            self.binds.append((tuple(name for name, _ in nodes), nodes))
+        nodes = [node for _, nodes in self.binds for _, node in nodes]
+        lengths = [node.length for node in nodes if node.length is not None]
+        self.length = min(lengths) if lengths else None
+        self.effects = tuple(effect for node in nodes for effect in node.effects)
+        self.streams = collections.defaultdict(list)
+        for effect in self.effects:
+            if isinstance(effect, _RandomNode):
+                self.streams[effect.stream].append(effect)
+        # Unsupported patterns draw from the stdlib generator, and can't share
+        # it with compiled nodes without reordering its numbers.
+        unseeded = [
+            x
+            for x in self.generators
+            if not isinstance(x.pattern, supriya.patterns.Pseed)
+        ]
+        if unseeded and (seeded or len(unseeded) > 1 or self.streams.get(None)):
+            raise _Uncompilable
+
+    def _compile(self, value, stream):
+        import supriya.patterns
+
+        if not isinstance(value, Pattern):
+            return _ConstantNode(Pattern._freeze_recursive(value))
+        type_ = type(value)
+        generator_count, seed_count = len(self.generators), len(self.seeds)
+        try:
+            if type_ is supriya.patterns.Pseq:
+                sequence = []
+                for x in value.sequence:
+                    if not isinstance(x, Pattern):
+                        sequence.append(x)
+                        continue
+                    node = self._compile(x, stream)
+                    if node.effects or node.length is None:
+                        raise _Uncompilable
+                    sequence.extend(node.evaluate(0, node.length, {}, {}))
+                return _SequenceNode(sequence, value.repetitions)
+            elif type_ is supriya.patterns.Prand:
+                if any(isinstance(x, Pattern) for x in value.sequence):
+                    raise _Uncompilable
+                return _ChoiceNode(value.sequence, value.repetitions, stream)
+            elif type_ is supriya.patterns.Pwhite:
+                if any(
+                    isinstance(x, collections.abc.Sequence)
+                    for x in (value.minimum, value.maximum)
+                ):
+                    raise _Uncompilable
+                return _WhiteNode(
+                    value.minimum, value.maximum, value.repetitions, stream
+                )
+            elif type_ is supriya.patterns.Pbinop:
+                one = self._compile(value.expr_one, stream)
+                two = self._compile(value.expr_two, stream)
+                procedure = value._string_to_operator()
+                if not (one.is_scalar and two.is_scalar):
+                    procedure = _Recursive(procedure)
+                return _BinaryNode(one, procedure, two)
+            elif type_ is supriya.patterns.Pseed:
+                node = _SeededNode(value.seed)
+                node.node = self._compile(value.pattern, node)
+                if any(isinstance(x, _GeneratorNode) for x in node.node.effects):
+                    raise _Uncompilable
+                node.effects, node.length = node.node.effects, node.node.length
+                self.seeds.append(node)
+                return node
+        except _Uncompilable:
+            del self.generators[generator_count:]
+            del self.seeds[seed_count:]
+        node = _GeneratorNode(value)
+        self.generators.append(node)
+        return node
+
+    def iterate(self, rng, chunk_size):
+        context = {None: rng}
+        for node in self.seeds:
+            context[node] = _iterate_seeded(node.seed)
+        for node in self.generators:
+            context[node] = iter(node.pattern)
+        generators = [x for x in self.effects if isinstance(x, _GeneratorNode)]
+        position, length = 0, self.length
+        while length is None or position < length:
+            count = chunk_size
+            if length is not None:
+                count = min(count, length - position)
+            # Generators may run out at any event, so pull them first, event by
+            # event, and only draw random numbers for events which happen
+            draws = {generator: [] for generator in generators}
+            exhausted = None
+            if generators:
+                for i in range(count):
+                    for generator in generators:
+                        try:
+                            draws[generator].append(next(context[generator]))
+                        except StopIteration:
+                            exhausted = generator
+                            break
+                    if exhausted is not None:
+                        count = i
+                        break
+            # Each node's random numbers are interleaved with the others',
+            # event by event, as the generators would draw them
+            for stream, effects in self.streams.items():
+                numbers = list(itertools.islice(context[stream], count * len(effects)))
+                for i, effect in enumerate(effects):
+                    draws[effect] = numbers[i :: len(effects)]
+            if exhausted is not None:
+                # The event the generator ran out in still drew numbers for
+                # the fields before it
+                for effect in self.effects[: self.effects.index(exhausted)]:
+                    if isinstance(effect, _RandomNode):
+                        effect.pull(context)
+                if not count:
+                    return
+            columns = {}
+            for names, nodes in self.binds:
+                for name, node in nodes:
+                    column = node.evaluate(position, count, context, draws)
+                    if name in columns:
+                        column = [
+                            y if y is not None else x
+                            for x, y in zip(columns[name], column)
+                        ]
+                    columns[name] = column
+            actual_count = min(len(x) for x in columns.values())
+            if actual_count < count:
+                if actual_count:
+                    yield {name: x[:actual_count] for name, x in columns.items()}
+                return
+            yield columns
+            if exhausted is not None:
+                return
+            position += count
+        for _, nodes in self.binds:
+            for _, node in nodes:
+                if node.length == position:
+                    node.exhaust(position, context)
+                    return
+                node.pull(context)
+
+
+class _Recursive:
+
+    __slots__ = ("procedure",)
+
+    def __init__(self, procedure):
+        self.procedure = procedure
+
+    def __call__(self, one, two):
+        return Pattern._process_recursive(one, two, self.procedure)
+
+
+class _SequenceSegment:
+
+    __slots__ = ("repetitions", "segments")
+
+    def __init__(self, segments, repetitions):
+        self.repetitions = repetitions
+        self.segments = segments
+
+    def iterate(self, rng, chunk_size):
+        for _ in Pattern._loop(self.repetitions):
+            for segment in self.segments:
+                yield from segment.iterate(rng, chunk_size)
+
+
+class _SeededSegment:
+
+    __slots__ = ("seed", "segment")
+
+    def __init__(self, segment, seed):
+        self.seed = seed
+        self.segment = segment
+
+    def iterate(self, rng, chunk_size):
+        rng = _iterate_seeded(self.seed)
+        yield from self.segment.iterate(rng, chunk_size)
+
+
+def _compile_events(pattern, seeded=False):
+    import supriya.patterns
+
+    type_ = type(pattern)
+    if type_ is supriya.patterns.Pbind:
+        return _BindSegment([pattern], seeded)
+    elif type_ is supriya.patterns.Pchain:
+        if any(type(x) is not supriya.patterns.Pbind for x in pattern.patterns):
+            raise _Uncompilable
+        return _BindSegment(pattern.patterns, seeded)
+    elif type_ is supriya.patterns.Pn and pattern.key is None:
+        segment = _compile_events(pattern.pattern, seeded)
+        return _SequenceSegment([segment], pattern.repetitions)
+    elif type_ is supriya.patterns.Pseq:
+        if not all(isinstance(x, Pattern) for x in pattern.sequence):
+            raise _Uncompilable
+        segments = [_compile_events(x, seeded) for x in pattern.sequence]
+        return _SequenceSegment(segments, pattern.repetitions)
+    elif type_ is supriya.patterns.Pseed:
+        return _SeededSegment(_compile_events(pattern.pattern, True), pattern.seed)
+    raise _Uncompilable
+
+
+class CompiledPattern(SupriyaObject):
+    """
+    An event pattern compiled to evaluate its events a chunk at a time.
+
+    ::
+
+        >>> pattern = supriya.patterns.Pseed(
+        ...     supriya.patterns.Pbind(
+        ...         amplitude=supriya.patterns.Pwhite(0.25, 0.5),
+        ...         duration=0.25,
+        ...         frequency=supriya.patterns.Pseq([220, 330, 440], 2) * 2,
+        ...     )
+        ... )
+        >>> compiled_pattern = supriya.patterns.CompiledPattern(pattern)
+        >>> compiled_pattern.is_compiled
+        True
+
+    Chunks hold a list of values per event field::
+
+        >>> for chunk in compiled_pattern.iterate_chunks(chunk_size=4):
+        ...     chunk["frequency"]
+        ...
+        [440, 660, 880, 440]
+        [660, 880]
+
+    Iterating a compiled pattern yields the same events as iterating the
+    pattern itself::
+
+        >>> events = list(compiled_pattern)
+        >>> events[0]
+        NoteEvent(
+            amplitude=0.250...,
+            delta=0.25,
+            duration=0.25,
+            frequency=440,
+            uuid=UUID('...'),
+            )
+        >>> [x["amplitude"] for x in events] == [x["amplitude"] for x in pattern]
+        True
+
+    ``Pbind``, ``Pchain`` of ``Pbind``, ``Pn``, ``Pseed`` and ``Pseq`` of
+    event patterns compile, as do ``Pbinop``, ``Prand``, ``Pseed``, ``Pseq``
+    and ``Pwhite`` bound to event fields. Other value patterns are iterated as
+    usual, field by field. Other event patterns are not compiled at all, and
+    are iterated as usual.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_pattern", "_segment")
+
+    ### INITIALIZER ###
+
+    def __init__(self, pattern):
+        assert isinstance(pattern, Pattern)
+        self._pattern = pattern
+        try:
+            self._segment = _compile_events(pattern)
+        except _Uncompilable:
+            self._segment = None
+
+    ### SPECIAL METHODS ###
+
+    def __iter__(self):
+        import supriya.patterns
+
+        if self._segment is None:
+            yield from self._pattern
+            return
+        for chunk in self.iterate_chunks():
+            names = tuple(chunk)
+            for values in zip(*chunk.values()):
+                settings = dict(zip(names, values))
+                if settings.get("uuid") is None:
+                    settings["uuid"] = uuid.uuid4()
+                yield supriya.patterns.NoteEvent(**settings)
+
+    ### PUBLIC METHODS ###
+
+    def iterate_chunks(self, chunk_size=1024):
+        """
+        Iterates over chunks of up to ``chunk_size`` events.
+
+        Each chunk maps event fields to lists of values, one per event.
+        Consecutive events with the same fields share chunks. Events from
+        patterns which do not compile lose their UUIDs.
+        """
+        import supriya.patterns
+
+        if self._segment is not None:
+            rng = supriya.patterns.RandomNumberGenerator.get_stdlib_rng()
+            yield from self._segment.iterate(rng, chunk_size)
+            return
+        chunk, names = {}, None
+        for event in self._pattern:
+            if not isinstance(event, supriya.patterns.Event):
+                raise ValueError(f"Expected event, got {event!r}")
+            settings = event.as_dict()
+            settings.pop("uuid", None)
+            if tuple(settings) != names or len(chunk[names[0]]) == chunk_size:
+                if chunk:
+                    yield chunk
+                names = tuple(settings)
+                chunk = {name: [] for name in names}
+            for name, value in settings.items():
+                chunk[name].append(value)
+        if chunk:
+            yield chunk
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def is_compiled(self):
+        """
+        Is true if the pattern compiled.
+        """
+        return self._segment is not None
+
+    @property
+    def pattern(self):
+        return self._pattern
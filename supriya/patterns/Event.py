@@ -2,9 +2,7 @@ import abc
 import collections
 import uuid
 
-import uqbar.objects
-
-from supriya.system import SupriyaValueObject
+from supriya.system import SupriyaValueObject, get_vars
 
 
 class Event(SupriyaValueObject):
@@ -98,7 +96,7 @@ class Event(SupriyaValueObject):
     ### PUBLIC METHODS ###
 
     def as_dict(self):
-        _, _, kwargs = uqbar.objects.get_vars(self)
+        _, _, kwargs = get_vars(self)
         return kwargs
 
     def get(self, item, default=None):
@@ -1,8 +1,7 @@
 import uuid
 
-from uqbar.objects import new
-
 from supriya.patterns.Pattern import Pattern
+from supriya.system import new
 
 
 class EventPattern(Pattern):
@@ -24,12 +23,15 @@ class EventPattern(Pattern):
 
     ### PUBLIC METHODS ###
 
-    def play(self, clock=None, server=None):
+    def play(self, clock=None, server=None, lookahead=None):
         import supriya.patterns
         import supriya.realtime
 
         event_player = supriya.patterns.EventPlayer(
-            self, clock=clock, server=server or supriya.realtime.Server.default()
+            self,
+            clock=clock,
+            lookahead=lookahead,
+            server=server or supriya.realtime.Server.default(),
         )
         event_player.start()
         return event_player
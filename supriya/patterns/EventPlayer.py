@@ -1,19 +1,82 @@
+import collections
+import heapq
 import itertools
-from queue import PriorityQueue
-
-from uqbar.objects import new
+import threading
 
 import supriya.commands
 import supriya.realtime
 import supriya.system
 from supriya.clock import TempoClock
+from supriya.osc import OscBundle
+from supriya.osc.messages import BUNDLE_PREFIX
+from supriya.system import new
+
+
+class _PrerenderedBundle(OscBundle):
+    """
+    An OSC bundle whose contents are encoded ahead of its timestamp.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_body",)
+
+    ### INITIALIZER ###
+
+    def __init__(self, timestamp=None, contents=None):
+        OscBundle.__init__(self, timestamp=timestamp, contents=contents)
+        self._body = None
+
+    ### SPECIAL METHODS ###
+
+    def __eq__(self, expr):
+        return self._to_osc_bundle() == expr
+
+    def __hash__(self):
+        return hash(self._to_osc_bundle())
+
+    def __repr__(self):
+        return repr(self._to_osc_bundle())
+
+    ### PRIVATE METHODS ###
+
+    def _to_osc_bundle(self):
+        return OscBundle(timestamp=self.timestamp, contents=self.contents)
+
+    def _prerender(self):
+        compiled = self._compile()
+        buffer = bytearray(compiled[0])
+        self._pack_into(buffer, 0, compiled)
+        self._body = bytes(buffer[16:])
+
+    ### PUBLIC METHODS ###
+
+    def to_datagram(self, realtime=True):
+        if self._body is None:
+            return OscBundle.to_datagram(self, realtime=realtime)
+        date = self._encode_date(self.timestamp, realtime=realtime)
+        return BUNDLE_PREFIX + date + self._body
 
 
 class EventPlayer:
+    """
+    Plays an event pattern on a server, one clock callback per timestamp.
+
+    With ``lookahead`` seconds, a worker thread iterates the pattern and
+    encodes its bundles ahead of the clock, so clock callbacks only stamp and
+    send bundles that are already rendered. Clock callbacks finding no bundle
+    render the next one themselves.
+    """
+
+    ### CLASS VARIABLES ###
+
+    _lookahead_capacity = 4096
 
     ### INITIALIZER ###
 
-    def __init__(self, pattern, server=None, event_template=None, clock=None):
+    def __init__(
+        self, pattern, server=None, event_template=None, clock=None, lookahead=None
+    ):
         import supriya.patterns
 
         clock = clock or TempoClock.default()
@@ -29,10 +92,30 @@ class EventPlayer:
         self._server = server or supriya.realtime.Server.default()
         self._uuids = {}
         self._event_id = None
+        if lookahead is not None:
+            lookahead = float(lookahead)
+            if lookahead <= 0:
+                raise ValueError(lookahead)
+        self._lookahead = lookahead
+        self._condition = threading.Condition()
+        self._buffer = collections.deque()
+        self._buffered_delta = 0.0
+        self._is_exhausted = False
+        self._is_stopping = False
+        self._late_bundle_count = 0
+        self._lookahead_iterator = None
+        self._maximum_lateness = 0.0
+        self._offset = 0.0
+        self._released_uuids = set()
+        self._render_lock = threading.Lock()
+        self._underrun_count = 0
+        self._worker = None
 
     ### SPECIAL METHODS ###
 
     def __call__(self, current_moment, desired_moment, *args, communicate=True):
+        if self._lookahead is not None and communicate:
+            return self._release(desired_moment)
         if self._iterator is None:
             self._iterator = self._iterate_outer(
                 pattern=self._pattern,
@@ -41,7 +124,25 @@ class EventPlayer:
                 uuids=self._uuids,
             )
         event_products, delta = next(self._iterator)
+        requests, _, stopped_uuids = self._collect_requests(event_products)
+        self._free_proxies(stopped_uuids)
+        consolidated_bundle = supriya.commands.RequestBundle(
+            timestamp=desired_moment.seconds, contents=requests
+        )
+        if communicate:
+            osc_bundle = consolidated_bundle.to_osc()
+            osc_bundle = new(
+                osc_bundle, timestamp=osc_bundle.timestamp + self._server.latency
+            )
+            self._server.send(osc_bundle)
+            return delta
+        return consolidated_bundle, delta
+
+    ### PRIVATE METHODS ###
+
+    def _collect_requests(self, event_products):
         node_free_ids, requests = set(), []
+        started_uuids, stopped_uuids = set(), []
         for event_product in event_products:
             if not event_product.event:
                 continue
@@ -51,33 +152,14 @@ class EventPlayer:
                 else:
                     requests.append(request)
             if event_product.is_stop:
-                proxies = self._uuids[event_product.uuid]
-                for proxy_id, proxy in proxies.items():
-                    if isinstance(
-                        proxy, (supriya.realtime.Bus, supriya.realtime.BusGroup)
-                    ):
-                        allocator = supriya.realtime.Bus._get_allocator(
-                            calculation_rate=proxy.calculation_rate, server=self._server
-                        )
-                        allocator.free(proxy_id)
-                self._uuids.pop(event_product.uuid)
+                stopped_uuids.append(event_product.uuid)
+            else:
+                started_uuids.add(event_product.uuid)
         if node_free_ids:
             node_free_ids = sorted(node_free_ids)
             request = supriya.commands.NodeFreeRequest(node_ids=node_free_ids)
             requests.append(request)
-        consolidated_bundle = supriya.commands.RequestBundle(
-            timestamp=desired_moment.seconds, contents=requests
-        )
-        if communicate:
-            osc_bundle = consolidated_bundle.to_osc()
-            osc_bundle = new(
-                osc_bundle, timestamp=osc_bundle.timestamp + self._server.latency
-            )
-            self._server.send(osc_bundle)
-            return delta
-        return consolidated_bundle, delta
-
-    ### PRIVATE METHODS ###
+        return requests, started_uuids, stopped_uuids
 
     def _collect_stop_requests(self):
         import supriya.nonrealtime
@@ -106,45 +188,157 @@ class EventPlayer:
             return
         return supriya.commands.RequestBundle(contents=requests)
 
+    def _free_proxies(self, uuids):
+        for uuid in uuids:
+            proxies = self._uuids.pop(uuid)
+            for proxy_id, proxy in proxies.items():
+                if isinstance(proxy, (supriya.realtime.Bus, supriya.realtime.BusGroup)):
+                    allocator = supriya.realtime.Bus._get_allocator(
+                        calculation_rate=proxy.calculation_rate, server=self._server
+                    )
+                    allocator.free(proxy_id)
+            self._released_uuids.discard(uuid)
+
+    def _get_buffered_seconds(self):
+        return self._clock._offset_to_seconds(
+            self._offset + self._buffered_delta
+        ) - self._clock._offset_to_seconds(self._offset)
+
     @staticmethod
     def _iterate_inner(pattern, server, timestamp, uuids):
-        queue = PriorityQueue()
+        # Products tied on their sort bundle come out in the order they were
+        # performed
+        queue, counter = [], itertools.count()
         for index, event in enumerate(pattern):
             for event_product in event._perform_realtime(
                 index=(index, 0), server=server, timestamp=timestamp, uuids=uuids
             ):
-                queue.put(event_product)
-            while not queue.empty():
-                event_product = queue.get()
-                if event_product.timestamp < (timestamp + event.delta):
-                    yield event_product
-                else:
-                    queue.put(event_product)
-                    break
+                heapq.heappush(
+                    queue,
+                    (event_product._get_sort_bundle(), next(counter), event_product),
+                )
+            while queue and queue[0][-1].timestamp < (timestamp + event.delta):
+                yield heapq.heappop(queue)[-1]
             timestamp += event.delta
-        while not queue.empty():
-            event_product = queue.get()
-            yield event_product
-        assert queue.empty()
+        while queue:
+            yield heapq.heappop(queue)[-1]
 
     @staticmethod
     def _iterate_outer(pattern, server, timestamp, uuids):
         iterator = EventPlayer._iterate_inner(pattern, server, timestamp, uuids)
         iterator = itertools.groupby(iterator, lambda x: x.timestamp)
-        pairs = []
         try:
             timestamp_one, grouper = next(iterator)
         except StopIteration:
             return
-        pairs.append((timestamp_one, tuple(grouper)))
+        event_products = tuple(grouper)
         for timestamp_two, grouper in iterator:
-            pairs.append((timestamp_two, tuple(grouper)))
-            timestamp_one, event_products = pairs.pop(0)
-            delta = timestamp_two - timestamp_one
-            yield event_products, delta
-        _, event_products = pairs.pop()
+            next_event_products = tuple(grouper)
+            yield event_products, timestamp_two - timestamp_one
+            timestamp_one, event_products = timestamp_two, next_event_products
         yield event_products, None
 
+    def _release(self, desired_moment):
+        if self._worker is None:
+            self._start_worker()
+        if not self._buffer:
+            # The worker has fallen behind, so render on the clock thread,
+            # unless the worker finishes a bundle first
+            self._underrun_count += 1
+            with self._render_lock:
+                if not self._buffer:
+                    self._render_next()
+        with self._condition:
+            item = self._buffer[0]
+            if not isinstance(item, Exception):
+                bundle, started_uuids, stopped_uuids, delta = self._buffer.popleft()
+                self._buffered_delta -= delta or 0.0
+                self._offset = desired_moment.offset + (delta or 0.0)
+                self._condition.notify_all()
+        if isinstance(item, Exception):
+            # Free everything the pattern started, then fail as playing
+            # without lookahead would
+            self.stop()
+            raise item
+        self._released_uuids.update(started_uuids)
+        self._free_proxies(stopped_uuids)
+        bundle.timestamp = desired_moment.seconds + self._server.latency
+        self._server.send(bundle)
+        lateness = self._clock.get_current_time() - bundle.timestamp
+        if lateness > 0:
+            self._late_bundle_count += 1
+            self._maximum_lateness = max(self._maximum_lateness, lateness)
+        return delta
+
+    def _render_next(self):
+        """
+        Renders the next bundle into the buffer.
+
+        Callers hold the render lock, which serializes access to the pattern.
+        Failures are buffered in place of the bundle, to be raised when it is
+        due, and end rendering.
+        """
+        try:
+            event_products, delta = next(self._lookahead_iterator, ((), None))
+            requests, started_uuids, stopped_uuids = self._collect_requests(
+                event_products
+            )
+            osc_bundle = supriya.commands.RequestBundle(contents=requests).to_osc()
+            bundle = _PrerenderedBundle(contents=osc_bundle.contents)
+            bundle._prerender()
+        except Exception as exception:
+            item, delta = exception, None
+        else:
+            item = (bundle, started_uuids, stopped_uuids, delta)
+        with self._condition:
+            self._buffer.append(item)
+            self._buffered_delta += delta or 0.0
+            self._is_exhausted = delta is None
+            self._condition.notify_all()
+
+    def _run_worker(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._is_stopping
+                    or (
+                        len(self._buffer) < self._lookahead_capacity
+                        and self._get_buffered_seconds() < self._lookahead
+                    )
+                )
+            with self._render_lock:
+                if self._is_stopping or self._is_exhausted:
+                    return
+                self._render_next()
+
+    def _start_worker(self):
+        self._buffer.clear()
+        self._buffered_delta = 0.0
+        self._is_exhausted = False
+        self._is_stopping = False
+        self._lookahead_iterator = self._iterate_outer(
+            pattern=self._pattern, server=self._server, timestamp=0.0, uuids=self._uuids
+        )
+        self._offset = 0.0
+        self._released_uuids.clear()
+        self._worker = threading.Thread(target=self._run_worker)
+        self._worker.daemon = True
+        self._worker.start()
+
+    def _stop_worker(self):
+        with self._condition:
+            self._is_stopping = True
+            self._condition.notify_all()
+        self._worker.join()
+        self._worker = None
+        self._lookahead_iterator = None
+        # Bundles never released never reached the server, so only free what
+        # they allocated
+        unreleased_uuids = [x for x in self._uuids if x not in self._released_uuids]
+        self._free_proxies(unreleased_uuids)
+        self._buffer.clear()
+        self._buffered_delta = 0.0
+
     ### PUBLIC METHODS ###
 
     def notify(self, topic, event):
@@ -155,6 +349,8 @@ class EventPlayer:
         if not self._server.is_running:
             return
         self._uuids.clear()
+        if self._lookahead is not None:
+            self._start_worker()
         self._event_id = self._clock.cue(self.__call__)
         if not self._clock.is_running:
             self._clock.start()
@@ -162,16 +358,61 @@ class EventPlayer:
     def stop(self):
         self._clock.cancel(self._event_id)
         self._iterator = None
+        if self._worker is not None:
+            self._stop_worker()
         bundle = self._collect_stop_requests()
         if bundle and self._server.is_running:
             self._server.send(bundle.to_osc())
 
     ### PUBLIC PROPERTIES ###
 
+    @property
+    def buffered_bundle_count(self):
+        """
+        Gets the number of bundles rendered ahead of the clock.
+        """
+        return len(self._buffer)
+
+    @property
+    def buffered_seconds(self):
+        """
+        Gets how many seconds of the pattern are rendered ahead of the clock, at
+        the clock's current tempo.
+        """
+        with self._condition:
+            return self._get_buffered_seconds()
+
     @property
     def event_template(self):
         return self._event_template
 
+    @property
+    def late_bundle_count(self):
+        """
+        Gets the number of bundles sent after their timestamp in lookahead mode.
+        """
+        return self._late_bundle_count
+
+    @property
+    def lookahead(self):
+        return self._lookahead
+
+    @property
+    def maximum_lateness(self):
+        """
+        Gets how many seconds after its timestamp the latest bundle was sent in
+        lookahead mode.
+        """
+        return self._maximum_lateness
+
     @property
     def pattern(self):
         return self._pattern
+
+    @property
+    def underrun_count(self):
+        """
+        Gets the number of clock callbacks which found no bundle rendered ahead,
+        and rendered one themselves.
+        """
+        return self._underrun_count
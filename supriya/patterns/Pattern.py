@@ -1,14 +1,13 @@
 import abc
 import collections
-import inspect
+import contextvars
 import itertools
 import re
-from typing import Dict, Generator, Iterator
+from typing import Generator
 
 from uqbar.enums import IntEnumeration
-from uqbar.objects import new
 
-from supriya.system import SupriyaValueObject
+from supriya.system import SupriyaValueObject, new
 
 
 class Pattern(SupriyaValueObject):
@@ -20,7 +19,8 @@ class Pattern(SupriyaValueObject):
 
     __slots__ = ()
 
-    _rngs: Dict[int, Iterator[float]] = {}
+    # The random number generator of the innermost seeded pattern running
+    _rng: contextvars.ContextVar = contextvars.ContextVar("rng", default=None)
 
     class PatternState(IntEnumeration):
         CONTINUE = 0
@@ -211,24 +211,10 @@ class Pattern(SupriyaValueObject):
 
     @classmethod
     def _get_rng(cls):
-        from supriya.patterns import Pseed, RandomNumberGenerator
+        from supriya.patterns import RandomNumberGenerator
 
-        pseed_file_path = Pseed._file_path
-        identifier = None
-        try:
-            frame = inspect.currentframe()
-            while frame is not None:
-                file_path = frame.f_code.co_filename
-                function_name = frame.f_code.co_name
-                if file_path == pseed_file_path and function_name == "_iterate":
-                    identifier = id(frame)
-                    break
-                frame = frame.f_back
-        finally:
-            del frame
-        if identifier in cls._rngs:
-            rng = cls._rngs[identifier]
-        else:
+        rng = cls._rng.get()
+        if rng is None:
             rng = RandomNumberGenerator.get_stdlib_rng()
         return rng
 
@@ -1,8 +1,7 @@
 import collections
 
-from uqbar.objects import new
-
 from supriya.patterns.EventPattern import EventPattern
+from supriya.system import new
 
 
 class Pbindf(EventPattern):
@@ -1,8 +1,7 @@
 import uuid
 
-from uqbar.objects import new
-
 from supriya.patterns.Ppar import Ppar
+from supriya.system import new
 
 
 class Pgpar(Ppar):
@@ -1,8 +1,7 @@
 import uuid
 
-from uqbar.objects import new
-
 from supriya.patterns.Pbind import Pbind
+from supriya.system import new
 
 
 class Pmono(Pbind):
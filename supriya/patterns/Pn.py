@@ -1,6 +1,5 @@
-from uqbar.objects import new
-
 from supriya.patterns.EventPattern import EventPattern
+from supriya.system import new
 
 
 class Pn(EventPattern):
@@ -1,9 +1,8 @@
 import collections
-from queue import PriorityQueue
-
-from uqbar.objects import new
+import heapq
 
 from supriya.patterns.EventPattern import EventPattern
+from supriya.system import new
 
 
 class Ppar(EventPattern):
@@ -62,13 +61,13 @@ class Ppar(EventPattern):
             self._debug("LOOP START")
             self._debug("    STOPPED?:", state["has_stopped"])
             self._debug("    VISITED?:", state["visited_iterators"])
-            if not state["iterator_queue"].empty():
+            if state["iterator_queue"]:
                 self._debug("PRIME QUEUES")
                 self._prime_queues(state)
-            elif state["event_queue"].empty():
+            elif not state["event_queue"]:
                 self._debug("ALL DONE")
                 return
-            if state["event_queue"].qsize() > 1:
+            if len(state["event_queue"]) > 1:
                 self._debug("YIELDING INNER")
                 event_tuple_a = self._fetch_event_tuple_a(state)
                 if not event_tuple_a:
@@ -85,7 +84,7 @@ class Ppar(EventPattern):
                 state["should_stop"] = yield event
                 self._debug("    STOP?", state["should_stop"])
                 self._post_process_event(event, event_tuple_a, event_tuple_b, state)
-            elif state["event_queue"].qsize() == 1 and state["iterator_queue"].empty():
+            elif len(state["event_queue"]) == 1 and not state["iterator_queue"]:
                 self._debug("YIELDING FINAL")
                 event = self._process_final_event(state)
                 self._debug(
@@ -98,7 +97,7 @@ class Ppar(EventPattern):
                 yield event
 
     def _fetch_event_tuple_a(self, state):
-        event_tuple_a = state["event_queue"].get()
+        event_tuple_a = heapq.heappop(state["event_queue"])
         if (
             state["has_stopped"]
             and event_tuple_a.iterator_index not in state["visited_iterators"]
@@ -107,14 +106,14 @@ class Ppar(EventPattern):
         return event_tuple_a
 
     def _fetch_event_tuple_b(self, state):
-        return state["event_queue"].get()
+        return heapq.heappop(state["event_queue"])
 
     def _pre_process_event(self, event_tuple_a, event_tuple_b):
         delta = float(event_tuple_b.offset - event_tuple_a.offset)
         return new(event_tuple_a.event, delta=delta)
 
     def _post_process_event(self, event, event_tuple_a, event_tuple_b, state):
-        state["event_queue"].put(event_tuple_b)
+        heapq.heappush(state["event_queue"], event_tuple_b)
         if not state["should_stop"]:
             state["visited_iterators"].add(event_tuple_a.iterator_index)
             return
@@ -132,9 +131,9 @@ class Ppar(EventPattern):
         if not state["has_stopped"]:
             state["has_stopped"] = True
         self._debug("UNWINDING")
-        assert state["event_queue"].qsize() == 1
+        assert len(state["event_queue"]) == 1
 
-        event_tuple = state["event_queue"].get()
+        event_tuple = heapq.heappop(state["event_queue"])
         if event_tuple.iterator_index not in state["visited_iterators"]:
             self._debug("    DISCARDING, UNVISITED", event_tuple)
         elif not isinstance(event_tuple.event, supriya.patterns.CompositeEvent):
@@ -143,14 +142,12 @@ class Ppar(EventPattern):
             self._debug("    DISCARDING, NON-STOP", event_tuple)
         else:
             self._debug("    PRESERVING", event_tuple)
-            state["event_queue"].put(event_tuple._replace(offset=0.0))
+            heapq.heappush(state["event_queue"], event_tuple._replace(offset=0.0))
 
-        iterator_queue = PriorityQueue()
-        while not state["iterator_queue"].empty():
-            iterator_tuple = state["iterator_queue"].get()
-            iterator_tuple = iterator_tuple._replace(offset=0.0)
-            iterator_queue.put(iterator_tuple)
-        state["iterator_queue"] = iterator_queue
+        # Iterators are unique by index, so rewinding them all to the same
+        # offset keeps them in heap order
+        iterator_queue = sorted(state["iterator_queue"])
+        state["iterator_queue"] = [x._replace(offset=0.0) for x in iterator_queue]
 
     def _process_realtime_stop(self, event, event_tuple_a, event_tuple_b, state):
         if not state["has_stopped"]:
@@ -158,12 +155,12 @@ class Ppar(EventPattern):
             state["has_stopped"] = True
 
     def _process_final_event(self, state):
-        event_tuple = state["event_queue"].get()
+        event_tuple = heapq.heappop(state["event_queue"])
         state["visited_iterators"].add(event_tuple.iterator_index)
         return event_tuple.event
 
     def _prime_queues(self, state):
-        iterator_tuple = state["iterator_queue"].get()
+        iterator_tuple = heapq.heappop(state["iterator_queue"])
         iterator = iterator_tuple.iterator
         self._debug("    ITER:", iterator_tuple)
         if (
@@ -193,10 +190,11 @@ class Ppar(EventPattern):
             event_index=event_index,
             event=event,
         )
-        state["event_queue"].put(event_tuple)
+        heapq.heappush(state["event_queue"], event_tuple)
         state["event_counter"][iterator] += 1
-        state["iterator_queue"].put(
-            iterator_tuple._replace(offset=float(iterator_tuple.offset + event.delta))
+        heapq.heappush(
+            state["iterator_queue"],
+            iterator_tuple._replace(offset=float(iterator_tuple.offset + event.delta)),
         )
 
     def _setup_state(self):
@@ -208,13 +206,15 @@ class Ppar(EventPattern):
                 iterators.append(iterator)
                 iterator_group.append(iterator)
             iterator_groups.append(tuple(iterator_group))
-        iterator_queue = PriorityQueue()
-        for i, iterator in enumerate(iterators):
-            iterator_tuple = self._IteratorTuple(offset=0, index=i, iterator=iterator)
-            iterator_queue.put(iterator_tuple)
+        # Heaps ordered by offset, then by index, so ties merge in the order
+        # the patterns were given
+        iterator_queue = [
+            self._IteratorTuple(offset=0, index=i, iterator=iterator)
+            for i, iterator in enumerate(iterators)
+        ]
         state = {
             "event_counter": collections.Counter(),
-            "event_queue": PriorityQueue(),
+            "event_queue": [],
             "has_stopped": False,
             "iterator_queue": iterator_queue,
             "iterators": iterators,
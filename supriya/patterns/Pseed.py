@@ -1,5 +1,3 @@
-import inspect
-
 from supriya.patterns.Pattern import Pattern
 from supriya.patterns.RandomNumberGenerator import RandomNumberGenerator
 
@@ -10,8 +8,6 @@ class Pseed(Pattern):
 
     __slots__ = ("_pattern", "_seed")
 
-    _file_path = __file__
-
     ### INITIALIZER ###
 
     def __init__(self, pattern, seed=0):
@@ -22,13 +18,23 @@ class Pseed(Pattern):
     ### PRIVATE METHODS ###
 
     def _iterate(self, state=None):
+        rng = iter(RandomNumberGenerator(seed=self.seed))
+        iterator = iter(self._pattern)
+        should_stop = None
         try:
-            identifier = id(inspect.currentframe())
-            rng = RandomNumberGenerator(seed=self.seed)
-            Pattern._rngs[identifier] = iter(rng)
-            yield from self._pattern
+            while True:
+                # Only make the generator current while the pattern runs, so
+                # interleaved iterations each draw from their own
+                token = Pattern._rng.set(rng)
+                try:
+                    expr = iterator.send(should_stop)
+                except StopIteration:
+                    return
+                finally:
+                    Pattern._rng.reset(token)
+                should_stop = yield expr
         finally:
-            del Pattern._rngs[identifier]
+            iterator.close()
 
     ### PUBLIC PROPERTIES ###
 
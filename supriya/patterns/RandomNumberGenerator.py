@@ -1,10 +1,15 @@
 import random
+from typing import Dict
 
 from supriya.system import SupriyaObject
 
 
 class RandomNumberGenerator(SupriyaObject):
 
+    ### CLASS VARIABLES ###
+
+    _block_coefficients: Dict = {}
+
     ### INITIALIZER ###
 
     def __init__(self, seed=1):
@@ -18,6 +23,28 @@ class RandomNumberGenerator(SupriyaObject):
             seed = (seed * 1_103_515_245 + 12345) & 0x7FFFFFFF
             yield float(seed) / 0x7FFFFFFF
 
+    ### PRIVATE METHODS ###
+
+    def _iterate_blocks(self, numpy, block_size):
+        mask = 0x7FFFFFFF
+        if block_size not in self._block_coefficients:
+            # Stepping k times multiplies the seed by a^k and adds
+            # c(a^(k-1) + ... + a + 1), modulo 2^31
+            multipliers = numpy.empty(block_size, dtype=numpy.uint64)
+            increments = numpy.empty(block_size, dtype=numpy.uint64)
+            multiplier, increment = 1, 0
+            for i in range(block_size):
+                multiplier = (multiplier * 1_103_515_245) & mask
+                increment = (increment * 1_103_515_245 + 12345) & mask
+                multipliers[i], increments[i] = multiplier, increment
+            self._block_coefficients[block_size] = multipliers, increments
+        multipliers, increments = self._block_coefficients[block_size]
+        seed = numpy.uint64(self._seed & mask)
+        while True:
+            seeds = (multipliers * seed + increments) & numpy.uint64(mask)
+            yield seeds / mask
+            seed = seeds[-1]
+
     ### PUBLIC METHODS ###
 
     @staticmethod
@@ -25,6 +52,40 @@ class RandomNumberGenerator(SupriyaObject):
         while True:
             yield random.random()
 
+    def iterate_blocks(self, block_size=1024):
+        """
+        Iterates over the generator's numbers a block at a time, as NumPy
+        arrays.
+
+        ::
+
+            >>> import itertools
+            >>> rng = supriya.patterns.RandomNumberGenerator(seed=1)
+            >>> blocks = rng.iterate_blocks(block_size=3)  # doctest: +SKIP
+            >>> next(blocks)  # doctest: +SKIP
+            array([0.51387008, 0.1757413 , 0.30865152])
+
+        ::
+
+            >>> numbers = list(itertools.islice(rng, 6))
+            >>> next(blocks).tolist() == numbers[3:]  # doctest: +SKIP
+            True
+
+        Each block continues the sequence iterating the generator yields, bit
+        for bit, computing every number in the block from the previous block's
+        last seed at once.
+
+        Requires NumPy, installed with the ``numpy`` extra.
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                "RandomNumberGenerator.iterate_blocks() requires NumPy; "
+                "install supriya with the numpy extra: pip install supriya[numpy]"
+            )
+        return self._iterate_blocks(numpy, block_size)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -2,6 +2,7 @@
 Tools for modeling patterns.
 """
 from .BusEvent import BusEvent  # noqa
+from .CompiledPattern import CompiledPattern  # noqa
 from .CompositeEvent import CompositeEvent  # noqa
 from .Event import Event  # noqa
 from .EventPattern import EventPattern  # noqa
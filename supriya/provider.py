@@ -2,9 +2,7 @@ import abc
 import collections
 import contextlib
 import dataclasses
-import pathlib
-import re
-import tempfile
+import shutil
 from types import MappingProxyType
 from typing import (
     Any,
@@ -20,8 +18,6 @@ from typing import (
     cast,
 )
 
-from uqbar.objects import new
-
 import supriya.nonrealtime  # noqa
 import supriya.realtime  # noqa
 from supriya import commands, nonrealtime, realtime
@@ -30,6 +26,7 @@ from supriya.enums import AddAction, CalculationRate, ParameterRate
 from supriya.nonrealtime import Session
 from supriya.realtime import AsyncServer, BaseServer, Server
 from supriya.synthdefs import SynthDef
+from supriya.system import new
 
 # with provider.at(): proxy = provider.add_buffer(file_path=file_path)
 # with provider.at(): proxy.free()
@@ -349,8 +346,9 @@ class ProviderMoment:
             return
         timestamp, request_bundle, synthdefs = results
         server = self.provider.server
+        directory_path = self._get_synthdef_directory_path(request_bundle)
         # The underlying asyncio UDP transport will silently drop oversize packets
-        if len(request_bundle.to_datagram()) <= 8192:
+        if directory_path is None and len(request_bundle.to_datagram()) <= 8192:
             if self.wait:
                 # If waiting, the original ProviderMoment timestamp can be ignored
                 await request_bundle.communicate_async(server=server, sync=True)
@@ -364,7 +362,11 @@ class ProviderMoment:
                 synthdef_request = requests[0]
                 requests = synthdef_request.callback.contents or []
                 synthdef_request = new(synthdef_request, callback=None)
-                await synthdef_request.communicate_async(sync=True, server=server)
+                try:
+                    await synthdef_request.communicate_async(sync=True, server=server)
+                finally:
+                    if directory_path is not None:
+                        shutil.rmtree(directory_path, ignore_errors=True)
             if self.wait:
                 # If waiting, the original ProviderMoment timestamp can be ignored
                 for bundle in commands.RequestBundle.partition(requests):
@@ -387,19 +389,35 @@ class ProviderMoment:
         if not results:
             return
         timestamp, request_bundle, synthdefs = results
-        try:
-            self.provider.server.send(request_bundle.to_osc())
-        except OSError:
-            requests = request_bundle.contents
-            if synthdefs:
-                synthdef_request = requests[0]
-                requests = synthdef_request.callback.contents or []
-                synthdef_request = new(synthdef_request, callback=None)
+        directory_path = self._get_synthdef_directory_path(request_bundle)
+        if directory_path is None:
+            try:
+                self.provider.server.send(request_bundle.to_osc())
+                return
+            except OSError:
+                pass
+        requests = request_bundle.contents
+        if synthdefs:
+            synthdef_request = requests[0]
+            requests = synthdef_request.callback.contents or []
+            synthdef_request = new(synthdef_request, callback=None)
+            try:
                 synthdef_request.communicate(sync=True, server=self.provider.server)
-            for bundle in commands.RequestBundle.partition(
-                requests, timestamp=timestamp
-            ):
-                self.provider.server.send(bundle.to_osc())
+            finally:
+                if directory_path is not None:
+                    shutil.rmtree(directory_path, ignore_errors=True)
+        for bundle in commands.RequestBundle.partition(requests, timestamp=timestamp):
+            self.provider.server.send(bundle.to_osc())
+
+    @staticmethod
+    def _get_synthdef_directory_path(request_bundle):
+        # /d_loadDir reads its temporary directory asynchronously, so it can only
+        # be removed once the server has replied.
+        if request_bundle.contents and isinstance(
+            request_bundle.contents[0], commands.SynthDefLoadDirectoryRequest
+        ):
+            return request_bundle.contents[0].directory_path
+        return None
 
     def _enter(self):
         self.provider._moments.append(self)
@@ -451,35 +469,17 @@ class ProviderMoment:
         if timestamp is not None:
             timestamp += self.provider._latency
         if synthdefs:
+            synthdef_library = self.provider.server.synthdef_library
             request_bundle = commands.RequestBundle(
                 timestamp=timestamp,
-                contents=[
-                    commands.SynthDefReceiveRequest(
-                        synthdefs=sorted(synthdefs, key=lambda x: x.actual_name),
-                        callback=commands.RequestBundle(contents=requests),
-                    )
-                ],
+                contents=synthdef_library.make_requests(
+                    synthdef_library.collect_missing(
+                        sorted(synthdefs, key=lambda x: x.actual_name)
+                    ),
+                    callback=commands.RequestBundle(contents=requests),
+                    maximum_receive_count=1,
+                ),
             )
-            # check bundle size, write synthdefs to disk and do /d_load
-            if len(request_bundle.to_datagram(with_placeholders=True)) > 8192:
-                directory_path = pathlib.Path(tempfile.mkdtemp())
-                # directory_path = pathlib.Path("~/Desktop").expanduser()
-                for synthdef in synthdefs:
-                    name = synthdef.anonymous_name
-                    if synthdef.name:
-                        name += "-" + re.sub(r"[^\w]", "-", synthdef.name)
-                    file_name = "{}.scsyndef".format(name)
-                    synthdef_path = directory_path / file_name
-                    synthdef_path.write_bytes(synthdef.compile())
-                request_bundle = commands.RequestBundle(
-                    timestamp=timestamp,
-                    contents=[
-                        supriya.commands.SynthDefLoadDirectoryRequest(
-                            directory_path=directory_path,
-                            callback=commands.RequestBundle(contents=requests),
-                        )
-                    ],
-                )
         else:
             request_bundle = commands.RequestBundle(
                 timestamp=timestamp, contents=requests
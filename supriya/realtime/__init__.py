@@ -19,6 +19,7 @@ from .interfaces import (
     SynthControl,
     SynthInterface,
 )
+from .libraries import SynthDefLibrary
 from .meters import Meters
 from .nodes import Group, Node, RootNode, Synth
 from .recorder import Recorder
@@ -50,6 +51,7 @@ __all__ = [
     "ServerObject",
     "Synth",
     "SynthControl",
+    "SynthDefLibrary",
     "SynthInterface",
     "boot",
 ]
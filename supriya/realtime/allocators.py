@@ -1,10 +1,8 @@
 import threading
 
-from uqbar.objects import new
-
 from supriya.intervals import IntervalTree
 from supriya.intervals.Interval import Interval
-from supriya.system import SupriyaObject
+from supriya.system import SupriyaObject, new
 
 
 class Block(Interval):
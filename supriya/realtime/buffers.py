@@ -1,5 +1,8 @@
+import array
 import collections
+import contextlib
 import os
+import tempfile
 
 import supriya.exceptions
 from supriya.system import SupriyaValueObject
@@ -7,6 +10,19 @@ from supriya.system import SupriyaValueObject
 from .bases import ServerObject
 
 
+@contextlib.contextmanager
+def _temporary_soundfile_path():
+    # Prefer shared memory, so bulk transfers never touch the disk.
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    file_descriptor, file_path = tempfile.mkstemp(suffix=".wav", dir=directory)
+    os.close(file_descriptor)
+    try:
+        yield file_path
+    finally:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+
 class Buffer(ServerObject):
     """
     A buffer.
@@ -46,6 +62,14 @@ class Buffer(ServerObject):
 
     __slots__ = ("_buffer_group", "_buffer_id", "_buffer_id_was_set_manually")
 
+    # Samples per /b_getn or /b_setn message when transferring to remote servers.
+    _chunk_size = 1024
+
+    # Requests pipelined at once when reading from remote servers.
+    _pipeline_size = 64
+
+    _local_ip_addresses = frozenset(["127.0.0.1", "localhost", "::1"])
+
     ### INITIALIZER ###
 
     def __init__(self, buffer_group_or_index=None):
@@ -1003,6 +1027,90 @@ class Buffer(ServerObject):
         response = self.get_contiguous(index_count_pairs=index_count_pairs)
         return response
 
+    def get_samples(self, starting_frame=0, frame_count=None):
+        """
+        Gets interleaved sample values in bulk.
+
+        ::
+
+            >>> server = supriya.Server.default().boot()
+            >>> buffer_ = supriya.realtime.Buffer().allocate(
+            ...     channel_count=2,
+            ...     frame_count=4,
+            ...     )
+            >>> buffer_.set_samples([0.25, -0.25, 0.5, -0.5], starting_frame=1)
+            >>> buffer_.get_samples()
+            array('f', [0.0, 0.0, 0.25, -0.25, 0.5, -0.5, 0.0, 0.0])
+
+        ::
+
+            >>> buffer_.get_samples(starting_frame=1, frame_count=1)
+            array('f', [0.25, -0.25])
+
+        ::
+
+            >>> buffer_ = buffer_.free()
+
+        ::
+
+            >>> buffer_.get_samples()
+            Traceback (most recent call last):
+            ...
+            supriya.exceptions.BufferNotAllocated
+
+        Servers on the local machine write the samples to a temporary soundfile,
+        in shared memory where available, rather than sending them over OSC.
+        Remote servers are read in chunks.
+
+        Returns an array of floats.
+        """
+        import supriya.commands
+        import supriya.soundfiles
+
+        if not self.is_allocated:
+            raise supriya.exceptions.BufferNotAllocated
+        if frame_count is None:
+            frame_count = self.frame_count - starting_frame
+        if starting_frame < 0 or self.frame_count < starting_frame + frame_count:
+            raise IndexError("Index out of range.")
+        if not frame_count:
+            return array.array("f")
+        if self.server.ip_address in self._local_ip_addresses:
+            with _temporary_soundfile_path() as file_path:
+                request = supriya.commands.BufferWriteRequest(
+                    buffer_id=self.buffer_id,
+                    file_path=file_path,
+                    frame_count=frame_count,
+                    header_format="wav",
+                    sample_format="float",
+                    starting_frame=starting_frame,
+                )
+                request.communicate(server=self.server, sync=False)
+                self.server.sync()
+                _, samples = supriya.soundfiles.read_float_wav(file_path)
+            return samples
+        start = starting_frame * self.channel_count
+        stop = start + frame_count * self.channel_count
+        requests = [
+            supriya.commands.BufferGetContiguousRequest(
+                buffer_id=self,
+                index_count_pairs=[(index, min(self._chunk_size, stop - index))],
+            )
+            for index in range(start, stop, self._chunk_size)
+        ]
+        samples = array.array("f")
+        for i in range(0, len(requests), self._pipeline_size):
+            pipeline = supriya.commands.RequestPipeline(
+                contents=requests[i : i + self._pipeline_size]
+            )
+            for response in pipeline.communicate(server=self.server):
+                if not isinstance(
+                    response, supriya.commands.BufferSetContiguousResponse
+                ):
+                    raise IOError("Failed to get samples.")
+                samples.extend(response.items[0].sample_values)
+        return samples
+
     def normalize(self, as_wavetable=None, new_maximum=1.0, sync=False):
         request = supriya.commands.BufferNormalizeRequest(
             as_wavetable=as_wavetable, buffer_id=self, new_maximum=new_maximum
@@ -1252,6 +1360,82 @@ class Buffer(ServerObject):
         )
         request.communicate(server=self.server, sync=sync)
 
+    def set_samples(self, samples, starting_frame=0, sync=True):
+        """
+        Sets interleaved sample values in bulk.
+
+        ::
+
+            >>> server = supriya.Server.default().boot()
+            >>> buffer_ = supriya.realtime.Buffer().allocate(
+            ...     frame_count=8,
+            ...     )
+
+        ::
+
+            >>> buffer_.set_samples([1, 2, 3, -3, 2, -1], starting_frame=1)
+            >>> buffer_.get_contiguous([(0, 8)]).as_dict()[0]
+            (0.0, 1.0, 2.0, 3.0, -3.0, 2.0, -1.0, 0.0)
+
+        ::
+
+            >>> buffer_ = buffer_.free()
+
+        ::
+
+            >>> buffer_.set_samples([])
+            Traceback (most recent call last):
+            ...
+            supriya.exceptions.BufferNotAllocated
+
+        ``samples`` may be any iterable of numbers. Float32 buffers, e.g.
+        ``array.array('f')`` or NumPy arrays, are copied without unpacking.
+        Servers on the local machine read the samples from a temporary soundfile,
+        in shared memory where available, rather than receiving them over OSC.
+        Remote servers are written in chunks. Writing to a local server always
+        waits for the read to complete.
+
+        Returns none.
+        """
+        import supriya.commands
+        import supriya.soundfiles
+
+        if not self.is_allocated:
+            raise supriya.exceptions.BufferNotAllocated
+        samples = supriya.soundfiles._as_float_array(samples)
+        if len(samples) % self.channel_count:
+            raise ValueError("Sample count must be a multiple of channel count.")
+        frame_count = len(samples) // self.channel_count
+        if starting_frame < 0 or self.frame_count < starting_frame + frame_count:
+            raise IndexError("Index out of range.")
+        if not frame_count:
+            return
+        if self.server.ip_address in self._local_ip_addresses:
+            with _temporary_soundfile_path() as file_path:
+                supriya.soundfiles.write_float_wav(
+                    file_path,
+                    samples,
+                    channel_count=self.channel_count,
+                    sample_rate=self.sample_rate or 44100,
+                )
+                request = supriya.commands.BufferReadRequest(
+                    buffer_id=self.buffer_id,
+                    file_path=file_path,
+                    frame_count=frame_count,
+                    starting_frame_in_buffer=starting_frame,
+                )
+                request.communicate(server=self.server, sync=True)
+            return
+        start = starting_frame * self.channel_count
+        for i in range(0, len(samples), self._chunk_size):
+            request = supriya.commands.BufferSetContiguousRequest(
+                buffer_id=self,
+                index_values_pairs=[(start + i, samples[i : i + self._chunk_size])],
+            )
+            request.communicate(server=self.server, sync=False)
+        if sync:
+            self.server.sync()
+
     def write(
         self,
         file_path,
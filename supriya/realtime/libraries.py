@@ -0,0 +1,283 @@
+import concurrent.futures
+import pathlib
+import re
+import shutil
+import tempfile
+
+from supriya.system import SupriyaObject
+
+
+class SynthDefLibrary(SupriyaObject):
+    """
+    A server's synthdef library.
+
+    Tracks which synthdefs a server has loaded, by name and by hash of their
+    compiled UGen graph, and loads missing synthdefs in as few round trips as
+    possible.
+
+    ::
+
+        >>> import supriya
+        >>> server = supriya.Server.default().boot()
+        >>> library = server.synthdef_library
+        >>> supriya.assets.synthdefs.default in library
+        False
+
+    ::
+
+        >>> library.allocate([supriya.assets.synthdefs.default])
+        (<SynthDef: default>,)
+
+    ::
+
+        >>> supriya.assets.synthdefs.default in library
+        True
+
+    ::
+
+        >>> library.allocate([supriya.assets.synthdefs.default])
+        ()
+
+    ::
+
+        >>> server.quit()
+        <Server: offline>
+
+    Missing synthdefs are packed into ``/d_recv`` requests of at most
+    ``maximum_datagram_size`` bytes each. Sets needing more than
+    ``maximum_receive_count`` of those, or containing a synthdef too large for
+    any of them, are written to a temporary directory and loaded with a single
+    ``/d_loadDir`` instead, which assumes the server shares our filesystem.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Server Internals"
+
+    __slots__ = ("_anonymous_names", "_server", "_synthdefs")
+
+    maximum_datagram_size = 8192
+
+    maximum_receive_count = 8
+
+    ### INITIALIZER ###
+
+    def __init__(self, server):
+        self._anonymous_names = {}
+        self._server = server
+        self._synthdefs = {}
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, expr):
+        import supriya.synthdefs
+
+        if not isinstance(expr, supriya.synthdefs.SynthDef):
+            return False
+        anonymous_name = self._anonymous_names.get(expr.actual_name)
+        return anonymous_name is not None and anonymous_name == expr.anonymous_name
+
+    def __getitem__(self, name):
+        return self._synthdefs[name]
+
+    def __iter__(self):
+        return iter(self._synthdefs.values())
+
+    def __len__(self):
+        return len(self._synthdefs)
+
+    ### PRIVATE METHODS ###
+
+    def _clear(self):
+        self._anonymous_names.clear()
+        self._synthdefs.clear()
+
+    @staticmethod
+    def _read_synthdef_file(file_path):
+        import supriya.synthdefs
+
+        return supriya.synthdefs.SynthDefDecompiler.decompile_synthdefs(
+            file_path.read_bytes()
+        )
+
+    def _fits(self, synthdefs):
+        import supriya.commands
+
+        request = supriya.commands.SynthDefReceiveRequest(synthdefs=synthdefs)
+        datagram = request.to_datagram(with_placeholders=True)
+        return len(datagram) <= self.maximum_datagram_size
+
+    def _register(self, synthdef):
+        name = synthdef.actual_name
+        self._anonymous_names[name] = synthdef.anonymous_name
+        self._synthdefs[name] = synthdef
+
+    def _unregister(self, name):
+        self._anonymous_names.pop(name, None)
+        return self._synthdefs.pop(name, None)
+
+    @staticmethod
+    def _write_synthdef_directory(synthdefs):
+        directory_path = pathlib.Path(tempfile.mkdtemp())
+        for synthdef in synthdefs:
+            name = synthdef.anonymous_name
+            if synthdef.name:
+                name += "-" + re.sub(r"[^\w]", "-", synthdef.name)
+            file_path = directory_path / "{}.scsyndef".format(name)
+            file_path.write_bytes(synthdef.compile())
+        return directory_path
+
+    ### PUBLIC METHODS ###
+
+    def allocate(self, synthdefs, callback=None, timeout=1.0):
+        """
+        Loads those of ``synthdefs`` the server does not have yet, then runs
+        ``callback``, a request or request bundle, if any.
+
+        All ``/d_recv`` requests are sent back to back, and the call blocks until
+        the server has acknowledged each of them.
+
+        Returns the synthdefs which were loaded.
+        """
+        import supriya.commands
+
+        missing = self.collect_missing(synthdefs)
+        requests = self.make_requests(missing, callback=callback)
+        if not requests:
+            return missing
+        for synthdef in missing:
+            self._register(synthdef)
+        try:
+            responses = supriya.commands.RequestPipeline(contents=requests).communicate(
+                server=self._server, timeout=timeout
+            )
+        except BaseException:
+            for synthdef in missing:
+                self._unregister(synthdef.actual_name)
+            raise
+        finally:
+            for request in requests:
+                if isinstance(request, supriya.commands.SynthDefLoadDirectoryRequest):
+                    shutil.rmtree(request.directory_path, ignore_errors=True)
+        # Synthdefs whose loads failed or timed out must be sent again next time
+        failed = set()
+        for request, response in zip(requests, responses or [None] * len(requests)):
+            if response is not None and not isinstance(
+                response, supriya.commands.FailResponse
+            ):
+                continue
+            elif isinstance(request, supriya.commands.SynthDefReceiveRequest):
+                failed.update(request.synthdefs)
+            elif isinstance(request, supriya.commands.SynthDefLoadDirectoryRequest):
+                failed.update(missing)
+        for synthdef in failed:
+            self._unregister(synthdef.actual_name)
+        return tuple(synthdef for synthdef in missing if synthdef not in failed)
+
+    def collect_missing(self, synthdefs):
+        """
+        Collects those of ``synthdefs`` not yet loaded, without duplicates, in
+        order.
+        """
+        missing, anonymous_names = [], set()
+        for synthdef in synthdefs:
+            if synthdef in self:
+                continue
+            key = (synthdef.actual_name, synthdef.anonymous_name)
+            if key in anonymous_names:
+                continue
+            anonymous_names.add(key)
+            missing.append(synthdef)
+        return tuple(missing)
+
+    def make_requests(self, synthdefs, callback=None, maximum_receive_count=None):
+        """
+        Makes requests loading ``synthdefs``, and nothing else.
+
+        ``callback`` is attached to the last request, so it runs once every
+        synthdef has loaded. If there are no synthdefs, the callback is the only
+        request.
+
+        ``/d_loadDir`` requests point to temporary directories, which the caller
+        is responsible for removing.
+        """
+        import supriya.commands
+
+        if not synthdefs:
+            return [callback] if callback is not None else []
+        if maximum_receive_count is None:
+            maximum_receive_count = self.maximum_receive_count
+        groups, group = [], []
+        for synthdef in synthdefs:
+            if self._fits([*group, synthdef]):
+                group.append(synthdef)
+                continue
+            elif not group or not self._fits([synthdef]):
+                groups = None
+                break
+            groups.append(group)
+            group = [synthdef]
+        if groups is not None:
+            groups.append(group)
+            requests = [
+                supriya.commands.SynthDefReceiveRequest(synthdefs=group)
+                for group in groups[:-1]
+            ]
+            requests.append(
+                supriya.commands.SynthDefReceiveRequest(
+                    synthdefs=groups[-1], callback=callback
+                )
+            )
+            if (
+                len(requests) <= maximum_receive_count
+                and len(requests[-1].to_datagram(with_placeholders=True))
+                <= self.maximum_datagram_size
+            ):
+                return requests
+        return [
+            supriya.commands.SynthDefLoadDirectoryRequest(
+                directory_path=self._write_synthdef_directory(synthdefs),
+                callback=callback,
+            )
+        ]
+
+    def preload(
+        self, directory_path, pattern="*.scsyndef", maximum_workers=None, timeout=1.0
+    ):
+        """
+        Loads the compiled synthdefs in ``directory_path`` matching ``pattern``.
+
+        Files are read and decompiled in parallel. If none of their synthdefs
+        are loaded yet and ``pattern`` matches everything the server would load,
+        the directory is loaded in place with a single ``/d_loadDir``.
+
+        Returns the synthdefs which were loaded.
+        """
+        import supriya.commands
+
+        directory_path = pathlib.Path(directory_path).resolve()
+        file_paths = sorted(directory_path.glob(pattern))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=maximum_workers
+        ) as executor:
+            synthdefs = [
+                synthdef
+                for file_synthdefs in executor.map(self._read_synthdef_file, file_paths)
+                for synthdef in file_synthdefs
+            ]
+        missing = self.collect_missing(synthdefs)
+        if pattern != "*.scsyndef" or len(missing) < len(synthdefs):
+            return self.allocate(missing, timeout=timeout)
+        elif missing:
+            for synthdef in missing:
+                self._register(synthdef)
+            supriya.commands.SynthDefLoadDirectoryRequest(
+                directory_path=directory_path
+            ).communicate(server=self._server, timeout=timeout)
+        return missing
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def server(self):
+        return self._server
@@ -1,12 +1,9 @@
 import abc
 import collections
-import pathlib
-import tempfile
 
 import uqbar.graphs
 import uqbar.strings
 from uqbar.containers import UniqueTreeList, UniqueTreeNode
-from uqbar.objects import new
 
 from supriya.enums import AddAction, NodeAction
 
@@ -100,26 +97,9 @@ class Node(ServerObject, UniqueTreeNode):
             request = supriya.commands.RequestBundle(contents=requests)
         else:
             request = requests[0]
-        requests[:] = [request]
-        if synthdefs:
-            synthdef_request = supriya.commands.SynthDefReceiveRequest(
-                synthdefs=synthdefs, callback=requests[0]
-            )
-            if len(synthdef_request.to_datagram(with_placeholders=True)) > 8192:
-                directory_path = pathlib.Path(tempfile.mkdtemp())
-                synthdef_request = supriya.commands.SynthDefLoadDirectoryRequest(
-                    directory_path=directory_path, callback=requests[0]
-                )
-                for synthdef in synthdefs:
-                    file_name = "{}.scsyndef".format(synthdef.anonymous_name)
-                    synthdef_path = directory_path / file_name
-                    synthdef_path.write_bytes(synthdef.compile())
-            requests[:] = [synthdef_request]
-            if len(requests[0].to_datagram(with_placeholders=True)) > 8192:
-                node_allocate_request = requests[0].callback
-                synthdef_request = new(requests[0], callback=None)
-                requests[:] = [node_allocate_request, synthdef_request]
-        for request in requests:
+        if server.synthdef_library.collect_missing(synthdefs):
+            server.synthdef_library.allocate(synthdefs, callback=request)
+        else:
             request.communicate(server=server, sync=True)
         return self
 
@@ -562,8 +542,7 @@ class Group(Node, UniqueTreeList):
                     )
                     requests.append(request)
                 else:
-                    if node.synthdef not in server:
-                        synthdefs.add(node.synthdef)
+                    synthdefs.add(node.synthdef)
                     (settings, map_requests) = node.controls._make_synth_new_settings()
                     request = supriya.commands.SynthNewRequest(
                         add_action=add_action,
@@ -4,8 +4,6 @@ import re
 import threading
 from typing import Set
 
-from uqbar.objects import new
-
 import supriya.exceptions
 from supriya import scsynth
 from supriya.commands import (  # type: ignore
@@ -19,14 +17,18 @@ from supriya.commands import (  # type: ignore
 from supriya.enums import NodeAction
 from supriya.osc.protocols import (
     AsyncOscProtocol,
+    AsyncTcpOscProtocol,
     HealthCheck,
     OscProtocolOffline,
     ThreadedOscProtocol,
+    ThreadedTcpOscProtocol,
 )
 from supriya.querytree import QueryTreeGroup, QueryTreeSynth
 from supriya.scsynth import Options
+from supriya.system import new
 
 from .allocators import BlockAllocator, NodeIdAllocator
+from .libraries import SynthDefLibrary
 from .meters import Meters
 from .protocols import AsyncProcessProtocol, SyncProcessProtocol
 from .recorder import Recorder
@@ -61,7 +63,7 @@ class BaseServer:
         self._node_id_allocator = None
         self._sync_id = 0
         # proxy mappings
-        self._synthdefs = {}
+        self._synthdef_library = SynthDefLibrary(self)
 
     ### SPECIAL METHODS ###
 
@@ -94,8 +96,7 @@ class BaseServer:
         from supriya.commands import Response
 
         response = Response.from_osc_message(message)
-        synthdef_name = response.synthdef_name
-        self._synthdefs.pop(synthdef_name, None)
+        self._synthdef_library._unregister(response.synthdef_name)
 
     def _setup_allocators(self):
         self._audio_bus_allocator = BlockAllocator(
@@ -222,6 +223,10 @@ class BaseServer:
     def status(self):
         return self._status
 
+    @property
+    def synthdef_library(self):
+        return self._synthdef_library
+
 
 class AsyncServer(BaseServer):
 
@@ -240,15 +245,16 @@ class AsyncServer(BaseServer):
 
     def __contains__(self, expr):
         if isinstance(expr, supriya.synthdefs.SynthDef):
-            name = expr.actual_name
-            if name in self._synthdefs and self._synthdefs[name] == expr:
-                return True
+            return expr in self._synthdef_library
         return False
 
     ### PRIVATE METHODS ###
 
     async def _connect(self):
-        self._osc_protocol = AsyncOscProtocol()
+        if self._options.protocol == "tcp":
+            self._osc_protocol = AsyncTcpOscProtocol()
+        else:
+            self._osc_protocol = AsyncOscProtocol()
         await self._osc_protocol.connect(
             ip_address=self._ip_address,
             port=self._port,
@@ -455,9 +461,7 @@ class Server(BaseServer):
             if node_id in self._nodes and self._nodes[node_id] is expr:
                 return True
         elif isinstance(expr, supriya.synthdefs.SynthDef):
-            name = expr.actual_name
-            if name in self._synthdefs and self._synthdefs[name] == expr:
-                return True
+            return expr in self._synthdef_library
         elif isinstance(expr, supriya.realtime.ServerObject):
             return expr.server is self
         return False
@@ -611,7 +615,10 @@ class Server(BaseServer):
         return self.default_group
 
     def _connect(self):
-        self._osc_protocol = ThreadedOscProtocol()
+        if self._options.protocol == "tcp":
+            self._osc_protocol = ThreadedTcpOscProtocol()
+        else:
+            self._osc_protocol = ThreadedOscProtocol()
         self._osc_protocol.connect(
             ip_address=self.ip_address,
             port=self.port,
@@ -728,8 +735,7 @@ class Server(BaseServer):
         from supriya.commands import Response
 
         response = Response.from_osc_message(message)
-        synthdef_name = response.synthdef_name
-        self._synthdefs.pop(synthdef_name, None)
+        self._synthdef_library._unregister(response.synthdef_name)
 
     def _rehydrate(self):
         from supriya.realtime import Group, Synth
@@ -818,7 +824,7 @@ class Server(BaseServer):
             for synthdef in system_synthdefs:
                 synthdef._register_with_local_server(self)
         else:
-            supriya.synthdefs.SynthDef._allocate_synthdefs(system_synthdefs, self)
+            self._synthdef_library.allocate(system_synthdefs)
 
     def _teardown_proxies(self):
         for set_ in tuple(self._audio_buses.values()):
@@ -842,7 +848,7 @@ class Server(BaseServer):
         self._default_group = None
         self._nodes.clear()
         self._root_node = None
-        self._synthdefs.clear()
+        self._synthdef_library._clear()
 
     def _shutdown(self):
         if not self.is_running:
@@ -854,7 +860,15 @@ class Server(BaseServer):
 
     ### PUBLIC METHODS ###
 
-    def boot(self, port=DEFAULT_PORT, *, scsynth_path=None, options=None, **kwargs):
+    def boot(
+        self,
+        port=DEFAULT_PORT,
+        *,
+        scsynth_path=None,
+        options=None,
+        synthdef_directory_path=None,
+        **kwargs,
+    ):
         if self.is_running:
             raise supriya.exceptions.ServerOnline
         port = port or DEFAULT_PORT
@@ -866,6 +880,8 @@ class Server(BaseServer):
         self._is_owner = True
         self._port = port
         self._connect()
+        if synthdef_directory_path is not None:
+            self._synthdef_library.preload(synthdef_directory_path)
         return self
 
     def connect(self, ip_address="127.0.0.1", port=DEFAULT_PORT):
@@ -2,11 +2,14 @@
 Tools for interacting with soundfiles.
 """
 import aifc
+import array
 import hashlib
 import pathlib
 import shlex
 import sndhdr
+import struct
 import subprocess
+import sys
 import wave
 
 import uqbar.strings
@@ -252,3 +255,108 @@ class SoundFile(SupriyaObject):
     @property
     def sample_width(self):
         return self._sample_width
+
+
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def read_float_wav(file_path):
+    """
+    Reads a 32-bit float WAV file.
+
+    ::
+
+        >>> import tempfile
+        >>> file_path = pathlib.Path(tempfile.mkdtemp()) / "samples.wav"
+        >>> supriya.soundfiles.write_float_wav(
+        ...     file_path, [0.25, -0.5, 0.75, -1.0], channel_count=2,
+        ... )
+        >>> supriya.soundfiles.read_float_wav(file_path)
+        (2, array('f', [0.25, -0.5, 0.75, -1.0]))
+
+    Returns channel count and interleaved samples, as a pair.
+    """
+    with open(file_path, "rb") as file_pointer:
+        data = file_pointer.read()
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise ValueError(file_path)
+    channel_count, samples, offset = None, None, 12
+    while offset + 8 <= len(data):
+        chunk_id, chunk_size = struct.unpack_from("<4sI", data, offset)
+        offset += 8
+        if chunk_id == b"fmt ":
+            format_tag, channel_count = struct.unpack_from("<HH", data, offset)
+            bits_per_sample = struct.unpack_from("<H", data, offset + 14)[0]
+            if bits_per_sample != 32 or format_tag not in (
+                _WAVE_FORMAT_IEEE_FLOAT,
+                _WAVE_FORMAT_EXTENSIBLE,
+            ):
+                raise ValueError("Not a 32-bit float WAV file: {}".format(file_path))
+        elif chunk_id == b"data":
+            chunk = data[offset : offset + chunk_size]
+            samples = array.array("f")
+            samples.frombytes(chunk[: len(chunk) - len(chunk) % 4])
+            if sys.byteorder == "big":
+                samples.byteswap()
+        offset += chunk_size + chunk_size % 2
+    if channel_count is None or samples is None:
+        raise ValueError(file_path)
+    return channel_count, samples
+
+
+def write_float_wav(file_path, samples, channel_count=1, sample_rate=44100):
+    """
+    Writes interleaved ``samples`` as a 32-bit float WAV file.
+
+    ``samples`` may be any iterable of numbers, or any object exporting a
+    contiguous float32 buffer (an ``array.array('f')``, a float32 NumPy
+    array), which is copied without unpacking.
+    """
+    samples = _as_float_array(samples)
+    if sys.byteorder == "big":
+        samples = array.array("f", samples)
+        samples.byteswap()
+    header = _build_float_wav_header(
+        len(samples) // channel_count, channel_count, sample_rate
+    )
+    with open(file_path, "wb") as file_pointer:
+        file_pointer.write(header)
+        samples.tofile(file_pointer)
+
+
+def _build_float_wav_header(frame_count, channel_count, sample_rate):
+    data_size = frame_count * channel_count * 4
+    return b"".join(
+        [
+            struct.pack("<4sI4s", b"RIFF", 4 + 26 + 12 + 8 + data_size, b"WAVE"),
+            struct.pack(
+                "<4sIHHIIHH",
+                b"fmt ",
+                18,
+                _WAVE_FORMAT_IEEE_FLOAT,
+                channel_count,
+                int(sample_rate),
+                int(sample_rate) * channel_count * 4,
+                channel_count * 4,
+                32,
+            ),
+            struct.pack("<H", 0),
+            struct.pack("<4sII", b"fact", 4, frame_count),
+            struct.pack("<4sI", b"data", data_size),
+        ]
+    )
+
+
+def _as_float_array(samples):
+    if isinstance(samples, array.array) and samples.typecode == "f":
+        return samples
+    try:
+        view = memoryview(samples)
+    except TypeError:
+        return array.array("f", samples)
+    if view.format != "f" or not view.c_contiguous:
+        return array.array("f", samples)
+    result = array.array("f")
+    result.frombytes(view.cast("B"))
+    return result
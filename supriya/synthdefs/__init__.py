@@ -13,6 +13,7 @@ from .bases import (
     WidthFirstUGen,
 )
 from .builders import SynthDefBuilder
+from .caches import SynthDefCache, SynthDefCacheInfo
 from .compilers import SynthDefCompiler, SynthDefDecompiler
 from .controls import (
     AudioControl,
@@ -42,6 +43,8 @@ __all__ = [
     "SuperColliderSynthDef",
     "SynthDef",
     "SynthDefBuilder",
+    "SynthDefCache",
+    "SynthDefCacheInfo",
     "SynthDefCompiler",
     "SynthDefDecompiler",
     "SynthDefFactory",
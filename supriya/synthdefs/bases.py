@@ -638,7 +638,7 @@ class UGen(UGenMethodMixin, metaclass=UGenMeta):
             antecedent_bundle = sort_bundles.get(antecedent, None)
             if not antecedent_bundle:
                 continue
-            antecedent_bundle.descendants.remove(self)
+            del antecedent_bundle.descendants[self]
             antecedent._optimize_graph(sort_bundles)
 
     def _validate_inputs(self):
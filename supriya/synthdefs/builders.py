@@ -3,9 +3,7 @@ import copy
 import uuid
 from typing import List
 
-from uqbar.objects import new
-
-from supriya.system import SupriyaObject
+from supriya.system import SupriyaObject, new
 
 
 class SynthDefBuilder(SupriyaObject):
@@ -153,6 +151,19 @@ class SynthDefBuilder(SupriyaObject):
             if not isinstance(ugen, supriya.synthdefs.Control)
         ]
         name = self.name or name
+        cache = supriya.synthdefs.SynthDefCache.default()
+        key = cache.fingerprint(
+            list(self._parameters.values()) + list(self._ugens),
+            type(self).__name__,
+            bool(optimize),
+        )
+        if key is not None:
+            state = cache.get(key)
+            if state is not None:
+                synthdef = object.__new__(supriya.synthdefs.SynthDef)
+                synthdef._name = name
+                synthdef._set_state(state)
+                return synthdef
         with self:
             ugens = list(self._parameters.values()) + list(self._ugens)
             ugens = copy.deepcopy(ugens)
@@ -165,6 +176,8 @@ class SynthDefBuilder(SupriyaObject):
             supriya.synthdefs.SynthDef._remap_controls(ugens, control_mapping)
             ugens = control_ugens + ugens
             synthdef = supriya.synthdefs.SynthDef(ugens, name=name, optimize=optimize)
+        if key is not None:
+            cache.set(key, synthdef._get_state())
         return synthdef
 
     def poll_ugen(self, ugen, label=None, trigger=None, trigger_id=-1):
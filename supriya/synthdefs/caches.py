@@ -0,0 +1,283 @@
+import collections
+import enum
+import io
+import hashlib
+import os
+import pathlib
+import pickle
+import tempfile
+import threading
+import uuid
+from typing import NamedTuple, Optional
+
+import supriya
+from supriya.system import SupriyaObject
+
+from .bases import UGen
+from .controls import Control, Parameter
+from .mixins import OutputProxy
+
+
+class _SynthDefCacheUnpickler(pickle.Unpickler):
+    """
+    Only resolves the classes making up cached SynthDef state.
+    """
+
+    def find_class(self, module, name):
+        if (module, name) == ("uuid", "UUID"):
+            return uuid.UUID
+        if module == "supriya" or module.startswith("supriya."):
+            class_ = super().find_class(module, name)
+            if isinstance(class_, type) and issubclass(
+                class_, (UGen, OutputProxy, Parameter, enum.Enum)
+            ):
+                return class_
+        raise pickle.UnpicklingError("{}.{} is forbidden".format(module, name))
+
+
+class SynthDefCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maximum_size: int
+
+
+class SynthDefCache(SupriyaObject):
+    """
+    A least-recently-used cache of compiled SynthDef state.
+
+    Keyed by a structural fingerprint of a UGen graph, so rebuilding an
+    identical graph skips copying, optimizing, sorting and compiling it.
+
+    ::
+
+        >>> cache = supriya.synthdefs.SynthDefCache(maximum_size=8)
+        >>> cache.get("key") is None
+        True
+
+    ::
+
+        >>> cache.set("key", "value")
+        >>> cache.get("key")
+        'value'
+
+    ::
+
+        >>> cache.info()
+        SynthDefCacheInfo(hits=1, misses=1, evictions=0, size=1, maximum_size=8)
+
+    Entries are kept pickled, and unpickled afresh on every hit, so callers
+    never share mutable state (such as UGen instances) with each other or
+    with the cache. Unpickling is far cheaper than copying a UGen graph.
+
+    When ``directory_path`` is set, entries are also pickled to disk there, and
+    survive between processes. The directory is off by default, and loading
+    only resolves UGen, parameter and enumeration classes from ``supriya``
+    itself, but it should still be a directory only you can write to.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "SynthDef Internals"
+
+    _default_cache: Optional["SynthDefCache"] = None
+
+    ### INITIALIZER ###
+
+    def __init__(self, maximum_size=1024, directory_path=None):
+        self._entries = collections.OrderedDict()
+        self._evictions = 0
+        self._hits = 0
+        self._lock = threading.RLock()
+        self._misses = 0
+        self.maximum_size = int(maximum_size)
+        self.directory_path = directory_path
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    ### PRIVATE METHODS ###
+
+    def _get_file_path(self, key):
+        if self.directory_path is None:
+            return None
+        return pathlib.Path(self.directory_path) / "{}.pickle".format(key)
+
+    @staticmethod
+    def _decode(data):
+        try:
+            return _SynthDefCacheUnpickler(io.BytesIO(data)).load()
+        except Exception:
+            return None
+
+    def _read(self, key):
+        file_path = self._get_file_path(key)
+        if file_path is None or not file_path.exists():
+            return None
+        try:
+            return file_path.read_bytes()
+        except OSError:
+            return None
+
+    def _store(self, key, value):
+        if self.maximum_size <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maximum_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _write(self, key, value):
+        file_path = self._get_file_path(key)
+        if file_path is None:
+            return
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent readers never see partial files.
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=str(file_path.parent))
+        try:
+            with os.fdopen(file_descriptor, "wb") as file_pointer:
+                file_pointer.write(value)
+            os.replace(temporary_path, str(file_path))
+        except Exception:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        """
+        Clears in-memory entries and statistics.
+
+        Entries on disk are left in place.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._evictions = self._hits = self._misses = 0
+
+    @classmethod
+    def default(cls):
+        """
+        Gets the process-wide cache used by ``SynthDef``.
+        """
+        if cls._default_cache is None:
+            cls._default_cache = cls()
+        return cls._default_cache
+
+    @staticmethod
+    def fingerprint(ugens, *extra):
+        """
+        Fingerprints the UGen graph made of ``ugens``.
+
+        ``ugens`` may mix UGens and parameters. Graphs with the same UGen types,
+        rates, inputs and parameters in the same order fingerprint identically,
+        regardless of object identity. ``extra`` values are folded into the
+        fingerprint.
+
+        Returns a hex digest, or none if the graph cannot be fingerprinted
+        (e.g. it references UGens outside of ``ugens``).
+        """
+        indices = {id(ugen): i for i, ugen in enumerate(ugens)}
+
+        def describe_value(value):
+            if isinstance(value, enum.Enum):
+                return value.value
+            elif value is None or isinstance(value, (bool, int, float, str)):
+                return value
+            elif isinstance(value, tuple) and all(
+                isinstance(x, (int, float)) for x in value
+            ):
+                return value
+            raise TypeError(value)
+
+        def describe_parameter(parameter):
+            range_ = parameter.range_
+            if range_ is not None:
+                range_ = (range_.minimum, range_.maximum)
+            return (
+                parameter.name,
+                parameter.value,
+                parameter.parameter_rate.value,
+                parameter.lag,
+                range_,
+                describe_value(parameter.unit),
+            )
+
+        description = [supriya.__version__, extra]
+        try:
+            for ugen in ugens:
+                if isinstance(ugen, Parameter):
+                    description.append(("Parameter", describe_parameter(ugen)))
+                    continue
+                elif not isinstance(ugen, UGen):
+                    return None
+                inputs = []
+                for input_ in ugen._inputs:
+                    if isinstance(input_, OutputProxy):
+                        inputs.append((indices[id(input_.source)], input_.output_index))
+                    else:
+                        inputs.append(input_)
+                cls = type(ugen)
+                item = [
+                    cls.__module__,
+                    cls.__qualname__,
+                    ugen._special_index,
+                    tuple(inputs),
+                    tuple(
+                        (key, describe_value(value))
+                        for key, value in sorted(getattr(ugen, "__dict__", {}).items())
+                    ),
+                ]
+                if isinstance(ugen, Control):
+                    item.append(tuple(describe_parameter(x) for x in ugen.parameters))
+                description.append(tuple(item))
+        except (KeyError, TypeError):
+            return None
+        return hashlib.sha1(repr(description).encode()).hexdigest()
+
+    def get(self, key):
+        """
+        Gets the entry at ``key``, or none.
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                data = self._read(key)
+            else:
+                self._entries.move_to_end(key)
+            value = None if data is None else self._decode(data)
+            if value is None:
+                self._entries.pop(key, None)
+                self._misses += 1
+            else:
+                self._store(key, data)
+                self._hits += 1
+            return value
+
+    def info(self):
+        """
+        Gets cache statistics.
+        """
+        with self._lock:
+            return SynthDefCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maximum_size=self.maximum_size,
+            )
+
+    def set(self, key, value):
+        """
+        Sets the entry at ``key`` to ``value``.
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._store(key, data)
+            self._write(key, data)
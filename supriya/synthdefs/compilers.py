@@ -73,7 +73,7 @@ class SynthDefCompiler(SupriyaObject):
         return result
 
     @staticmethod
-    def compile_ugen(ugen, synthdef):
+    def compile_ugen(ugen, synthdef, constant_indices=None, ugen_indices=None):
         outputs = ugen._get_outputs()
         result = []
         result.append(SynthDefCompiler.encode_string(type(ugen).__name__))
@@ -84,7 +84,14 @@ class SynthDefCompiler(SupriyaObject):
             SynthDefCompiler.encode_unsigned_int_16bit(int(ugen.special_index))
         )
         for input_ in ugen.inputs:
-            result.append(SynthDefCompiler.compile_ugen_input_spec(input_, synthdef))
+            result.append(
+                SynthDefCompiler.compile_ugen_input_spec(
+                    input_,
+                    synthdef,
+                    constant_indices=constant_indices,
+                    ugen_indices=ugen_indices,
+                )
+            )
         for output in outputs:
             result.append(SynthDefCompiler.encode_unsigned_int_8bit(output))
         result = bytes().join(result)
@@ -100,25 +107,43 @@ class SynthDefCompiler(SupriyaObject):
             result.append(SynthDefCompiler.encode_float(constant))
         result.append(SynthDefCompiler.compile_parameters(synthdef))
         result.append(SynthDefCompiler.encode_unsigned_int_32bit(len(synthdef.ugens)))
-        for ugen_index, ugen in enumerate(synthdef.ugens):
-            result.append(SynthDefCompiler.compile_ugen(ugen, synthdef))
+        # Index lookups up front, rather than a linear search per input.
+        constant_indices = {x: i for i, x in enumerate(synthdef.constants)}
+        ugen_indices = {x: i for i, x in enumerate(synthdef.ugens)}
+        for ugen in synthdef.ugens:
+            result.append(
+                SynthDefCompiler.compile_ugen(
+                    ugen,
+                    synthdef,
+                    constant_indices=constant_indices,
+                    ugen_indices=ugen_indices,
+                )
+            )
         result.append(SynthDefCompiler.encode_unsigned_int_16bit(0))
         result = bytes().join(result)
         return result
 
     @staticmethod
-    def compile_ugen_input_spec(input_, synthdef):
+    def compile_ugen_input_spec(
+        input_, synthdef, constant_indices=None, ugen_indices=None
+    ):
         import supriya.synthdefs
 
         result = []
         if isinstance(input_, float):
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(0xFFFFFFFF))
-            constant_index = synthdef._constants.index(input_)
+            if constant_indices is not None:
+                constant_index = constant_indices[input_]
+            else:
+                constant_index = synthdef._constants.index(input_)
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(constant_index))
         elif isinstance(input_, supriya.synthdefs.OutputProxy):
             ugen = input_.source
             output_index = input_.output_index
-            ugen_index = synthdef._ugens.index(ugen)
+            if ugen_indices is not None:
+                ugen_index = ugen_indices[ugen]
+            else:
+                ugen_index = synthdef._ugens.index(ugen)
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(ugen_index))
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(output_index))
         else:
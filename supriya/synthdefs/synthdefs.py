@@ -3,7 +3,6 @@ import copy
 import hashlib
 import os
 import pathlib
-import shutil
 import subprocess
 import tempfile
 
@@ -19,6 +18,7 @@ from supriya import (
 from supriya.system import SupriyaObject
 
 from .bases import BinaryOpUGen, UGen, UnaryOpUGen, WidthFirstUGen
+from .caches import SynthDefCache
 from .compilers import SynthDefCompiler
 from .controls import AudioControl, Control, LagControl, Parameter, TrigControl
 from .grapher import SynthDefGrapher
@@ -91,6 +91,19 @@ class SynthDef:
 
     def __init__(self, ugens, name=None, optimize=True, parameter_names=None, **kwargs):
         self._name = name
+        ugens = list(ugens)
+        cache = SynthDefCache.default()
+        key = cache.fingerprint(
+            ugens,
+            type(self).__name__,
+            bool(optimize),
+            tuple(parameter_names) if parameter_names else None,
+        )
+        if key is not None:
+            state = cache.get(key)
+            if state is not None:
+                self._set_state(state)
+                return
         ugens = list(copy.deepcopy(ugens))
         assert all(isinstance(_, UGen) for _ in ugens)
         ugens = self._cleanup_pv_chains(ugens)
@@ -105,6 +118,8 @@ class SynthDef:
             self._control_ugens, parameter_names=parameter_names
         )
         self._compiled_ugen_graph = SynthDefCompiler.compile_ugen_graph(self)
+        if key is not None:
+            cache.set(key, self._get_state())
 
     ### SPECIAL METHODS ###
 
@@ -304,46 +319,10 @@ class SynthDef:
 
     @staticmethod
     def _allocate_synthdefs(synthdefs, server):
-        # TODO: Should sync be configurable here?
-        import supriya.commands
+        import supriya.realtime
 
-        d_recv_synthdef_groups = []
-        d_recv_synth_group = []
-        current_total = 0
-        d_load_synthdefs = []
-        if not synthdefs:
-            return
-        for synthdef in synthdefs:
-            # synthdef._register_with_local_server(server=server)
-            compiled = synthdef.compile()
-            if 8192 < len(compiled):
-                d_load_synthdefs.append(synthdef)
-            elif current_total + len(compiled) < 8192:
-                d_recv_synth_group.append(synthdef)
-                current_total += len(compiled)
-            else:
-                d_recv_synthdef_groups.append(d_recv_synth_group)
-                d_recv_synth_group = [synthdef]
-                current_total = len(compiled)
-        if d_recv_synth_group:
-            d_recv_synthdef_groups.append(d_recv_synth_group)
-        for d_recv_synth_group in d_recv_synthdef_groups:
-            d_recv_request = supriya.commands.SynthDefReceiveRequest(
-                synthdefs=tuple(d_recv_synth_group)
-            )
-            d_recv_request.communicate(server=server, sync=True)
-        if d_load_synthdefs:
-            temp_directory_path = tempfile.mkdtemp()
-            for synthdef in d_load_synthdefs:
-                file_name = "{}.scsyndef".format(synthdef.actual_name)
-                file_path = os.path.join(temp_directory_path, file_name)
-                with open(file_path, "wb") as file_pointer:
-                    file_pointer.write(synthdef.compile())
-            d_load_dir_request = supriya.commands.SynthDefLoadDirectoryRequest(
-                directory_path=temp_directory_path
-            )
-            d_load_dir_request.communicate(server=server, sync=True)
-            shutil.rmtree(temp_directory_path)
+        server = server or supriya.realtime.Server.default()
+        server.synthdef_library.allocate(synthdefs)
 
     @staticmethod
     def _build_control_mapping(parameters):
@@ -491,13 +470,11 @@ class SynthDef:
 
     @staticmethod
     def _collect_constants(ugens):
-        constants = []
+        constants = {}
         for ugen in ugens:
             for input_ in ugen._inputs:
-                if not isinstance(input_, float):
-                    continue
-                if input_ not in constants:
-                    constants.append(input_)
+                if isinstance(input_, float):
+                    constants.setdefault(input_, None)
         return tuple(constants)
 
     @staticmethod
@@ -531,6 +508,15 @@ class SynthDef:
         parameters = tuple(sorted(parameters, key=lambda x: x.name))
         return ugens, parameters
 
+    def _get_state(self):
+        return (
+            self._ugens,
+            self._constants,
+            self._control_ugens,
+            self._indexed_parameters,
+            self._compiled_ugen_graph,
+        )
+
     @staticmethod
     def _initialize_topological_sort(ugens):
         ugens = list(ugens)
@@ -540,12 +526,8 @@ class SynthDef:
             sort_bundles[ugen] = UGenSortBundle(ugen, width_first_antecedents)
             if isinstance(ugen, WidthFirstUGen):
                 width_first_antecedents.append(ugen)
-        for ugen in ugens:
-            sort_bundle = sort_bundles[ugen]
+        for sort_bundle in sort_bundles.values():
             sort_bundle._initialize_topological_sort(sort_bundles)
-            sort_bundle.descendants[:] = sorted(
-                sort_bundles[ugen].descendants, key=lambda x: ugens.index(ugen)
-            )
         return sort_bundles
 
     @staticmethod
@@ -559,8 +541,7 @@ class SynthDef:
         import supriya.realtime
 
         server = server or supriya.realtime.Server.default()
-        synthdef_name = self.actual_name
-        server._synthdefs[synthdef_name] = self
+        server.synthdef_library._register(self)
 
     @staticmethod
     def _remap_controls(ugens, control_mapping):
@@ -572,18 +553,53 @@ class SynthDef:
                     inputs[i] = output_proxy
             ugen._inputs = tuple(inputs)
 
+    def _set_state(self, state):
+        (
+            self._ugens,
+            self._constants,
+            self._control_ugens,
+            self._indexed_parameters,
+            self._compiled_ugen_graph,
+        ) = state
+
     @staticmethod
     def _sort_ugens_topologically(ugens):
-        sort_bundles = SynthDef._initialize_topological_sort(ugens)
-        available_ugens = []
-        for ugen in reversed(ugens):
-            sort_bundles[ugen]._make_available(available_ugens)
+        """
+        Sorts ``ugens`` depth-first, preferring earlier ugens.
+
+        Works over ugen positions rather than sort bundles: each ugen's
+        descendants are listed in ugen order, and it becomes available once its
+        count of unscheduled antecedents reaches zero. Width-first ugens precede
+        every ugen after them.
+        """
+        ugens = list(ugens)
+        positions = {ugen: i for i, ugen in enumerate(ugens)}
+        antecedent_counts = [0] * len(ugens)
+        descendants = [[] for _ in ugens]
+        width_first_positions = []
+        for i, ugen in enumerate(ugens):
+            antecedent_positions = set()
+            for input_ in ugen._inputs:
+                if isinstance(input_, OutputProxy):
+                    input_ = input_.source
+                elif not isinstance(input_, UGen):
+                    continue
+                antecedent_positions.add(positions[input_])
+            antecedent_positions.update(width_first_positions)
+            for position in antecedent_positions:
+                descendants[position].append(i)
+            antecedent_counts[i] = len(antecedent_positions)
+            if isinstance(ugen, WidthFirstUGen):
+                width_first_positions.append(i)
+        available = [i for i in reversed(range(len(ugens))) if not antecedent_counts[i]]
         out_stack = []
-        while available_ugens:
-            available_ugen = available_ugens.pop()
-            sort_bundles[available_ugen]._schedule(
-                available_ugens, out_stack, sort_bundles
-            )
+        while available:
+            i = available.pop()
+            for position in reversed(descendants[i]):
+                antecedent_counts[position] -= 1
+                if not antecedent_counts[position]:
+                    available.append(position)
+            out_stack.append(ugens[i])
         return out_stack
 
     ### PUBLIC METHODS ###
@@ -606,8 +622,7 @@ class SynthDef:
 
         server = server or supriya.realtime.Server.default()
         assert self in server
-        synthdef_name = self.actual_name
-        del server._synthdefs[synthdef_name]
+        server.synthdef_library._unregister(self.actual_name)
         request = supriya.commands.SynthDefFreeRequest(synthdef=self)
         if server.is_running:
             request.communicate(server=server)
@@ -961,49 +976,33 @@ class UGenSortBundle(SupriyaObject):
     ### INITIALIZER ###
 
     def __init__(self, ugen, width_first_antecedents):
-        self.antecedents = []
-        self.descendants = []
+        # Ordered sets, as dicts, so membership tests and removals are constant
+        # time however widely a ugen fans out.
+        self.antecedents = {}
+        self.descendants = {}
         self.ugen = ugen
         self.width_first_antecedents = tuple(width_first_antecedents)
 
     ### PRIVATE METHODS ###
 
     def _initialize_topological_sort(self, sort_bundles):
-        for input_ in self.ugen.inputs:
+        for input_ in self.ugen._inputs:
             if isinstance(input_, OutputProxy):
                 input_ = input_.source
             elif not isinstance(input_, UGen):
                 continue
-            input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
-                self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
+            sort_bundles[input_].descendants[self.ugen] = None
+            self.antecedents[input_] = None
         for input_ in self.width_first_antecedents:
-            input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
-                self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
-
-    def _make_available(self, available_ugens):
-        if not self.antecedents:
-            if self.ugen not in available_ugens:
-                available_ugens.append(self.ugen)
-
-    def _schedule(self, available_ugens, out_stack, sort_bundles):
-        for ugen in reversed(self.descendants):
-            sort_bundle = sort_bundles[ugen]
-            sort_bundle.antecedents.remove(self.ugen)
-            sort_bundle._make_available(available_ugens)
-        out_stack.append(self.ugen)
+            sort_bundles[input_].descendants[self.ugen] = None
+            self.antecedents[input_] = None
 
     ### PUBLIC METHODS ###
 
     def clear(self):
-        self.antecedents[:] = []
-        self.descendants[:] = []
-        self.width_first_antecedents[:] = []
+        self.antecedents.clear()
+        self.descendants.clear()
+        self.width_first_antecedents = ()
 
 
 class SuperColliderSynthDef(SupriyaObject):
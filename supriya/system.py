@@ -1,12 +1,16 @@
 import abc
+import collections
 import fnmatch
+import functools
+import inspect
+import itertools
 import os
 from typing import List, Optional, Union
 
-import uqbar.objects
-
 import supriya
 
+_missing = object()
+
 
 def _search(pattern: str, root_path: str):
     search_path, pattern = os.path.split(pattern)
@@ -24,6 +28,197 @@ def _search(pattern: str, root_path: str):
     return result
 
 
+@functools.lru_cache(maxsize=None)
+def _get_fields(class_):
+    """
+    Gets the constructor parameters of ``class_`` once per class.
+
+    Returns each parameter's kind, name, default and the attribute names its
+    value may be found under, and whether instances can be subscripted.
+    """
+    if class_.__new__ is not object.__new__:
+        signature = inspect.signature(class_.__new__)
+    elif class_.__init__ is not object.__init__:
+        signature = inspect.signature(class_.__init__)
+    else:
+        return None, False
+    fields = []
+    for i, (name, parameter) in enumerate(signature.parameters.items()):
+        if i == 0 and name in ("self", "cls", "class_", "klass"):
+            continue
+        fields.append((parameter.kind, name, parameter.default, (name, "_" + name)))
+    return tuple(fields), hasattr(class_, "__getitem__")
+
+
+def get_vars(expr):
+    """
+    Gets ``args``, ``var args`` and ``kwargs`` for an object ``expr``.
+
+    Behaves like ``uqbar.objects.get_vars()``, but only inspects the
+    signature of each class once.
+
+    ::
+
+        >>> import supriya.system
+        >>> supriya.system.get_vars(supriya.patterns.Pseq([1, 2], 3))
+        (OrderedDict([('sequence', (1, 2))]), [], {'repetitions': 3})
+
+    """
+    fields, subscriptable = _get_fields(type(expr))
+    if fields is None:
+        return {}, [], {}
+    args = collections.OrderedDict()
+    var_args = []
+    kwargs = {}
+    if expr is None:
+        return args, var_args, kwargs
+    for kind, name, default, attributes in fields:
+        if kind is inspect.Parameter.POSITIONAL_ONLY:
+            value = getattr(expr, name, _missing)
+            if value is _missing:
+                value = expr[name]
+            args[name] = value
+        elif (
+            kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+            or kind is inspect.Parameter.KEYWORD_ONLY
+        ):
+            for attribute in attributes:
+                value = getattr(expr, attribute, _missing)
+                if value is not _missing:
+                    break
+                elif subscriptable:
+                    try:
+                        value = expr[attribute]
+                        break
+                    except (KeyError, TypeError):
+                        pass
+            if value is _missing:
+                raise ValueError("Cannot find value for {!r}".format(name))
+            if default is inspect.Parameter.empty:
+                args[name] = value
+            elif default != value:
+                kwargs[name] = value
+        elif kind is inspect.Parameter.VAR_POSITIONAL:
+            if subscriptable:
+                try:
+                    value = expr[:]
+                except TypeError:
+                    value = getattr(expr, name)
+            else:
+                value = getattr(expr, name)
+            if value:
+                var_args.extend(value)
+        elif kind is inspect.Parameter.VAR_KEYWORD:
+            items = {}
+            if hasattr(expr, "items"):
+                items = expr.items()
+            else:
+                for attribute in attributes:
+                    mapping = getattr(expr, attribute, _missing)
+                    if mapping is not _missing:
+                        if not isinstance(mapping, dict):
+                            mapping = dict(mapping)
+                        items = mapping.items()
+                        break
+            for key, value in items:
+                if key not in args:
+                    kwargs[key] = value
+    return args, var_args, kwargs
+
+
+def get_repr(expr, multiline=None):
+    """
+    Builds a repr string for ``expr`` from its vars and signature.
+
+    Behaves like ``uqbar.objects.get_repr()``, using ``get_vars()``.
+    """
+    fields, _ = _get_fields(type(expr))
+    if fields is None:
+        return "{}()".format(type(expr).__name__)
+    defaults = {
+        name: default
+        for _, name, default, _ in fields
+        if default is not inspect.Parameter.empty
+    }
+    args, var_args, kwargs = get_vars(expr)
+    has_lines = bool(multiline)
+    parts = []
+    for value in itertools.chain(args.values(), var_args):
+        part = _format(value)
+        if "\n" in part:
+            has_lines = True
+        parts.append(part)
+    for key, value in sorted(kwargs.items()):
+        if key in defaults and value == defaults[key]:
+            continue
+        parts.append("{}={}".format(key, _format(value)))
+        has_lines = True
+    if has_lines and parts and multiline is not False:
+        parts = [
+            "\n".join("    " + line for line in part.split("\n")) for part in parts
+        ]
+        parts.append("    )")
+        return "{}(\n{}".format(type(expr).__name__, ",\n".join(parts))
+    return "{}({})".format(type(expr).__name__, ", ".join(parts))
+
+
+def new(expr, *args, **kwargs):
+    """
+    Templates an object.
+
+    Behaves like ``uqbar.objects.new()``, using ``get_vars()``.
+
+    ::
+
+        >>> import supriya.system
+        >>> pattern = supriya.patterns.Pseq([1, 2], 3)
+        >>> supriya.system.new(pattern, repetitions=None)
+        Pseq(
+            (1, 2),
+            repetitions=None,
+            )
+
+    """
+    current_args, current_var_args, current_kwargs = get_vars(expr)
+    new_kwargs = current_kwargs.copy()
+    recursive_arguments = {}
+    for key in tuple(kwargs):
+        if "__" in key:
+            value = kwargs.pop(key)
+            key, _, subkey = key.partition("__")
+            recursive_arguments.setdefault(key, []).append((subkey, value))
+    for key, pairs in recursive_arguments.items():
+        recursed_object = current_args.get(key, current_kwargs.get(key))
+        if recursed_object is None:
+            continue
+        kwargs[key] = new(recursed_object, **dict(pairs))
+    if args:
+        current_var_args = args
+    for key, value in kwargs.items():
+        if key in current_args:
+            current_args[key] = value
+        else:
+            new_kwargs[key] = value
+    new_args = list(current_args.values()) + list(current_var_args)
+    return type(expr)(*new_args, **new_kwargs)
+
+
+def _format(expr):
+    if not isinstance(expr, (list, tuple)):
+        return repr(expr)
+    if all(isinstance(x, (bool, int, float, str, type(None))) for x in expr):
+        result = repr(expr)
+        if len(result) < 50:
+            return result
+    braces = "[]" if isinstance(expr, list) else "()"
+    lines = [braces[0]]
+    for x in expr:
+        lines.extend("    " + line for line in repr(x).splitlines())
+        lines[-1] += ","
+    lines.append("    " + braces[1])
+    return "\n".join(lines)
+
+
 class _AssetsMeta(abc.ABCMeta):
 
     root_path: str = supriya.__path__[0]  # type: ignore
@@ -54,7 +249,7 @@ class SupriyaObject(metaclass=abc.ABCMeta):
     ### SPECIAL METHODS ###
 
     def __repr__(self):
-        return uqbar.objects.get_repr(self, multiline=True)
+        return get_repr(self, multiline=True)
 
 
 class SupriyaValueObject(SupriyaObject):
@@ -66,18 +261,18 @@ class SupriyaValueObject(SupriyaObject):
     ### SPECIAL METHODS ###
 
     def __copy__(self, *args):
-        return uqbar.objects.new(self)
+        return new(self)
 
     def __eq__(self, expr):
-        self_values = type(self), uqbar.objects.get_vars(self)
+        self_values = type(self), get_vars(self)
         try:
-            expr_values = type(expr), uqbar.objects.get_vars(expr)
+            expr_values = type(expr), get_vars(expr)
         except AttributeError:
             expr_values = type(expr), expr
         return self_values == expr_values
 
     def __hash__(self):
-        args, var_args, kwargs = uqbar.objects.get_vars(self)
+        args, var_args, kwargs = get_vars(self)
         hash_values = [type(self)]
         hash_values.append(tuple(args.items()))
         hash_values.append(tuple(var_args))
@@ -0,0 +1,90 @@
+import queue
+import random
+from typing import NamedTuple, Optional
+
+import pytest
+
+from supriya.clock.eventqueue import EventQueue
+
+
+class Event(NamedTuple):
+    seconds: float
+    event_type: int
+    event_id: int
+    offset: Optional[float] = None
+
+
+def drain(event_queue):
+    items = []
+    while event_queue.qsize():
+        items.append(event_queue.get())
+    return items
+
+
+@pytest.fixture
+def events():
+    random_ = random.Random(0)
+    return [Event(random_.random() * 100, 1, event_id) for event_id in range(500)]
+
+
+def test_get(events):
+    event_queue = EventQueue()
+    for event in events:
+        event_queue.put(event)
+    assert event_queue.qsize() == len(events)
+    assert event_queue.peek() == min(events)
+    assert drain(event_queue) == sorted(events)
+    with pytest.raises(queue.Empty):
+        event_queue.peek()
+
+
+def test_remove(events):
+    event_queue = EventQueue()
+    for event in events:
+        event_queue.put(event)
+    removed = events[::3]
+    for event in removed:
+        assert event_queue.remove(event) == event
+        assert event_queue.remove(event) is None
+    assert drain(event_queue) == sorted(set(events) - set(removed))
+
+
+def test_replace(events):
+    event_queue = EventQueue()
+    for event in events:
+        event_queue.put(event)
+    replaced = [event._replace(seconds=100 - event.seconds) for event in events[::2]]
+    for event in replaced:
+        event_queue.put(event)
+    assert drain(event_queue) == sorted(replaced + events[1::2])
+
+
+def test_retime(events):
+    event_queue = EventQueue()
+    for event in events:
+        event_queue.put(event)
+    event_ids = [event.event_id for event in events[::2]] + [len(events)]
+    retimed = event_queue.retime(event_ids, lambda x: x._replace(seconds=x.seconds / 2))
+    assert len(retimed) == len(events[::2])
+    assert event_queue.remove(retimed[0]) == retimed[0]
+    assert drain(event_queue) == sorted(retimed[1:] + events[1::2])
+
+
+def test_offset_to_seconds(events):
+    state = {"seconds_per_offset": 1.0}
+
+    def offset_to_seconds(offset):
+        return offset * state["seconds_per_offset"]
+
+    event_queue = EventQueue(offset_to_seconds=offset_to_seconds)
+    offset_events = [
+        Event(event.seconds, 1, event.event_id, offset=event.seconds)
+        for event in events[::2]
+    ]
+    for event in offset_events + events[1::2]:
+        event_queue.put(event)
+    state["seconds_per_offset"] = 0.5
+    expected = [
+        event._replace(seconds=event.offset / 2) for event in offset_events
+    ] + events[1::2]
+    assert drain(event_queue) == sorted(expected)
@@ -0,0 +1,108 @@
+import pytest
+
+from supriya.clock import OfflineTempoClock, TimeUnit
+from supriya.provider import Provider
+
+
+def callback(
+    current_moment,
+    desired_moment,
+    event,
+    store,
+    delta=0.25,
+    limit=4,
+    time_unit=TimeUnit.BEATS,
+    **kwargs,
+):
+    store.append((current_moment, desired_moment))
+    if limit is None or event.invocations < limit:
+        return delta, time_unit
+    return None
+
+
+def summarize(store):
+    return [
+        (
+            "{}/{}".format(*desired_moment.time_signature),
+            desired_moment.beats_per_minute,
+            desired_moment.measure,
+            desired_moment.offset,
+            desired_moment.seconds,
+            current_moment.seconds,
+        )
+        for current_moment, desired_moment in store
+    ]
+
+
+def test_basic():
+    store = []
+    clock = OfflineTempoClock()
+    clock.schedule(callback, schedule_at=0.0, args=[store])
+    clock.start()
+    assert clock.run() == 5
+    assert summarize(store) == [
+        ("4/4", 120.0, 1, 0.0, 0.0, 0.0),
+        ("4/4", 120.0, 1, 0.25, 0.5, 0.5),
+        ("4/4", 120.0, 1, 0.5, 1.0, 1.0),
+        ("4/4", 120.0, 1, 0.75, 1.5, 1.5),
+        ("4/4", 120.0, 2, 1.0, 2.0, 2.0),
+    ]
+    assert clock.get_current_time() == 2.0
+    assert clock.event_count == 5
+    assert clock.events_per_second > 0
+
+
+def test_not_started():
+    clock = OfflineTempoClock()
+    with pytest.raises(RuntimeError):
+        clock.run()
+
+
+def test_run_until():
+    store_one, store_two = [], []
+    clock_one, clock_two = OfflineTempoClock(), OfflineTempoClock()
+    for clock, store in [(clock_one, store_one), (clock_two, store_two)]:
+        clock.schedule(callback, schedule_at=0.0, args=[store], kwargs={"limit": 64})
+        clock.schedule_change(schedule_at=3.0, beats_per_minute=90)
+        clock.schedule_change(schedule_at=2, time_signature=(3, 4))
+        clock.start()
+    assert clock_one.run() == 65
+    for until in range(1, 40):
+        clock_two.run(until=until / 2)
+        assert clock_two.get_current_time() == until / 2
+    clock_two.run()
+    assert summarize(store_one) == summarize(store_two)
+    assert [x[1] for x in summarize(store_one)[:14]] == [120.0] * 12 + [90.0] * 2
+    assert summarize(store_one)[12] == ("3/4", 90.0, 4, 3.0, 6.0, 6.0)
+
+
+def test_stop():
+    store = []
+    clock = OfflineTempoClock()
+
+    def stopping_callback(current_moment, desired_moment, event):
+        store.append(desired_moment.seconds)
+        if event.invocations == 3:
+            clock.stop()
+        return 1.0
+
+    clock.cue(stopping_callback)
+    clock.start(initial_time=10.0)
+    assert clock.run() == 4
+    assert store == [10.0, 12.0, 14.0, 16.0]
+    assert not clock.is_running
+
+
+def test_nonrealtime_provider():
+    provider = Provider.nonrealtime()
+
+    def procedure(current_moment, desired_moment, event):
+        with provider.at(desired_moment.seconds):
+            provider.add_synth(duration=0.5, frequency=440 + event.invocations)
+        return 0.25
+
+    clock = OfflineTempoClock()
+    clock.cue(procedure)
+    clock.start()
+    assert clock.run(until=600) == 1201
+    assert len(provider.session.nodes) == 1201
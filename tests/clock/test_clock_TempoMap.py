@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from supriya import conversions
+from supriya.clock.ephemera import ClockState
+from supriya.clock.tempomap import TempoMap
+
+
+@pytest.fixture
+def state():
+    return ClockState(
+        beats_per_minute=120.0,
+        initial_seconds=0.0,
+        previous_measure=1,
+        previous_offset=0.0,
+        previous_seconds=0.0,
+        previous_time_signature_change_offset=0.0,
+        time_signature=(4, 4),
+    )
+
+
+def test_single_segment(state):
+    state = state._replace(
+        beats_per_minute=135.0,
+        previous_measure=3,
+        previous_offset=1.75,
+        previous_seconds=3.25,
+        previous_time_signature_change_offset=1.5,
+        time_signature=(7, 8),
+    )
+    tempo_map = TempoMap(state)
+    random_ = random.Random(0)
+    offsets = [random_.random() * 20 + 1.75 for _ in range(100)]
+    for offset in offsets:
+        assert tempo_map.offset_to_seconds(offset) == conversions.offset_to_seconds(
+            beats_per_minute=135.0,
+            current_offset=offset,
+            previous_offset=1.75,
+            previous_seconds=3.25,
+            beat_duration=1 / 8,
+        )
+        assert tempo_map.offset_to_measure(offset) == (
+            conversions.offset_to_measure(offset, (7, 8), 3, 1.5),
+            conversions.offset_to_measure_offset(offset, (7, 8), 1.5),
+        )
+    for measure in range(3, 20):
+        expected = conversions.measure_to_offset(measure, (7, 8), 3, 1.5)
+        assert tempo_map.measure_to_offset(measure) == expected
+    seconds = tempo_map.offsets_to_seconds(offsets)
+    assert seconds == [tempo_map.offset_to_seconds(x) for x in offsets]
+    assert tempo_map.seconds_to_offsets(seconds) == [
+        tempo_map.seconds_to_offset(x) for x in seconds
+    ]
+
+
+def test_segments(state):
+    tempo_map = TempoMap(state)
+    # Moving along the current segment changes nothing
+    tempo_map.update(state._replace(previous_offset=0.5, previous_seconds=1.0))
+    assert tempo_map._tempo_offsets == [0.0]
+    tempo_map.update(
+        state._replace(beats_per_minute=60.0, previous_offset=1.0, previous_seconds=2.0)
+    )
+    tempo_map.update(
+        state._replace(
+            beats_per_minute=60.0,
+            previous_measure=3,
+            previous_offset=2.0,
+            previous_seconds=6.0,
+            previous_time_signature_change_offset=2.0,
+            time_signature=(3, 8),
+        )
+    )
+    assert tempo_map._tempo_offsets == [0.0, 1.0, 2.0]
+    assert tempo_map._meter_offsets == [0.0, 2.0]
+    assert tempo_map.offsets_to_seconds([0.5, 1.5, 2.0, 2.5]) == [1.0, 4.0, 6.0, 10.0]
+    assert tempo_map.seconds_to_offsets([1.0, 4.0, 6.0, 10.0]) == [0.5, 1.5, 2.0, 2.5]
+    offsets = [0.0, 1.0, 1.5, 2.0, 2.375]
+    assert tempo_map.offsets_to_measures(offsets) == [1, 2, 2, 3, 4]
+    assert tempo_map.measures_to_offsets([1, 2, 3, 4]) == [0.0, 1.0, 2.0, 2.375]
+    assert tempo_map.get_beats_per_minute(0.5) == 120.0
+    assert tempo_map.get_time_signature(2.0) == (3, 8)
+    # Changing before later segments discards them
+    tempo_map.update(
+        state._replace(
+            beats_per_minute=240.0, previous_offset=1.0, previous_seconds=2.0
+        )
+    )
+    assert tempo_map._tempo_offsets == [0.0, 1.0]
+    assert tempo_map.offset_to_seconds(2.0) == 3.0
@@ -0,0 +1,91 @@
+import types
+
+import pytest
+
+import supriya
+from supriya.commands import (
+    BufferAllocateRequest,
+    BufferGetRequest,
+    BufferQueryRequest,
+    ControlBusGetRequest,
+    ControlBusSetRequest,
+    NodeSetRequest,
+    RequestPipeline,
+)
+from supriya.osc import OscBundle, OscMessage
+
+
+def test_communicate(server):
+    requests = [
+        BufferAllocateRequest(buffer_id=i, frame_count=8 * (i + 1)) for i in range(4)
+    ]
+    responses = RequestPipeline(contents=requests).communicate(server=server)
+    assert [response.action for response in responses] == [
+        ("/b_alloc", i) for i in range(4)
+    ]
+    ControlBusSetRequest(index_value_pairs=[(0, 0.25), (1, 0.5)]).communicate(
+        server=server
+    )
+    requests = [BufferQueryRequest(buffer_ids=[i]) for i in reversed(range(4))]
+    requests.extend(ControlBusGetRequest(indices=[i]) for i in range(2))
+    requests.append(BufferGetRequest(buffer_id=0, indices=[99]))
+    requests.append(NodeSetRequest(1, foo=1))
+    responses = RequestPipeline(contents=requests).communicate(server=server)
+    assert [response.items[0].frame_count for response in responses[:4]] == [
+        32,
+        24,
+        16,
+        8,
+    ]
+    assert [response.items[0].bus_value for response in responses[4:6]] == [
+        0.25,
+        0.5,
+    ]
+    assert isinstance(responses[6], supriya.commands.FailResponse)
+    assert responses[7] is None
+
+
+def test_communicate_timeout(server):
+    requests = [BufferQueryRequest(buffer_ids=[0]), NodeSetRequest(1, foo=1)]
+    responses = RequestPipeline(contents=requests).communicate(
+        server=server, timeout=0.0
+    )
+    assert responses == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_communicate_async():
+    server = supriya.realtime.AsyncServer()
+    await server.boot()
+    try:
+        requests = [BufferQueryRequest(buffer_ids=[i]) for i in range(8)]
+        responses = await RequestPipeline(contents=requests).communicate_async(
+            server=server
+        )
+        assert [response.items[0].buffer_id for response in responses] == list(range(8))
+    finally:
+        await server.quit()
+
+
+def test_requestable():
+    server = types.SimpleNamespace(next_sync_id=3)
+    request_pipeline = RequestPipeline(
+        contents=[BufferQueryRequest(buffer_ids=[0]), NodeSetRequest(1, foo=1)]
+    )
+    (
+        success_pattern,
+        failure_pattern,
+        requestable,
+    ) = request_pipeline._get_response_patterns_and_requestable(server)
+    assert success_pattern == ["/synced", 3]
+    assert failure_pattern is None
+    assert requestable.to_list() == [
+        ["/b_query", 0],
+        ["/n_set", 1, "foo", 1],
+        ["/sync", 3],
+    ]
+    assert request_pipeline.to_datagram() == (
+        OscBundle(
+            contents=[OscMessage("/b_query", 0), OscMessage("/n_set", 1, "foo", 1)]
+        ).to_datagram()
+    )
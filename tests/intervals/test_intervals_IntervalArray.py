@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from supriya.intervals import Interval, IntervalTree
+
+numpy = pytest.importorskip("numpy")
+
+
+def make_random_intervals(count=200, range_=50, seed=0):
+    random_ = random.Random(seed)
+    intervals = []
+    for _ in range(count):
+        start_offset = random_.randrange(range_) / 2
+        stop_offset = start_offset + random_.randrange(range_) / 2
+        intervals.append(Interval(start_offset, stop_offset))
+    return intervals
+
+
+def test_bulk_build():
+    intervals = make_random_intervals()
+    bulk_tree = IntervalTree(intervals, accelerated=False)
+    incremental_tree = IntervalTree(accelerated=False)
+    for interval in intervals:
+        incremental_tree.add(interval)
+    assert list(bulk_tree) == list(incremental_tree)
+    assert bulk_tree[:] == incremental_tree[:]
+    assert abs(bulk_tree._root_node.balance) <= 1
+    assert bulk_tree.latest_stop_offset == incremental_tree.latest_stop_offset
+    for interval in intervals[:50]:
+        bulk_tree.remove(interval)
+        incremental_tree.remove(interval)
+    bulk_tree.update(intervals[:25])
+    for interval in intervals[:25]:
+        incremental_tree.add(interval)
+    assert list(bulk_tree) == list(incremental_tree)
+    for interval in intervals[:10]:
+        assert bulk_tree.index(interval) == incremental_tree.index(interval)
+
+
+def test_find_intersections():
+    interval_tree = IntervalTree(make_random_intervals(), accelerated=False)
+    offsets = [x / 4 for x in range(-4, 204)]
+    expected = [interval_tree.find_intersection(offset) for offset in offsets]
+    assert interval_tree.find_intersections(offsets) == expected
+    assert interval_tree._interval_array is not None
+    interval_tree.add(Interval(10, 11))
+    assert interval_tree._interval_array is None
+    expected = [interval_tree.find_intersection(offset) for offset in offsets]
+    assert interval_tree.find_intersections(numpy.array(offsets)) == expected
+
+
+def test_iterate_sweep():
+    intervals = make_random_intervals()
+    interval_tree = IntervalTree(intervals, accelerated=False)
+    sweep = list(interval_tree.iterate_sweep())
+    assert [offset for offset, _, _ in sweep] == list(interval_tree.all_offsets)
+    for offset, starting, stopping in sweep:
+        assert list(starting) == interval_tree.find_intervals_starting_at(offset)
+        assert list(stopping) == interval_tree.find_intervals_stopping_at(offset)
@@ -0,0 +1,69 @@
+import pickle
+import random
+
+import pytest
+
+from supriya.nonrealtime.mappings import PersistentMapping
+
+
+class Key:
+    """
+    A key whose hash collides with every other key's.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, expr):
+        return isinstance(expr, type(self)) and self.name == expr.name
+
+    def __hash__(self):
+        return 0
+
+    def __repr__(self):
+        return "Key({!r})".format(self.name)
+
+
+@pytest.mark.parametrize("make_key", [int, str, Key])
+def test_random_operations(make_key):
+    random_ = random.Random(0)
+    mapping, expected = PersistentMapping(), {}
+    snapshots = []
+    for i in range(2000):
+        key = make_key(random_.randrange(200))
+        if random_.random() < 0.4 and key in expected:
+            del mapping[key]
+            del expected[key]
+        else:
+            mapping[key] = i
+            expected[key] = i
+        if not i % 100:
+            snapshots.append((mapping.copy(), dict(expected)))
+    for snapshot, snapshot_expected in snapshots + [(mapping, expected)]:
+        assert dict(snapshot) == snapshot_expected
+        assert len(snapshot) == len(snapshot_expected)
+        assert snapshot == PersistentMapping(snapshot_expected)
+        assert snapshot == snapshot_expected
+
+
+def test_copy():
+    mapping_one = PersistentMapping({i: i for i in range(100)})
+    mapping_two = mapping_one.copy()
+    for i in range(50):
+        del mapping_two[i]
+        mapping_one[i + 100] = i
+    assert sorted(mapping_one) == list(range(150))
+    assert sorted(mapping_two) == list(range(50, 100))
+    assert mapping_one != mapping_two
+
+
+def test_delete_missing():
+    mapping = PersistentMapping({"a": 1})
+    with pytest.raises(KeyError):
+        del mapping["b"]
+    assert mapping == {"a": 1}
+
+
+def test_pickle():
+    mapping = PersistentMapping({Key("a"): 1, Key("b"): 2, "c": 3})
+    assert pickle.loads(pickle.dumps(mapping)) == mapping
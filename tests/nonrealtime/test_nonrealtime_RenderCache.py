@@ -0,0 +1,161 @@
+import pathlib
+import sys
+
+import pytest
+
+import supriya.nonrealtime
+
+fake_scsynth = """#!{executable}
+import pathlib, sys
+output_path = pathlib.Path(sys.argv[4])
+output_path.write_bytes(output_path.name.encode())
+with open({log_path!r}, "a") as file_pointer:
+    print(output_path.name, file=file_pointer)
+"""
+
+
+def build_session(duration=2):
+    stem = supriya.nonrealtime.Session()
+    with stem.at(0):
+        stem.add_synth(duration=2)
+    session = supriya.nonrealtime.Session()
+    with session.at(0):
+        session.cue_soundfile(stem, duration=duration)
+    return session
+
+
+def test_store_fetch_evict(tmpdir):
+    directory_path = pathlib.Path(tmpdir)
+    cache = supriya.nonrealtime.RenderCache(directory_path / "cache", maximum_size=25)
+    for name in ("a", "b", "c"):
+        (directory_path / name).write_bytes(b"0123456789")
+    cache.store("a.aiff", directory_path / "a", sample_rate=44100)
+    cache.store("b.aiff", directory_path / "b")
+    assert len(cache) == 2 and cache.size == 20
+    assert cache.get_metadata("a.aiff") == {"sample_rate": 44100}
+    assert cache.fetch("a.aiff", directory_path / "fetched.aiff")
+    assert (directory_path / "fetched.aiff").read_bytes() == b"0123456789"
+    assert not cache.fetch("c.aiff", directory_path / "missing.aiff")
+    cache.store("c.aiff", directory_path / "c")
+    assert "a.aiff" in cache and "c.aiff" in cache and "b.aiff" not in cache
+    assert not (directory_path / "cache" / "b.aiff").exists()
+    assert cache.evict(maximum_size=0) == ["a.aiff", "c.aiff"]
+    assert len(cache) == 0
+    cache.set_key("fingerprint", "a.aiff")
+    assert cache.get_key("fingerprint") == "a.aiff"
+    assert cache.get_key("other") is None
+
+
+def test_render(tmpdir, monkeypatch):
+    directory_path = pathlib.Path(tmpdir)
+    log_path = directory_path / "log.txt"
+    scsynth_path = directory_path / "scsynth"
+    scsynth_path.write_text(
+        fake_scsynth.format(executable=sys.executable, log_path=str(log_path))
+    )
+    scsynth_path.chmod(0o755)
+    cache = supriya.nonrealtime.RenderCache(directory_path / "cache")
+    render_directory_paths = []
+    for i in range(3):
+        render_directory_path = directory_path / "render-{}".format(i)
+        render_directory_path.mkdir()
+        render_directory_paths.append(render_directory_path)
+    exit_code, output_file_path = build_session().render(
+        render_directory_path=render_directory_paths[0],
+        scsynth_path=scsynth_path,
+        render_cache=cache,
+    )
+    assert exit_code == 0
+    assert len(log_path.read_text().splitlines()) == 2
+    assert len(cache) == 2
+    # An equal session renders elsewhere from the cache, without compiling.
+    with monkeypatch.context() as context:
+        context.setattr(
+            supriya.nonrealtime.Session,
+            "_iterate_non_xrefd_request_bundles",
+            pytest.fail,
+        )
+        exit_code, cached_output_file_path = build_session().render(
+            render_directory_path=render_directory_paths[1],
+            scsynth_path=scsynth_path,
+            render_cache=cache,
+        )
+    assert exit_code == 0
+    assert cached_output_file_path.name == output_file_path.name
+    assert cached_output_file_path.read_bytes() == output_file_path.read_bytes()
+    assert len(log_path.read_text().splitlines()) == 2
+    # A changed session renders anew, reusing its unchanged stem.
+    exit_code, _ = build_session(duration=3).render(
+        render_directory_path=render_directory_paths[2],
+        scsynth_path=scsynth_path,
+        render_cache=cache,
+    )
+    assert len(log_path.read_text().splitlines()) == 3
+
+
+def test_render_evicted(tmpdir, monkeypatch):
+    directory_path = pathlib.Path(tmpdir)
+    log_path = directory_path / "log.txt"
+    scsynth_path = directory_path / "scsynth"
+    scsynth_path.write_text(
+        fake_scsynth.format(executable=sys.executable, log_path=str(log_path))
+    )
+    scsynth_path.chmod(0o755)
+    cache = supriya.nonrealtime.RenderCache(directory_path / "cache")
+    render_directory_paths = []
+    for i in range(3):
+        render_directory_path = directory_path / "render-{}".format(i)
+        render_directory_path.mkdir()
+        render_directory_paths.append(render_directory_path)
+    build_session().render(
+        render_directory_path=render_directory_paths[0],
+        scsynth_path=scsynth_path,
+        render_cache=cache,
+    )
+    assert len(log_path.read_text().splitlines()) == 2
+    # Evicting the output once it's been found doesn't lose it.
+    collect_prerender_tuples = (
+        supriya.nonrealtime.SessionRenderer._collect_prerender_tuples
+    )
+
+    def wrapper(self, *args, **kwargs):
+        result = collect_prerender_tuples(self, *args, **kwargs)
+        cache.evict(maximum_size=0)
+        return result
+
+    with monkeypatch.context() as context:
+        context.setattr(
+            supriya.nonrealtime.SessionRenderer, "_collect_prerender_tuples", wrapper
+        )
+        exit_code, output_file_path = build_session().render(
+            render_directory_path=render_directory_paths[1],
+            scsynth_path=scsynth_path,
+            render_cache=cache,
+        )
+    assert exit_code == 0
+    assert output_file_path.read_bytes() == output_file_path.name.encode()
+    assert len(log_path.read_text().splitlines()) == 2
+    # Evicted outputs render anew, along with everything they depend on.
+    cache.evict(maximum_size=0)
+    exit_code, output_file_path = build_session().render(
+        render_directory_path=render_directory_paths[2],
+        scsynth_path=scsynth_path,
+        render_cache=cache,
+    )
+    assert exit_code == 0
+    assert output_file_path.read_bytes() == output_file_path.name.encode()
+    assert len(log_path.read_text().splitlines()) == 4
+    assert len(cache) == 2
+
+
+def test_fingerprint():
+    session = build_session()
+    fingerprint = session._build_fingerprint()
+    assert build_session()._build_fingerprint() == fingerprint
+    with session.at(1):
+        synth = session.add_synth(duration=1)
+    assert session._build_fingerprint() != fingerprint
+    fingerprint = session._build_fingerprint()
+    with session.at(1.5):
+        synth["amplitude"] = 0.5
+    assert session._build_fingerprint() != fingerprint
@@ -0,0 +1,121 @@
+import collections
+import pathlib
+import sys
+
+import pytest
+
+import supriya.nonrealtime
+
+fake_scsynth = """#!{executable}
+import pathlib, sys, time
+_, _, osc_path, input_path, output_path = sys.argv[:5]
+log_path = pathlib.Path({log_path!r})
+if input_path != "_" and not pathlib.Path(input_path).exists():
+    sys.exit(1)
+start_time = time.time()
+for i in range(5):
+    print("nextOSCPacket {{}}".format(i / 5), flush=True)
+    time.sleep(0.05)
+pathlib.Path(output_path).write_bytes(b"")
+with log_path.open("a") as file_pointer:
+    print(osc_path, start_time, time.time(), file=file_pointer)
+"""
+
+
+def test_render_concurrently(tmpdir):
+    directory_path = pathlib.Path(tmpdir)
+    render_directory_path = directory_path / "render"
+    render_directory_path.mkdir()
+    log_path = directory_path / "log.txt"
+    scsynth_path = directory_path / "scsynth"
+    scsynth_path.write_text(
+        fake_scsynth.format(executable=sys.executable, log_path=str(log_path))
+    )
+    scsynth_path.chmod(0o755)
+    session_c = supriya.nonrealtime.Session(name="c")
+    with session_c.at(0):
+        session_c.add_synth(duration=1)
+    session_a = supriya.nonrealtime.Session(input_=session_c, name="a")
+    with session_a.at(0):
+        session_a.add_synth(duration=2)
+    session_b = supriya.nonrealtime.Session(input_=session_c, name="b")
+    with session_b.at(0):
+        session_b.add_synth(duration=3)
+    session = supriya.nonrealtime.Session()
+    with session.at(0):
+        session.cue_soundfile(session_a, duration=4)
+        session.cue_soundfile(session_b, duration=4)
+    exit_code, output_file_path = session.render(
+        render_directory_path=render_directory_path,
+        scsynth_path=scsynth_path,
+        maximum_workers=4,
+    )
+    assert exit_code == 0
+    assert output_file_path.exists()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session, render_directory_path=render_directory_path
+    )
+    renderer._collect_prerender_tuples(session)
+    spans = {}
+    for line in log_path.read_text().splitlines():
+        osc_path, start_time, stop_time = line.split()
+        spans[pathlib.Path(osc_path).stem] = float(start_time), float(stop_time)
+    assert len(spans) == 4
+    c, a, b, top = [
+        spans[renderer.renderable_prefixes[x].name]
+        for x in (session_c, session_a, session_b, session)
+    ]
+    assert c[1] <= a[0] and c[1] <= b[0]
+    assert a[0] < b[1] and b[0] < a[1]
+    assert a[1] <= top[0] and b[1] <= top[0]
+
+
+@pytest.mark.parametrize("maximum_workers", [None, 4])
+def test_render_compiles_once(maximum_workers, monkeypatch, tmpdir):
+    directory_path = pathlib.Path(tmpdir)
+    render_directory_path = directory_path / "render"
+    render_directory_path.mkdir()
+    scsynth_path = directory_path / "scsynth"
+    scsynth_path.write_text(
+        fake_scsynth.format(
+            executable=sys.executable, log_path=str(directory_path / "log.txt")
+        )
+    )
+    scsynth_path.chmod(0o755)
+    compilations = collections.Counter()
+    iterate_non_xrefd_request_bundles = (
+        supriya.nonrealtime.Session._iterate_non_xrefd_request_bundles
+    )
+
+    def wrapper(self, *args, **kwargs):
+        compilations[self.name] += 1
+        return iterate_non_xrefd_request_bundles(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        supriya.nonrealtime.Session, "_iterate_non_xrefd_request_bundles", wrapper
+    )
+    session_b = supriya.nonrealtime.Session(name="b")
+    with session_b.at(0):
+        session_b.add_synth(duration=1)
+    session_a = supriya.nonrealtime.Session(input_=session_b, name="a")
+    with session_a.at(0):
+        session_a.add_synth(duration=2)
+    session = supriya.nonrealtime.Session(name="top")
+    with session.at(0):
+        session.cue_soundfile(session_a, duration=4)
+        session.cue_soundfile(session_b, duration=4)
+    exit_code, _ = session.render(
+        render_directory_path=render_directory_path,
+        scsynth_path=scsynth_path,
+        maximum_workers=maximum_workers,
+    )
+    assert exit_code == 0
+    assert compilations == {"a": 1, "b": 1, "top": 1}
+    assert sorted(x.suffix for x in render_directory_path.iterdir()) == [
+        ".aiff",
+        ".aiff",
+        ".aiff",
+        ".osc",
+        ".osc",
+        ".osc",
+    ]
@@ -0,0 +1,158 @@
+import concurrent.futures
+import pathlib
+import sys
+
+import supriya.nonrealtime
+import supriya.soundfiles
+
+fake_scsynth = """#!{executable}
+import array, struct, sys
+arguments = sys.argv[1:]
+osc_path, input_path, output_path, sample_rate = arguments[1:5]
+header_format, sample_format = arguments[5:7]
+channel_count = 8
+if "-o" in arguments:
+    channel_count = int(arguments[arguments.index("-o") + 1])
+data, offset, timestamp = open(osc_path, "rb").read(), 0, 0.0
+while offset < len(data):
+    size = struct.unpack_from(">i", data, offset)[0]
+    timestamp = struct.unpack_from(">Q", data, offset + 12)[0] / 2 ** 32
+    offset += 4 + size
+frame_count = int(round(timestamp * int(sample_rate)))
+if (header_format, sample_format) != ("wav", "float"):
+    open(output_path, "wb").write(open(input_path, "rb").read())
+    sys.exit(0)
+samples = array.array("f", [
+    frame for frame in range(frame_count) for _ in range(channel_count)
+])
+with open(output_path, "wb") as file_pointer:
+    file_pointer.write(struct.pack(
+        "<4sI4s4sIHHIIHH4sI", b"RIFF", 36 + len(samples) * 4, b"WAVE",
+        b"fmt ", 16, 3, channel_count, int(sample_rate),
+        int(sample_rate) * channel_count * 4, channel_count * 4, 32,
+        b"data", len(samples) * 4,
+    ))
+    file_pointer.write(samples.tobytes())
+"""
+
+
+def build_session():
+    session = supriya.nonrealtime.Session(output_bus_channel_count=2)
+    with session.at(0):
+        group = session.add_group(duration=4)
+        bus = session.add_bus()
+        synth_a = group.add_synth(duration=3, amplitude=0.25)
+    with session.at(0.5):
+        bus.set_(0.75)
+        synth_a["amplitude"] = 0.5
+    with session.at(2):
+        group.add_synth(duration=1, frequency=bus)
+    return session
+
+
+def write_fake_scsynth(directory_path):
+    scsynth_path = directory_path / "scsynth"
+    scsynth_path.write_text(fake_scsynth.format(executable=sys.executable))
+    scsynth_path.chmod(0o755)
+    return scsynth_path
+
+
+def test_segment_request_bundles():
+    session = build_session()
+    synthdef_name = "da0982184cc8fa54cf9d288a0fe1f6ca"
+    bundles = [
+        request_bundle.to_osc().to_list()
+        for request_bundle in session._iterate_segment_request_bundles(1.5, 2.5)
+    ]
+    assert [bundle[0] for bundle in bundles] == [0.0, 0.5, 1.0]
+    assert [message for message in bundles[0][1] if message[0] != "/d_recv"] == [
+        ["/c_set", 0, 0.75],
+        ["/g_new", 1000, 1, 0],
+        ["/s_new", synthdef_name, 1001, 1, 1000, "amplitude", 0.5],
+    ]
+    assert bundles[1][1] == [["/s_new", synthdef_name, 1002, 0, 1000, "frequency", 0]]
+    assert bundles[2][1] == [[0]]
+
+
+def test_segment_request_bundles_seek(monkeypatch):
+    session = build_session()
+    compiled_offsets = []
+    collect_requests_at_offset = supriya.nonrealtime.Session._collect_requests_at_offset
+
+    def wrapper(self, *args, **kwargs):
+        compiled_offsets.append(args[-2])
+        return collect_requests_at_offset(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        supriya.nonrealtime.Session, "_collect_requests_at_offset", wrapper
+    )
+    list(session._iterate_segment_request_bundles(1.5, 2.5))
+    assert compiled_offsets == [2.0]
+
+
+def test_render_segments(monkeypatch, tmpdir):
+    directory_path = pathlib.Path(tmpdir)
+    scsynth_path = write_fake_scsynth(directory_path)
+    session = build_session()
+    executors = []
+
+    class ThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            executors.append(self)
+
+    monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", ThreadPoolExecutor)
+    exit_code, output_file_path = session.render(
+        header_format="wav",
+        render_directory_path=directory_path,
+        sample_format="float",
+        sample_rate=1000,
+        scsynth_path=scsynth_path,
+        maximum_workers=2,
+        segment_offsets=[1, 2.5],
+        segment_preroll=0.5,
+        segment_crossfade=0.1,
+    )
+    assert exit_code == 0
+    channel_count, samples = supriya.soundfiles.read_float_wav(output_file_path)
+    assert channel_count == 2
+    assert len(samples) == 4000 * 2
+    # Each fake segment holds its own frame indices, starting from its
+    # pre-roll offset, rounded down to a whole block: 0, 448 and 1984.
+    expected = []
+    for frame in range(4000):
+        if frame < 1000:
+            value = frame
+        elif frame < 1100:
+            gain = (frame - 1000 + 0.5) / 100
+            value = frame * (1 - gain) + (frame - 448) * gain
+        elif frame < 2500:
+            value = frame - 448
+        elif frame < 2600:
+            gain = (frame - 2500 + 0.5) / 100
+            value = (frame - 448) * (1 - gain) + (frame - 1984) * gain
+        else:
+            value = frame - 1984
+        expected.extend([value, value])
+    assert all(abs(x - y) < 1e-3 for x, y in zip(samples, expected))
+    assert len(list(directory_path.glob("segment-*.wav"))) == 3
+    # Segments share the renderer's threads, and only their scores are written.
+    assert len(executors) == 1
+    assert not list(directory_path.glob("session-*.osc"))
+
+
+def test_render_segments_converts(tmpdir):
+    directory_path = pathlib.Path(tmpdir)
+    scsynth_path = write_fake_scsynth(directory_path)
+    session = build_session()
+    exit_code, output_file_path = session.render(
+        render_directory_path=directory_path,
+        sample_rate=1000,
+        scsynth_path=scsynth_path,
+        segment_offsets=[2],
+    )
+    assert exit_code == 0
+    assert output_file_path.suffix == ".aiff"
+    channel_count, samples = supriya.soundfiles.read_float_wav(output_file_path)
+    assert channel_count == 2 and len(samples) == 4000 * 2
+    assert not list(directory_path.glob("*.stitched.wav"))
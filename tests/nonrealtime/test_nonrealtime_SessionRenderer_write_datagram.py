@@ -0,0 +1,50 @@
+import hashlib
+import pathlib
+import struct
+
+import uqbar.io
+
+import supriya.nonrealtime
+
+
+def test_write_datagram(tmpdir):
+    session = supriya.nonrealtime.Session()
+    with session.at(0):
+        group = session.add_group(duration=10)
+    for offset in range(8):
+        with session.at(offset):
+            group.add_synth(duration=2, amplitude=offset / 8)
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session, render_directory_path=tmpdir
+    )
+    renderer._collect_prerender_tuples(session)
+    expected = b"".join(
+        struct.pack(">i", len(datagram)) + datagram
+        for datagram in (
+            osc_bundle.to_datagram(realtime=False)
+            for osc_bundle in session.to_osc_bundles()
+        )
+    )
+    md5 = hashlib.md5(expected)
+    for value in (
+        session.options.input_bus_channel_count,
+        session.options.output_bus_channel_count,
+        renderer.sample_rate,
+        renderer.header_format,
+        renderer.sample_format,
+    ):
+        md5.update(str(value).encode())
+    file_path = pathlib.Path(tmpdir) / "session-{}.osc".format(md5.hexdigest())
+    assert renderer.renderable_prefixes[session] == pathlib.Path(file_path.stem)
+    renderer._write_datagram(file_path, session)
+    assert file_path.read_bytes() == expected
+    renderer._write_datagram(file_path, session)
+    assert renderer.transcript[-1].endswith("File already exists.")
+    file_path.write_bytes(expected[:-1])
+    renderer._write_datagram(file_path, session)
+    assert file_path.read_bytes() == expected
+    assert renderer.transcript[-1].startswith("    Wrote")
+    with uqbar.io.DirectoryChange(directory=str(tmpdir)):
+        assert renderer._write_datagram(None, session) == pathlib.Path(file_path.name)
+    assert renderer.transcript[-1].endswith("File already exists.")
+    assert sorted(x.name for x in pathlib.Path(tmpdir).iterdir()) == [file_path.name]
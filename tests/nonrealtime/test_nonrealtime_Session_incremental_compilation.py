@@ -0,0 +1,133 @@
+import gc
+import random
+import tracemalloc
+
+import pytest
+
+import supriya.nonrealtime
+
+
+@pytest.fixture
+def compiled_offsets(monkeypatch):
+    compiled_offsets = []
+    collect_requests_at_offset = supriya.nonrealtime.Session._collect_requests_at_offset
+
+    def wrapper(self, *args, **kwargs):
+        compiled_offsets.append(args[-2])
+        return collect_requests_at_offset(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        supriya.nonrealtime.Session, "_collect_requests_at_offset", wrapper
+    )
+    return compiled_offsets
+
+
+def compile_from_scratch(session):
+    session._compiled_offsets.clear()
+    return session.to_lists()
+
+
+def test_dirty_offsets(compiled_offsets):
+    session = supriya.nonrealtime.Session(incremental=True)
+    with session.at(0):
+        group = session.add_group(duration=20)
+    synths = []
+    for offset in range(10):
+        with session.at(offset):
+            synths.append(group.add_synth(duration=5))
+    session._to_non_xrefd_request_bundles()
+    assert compiled_offsets == [float(offset) for offset in range(15)] + [20.0]
+    compiled_offsets[:] = []
+    session._to_non_xrefd_request_bundles()
+    assert compiled_offsets == [20.0]
+    compiled_offsets[:] = []
+    with session.at(7):
+        synths[4]["amplitude"] = 0.25
+    session._to_non_xrefd_request_bundles()
+    assert compiled_offsets == [7.0, 20.0]
+    result = session.to_lists()
+    assert result == compile_from_scratch(session)
+    assert [7.0, ["/n_set", 1005, "amplitude", 0.25]] in [
+        [offset, message] for offset, messages in result for message in messages
+    ]
+
+
+def test_duration_change_recompiles_everything(compiled_offsets):
+    session = supriya.nonrealtime.Session(incremental=True)
+    with session.at(0):
+        session.add_synth(duration=10)
+    session._to_non_xrefd_request_bundles()
+    compiled_offsets[:] = []
+    session._to_non_xrefd_request_bundles(duration=5)
+    assert compiled_offsets == [0.0, 5.0]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_edits(seed):
+    random_ = random.Random(seed)
+    session = supriya.nonrealtime.Session(incremental=True)
+    with session.at(0):
+        groups = [session.add_group(duration=40) for _ in range(3)]
+    bus = session.add_bus()
+    synths = []
+    for _ in range(30):
+        choice = random_.random()
+        if choice < 0.4 or not synths:
+            with session.at(random_.randrange(30)):
+                group = random_.choice(groups)
+                synths.append(group.add_synth(duration=random_.randrange(1, 10)))
+        elif choice < 0.5:
+            synth = random_.choice(synths)
+            with session.at(synth.start_offset):
+                synth["frequency"] = bus
+        elif choice < 0.6:
+            synth = random_.choice(synths)
+            with session.at(synth.start_offset + random_.random()):
+                synth["amplitude"] = random_.random()
+        elif choice < 0.7:
+            synth = random_.choice(synths)
+            with session.at(synth.start_offset):
+                random_.choice(groups).move_node(synth, add_action="ADD_TO_TAIL")
+        elif choice < 0.8:
+            random_.choice(synths).set_duration(random_.randrange(1, 12))
+        elif choice < 0.9:
+            with session.at(random_.randrange(30)):
+                bus.set_(random_.random())
+        else:
+            with session.at(random_.randrange(20) + 0.5):
+                session.add_buffer(duration=random_.randrange(1, 10)).zero()
+        assert session.to_lists() == compile_from_scratch(session)
+
+
+def test_not_incremental(compiled_offsets):
+    session = supriya.nonrealtime.Session()
+    with session.at(0):
+        session.add_synth(duration=10)
+    session._to_non_xrefd_request_bundles()
+    compiled_offsets[:] = []
+    session._to_non_xrefd_request_bundles()
+    assert compiled_offsets == [0.0, 10.0]
+    assert not session._compiled_offsets
+    assert not session._dirty_offsets
+
+
+def test_memory():
+    session = supriya.nonrealtime.Session()
+    for offset in range(1000):
+        with session.at(offset):
+            session.add_synth(duration=5, amplitude=offset / 1000)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        sizes = []
+        for _ in range(3):
+            for _ in session._iterate_non_xrefd_osc_bundles():
+                pass
+            gc.collect()
+            sizes.append(tracemalloc.get_traced_memory()[0])
+    finally:
+        tracemalloc.stop()
+    # Caching every bundle would retain several megabytes.
+    assert sizes[-1] < 1024 * 1024
+    assert sizes[-1] - sizes[0] < 64 * 1024
+    assert not session._compiled_offsets
@@ -0,0 +1,70 @@
+import bisect
+import pickle
+import random
+
+import supriya.nonrealtime
+from supriya.nonrealtime.timelines import Timeline
+
+
+def test_random_operations(monkeypatch):
+    monkeypatch.setattr(Timeline, "_block_size", 4)
+    random_ = random.Random(0)
+    timeline, expected = Timeline(), {}
+    for i in range(2000):
+        if random_.random() < 0.1:
+            events = [(random_.randrange(500) / 4, i) for _ in range(10)]
+            timeline.update(events)
+            expected.update(events)
+        else:
+            offset = random_.randrange(500) / 4
+            timeline.set(offset, i)
+            expected[offset] = i
+        if i % 100:
+            continue
+        offsets = sorted(expected)
+        assert timeline == [(offset, expected[offset]) for offset in offsets]
+        for _ in range(20):
+            offset = random_.randrange(-4, 504) / 8
+            index = bisect.bisect_right(offsets, offset) - 1
+            if index < 0:
+                assert timeline.get(offset) == (None, None)
+            else:
+                assert timeline.get(offset) == (
+                    expected[offsets[index]],
+                    offsets[index],
+                )
+        start_offset = random_.randrange(500) / 4
+        stop_offset = start_offset + random_.randrange(40)
+        assert list(timeline.irange(start_offset, stop_offset)) == [
+            (offset, expected[offset])
+            for offset in offsets
+            if start_offset <= offset < stop_offset
+        ]
+        left, right = timeline.split(start_offset)
+        assert list(left) + list(right) == list(timeline)
+        assert all(offset < start_offset for offset, _ in left)
+        assert all(start_offset <= offset for offset, _ in right)
+    assert pickle.loads(pickle.dumps(timeline)) == timeline
+    assert timeline.copy() == timeline
+
+
+def test_set_curve():
+    session = supriya.nonrealtime.Session()
+    with session.at(0):
+        synth = session.add_synth(duration=10)
+    offsets = [i / 100 for i in range(-100, 1100)]
+    synth.set_curve("frequency", offsets, [440 + i for i in range(len(offsets))])
+    assert len(synth._events["frequency"]) == 1000
+    assert session.offsets[-1] == 10
+    assert len(session.offsets) == 1002
+    with session.at(5.005):
+        assert synth["frequency"] == 1040
+    other_session = supriya.nonrealtime.Session()
+    with other_session.at(0):
+        other_synth = other_session.add_synth(duration=10)
+    for offset in offsets:
+        if not 0 <= offset < 10:
+            continue
+        with other_session.at(offset):
+            other_synth["frequency"] = 440 + int(round(offset * 100)) + 100
+    assert session.to_lists() == other_session.to_lists()
@@ -1,3 +1,4 @@
+import pytest
 import uqbar.strings
 
 import supriya
@@ -51,3 +52,47 @@ def test():
         ), ['a', 'b', ['c', 'd']])
     """
     )
+
+
+@pytest.mark.parametrize(
+    "osc_message",
+    [
+        supriya.osc.OscMessage("/g_new"),
+        supriya.osc.OscMessage("/abc", "abc", "abcd", "", 0, -1, 0.25),
+        supriya.osc.OscMessage("/blob", b"", b"a", b"abcd", b"abcde"),
+        supriya.osc.OscMessage("/array", [], [1, [2.5, ["three"]]], None, True, False),
+        supriya.osc.OscMessage(
+            "/b_setn", 1, 0, 256, *(float(i) / 256 for i in range(256))
+        ),
+    ],
+)
+def test_roundtrip(osc_message):
+    datagram = osc_message.to_datagram()
+    assert len(datagram) % 4 == 0
+    assert supriya.osc.OscMessage.from_datagram(datagram) == osc_message
+    assert supriya.osc.OscMessage.from_datagram(bytearray(datagram)) == osc_message
+
+
+def test_int_address():
+    datagram = supriya.osc.OscMessage(3, 1).to_datagram()
+    assert datagram == b"\x00\x00\x00\x03,i\x00\x00\x00\x00\x00\x01"
+
+
+def test_bundle_roundtrip():
+    osc_bundle = supriya.osc.OscBundle(
+        timestamp=1401557034.5,
+        contents=(
+            supriya.osc.OscMessage("/one", 1, "two"),
+            supriya.osc.OscBundle(contents=(supriya.osc.OscMessage("/three", 3.5),)),
+        ),
+    )
+    datagram = osc_bundle.to_datagram()
+    assert supriya.osc.OscBundle.from_datagram(datagram) == osc_bundle
+    datagram = osc_bundle.to_datagram(realtime=False)
+    assert supriya.osc.OscBundle.from_datagram(datagram).contents == osc_bundle.contents
+
+
+def test_truncated_datagram():
+    datagram = supriya.osc.OscMessage("/b_setn", 1, 0, 2, 0.5, 0.25).to_datagram()
+    with pytest.raises(ValueError):
+        supriya.osc.OscMessage.from_datagram(datagram[:-4])
@@ -0,0 +1,138 @@
+import asyncio
+import socket
+
+import pytest
+
+from supriya.osc import (
+    AsyncOscProtocol,
+    OscBundle,
+    OscMessage,
+    ThreadedOscProtocol,
+)
+
+
+def decode(datagram):
+    if datagram.startswith(b"#bundle"):
+        return OscBundle.from_datagram(datagram)
+    return OscMessage.from_datagram(datagram)
+
+
+def receive_all(server_socket):
+    received = []
+    while True:
+        try:
+            received.append(decode(server_socket.recv(65536)))
+        except socket.timeout:
+            return received
+
+
+@pytest.mark.parametrize("maximum", [64, 256, 8192])
+def test_partition(maximum):
+    messages = [OscMessage("/n_set", i, "amplitude", i / 10) for i in range(20)]
+    bundles = OscBundle.partition(messages, timestamp=1.5, maximum=maximum)
+    assert [x for bundle in bundles for x in bundle.contents] == messages
+    assert all(bundle.timestamp == 1.5 for bundle in bundles)
+    assert all(len(bundle.to_datagram()) <= maximum for bundle in bundles)
+    datagrams = OscBundle.partition_datagrams(messages, timestamp=1.5, maximum=maximum)
+    assert datagrams == [bundle.to_datagram() for bundle in bundles]
+
+
+def test_partition_oversized():
+    messages = [OscMessage("/b_setn", 0, 0, 100, *range(100)), OscMessage("/sync", 1)]
+    bundles = OscBundle.partition(messages, maximum=64)
+    assert [bundle.contents for bundle in bundles] == [(x,) for x in messages]
+    datagrams = OscBundle.partition_datagrams(messages, maximum=64)
+    assert datagrams == [x.to_datagram() for x in messages]
+
+
+def test_coalesce_send_queue():
+    protocol = ThreadedOscProtocol(max_datagram_size=64)
+    nested = OscBundle(contents=[OscBundle(contents=[OscMessage("/c")])])
+    protocol.send_queue = [
+        OscMessage("/a", 1),
+        OscBundle(contents=[OscMessage("/a", 2)]),
+        OscBundle(timestamp=2.0, contents=[OscMessage("/b", 1)]),
+        OscBundle(timestamp=2.0, contents=[OscMessage("/b", 2)]),
+        nested,
+        OscMessage("/a", 3),
+    ]
+    assert [decode(x) for x in protocol._coalesce_send_queue()] == [
+        OscBundle(contents=[OscMessage("/a", 1), OscMessage("/a", 2)]),
+        OscBundle(timestamp=2.0, contents=[OscMessage("/b", 1), OscMessage("/b", 2)]),
+        nested,
+        OscMessage("/a", 3),
+    ]
+    assert protocol.send_queue == []
+
+
+def test_threaded_coalescing():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server_socket:
+        server_socket.bind(("127.0.0.1", 0))
+        server_socket.settimeout(0.5)
+        protocol = ThreadedOscProtocol(coalescing_window=0.05)
+        protocol.connect("127.0.0.1", server_socket.getsockname()[1])
+        try:
+            for i in range(100):
+                protocol.send(OscMessage("/n_free", i))
+            received = receive_all(server_socket)
+            protocol.send(OscMessage("/sync", 1))
+            protocol.disconnect()
+            received.extend(receive_all(server_socket))
+        finally:
+            protocol.disconnect()
+    assert received == [
+        OscBundle(contents=[OscMessage("/n_free", i) for i in range(100)]),
+        OscMessage("/sync", 1),
+    ]
+
+
+def test_threaded_coalescing_send_error():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server_socket:
+        server_socket.bind(("127.0.0.1", 0))
+        server_socket.settimeout(0.5)
+        protocol = ThreadedOscProtocol(coalescing_window=0.05, max_datagram_size=64)
+        protocol.connect("127.0.0.1", server_socket.getsockname()[1])
+        send_datagram, failures = protocol._send_datagram, [True]
+
+        def flaky_send_datagram(datagram):
+            if failures:
+                raise OSError(failures.pop())
+            send_datagram(datagram)
+
+        protocol._send_datagram = flaky_send_datagram
+        try:
+            for i in range(10):
+                protocol.send(OscMessage("/n_free", i))
+            received = receive_all(server_socket)
+            protocol.send(OscMessage("/sync", 1))
+            received.extend(receive_all(server_socket))
+        finally:
+            protocol.disconnect()
+    # Only the first datagram is lost, and the sender keeps running
+    contents = [x for bundle in received[:-1] for x in bundle.contents]
+    assert contents and contents == [
+        OscMessage("/n_free", i) for i in range(10 - len(contents), 10)
+    ]
+    assert received[-1] == OscMessage("/sync", 1)
+
+
+@pytest.mark.asyncio
+async def test_async_coalescing():
+    loop = asyncio.get_running_loop()
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server_socket:
+        server_socket.bind(("127.0.0.1", 0))
+        server_socket.settimeout(0.5)
+        protocol = AsyncOscProtocol(coalescing_window=0.05, max_datagram_size=256)
+        await protocol.connect("127.0.0.1", server_socket.getsockname()[1])
+        try:
+            for i in range(20):
+                protocol.send(OscMessage("/n_free", i))
+            await asyncio.sleep(0.1)
+        finally:
+            await protocol.disconnect()
+        received = await loop.run_in_executor(None, receive_all, server_socket)
+    assert len(received) > 1
+    assert all(isinstance(x, OscBundle) for x in received)
+    assert [x for bundle in received for x in bundle.contents] == [
+        OscMessage("/n_free", i) for i in range(20)
+    ]
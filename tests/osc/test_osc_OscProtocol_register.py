@@ -0,0 +1,84 @@
+import socket
+import time
+
+from supriya.osc import AsyncOscProtocol, OscMessage, ThreadedOscProtocol
+
+
+def test_match_by_prefix():
+    protocol = AsyncOscProtocol()
+    received = []
+    protocol.register(pattern="/n_go", procedure=lambda m: received.append("any"))
+    for node_id in (1000, 1001):
+        protocol.register(
+            pattern=("/n_go", node_id),
+            procedure=lambda m, node_id=node_id: received.append(node_id),
+        )
+    protocol.register(
+        pattern=("/n_go", 1000, 1), procedure=lambda m: received.append("parent")
+    )
+    for message in [
+        OscMessage("/n_go", 1000, 1, -1, -1, 0),
+        OscMessage("/n_go", 1001, 1, -1, -1, 0),
+        OscMessage("/n_go", 1002, 1, -1, -1, 0),
+        OscMessage("/n_end", 1000, 1, -1, -1, 0),
+        OscMessage("/n_go", [1000], 1),
+    ]:
+        protocol._validate_receive(message.to_datagram())
+    assert received == ["any", 1000, "parent", "any", 1001, "any", "any"]
+
+
+def test_unregister():
+    protocol = AsyncOscProtocol()
+    received = []
+    callback_one, callback_two = [
+        protocol.register(
+            pattern=("/done", "/b_alloc", 1),
+            failure_pattern=("/fail", "/b_alloc"),
+            procedure=received.append,
+        )
+        for _ in range(2)
+    ]
+    assert callback_one == callback_two
+    protocol.unregister(callback_one)
+    assert set(protocol.callbacks) == {"/done", "/fail"}
+    protocol._validate_receive(OscMessage("/done", "/b_alloc", 1).to_datagram())
+    assert len(received) == 1
+    protocol.unregister(callback_two)
+    protocol.unregister(callback_two)
+    assert not protocol.callbacks
+
+
+def test_once():
+    protocol = AsyncOscProtocol()
+    received = []
+    protocol.register(
+        pattern=("/synced", 1),
+        failure_pattern=["/fail", "/sync"],
+        procedure=received.append,
+        once=True,
+    )
+    for _ in range(2):
+        protocol._validate_receive(OscMessage("/synced", 1).to_datagram())
+    assert received == [OscMessage("/synced", 1)]
+    assert not protocol.callbacks
+
+
+def test_threaded_batch_receive():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server_socket:
+        server_socket.bind(("127.0.0.1", 0))
+        server_socket.settimeout(1.0)
+        received = []
+        protocol = ThreadedOscProtocol()
+        protocol.register(pattern="/n_end", procedure=received.append)
+        protocol.connect("127.0.0.1", server_socket.getsockname()[1])
+        try:
+            protocol.send(OscMessage("/notify", 1))
+            _, address = server_socket.recvfrom(8192)
+            for i in range(200):
+                server_socket.sendto(OscMessage("/n_end", i).to_datagram(), address)
+            deadline = time.time() + 2.0
+            while len(received) < 200 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            protocol.disconnect()
+    assert [message.contents[0] for message in received] == list(range(200))
@@ -0,0 +1,125 @@
+import asyncio
+import socketserver
+import threading
+import time
+
+import pytest
+
+from supriya.osc import AsyncTcpOscProtocol, OscMessage, ThreadedTcpOscProtocol
+from supriya.osc.protocols import _MAXIMUM_FRAME_LENGTH, _frame, _unframe
+
+
+class EchoHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        while True:
+            data = self.request.recv(65536)
+            if not data:
+                return
+            self.request.sendall(data)
+
+
+@pytest.fixture
+def echo_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), EchoHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+def test_unframe():
+    datagrams = [OscMessage("/a", i).to_datagram() for i in range(3)]
+    data = b"".join(_frame(x) for x in datagrams)
+    buffer, received = bytearray(), []
+    for i in range(len(data)):
+        buffer.extend(data[i : i + 1])
+        received.extend(_unframe(buffer))
+    assert received == datagrams
+    assert not buffer
+
+
+@pytest.mark.parametrize("length", [-1, _MAXIMUM_FRAME_LENGTH + 1])
+def test_unframe_invalid(length):
+    buffer = bytearray(length.to_bytes(4, "big", signed=True) + b"\x00" * 8)
+    with pytest.raises(ValueError):
+        _unframe(buffer)
+
+
+class CorruptHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        self.request.sendall((-1).to_bytes(4, "big", signed=True))
+        self.request.recv(65536)
+
+
+@pytest.fixture
+def corrupt_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), CorruptHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+def test_threaded_tcp(echo_server):
+    received = []
+    protocol = ThreadedTcpOscProtocol()
+    protocol.register(pattern="/b_setn", procedure=received.append)
+    protocol.connect(*echo_server)
+    # far larger than a UDP datagram can carry
+    message = OscMessage("/b_setn", 0, 0, 50000, *[x / 4 for x in range(50000)])
+    try:
+        protocol.send(message)
+        protocol.send(OscMessage("/b_setn", 1))
+        deadline = time.time() + 2.0
+        while len(received) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        protocol.disconnect()
+    assert received == [message, OscMessage("/b_setn", 1)]
+
+
+@pytest.mark.asyncio
+async def test_async_tcp(echo_server):
+    received = []
+    protocol = AsyncTcpOscProtocol()
+    protocol.register(pattern="/b_setn", procedure=received.append)
+    await protocol.connect(*echo_server)
+    message = OscMessage("/b_setn", 0, 0, 50000, *[x / 4 for x in range(50000)])
+    try:
+        protocol.send(message)
+        protocol.send(OscMessage("/b_setn", 1))
+        for _ in range(200):
+            if len(received) == 2:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await protocol.disconnect()
+    assert received == [message, OscMessage("/b_setn", 1)]
+
+
+def test_threaded_tcp_corrupt(corrupt_server):
+    protocol = ThreadedTcpOscProtocol()
+    protocol.connect(*corrupt_server)
+    try:
+        protocol.server_thread.join(2.0)
+        assert not protocol.server_thread.is_alive()
+    finally:
+        protocol.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_async_tcp_corrupt(corrupt_server):
+    protocol = AsyncTcpOscProtocol()
+    await protocol.connect(*corrupt_server)
+    try:
+        for _ in range(200):
+            if protocol.transport.is_closing():
+                break
+            await asyncio.sleep(0.01)
+        assert protocol.transport.is_closing()
+    finally:
+        await protocol.disconnect()
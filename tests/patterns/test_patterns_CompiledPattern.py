@@ -0,0 +1,124 @@
+import itertools
+import random
+
+import pytest
+
+import supriya.patterns
+
+
+def strip_uuids(events):
+    settings = []
+    for event in events:
+        settings.append(event.as_dict())
+        settings[-1].pop("uuid", None)
+    return settings
+
+
+pbind_a = supriya.patterns.Pbind(
+    amplitude=supriya.patterns.Pwhite(0.1, 0.9),
+    duration=supriya.patterns.Pseq([0.25, 0.5], 3),
+    frequency=supriya.patterns.Pseq([[440, 550], 660, None], None),
+)
+pbind_b = supriya.patterns.Pbind(
+    delta=supriya.patterns.Pwhite(1, 0, repetitions=5),
+    frequency=(supriya.patterns.Prand([1, 2, 3], None) + [100, 200]) * 2,
+    pan=supriya.patterns.Pseed(supriya.patterns.Pwhite(-1, 1), seed=3),
+)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        pbind_a,
+        pbind_b,
+        supriya.patterns.Pseq([pbind_a, pbind_b], 2),
+        supriya.patterns.Pseed(supriya.patterns.Pseq([pbind_b, pbind_a]), seed=7),
+        supriya.patterns.Pseed(supriya.patterns.Pn(pbind_a, 3)),
+        supriya.patterns.Pchain([pbind_a, pbind_b]),
+        supriya.patterns.Pchain(
+            [pbind_b, supriya.patterns.Pbind(foo=supriya.patterns.Pwhite())]
+        ),
+        supriya.patterns.Pbind(
+            frequency=supriya.patterns.Prand(
+                [supriya.patterns.Pseq([1, 2]), 3], repetitions=10
+            )
+        ),
+        supriya.patterns.Pn(
+            supriya.patterns.Pbind(
+                amplitude=supriya.patterns.Pseed(
+                    supriya.patterns.Pseq([supriya.patterns.Pwhite(0, 1, 2), 3], 1),
+                    seed=1,
+                ),
+                pan=supriya.patterns.Pwhite(0, 1),
+            ),
+            2,
+        ),
+        supriya.patterns.Pbind(
+            amplitude=supriya.patterns.Pwhite(0, 1),
+            delta=supriya.patterns.Pseed(
+                supriya.patterns.Pseq([supriya.patterns.Pwhite(0, 1, 2), 3], 1)
+            ),
+            pan=supriya.patterns.Pwhite(-1, 0),
+        ),
+    ],
+)
+def test_compiled(pattern):
+    compiled_pattern = supriya.patterns.CompiledPattern(pattern)
+    assert compiled_pattern.is_compiled
+    random.seed(0)
+    expected = strip_uuids(pattern)
+    state = random.getstate()
+    random.seed(0)
+    assert strip_uuids(compiled_pattern) == expected
+    # Random numbers are drawn as iterating the pattern draws them
+    assert random.getstate() == state
+    random.seed(0)
+    chunks = list(compiled_pattern.iterate_chunks(chunk_size=4))
+    assert all(0 < len(x["synthdef"]) <= 4 for x in chunks)
+    events = [
+        dict(zip(chunk, values)) for chunk in chunks for values in zip(*chunk.values())
+    ]
+    assert strip_uuids(supriya.patterns.NoteEvent(**x) for x in events) == expected
+
+
+def test_infinite():
+    pattern = supriya.patterns.Pseed(
+        supriya.patterns.Pbind(
+            amplitude=supriya.patterns.Pwhite(),
+            frequency=supriya.patterns.Pseq([440, 660], None),
+        )
+    )
+    compiled_pattern = supriya.patterns.CompiledPattern(pattern)
+    assert compiled_pattern.is_compiled
+    assert strip_uuids(itertools.islice(compiled_pattern, 3000)) == strip_uuids(
+        itertools.islice(pattern, 3000)
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        supriya.patterns.Pn(pbind_a, 2, key="repeat"),
+        supriya.patterns.Ppar([pbind_a, pbind_b]),
+        # Two unsupported value patterns would draw random numbers field by
+        # field, not event by event
+        supriya.patterns.Pbind(
+            foo=supriya.patterns.Pwhite([0, 1], 2),
+            bar=supriya.patterns.Pwhite([0, 1], 2),
+        ),
+    ],
+)
+def test_not_compiled(pattern):
+    compiled_pattern = supriya.patterns.CompiledPattern(pattern)
+    assert not compiled_pattern.is_compiled
+    random.seed(0)
+    expected = strip_uuids(itertools.islice(pattern, 20))
+    random.seed(0)
+    assert strip_uuids(itertools.islice(compiled_pattern, 20)) == expected
+
+
+def test_not_compiled_peripherals():
+    pattern = pbind_a.with_group()
+    compiled_pattern = supriya.patterns.CompiledPattern(pattern)
+    assert not compiled_pattern.is_compiled
+    assert [type(x) for x in compiled_pattern] == [type(x) for x in pattern]
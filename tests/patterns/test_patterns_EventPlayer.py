@@ -1,5 +1,11 @@
+import types
+
+import pytest
+
 import supriya.patterns
 import supriya.realtime
+from supriya.clock import OfflineTempoClock
+from supriya.realtime import BlockAllocator, NodeIdAllocator
 
 
 def test_iterate_inner_1(pseudo_server):
@@ -132,3 +138,123 @@ def test_iterate_inner_5(pseudo_server):
         (4.0, (4, 0), True),
         (5.0, (5, 0), True),
     ]
+
+
+@pytest.mark.parametrize("lookahead", [0.5, 100.0])
+def test_lookahead(lookahead):
+    pattern = supriya.patterns.Ppar(
+        [
+            supriya.patterns.Pbind(
+                duration=duration, frequency=supriya.patterns.Pseq(range(20), 1),
+            )
+            for duration in (0.25, 0.5, 0.75)
+        ]
+    ).with_bus()
+    sent = {}
+    for key in (None, lookahead):
+        server = types.SimpleNamespace(
+            audio_bus_allocator=BlockAllocator(),
+            control_bus_allocator=BlockAllocator(),
+            is_running=True,
+            latency=0.1,
+            node_id_allocator=NodeIdAllocator(),
+            send=sent.setdefault(key, []).append,
+        )
+        clock = OfflineTempoClock()
+        player = supriya.patterns.EventPlayer(
+            pattern, clock=clock, lookahead=key, server=server
+        )
+        player.start()
+        clock.run()
+        if key is not None:
+            assert player.late_bundle_count == 0
+            assert player.buffered_bundle_count == 0
+        player.stop()
+        assert not player._uuids
+        assert not server.audio_bus_allocator._used_heap
+    assert [x.to_datagram() for x in sent[lookahead]] == [
+        x.to_datagram() for x in sent[None]
+    ]
+    assert sent[lookahead] == sent[None]
+    assert repr(sent[lookahead][0]) == repr(sent[None][0])
+
+
+def test_lookahead_underrun(monkeypatch):
+    # A worker which never renders leaves every bundle to the clock thread
+    monkeypatch.setattr(supriya.patterns.EventPlayer, "_run_worker", lambda self: None)
+    pattern = supriya.patterns.Pbind(
+        duration=0.5, frequency=supriya.patterns.Pseq(range(10), 1)
+    )
+    sent = {}
+    for key in (None, 10.0):
+        server = types.SimpleNamespace(
+            audio_bus_allocator=BlockAllocator(),
+            control_bus_allocator=BlockAllocator(),
+            is_running=True,
+            latency=0.1,
+            node_id_allocator=NodeIdAllocator(),
+            send=sent.setdefault(key, []).append,
+        )
+        clock = OfflineTempoClock()
+        player = supriya.patterns.EventPlayer(
+            pattern, clock=clock, lookahead=key, server=server
+        )
+        player.start()
+        clock.run()
+        player.stop()
+    assert sent[10.0] == sent[None]
+    assert player.underrun_count == 11
+
+
+def test_lookahead_stop():
+    pattern = supriya.patterns.Pbind(
+        duration=1.0, frequency=supriya.patterns.Pseq(range(100), 1)
+    ).with_bus()
+    sent = []
+    server = types.SimpleNamespace(
+        audio_bus_allocator=BlockAllocator(),
+        control_bus_allocator=BlockAllocator(),
+        is_running=True,
+        latency=0.1,
+        node_id_allocator=NodeIdAllocator(),
+        send=sent.append,
+    )
+    clock = OfflineTempoClock()
+    player = supriya.patterns.EventPlayer(
+        pattern, clock=clock, lookahead=10.0, server=server
+    )
+    player.start()
+    clock.run(until=5.0)
+    player.stop()
+    assert player.buffered_bundle_count == 0
+    # Only the nodes the server was sent are freed
+    assert sent[-2].to_list()[1][-1][:3] == ["/s_new", "default", 1004]
+    assert sent[-1].to_list() == [None, [["/n_free", 1000, 1001, 1004]]]
+
+
+def test_lookahead_error(capsys):
+    # Raising when the fourth note's amplitude is computed
+    pattern = supriya.patterns.Pbind(
+        duration=0.5, amplitude=0 ** supriya.patterns.Pseq([1, 2, 3, -1], 1)
+    )
+    sent = []
+    server = types.SimpleNamespace(
+        audio_bus_allocator=BlockAllocator(),
+        control_bus_allocator=BlockAllocator(),
+        is_running=True,
+        latency=0.1,
+        node_id_allocator=NodeIdAllocator(),
+        send=sent.append,
+    )
+    clock = OfflineTempoClock()
+    player = supriya.patterns.EventPlayer(
+        pattern, clock=clock, lookahead=10.0, server=server
+    )
+    player.start()
+    clock.run()
+    assert "ZeroDivisionError" in capsys.readouterr().err
+    assert player._worker is None
+    assert player.buffered_bundle_count == 0
+    # The nodes the server was sent are freed
+    assert sent[0].to_list()[1][0][:3] == ["/s_new", "default", 1000]
+    assert sent[-1].to_list() == [None, [["/n_free", 1000]]]
@@ -567,3 +567,29 @@ def test___iter___06():
             )
         """
     )
+
+
+def test_many_voices():
+    """
+    Voices merge by offset, tied voices in the order they were given.
+    """
+    durations = [0.5, 0.75, 1.0, 0.25] * 16
+    pattern = supriya.patterns.Ppar(
+        [
+            supriya.patterns.Pbind(
+                duration=duration, frequency=supriya.patterns.Pseq([i, i], 1),
+            )
+            for i, duration in enumerate(durations)
+        ]
+    )
+    events = list(pattern)
+    offset, actual = 0.0, []
+    for event in events:
+        actual.append((offset, event["frequency"]))
+        offset += event.delta
+    expected = sorted(
+        (offset, i)
+        for i, duration in enumerate(durations)
+        for offset in (0.0, duration)
+    )
+    assert actual == expected
@@ -128,3 +128,15 @@ def test_grouped():
     output_b = [next(iterator_b) for _ in range(10)]
     output_c = [next(iterator_c) for _ in range(10)]
     assert output_a == output_b == output_c
+
+
+def test_nested_contextvar():
+    """
+    Patterns draw from their innermost seeded pattern's generator.
+    """
+    inner = supriya.patterns.Pseed(supriya.patterns.Pwhite(repetitions=3), seed=1)
+    pattern = supriya.patterns.Pseed(
+        supriya.patterns.Pseq([supriya.patterns.Pwhite(repetitions=3), inner]), seed=1,
+    )
+    output = list(pattern)
+    assert output[:3] == output[3:] == list(inner)
@@ -0,0 +1,24 @@
+import itertools
+import sys
+
+import pytest
+
+import supriya.patterns
+
+
+@pytest.mark.parametrize("seed", [0, 1, -1, 12345, 2 ** 40])
+@pytest.mark.parametrize("block_size", [1, 7, 1024])
+def test_iterate_blocks(seed, block_size):
+    pytest.importorskip("numpy")
+    rng = supriya.patterns.RandomNumberGenerator(seed=seed)
+    blocks = list(itertools.islice(rng.iterate_blocks(block_size), 3000 // block_size))
+    assert all(len(x) == block_size for x in blocks)
+    numbers = list(itertools.chain.from_iterable(x.tolist() for x in blocks))
+    assert numbers == list(itertools.islice(rng, len(numbers)))
+
+
+def test_iterate_blocks_without_numpy(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    rng = supriya.patterns.RandomNumberGenerator()
+    with pytest.raises(ImportError, match=r"supriya\[numpy\]"):
+        rng.iterate_blocks()
@@ -0,0 +1,24 @@
+import array
+
+import pytest
+
+import supriya.realtime
+
+
+@pytest.mark.parametrize("is_local", [True, False])
+def test_roundtrip(server, monkeypatch, is_local):
+    if not is_local:
+        monkeypatch.setattr(supriya.realtime.Buffer, "_local_ip_addresses", frozenset())
+    buffer_ = supriya.realtime.Buffer()
+    buffer_.allocate(channel_count=2, frame_count=3000, sync=True)
+    samples = array.array("f", [(x % 64) / 64 for x in range(5000)])
+    buffer_.set_samples(samples, starting_frame=500)
+    result = buffer_.get_samples()
+    assert isinstance(result, array.array)
+    assert result == array.array("f", [0.0] * 1000) + samples
+    assert buffer_.get_samples(starting_frame=500, frame_count=2) == samples[:4]
+    with pytest.raises(IndexError):
+        buffer_.get_samples(starting_frame=2999, frame_count=2)
+    with pytest.raises(ValueError):
+        buffer_.set_samples([1.0, 2.0, 3.0])
+    buffer_.free()
@@ -0,0 +1,154 @@
+import shutil
+
+import pytest
+
+import supriya.commands
+import supriya.provider
+import supriya.realtime
+import supriya.synthdefs
+import supriya.ugens
+
+
+def build(frequency=440, voice_count=1):
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        source = supriya.ugens.Mix.new(
+            [
+                supriya.ugens.SinOsc.ar(frequency=frequency + i)
+                for i in range(voice_count)
+            ]
+        )
+        supriya.ugens.Out.ar(bus=0, source=source)
+    return builder.build()
+
+
+@pytest.fixture
+def library():
+    return supriya.realtime.SynthDefLibrary(supriya.realtime.Server())
+
+
+def test_collect_missing(library):
+    synthdefs = [build(frequency=x) for x in (1, 2, 1, 3)]
+    library._register(synthdefs[1])
+    assert library.collect_missing(synthdefs) == (synthdefs[0], synthdefs[3])
+    assert synthdefs[2] not in library
+    assert synthdefs[1] in library
+    library._unregister(synthdefs[1].actual_name)
+    assert synthdefs[1] not in library
+
+
+def test_make_requests(library):
+    callback = supriya.commands.NodeFreeRequest(node_ids=[1000])
+    synthdefs = [build(frequency=x, voice_count=20) for x in range(10)]
+    requests = library.make_requests(synthdefs, callback=callback)
+    assert all(isinstance(x, supriya.commands.SynthDefReceiveRequest) for x in requests)
+    assert 1 < len(requests)
+    assert [x for request in requests for x in request.synthdefs] == synthdefs
+    assert [request.callback for request in requests[:-1]] == [None] * (
+        len(requests) - 1
+    )
+    assert requests[-1].callback is callback
+    for request in requests:
+        assert len(request.to_datagram()) <= library.maximum_datagram_size
+    assert library.make_requests([], callback=callback) == [callback]
+
+
+def test_make_requests_boundary(library, monkeypatch):
+    synthdefs = [build(frequency=x, voice_count=4) for x in range(3)]
+    size = len(
+        supriya.commands.SynthDefReceiveRequest(synthdefs=synthdefs[:2]).to_datagram()
+    )
+    monkeypatch.setattr(type(library), "maximum_datagram_size", size)
+    requests = library.make_requests(synthdefs)
+    assert [request.synthdefs for request in requests] == [
+        tuple(synthdefs[:2]),
+        (synthdefs[2],),
+    ]
+    monkeypatch.setattr(type(library), "maximum_datagram_size", size - 1)
+    requests = library.make_requests(synthdefs)
+    assert [request.synthdefs for request in requests] == [(x,) for x in synthdefs]
+    for request in requests:
+        assert len(request.to_datagram()) <= library.maximum_datagram_size
+
+
+@pytest.mark.parametrize("response", [None, "fail", "error"])
+def test_allocate_failure(library, monkeypatch, response):
+    def communicate(self, **kwargs):
+        if response == "error":
+            raise RuntimeError
+        elif response == "fail":
+            return [supriya.commands.FailResponse("/d_recv", "failed")] * len(self)
+        return [None] * len(self)
+
+    monkeypatch.setattr(supriya.commands.RequestPipeline, "communicate", communicate)
+    synthdefs = [build(frequency=x) for x in range(2)]
+    if response == "error":
+        with pytest.raises(RuntimeError):
+            library.allocate(synthdefs)
+    else:
+        assert library.allocate(synthdefs) == ()
+    assert not any(synthdef in library for synthdef in synthdefs)
+    assert library.collect_missing(synthdefs) == tuple(synthdefs)
+
+
+@pytest.mark.parametrize(
+    "synthdefs, maximum_receive_count",
+    [
+        ([build(frequency=x, voice_count=20) for x in range(10)], 1),
+        ([build(voice_count=500)], None),
+    ],
+)
+def test_make_requests_spill(library, synthdefs, maximum_receive_count):
+    (request,) = library.make_requests(
+        synthdefs, maximum_receive_count=maximum_receive_count
+    )
+    assert isinstance(request, supriya.commands.SynthDefLoadDirectoryRequest)
+    try:
+        assert len(list(request.directory_path.glob("*.scsyndef"))) == len(synthdefs)
+    finally:
+        shutil.rmtree(request.directory_path)
+
+
+def test_allocate(server):
+    synthdefs = [build(frequency=x, voice_count=20) for x in range(10)]
+    synthdefs.append(build(voice_count=500))
+    assert server.synthdef_library.allocate(synthdefs) == tuple(synthdefs)
+    assert all(synthdef in server for synthdef in synthdefs)
+    assert server.synthdef_library.allocate(synthdefs) == ()
+    synth = supriya.realtime.Synth(synthdefs[-1]).allocate()
+    assert synth.is_allocated
+
+
+def test_preload(server, tmp_path):
+    synthdefs = [build(frequency=x) for x in range(4)]
+    for synthdef in synthdefs:
+        (tmp_path / "{}.scsyndef".format(synthdef.actual_name)).write_bytes(
+            synthdef.compile()
+        )
+    loaded = server.synthdef_library.preload(tmp_path)
+    assert sorted(x.anonymous_name for x in loaded) == sorted(
+        x.anonymous_name for x in synthdefs
+    )
+    assert all(synthdef in server for synthdef in synthdefs)
+    assert server.synthdef_library.preload(tmp_path) == ()
+
+
+def test_provider_load_directory(server, monkeypatch):
+    directory_paths = []
+    write_synthdef_directory = (
+        supriya.realtime.SynthDefLibrary._write_synthdef_directory
+    )
+
+    def spy(synthdefs):
+        directory_paths.append(write_synthdef_directory(synthdefs))
+        return directory_paths[-1]
+
+    monkeypatch.setattr(
+        supriya.realtime.SynthDefLibrary, "_write_synthdef_directory", spy
+    )
+    provider = supriya.provider.Provider.from_context(server)
+    synthdef = build(voice_count=500)
+    with provider.at(None):
+        provider.add_synth(synthdef=synthdef)
+    assert len(directory_paths) == 1
+    assert not directory_paths[0].exists()
+    assert synthdef in server
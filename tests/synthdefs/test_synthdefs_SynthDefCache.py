@@ -0,0 +1,105 @@
+import pytest
+
+import supriya.synthdefs
+import supriya.ugens
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = supriya.synthdefs.SynthDefCache()
+    monkeypatch.setattr(supriya.synthdefs.SynthDefCache, "_default_cache", cache)
+    return cache
+
+
+def build(frequency=440, name=None):
+    with supriya.synthdefs.SynthDefBuilder(amplitude=0.5, gate=1) as builder:
+        source = supriya.ugens.SinOsc.ar(frequency=frequency)
+        envelope = supriya.ugens.EnvGen.kr(
+            envelope=supriya.synthdefs.Envelope.asr(), gate=builder["gate"]
+        )
+        supriya.ugens.Out.ar(bus=0, source=source * envelope * builder["amplitude"])
+    return builder.build(name=name)
+
+
+def test_hit(cache):
+    synthdef_one = build(name="foo")
+    info = cache.info()
+    assert (info.hits, info.size) == (0, 2)
+    synthdef_two = build(name="bar")
+    assert cache.info().hits == 1
+    assert synthdef_two.name == "bar"
+    assert synthdef_two._compiled_ugen_graph == synthdef_one._compiled_ugen_graph
+    assert synthdef_two.parameter_names == ["amplitude", "gate"]
+    assert str(synthdef_two) == str(synthdef_one).replace("foo", "bar")
+    synthdef_three = supriya.synthdefs.SynthDef(synthdef_one.ugens)
+    assert synthdef_three == build()
+
+
+def test_miss(cache):
+    assert build(frequency=440) != build(frequency=441)
+    assert cache.info().hits == 0
+    assert cache.info().misses == 4
+
+
+def test_uncached(cache):
+    sine = supriya.ugens.SinOsc.ar()
+    product = supriya.synthdefs.BinaryOpUGen._new_single(
+        calculation_rate=sine.calculation_rate, left=sine, right=2.0, special_index=2
+    )
+    assert cache.fingerprint([product]) is None
+    assert cache.fingerprint([sine, product]) is not None
+
+
+def test_eviction(cache):
+    cache.maximum_size = 2
+    for frequency in range(3):
+        supriya.synthdefs.SynthDef(build(frequency=frequency).ugens, optimize=False)
+    info = cache.info()
+    assert (info.size, info.evictions) == (2, 7)
+
+
+def test_directory(cache, tmp_path):
+    cache.directory_path = tmp_path
+    synthdef = build()
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+    cache.clear()
+    assert build() == synthdef
+    assert cache.info().hits == 1
+
+
+def test_copies(cache):
+    synthdef_one = build(name="foo")
+    synthdef_two = build(name="bar")
+    assert cache.info().hits == 1
+    assert synthdef_two == build(name="bar")
+    ugens_one, ugens_two = (
+        set(map(id, synthdef_one.ugens)),
+        set(map(id, synthdef_two.ugens)),
+    )
+    assert not ugens_one & ugens_two
+
+
+def test_mutation(cache):
+    synthdef_one = build(name="foo")
+    compiled = synthdef_one.compile()
+    for synthdef in (synthdef_one, build(name="bar")):
+        # Mutate both the built and the cached copy's UGens in place
+        for ugen in synthdef.ugens:
+            ugen._inputs = tuple(0.0 for _ in ugen._inputs)
+    synthdef_three = build(name="foo")
+    assert cache.info().hits == 2
+    assert synthdef_three.ugens[-1]._inputs != synthdef_one.ugens[-1]._inputs
+    assert synthdef_three.compile() == compiled
+
+
+def test_directory_forbidden(cache, tmp_path):
+    import pickle
+
+    cache.directory_path = tmp_path
+    with (tmp_path / "key.pickle").open("wb") as file_pointer:
+        pickle.dump(("os", "system"), file_pointer)
+    assert cache.get("key") == ("os", "system")
+    with (tmp_path / "key.pickle").open("wb") as file_pointer:
+        pickle.dump(pickle.Pickler, file_pointer)
+    cache.clear()
+    assert cache.get("key") is None
@@ -0,0 +1,60 @@
+import copy
+
+import pytest
+import uqbar.objects
+
+import supriya.commands
+import supriya.intervals
+import supriya.osc
+import supriya.patterns
+import supriya.system
+
+
+class Keywords(supriya.system.SupriyaValueObject):
+    def __init__(self, name, *args, foo=None, **kwargs):
+        self._name = name
+        self.args = args
+        self.foo = foo
+        self.kwargs = kwargs
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        Keywords("a"),
+        Keywords("a", 1, 2, foo=3, bar=[4]),
+        supriya.commands.SynthNewRequest(
+            node_id=1000, synthdef="default", target_node_id=1, frequency=443
+        ),
+        supriya.intervals.Interval(1, 2),
+        supriya.osc.OscMessage("/n_set", 1000, "amplitude", 0.5),
+        supriya.patterns.NoteEvent(duration=1, frequency=[440, 550]),
+        supriya.patterns.Pbind(frequency=supriya.patterns.Pseq([1, 2], 3)),
+        None,
+    ],
+)
+def test_uqbar_compatibility(expr):
+    assert supriya.system.get_vars(expr) == uqbar.objects.get_vars(expr)
+    assert supriya.system.get_repr(expr) == uqbar.objects.get_repr(expr)
+    if isinstance(expr, supriya.system.SupriyaValueObject):
+        clone = copy.copy(expr)
+        assert clone == expr and clone is not expr
+        assert supriya.system.get_vars(supriya.system.new(expr)) == (
+            uqbar.objects.get_vars(uqbar.objects.new(expr))
+        )
+
+
+def test_equality():
+    assert Keywords("a", 1, foo=2) == Keywords("a", 1, foo=2)
+    assert Keywords("a", 1, foo=2) != Keywords("a", 1, foo=3)
+    assert Keywords("a") != "a"
+    assert Keywords("a") != 1.5
+    assert len({Keywords("a", 1), Keywords("a", 1), Keywords("b")}) == 2
+
+
+def test_new():
+    pattern = supriya.patterns.Pbind(frequency=supriya.patterns.Pseq([1, 2], 3))
+    clone = supriya.system.new(pattern, frequency__repetitions=None, amplitude=0.5)
+    assert clone == supriya.patterns.Pbind(
+        amplitude=0.5, frequency=supriya.patterns.Pseq([1, 2], None)
+    )